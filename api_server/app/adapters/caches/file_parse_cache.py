@@ -0,0 +1,139 @@
+"""
+파싱 결과를 로컬 디스크에 원문 내용 해시 키로 저장하는 캐시 구현체.
+
+- 키(sha256 hex)별로 {cache_dir}/{key[:2]}/{key}.json 파일 하나에 ParsedDocument JSON을 저장
+- 조회에 성공하면 파일 mtime을 갱신해 LRU 순서를 유지
+- 전체 크기가 max_bytes를 넘으면 mtime이 오래된 파일부터 삭제(max_bytes의 90%까지)
+- 여러 프로세스가 같은 디렉터리를 함께 써도 되도록 임시 파일에 쓴 뒤 교체한다
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import List, Optional, Tuple
+import logging
+import os
+
+from pydantic import ValidationError
+
+from api_server.app.domain.ports import ParseCachePort
+from api_server.app.domain.models import ParsedDocument
+
+logger = logging.getLogger(__name__)
+
+# 정리 후 남길 크기 비율 (쓰기마다 정리가 반복되지 않도록 여유를 둔다)
+_EVICT_LOW_WATERMARK = 0.9
+
+
+class FileParseCache(ParseCachePort):
+
+    def __init__(self, cache_dir: str, max_bytes: int = 512 * 1024 * 1024) -> None:
+        """
+        Args:
+            cache_dir: 캐시 디렉터리
+            max_bytes: 캐시 전체 최대 크기(바이트)
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        # 현재 캐시 크기 추정치(처음 쓰기 시 디렉터리를 훑어 계산)
+        self._total_bytes: Optional[int] = None
+
+    def get(self, key: str) -> Optional[ParsedDocument]:
+        """
+        캐시된 파싱 결과를 읽는다. 손상된 항목은 삭제하고 None을 반환한다.
+
+        Args:
+            key: 원문 내용 해시 키
+        Returns:
+            ParsedDocument | None
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("parse cache read failed: %s error=%s", path, e)
+            return None
+
+        try:
+            doc = ParsedDocument.model_validate_json(data)
+        except ValidationError as e:
+            logger.warning("drop broken parse cache entry: %s error=%s", path, e)
+            self._remove(path)
+            return None
+
+        # LRU: 최근 사용 시각 갱신
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return doc
+
+    def put(self, key: str, doc: ParsedDocument) -> None:
+        """
+        파싱 결과를 저장하고, 최대 크기를 넘으면 오래된 항목을 정리한다.
+        (캐시 쓰기 실패는 파싱 결과에 영향을 주지 않도록 경고만 남긴다)
+
+        Args:
+            key: 원문 내용 해시 키
+            doc: 파싱 결과
+        """
+        path = self._path(key)
+        data = doc.model_dump_json().encode("utf-8")
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("parse cache write failed: %s error=%s", path, e)
+            self._remove(tmp)
+            return
+
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._entries())
+        else:
+            self._total_bytes += len(data)
+        if self._total_bytes > self._max_bytes:
+            self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """
+        캐시 항목 목록(mtime, 크기, 경로)을 반환한다.
+        """
+        entries = []
+        for path in self._cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # 다른 프로세스가 먼저 정리한 경우
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """
+        가장 오래전에 사용된 항목부터 삭제하여 max_bytes의 90% 이하로 줄인다.
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        target = int(self._max_bytes * _EVICT_LOW_WATERMARK)
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        logger.info("parse cache evicted %d entries, size=%d bytes", removed, total)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
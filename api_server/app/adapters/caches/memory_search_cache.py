@@ -0,0 +1,84 @@
+"""
+검색 결과를 프로세스 메모리에 저장하는 LRU + TTL 캐시 구현체.
+
+- 최대 항목 수(max_entries)를 넘으면 가장 오래전에 사용된 항목부터 삭제
+- 저장 후 ttl_seconds가 지나면 만료(조회 시 삭제)
+- invalidate()는 세대를 올리고 저장된 항목을 모두 비운다
+- 같은 프로세스 안에서만 공유되므로 여러 워커로 실행할 때는 Redis 구현체를 사용한다
+- AsyncMemorySearchCache는 같은 캐시를 async 검색 경로에서 쓰기 위한 래퍼(잠금은 짧게만 잡으므로 루프를 막지 않는다)
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+
+from api_server.app.domain.ports import AsyncSearchCachePort, SearchCachePort
+
+
+class MemorySearchCache(SearchCachePort):
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60.0) -> None:
+        """
+        Args:
+            max_entries: 최대 저장 항목 수
+            ttl_seconds: 항목 유효 시간(초)
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 검색 결과를 반환한다. 반환값은 캐시와 공유되므로 수정하지 않는다.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self) -> int:
+        return self._generation
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+class AsyncMemorySearchCache(AsyncSearchCachePort):
+
+    def __init__(self, cache: MemorySearchCache) -> None:
+        """
+        Args:
+            cache: 색인 쪽 무효화와 공유하는 메모리 캐시
+        """
+        self._cache = cache
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._cache.get(key)
+
+    async def put(self, key: str, value: Dict[str, Any]) -> None:
+        self._cache.put(key, value)
+
+    async def generation(self) -> int:
+        return self._cache.generation()
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,117 @@
+"""
+검색 결과를 Redis에 저장하는 캐시 구현체(여러 워커/서버가 함께 사용).
+
+- 항목: {prefix}:{key} 에 JSON을 ttl_seconds 만료로 저장
+- 세대: {prefix}:generation 정수(INCR로 증가). 키에 세대가 들어가므로 이전 세대 항목은 조회되지 않고 TTL로 사라진다
+- Redis 오류는 경고 로그만 남기고 캐시 미스로 처리한다(검색 자체는 실패시키지 않음)
+- async 검색 경로는 redis.asyncio 클라이언트를 쓰는 AsyncRedisSearchCache로 조회/저장하고,
+  색인 쪽은 RedisSearchCache.invalidate()로 같은 세대 키를 올린다
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Optional
+import json
+import logging
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from api_server.app.domain.ports import AsyncSearchCachePort, SearchCachePort
+
+logger = logging.getLogger(__name__)
+
+
+def _encode(value: Dict[str, Any]) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _decode(data: Any) -> Optional[Dict[str, Any]]:
+    if data is None:
+        return None
+    try:
+        return json.loads(data)
+    except ValueError:
+        return None
+
+
+class RedisSearchCache(SearchCachePort):
+
+    def __init__(self, client: Redis, prefix: str = "search", ttl_seconds: int = 60) -> None:
+        """
+        Args:
+            client: Redis 클라이언트
+            prefix: 키 접두사
+            ttl_seconds: 항목 유효 시간(초)
+        """
+        self._client = client
+        self._prefix = prefix
+        self._ttl_seconds = ttl_seconds
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            data = self._client.get(f"{self._prefix}:{key}")
+        except RedisError as e:
+            logger.warning("search cache get failed: key=%s error=%s", key, e)
+            return None
+        return _decode(data)
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        try:
+            self._client.set(f"{self._prefix}:{key}", _encode(value), ex=self._ttl_seconds)
+        except RedisError as e:
+            logger.warning("search cache put failed: key=%s error=%s", key, e)
+
+    def generation(self) -> int:
+        try:
+            return int(self._client.get(f"{self._prefix}:generation") or 0)
+        except RedisError as e:
+            logger.warning("search cache generation read failed: error=%s", e)
+            return 0
+
+    def invalidate(self) -> None:
+        try:
+            self._client.incr(f"{self._prefix}:generation")
+        except RedisError as e:
+            logger.warning("search cache invalidate failed: error=%s", e)
+
+
+class AsyncRedisSearchCache(AsyncSearchCachePort):
+    """
+    RedisSearchCache와 같은 키/형식을 쓰는 비동기 구현체.
+    """
+
+    def __init__(self, client: AsyncRedis, prefix: str = "search", ttl_seconds: int = 60) -> None:
+        """
+        Args:
+            client: redis.asyncio 클라이언트
+            prefix: 키 접두사
+            ttl_seconds: 항목 유효 시간(초)
+        """
+        self._client = client
+        self._prefix = prefix
+        self._ttl_seconds = ttl_seconds
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            data = await self._client.get(f"{self._prefix}:{key}")
+        except RedisError as e:
+            logger.warning("search cache get failed: key=%s error=%s", key, e)
+            return None
+        return _decode(data)
+
+    async def put(self, key: str, value: Dict[str, Any]) -> None:
+        try:
+            await self._client.set(f"{self._prefix}:{key}", _encode(value), ex=self._ttl_seconds)
+        except RedisError as e:
+            logger.warning("search cache put failed: key=%s error=%s", key, e)
+
+    async def generation(self) -> int:
+        try:
+            return int(await self._client.get(f"{self._prefix}:generation") or 0)
+        except RedisError as e:
+            logger.warning("search cache generation read failed: error=%s", e)
+            return 0
+
+    async def close(self) -> None:
+        await self._client.aclose()
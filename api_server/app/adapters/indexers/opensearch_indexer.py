@@ -6,32 +6,112 @@ from __future__ import annotations
 import json
 import os
 import re
-from typing import Any, List, Dict, Tuple
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Deque, List, Dict, Optional, Tuple, Iterable, Iterator
 from pathlib import Path
 from opensearchpy import OpenSearch, helpers
 from opensearchpy.exceptions import ConnectionError, RequestError
 from api_server.app.domain.ports import IndexPort
+from api_server.app.domain.artifacts import is_trusted, iter_records
 from api_server.app.domain.models import (
     NormalizedChunk, IndexResult, IndexErrorItem, AliasResult
 )
 from api_server.app.platform.exceptions import DomainError, IndexingFailed
 
+# 저장된 content_hash가 같으면 문서를 다시 쓰지 않는다(noop). 다르거나 문서가 없으면 문서 전체를 쓴다.
+_UPSERT_IF_CHANGED_SCRIPT = (
+    "if (params.doc.content_hash != null && ctx._source.content_hash == params.doc.content_hash) "
+    "{ ctx.op = 'none' } else { ctx._source.clear(); ctx._source.putAll(params.doc) }"
+)
+
+# 대량 적재 동안 적용하는 인덱스 설정(refresh 중지, 복제본 없음). 적재 후 스키마 값으로 되돌린다.
+# 인덱스에 저장되는 값이므로 refresh_interval이 아직 -1인 인덱스는 적재가 끝나지 않은 것으로 보고
+# alias 회전에서 제외한다(다른 프로세스/재시작 후에도 같은 판단).
+_BULK_LOAD_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+# force merge는 세그먼트 크기에 따라 오래 걸릴 수 있으므로 요청 타임아웃을 넉넉히 둔다(초)
+_FORCEMERGE_TIMEOUT = 600
+
+
+@lru_cache(maxsize=1)
+def load_index_schema() -> Dict[str, Any]:
+    """
+    인덱스 스키마(resources/schema/search_index.json)를 프로세스당 한 번만 읽어 파싱한다.
+    반환값은 공유되므로 수정하지 않는다(인덱스 생성 시에는 새 dict로 병합해서 사용).
+    """
+    root_dir = Path(os.path.dirname(__file__)).resolve().parents[2]
+    schema_path = root_dir / "resources/schema/search_index.json"
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class _TrustedChunk:
+    """
+    이미 색인 문서 형태(model_dump(mode="json"))인 레코드(신뢰 산출물, 열 단위 변환 결과)를
+    NormalizedChunk 대신 색인에 넘긴다.
+    _index가 쓰는 속성(source_id, content_hash)과 model_dump만 제공한다.
+    """
+    __slots__ = ("source_id", "content_hash", "_doc")
+
+    def __init__(self, doc: Dict[str, Any]) -> None:
+        self.source_id = doc["source_id"]
+        self.content_hash = doc.get("content_hash")
+        self._doc = doc
+
+    def model_dump(self, mode: str = "json") -> Dict[str, Any]:
+        return self._doc
+
+
 class OpenSearchIndexer(IndexPort):
     
-    def __init__(self, client: OpenSearch, prefix_name: str, alias_name: str) -> None:
+    def __init__(
+        self,
+        client: OpenSearch,
+        prefix_name: str,
+        alias_name: str,
+        bulk_thread_count: int = 1,
+        bulk_chunk_size: int = 500,
+        bulk_max_chunk_bytes: int = 100 * 1024 * 1024,
+        forcemerge_max_segments: int = 0,
+        on_alias_rotated: Optional[Callable[[], None]] = None,
+        trust_artifacts: bool = False) -> None:
+        """
+            Args:
+                client: OpenSearch 클라이언트
+                prefix_name: 인덱스 이름 접두사
+                alias_name: 검색용 alias 이름
+                bulk_thread_count: bulk 요청 동시 전송 스레드 수(1이면 streaming_bulk, 2 이상이면 parallel_bulk)
+                bulk_chunk_size: bulk 요청 1회당 최대 문서 수
+                bulk_max_chunk_bytes: bulk 요청 1회당 최대 바이트 수
+                forcemerge_max_segments: 적재 완료 후 force merge 목표 세그먼트 수(0이면 생략)
+                on_alias_rotated: alias가 새 인덱스로 갱신된 뒤 호출할 콜백(검색 캐시 무효화 등)
+                trust_artifacts: 스키마 버전 헤더가 일치하는 내부 산출물은 검증/재직렬화 없이 색인
+        """
         self.client = client
         self.prefix_name = prefix_name
         self.alias_name = alias_name
+        self.bulk_thread_count = bulk_thread_count
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_max_chunk_bytes = bulk_max_chunk_bytes
+        self.forcemerge_max_segments = forcemerge_max_segments
+        self.on_alias_rotated = on_alias_rotated
+        self.trust_artifacts = trust_artifacts
+        # 이번에 새로 만든(비어 있는) 인덱스: 비교할 기존 문서가 없으므로 그냥 index 한다
+        self._created_indices: set[str] = set()
+        # 적재 중(생성/복제 후 finalize 전)인 인덱스: alias 회전 대상에서 제외한다
+        # (source=all 동시 실행 시 다른 소스의 회전이 적재 중인 인덱스를 노출하지 않도록)
+        self._loading: set[str] = set()
+        # 이번 적재에서 새로 만들거나 복제한 인덱스(finalize 전): 적재에 실패하면 삭제한다(discard_index)
+        self._owned: set[str] = set()
+        self._alias_lock = threading.Lock()
         self._load_index_schema()
         
     def _load_index_schema(self) -> None:
         """
-            인덱스 스키마를 JSON 파일에서 로드한다.
+            인덱스 스키마를 로드한다(파일은 프로세스당 한 번만 읽는다).
         """
-        root_dir = Path(os.path.dirname(__file__)).resolve().parents[2]
-        schema_path = root_dir / "resources/schema/search_index.json"
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            self.index_schema = json.load(f)
+        self.index_schema = load_index_schema()
     
     def _create_index_name(self, source: str, index_date: str) -> str:
         return f"{self.prefix_name}-{source}-{index_date}"
@@ -42,6 +122,9 @@ class OpenSearchIndexer(IndexPort):
             인덱스 이름 형식: {prefix_name}-{source}-{index_date}
             ex. myidx-html-1, myidx-tsv-2, myidx-tsv-3
 
+            새로 만드는 인덱스는 대량 적재용 설정(refresh 중지, 복제본 0)으로 생성하며,
+            적재가 끝나면 finalize_index로 스키마 설정을 복원해야 한다.
+
             Args:
                 source: 소스 이름(html, tsv)
                 index_date: 인덱스 날짜(ex. 1,2,3)
@@ -49,11 +132,18 @@ class OpenSearchIndexer(IndexPort):
                 생성된 인덱스 이름
         """
         index_name = self._create_index_name(source, index_date)
+        self._loading.add(index_name)
         if self.client.indices.exists(index=index_name):
             print(f"Index '{index_name}' already exists.")
             return index_name
         
-        self.client.indices.create(index=index_name, body=self.index_schema)
+        body = {
+            **self.index_schema,
+            "settings": {**self.index_schema.get("settings", {}), **_BULK_LOAD_SETTINGS},
+        }
+        self.client.indices.create(index=index_name, body=body)
+        self._created_indices.add(index_name)
+        self._owned.add(index_name)
         print(f"Index '{index_name}' created successfully.")
         return index_name
 
@@ -71,20 +161,241 @@ class OpenSearchIndexer(IndexPort):
                 색인 결과(색인 성공/실패 건수, 실패 상세, 인덱스 이름, 별칭)
         """
         try:
-            chunks: List[NormalizedChunk] = []
-            with open(resource_file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    doc = json.loads(line.strip())
-                    if self._is_published(doc):
-                        chunks.append(NormalizedChunk.model_validate(doc))
-            return self._index(index_name, chunks)
+            return self._index(index_name, self._read_chunks(resource_file_path))
         except ConnectionError as e:
-            raise IndexingFailed(f"connection error: {index_name} resource_file_path={resource_file_path} error={e}")
+            raise IndexingFailed(index_name, f"connection error: resource_file_path={resource_file_path} error={e}")
         except RequestError as e:
-            raise IndexingFailed(f"request error: {index_name} resource_file_path={resource_file_path} error={e}")
+            raise IndexingFailed(index_name, f"request error: resource_file_path={resource_file_path} error={e}")
         except Exception as e:
             raise DomainError(f"failed to index: {index_name} resource_file_path={resource_file_path} error={e}")
 
+    def index_chunks(self, index_name: str, chunks: Iterable[NormalizedChunk]) -> IndexResult:
+        """
+            파일을 거치지 않고 NormalizedChunk 이터러블을 바로 색인한다(파이프라인 모드).
+
+            - 이터러블을 bulk 청크 단위로 소비하므로 전체 문서를 메모리에 올리지 않는다.
+            - 공개(published)된 청크만 색인한다.
+            - 실패 항목의 seq는 스트림 내 순번(1부터, 비공개 청크 포함)이다.
+
+            Args:
+                index_name: 인덱스 이름
+                chunks: NormalizedChunk 이터러블(제너레이터)
+            Returns:
+                색인 결과(색인 성공/실패 건수, 실패 상세)
+        """
+        try:
+            return self._index(
+                index_name, ((seq, c) for seq, c in enumerate(chunks, start=1) if c.published))
+        except DomainError:
+            # 상위 단계(파싱/변환)에서 발생한 도메인 예외는 그대로 전파
+            raise
+        except ConnectionError as e:
+            raise IndexingFailed(index_name, f"connection error: error={e}")
+        except RequestError as e:
+            raise IndexingFailed(index_name, f"request error: error={e}")
+        except Exception as e:
+            raise DomainError(f"failed to index: {index_name} error={e}")
+
+    def index_records(self, index_name: str, records: Iterable[Dict[str, Any]]) -> IndexResult:
+        """
+            색인 문서 형태(dict)로 만들어진 레코드를 검증/재직렬화 없이 바로 색인한다(열 단위 고속 경로).
+
+            - 공개(published)된 레코드만 색인한다.
+            - 실패 항목의 seq는 스트림 내 순번(1부터, 비공개 레코드 포함)이다.
+
+            Args:
+                index_name: 인덱스 이름
+                records: NormalizedChunk.model_dump(mode="json") 형태의 dict 이터러블
+            Returns:
+                색인 결과(색인 성공/실패 건수, 실패 상세)
+        """
+        try:
+            return self._index(
+                index_name,
+                ((seq, _TrustedChunk(r)) for seq, r in enumerate(records, start=1) if self._is_published(r)))
+        except DomainError:
+            raise
+        except ConnectionError as e:
+            raise IndexingFailed(index_name, f"connection error: error={e}")
+        except RequestError as e:
+            raise IndexingFailed(index_name, f"request error: error={e}")
+        except Exception as e:
+            raise DomainError(f"failed to index: {index_name} error={e}")
+
+    def finalize_index(self, index_name: str) -> None:
+        """
+            대량 적재를 마친 인덱스를 검색 가능한 상태로 마무리한다(alias 회전 전에 호출).
+
+            - refresh_interval/number_of_replicas를 스키마 값으로 복원한다(스키마에 없으면 클러스터 기본값).
+            - refresh를 한 번 실행해 적재된 문서를 검색에 노출한다.
+            - forcemerge_max_segments > 0 이면 세그먼트를 병합해 첫 요청부터 병합된 세그먼트로 검색한다.
+
+            Args:
+                index_name: 인덱스 이름
+        """
+        settings = self.index_schema.get("settings", {})
+        try:
+            self.client.indices.put_settings(
+                index=index_name,
+                body={"index": {
+                    "refresh_interval": settings.get("refresh_interval"),
+                    "number_of_replicas": settings.get("number_of_replicas"),
+                }},
+            )
+            self.client.indices.refresh(index=index_name)
+            if self.forcemerge_max_segments > 0:
+                self.client.indices.forcemerge(
+                    index=index_name,
+                    max_num_segments=self.forcemerge_max_segments,
+                    request_timeout=_FORCEMERGE_TIMEOUT,
+                )
+            self._loading.discard(index_name)
+            self._owned.discard(index_name)
+            self._created_indices.discard(index_name)
+            print(f"Index '{index_name}' finalized.")
+        except ConnectionError as e:
+            raise IndexingFailed(index_name, f"connection error: finalize error={e}")
+        except RequestError as e:
+            raise IndexingFailed(index_name, f"request error: finalize error={e}")
+
+    def discard_index(self, index_name: str) -> None:
+        """
+            적재에 실패하거나 취소된 인덱스를 정리한다(finalize 전에 예외가 난 경우 호출).
+
+            - 이번 적재에서 새로 만들거나 복제한 인덱스는 삭제한다
+              (대량 적재 설정(refresh 중지, 복제본 0)이 남은 채 다음 alias 회전에 노출되지 않도록).
+            - 이미 있던 인덱스(같은 날짜 재실행)는 서비스 중일 수 있으므로 삭제하지 않는다.
+            - 삭제에 실패해도 예외를 던지지 않는다(원래 예외를 그대로 전파하기 위해).
+
+            Args:
+                index_name: 인덱스 이름
+        """
+        self._loading.discard(index_name)
+        if index_name not in self._owned:
+            return
+        self._owned.discard(index_name)
+        self._created_indices.discard(index_name)
+        try:
+            self.client.indices.delete(index=index_name, ignore=[404])
+            print(f"Discarded partially loaded index: {index_name}")
+        except Exception as e:
+            print(f"Failed to discard index '{index_name}': {e}")
+
+    def clone_index(self, source: str, from_date: str, to_date: str) -> Optional[str]:
+        """
+            이전 날짜 인덱스를 새 날짜 인덱스로 복제한다(delta 색인용).
+            clone은 세그먼트를 그대로 복사하므로 전체 재색인보다 훨씬 가볍다.
+
+            - 대상 인덱스가 이미 있으면 그대로 사용한다(같은 날짜 재실행).
+            - 기준 인덱스가 없으면 None을 반환한다(호출 측에서 전체 색인으로 대체).
+            - clone 동안 기준 인덱스를 쓰기 금지로 두었다가 원래대로 되돌린다.
+            - 복제한 인덱스도 대량 적재용 설정으로 만들며, 변경분 적재 후 finalize_index로 복원해야 한다.
+
+            Args:
+                source: 소스 이름(html, tsv)
+                from_date: 기준(이전) 날짜
+                to_date: 새 인덱스 날짜
+            Returns:
+                복제된 인덱스 이름 또는 None
+        """
+        base_index = self._create_index_name(source, from_date)
+        index_name = self._create_index_name(source, to_date)
+        try:
+            if self.client.indices.exists(index=index_name):
+                print(f"Index '{index_name}' already exists.")
+                self._loading.add(index_name)
+                return index_name
+            if not self.client.indices.exists(index=base_index):
+                print(f"Base index '{base_index}' not found.")
+                return None
+
+            self.client.indices.put_settings(index=base_index, body={"index.blocks.write": True})
+            try:
+                self.client.indices.clone(
+                    index=base_index,
+                    target=index_name,
+                    body={"settings": {"index.blocks.write": False, **_BULK_LOAD_SETTINGS}},
+                    params={"wait_for_active_shards": "1"},
+                )
+            finally:
+                self.client.indices.put_settings(index=base_index, body={"index.blocks.write": False})
+            print(f"Index '{index_name}' cloned from '{base_index}'.")
+            self._loading.add(index_name)
+            self._owned.add(index_name)
+            return index_name
+        except ConnectionError as e:
+            raise IndexingFailed(index_name, f"connection error: clone from={base_index} error={e}")
+        except RequestError as e:
+            raise IndexingFailed(index_name, f"request error: clone from={base_index} error={e}")
+
+    def apply_delta(
+        self,
+        index_name: str,
+        upserts: Iterable[NormalizedChunk],
+        deletes: Iterable[str]) -> IndexResult:
+        """
+            변경분만 bulk로 적재한다(delta 색인).
+
+            - upsert: 추가/변경된 청크를 index 액션으로 덮어쓴다.
+            - delete: 사라진 source_id를 삭제한다. 이미 없는 문서(404)는 실패로 보지 않는다.
+            - deletes는 upserts를 모두 보낸 뒤에 순회한다.
+
+            Args:
+                index_name: 인덱스 이름
+                upserts: 추가/변경된 NormalizedChunk 이터러블
+                deletes: 삭제할 source_id 이터러블
+            Returns:
+                색인 결과(색인/삭제 건수, 실패 상세)
+        """
+        def actions():
+            for seq, c in enumerate(upserts, start=1):
+                yield seq, {
+                    "_op_type": "index",
+                    "_index": index_name,
+                    "_id": c.source_id,
+                    "_source": c.model_dump(mode="json"),
+                }
+            # 삭제 대상은 파일/스트림 상 위치가 없으므로 seq=0
+            for source_id in deletes:
+                yield 0, {"_op_type": "delete", "_index": index_name, "_id": source_id}
+
+        try:
+            indexed = deleted = 0
+            err_items: list[IndexErrorItem] = []
+            for ok, seq, op_type, detail in self._bulk(actions()):
+                if ok:
+                    if op_type == "delete":
+                        deleted += 1
+                    else:
+                        indexed += 1
+                elif op_type == "delete" and detail.get("status") == 404:
+                    continue
+                else:
+                    err_items.append(self._error_item(seq, op_type, detail))
+            return IndexResult(indexed=indexed, deleted=deleted, errors=err_items)
+        except DomainError:
+            raise
+        except ConnectionError as e:
+            raise IndexingFailed(index_name, f"connection error: delta error={e}")
+        except RequestError as e:
+            raise IndexingFailed(index_name, f"request error: delta error={e}")
+        except Exception as e:
+            raise DomainError(f"failed to apply delta: {index_name} error={e}")
+
+    def _read_chunks(self, resource_file_path: str) -> Iterator[Tuple[int, NormalizedChunk]]:
+        """
+            파일에서 공개된 NormalizedChunk를 한 건씩 읽어 (순번, 청크)로 반환한다.
+            Args:
+                resource_file_path: NormalizedChunk들이 저장된 파일 경로(JSONL/압축 JSONL/parquet)
+            Returns:
+                Iterator[Tuple[int, NormalizedChunk]]: 순번(JSONL은 줄 번호)은 1부터(실패 항목 seq로 사용)
+        """
+        # 변환 단계가 현재 스키마로 기록한 파일이면 읽은 dict를 그대로 색인 문서로 쓴다
+        trusted = self.trust_artifacts and is_trusted(resource_file_path, NormalizedChunk)
+        for line_no, doc in iter_records(resource_file_path):
+            if self._is_published(doc):
+                yield line_no, _TrustedChunk(doc) if trusted else NormalizedChunk.model_validate(doc)
+
     def _is_published(self, doc: dict) -> bool:
         """
             문서가 공개되었는지 확인한다.
@@ -95,34 +406,121 @@ class OpenSearchIndexer(IndexPort):
         """
         return doc.get("published", True)
 
-    def _index(self, index_name: str, chunks: List[NormalizedChunk]) -> IndexResult:
+    def _index(self, index_name: str, chunks: Iterable[Tuple[int, NormalizedChunk]]) -> IndexResult:
         """
             인덱스에 NormalizedChunk들을 색인한다.
-            
+
+            - 이번에 새로 만든 인덱스에는 index 액션으로 적재한다.
+            - 이미 있던 인덱스(같은 날짜 재실행 등)에는 content_hash를 비교하는 update(upsert)로 적재해
+              내용이 같은 문서는 noop으로 건너뛴다(세그먼트 재기록 없음).
+
             Args:
                 index_name: 인덱스 이름
-                chunks: NormalizedChunk들
+                chunks: (seq, NormalizedChunk) 이터러블
             Returns:
                 색인 결과(색인 성공/실패 건수, 실패 상세, 인덱스 이름, 별칭)
         """
+        guarded = index_name not in self._created_indices
+
         def actions():
-            for c in chunks:
-                yield {
-                    "_op_type": "index",
-                    "_index": index_name,
-                    "_id": c.source_id,
-                    "_source": c.model_dump(mode="json"),
-                }
+            for seq, c in chunks:
+                if guarded and c.content_hash:
+                    yield seq, self._upsert_if_changed_action(index_name, c)
+                else:
+                    yield seq, {
+                        "_op_type": "index",
+                        "_index": index_name,
+                        "_id": c.source_id,
+                        "_source": c.model_dump(mode="json"),
+                    }
 
         # bulk 적재
-        ok, errors = helpers.bulk(self.client, actions(), raise_on_error=False)
+        indexed = 0
         err_items: list[IndexErrorItem] = []
-        for e in errors or []:
-            err_items.append(IndexErrorItem(
-                doc_id=str(e.get("index", {}).get("_id", "")),
-                seq=0,
-                reason=str(e)))
-        return IndexResult(indexed=ok, errors=err_items)
+        for ok, seq, op_type, detail in self._bulk(actions()):
+            if ok:
+                indexed += 1
+            else:
+                err_items.append(self._error_item(seq, op_type, detail))
+        return IndexResult(indexed=indexed, errors=err_items)
+
+    def _bulk(
+        self,
+        actions: Iterable[Tuple[int, Dict[str, Any]]]) -> Iterator[Tuple[bool, int, str, Dict[str, Any]]]:
+        """
+            (seq, 액션) 이터러블을 bulk로 전송하고 문서별 결과를 반환한다.
+
+            - bulk_thread_count가 2 이상이면 parallel_bulk로 여러 bulk 요청을 동시에 보내고,
+              아니면 streaming_bulk로 순차 전송한다. 둘 다 액션을 chunk 단위로만 소비하므로
+              메모리 사용량은 입력 크기와 무관하게 일정하다.
+            - 결과는 액션 순서대로 나오므로(parallel_bulk도 순서 보장) seq를 큐로 짝지운다.
+
+            Args:
+                actions: (seq, bulk 액션) 이터러블
+            Returns:
+                Iterator[Tuple[bool, int, str, Dict[str, Any]]]: (성공 여부, seq, op_type, 응답 상세)
+        """
+        seqs: Deque[int] = deque()
+
+        def tracked():
+            for seq, action in actions:
+                seqs.append(seq)
+                yield action
+
+        if self.bulk_thread_count > 1:
+            results = helpers.parallel_bulk(
+                self.client,
+                tracked(),
+                thread_count=self.bulk_thread_count,
+                chunk_size=self.bulk_chunk_size,
+                max_chunk_bytes=self.bulk_max_chunk_bytes,
+                queue_size=self.bulk_thread_count,
+                raise_on_error=False,
+            )
+        else:
+            results = helpers.streaming_bulk(
+                self.client,
+                tracked(),
+                chunk_size=self.bulk_chunk_size,
+                max_chunk_bytes=self.bulk_max_chunk_bytes,
+                raise_on_error=False,
+            )
+        for ok, item in results:
+            op_type, detail = next(iter(item.items()))
+            yield ok, seqs.popleft(), op_type, detail
+
+    def _error_item(self, seq: int, op_type: str, detail: Dict[str, Any]) -> IndexErrorItem:
+        """
+            bulk 실패 응답을 IndexErrorItem으로 변환한다.
+        """
+        return IndexErrorItem(
+            doc_id=str(detail.get("_id", "")),
+            seq=seq,
+            reason=str({op_type: detail}))
+
+    def _upsert_if_changed_action(self, index_name: str, chunk: NormalizedChunk) -> Dict[str, Any]:
+        """
+            content_hash가 같으면 noop, 다르거나 문서가 없으면 문서를 쓰는 update 액션을 만든다.
+            문서는 script params로 한 번만 보내고, 없는 문서는 scripted_upsert로 빈 문서에서 스크립트를 실행해 만든다.
+            Args:
+                index_name: 인덱스 이름
+                chunk: NormalizedChunk
+            Returns:
+                bulk update 액션
+        """
+        doc = chunk.model_dump(mode="json")
+        return {
+            "_op_type": "update",
+            "_index": index_name,
+            "_id": chunk.source_id,
+            "scripted_upsert": True,
+            "script": {
+                "source": _UPSERT_IF_CHANGED_SCRIPT,
+                "lang": "painless",
+                "params": {"doc": doc},
+            },
+            "upsert": {},
+        }
 
     # ================== alias ==================
     def rotate_alias_to_latest(
@@ -148,6 +546,22 @@ class OpenSearchIndexer(IndexPort):
         Returns:
             AliasResult: alias가 가리키는 최신 인덱스 목록
         """
+        # 여러 소스가 동시에 회전해도 alias 액션이 섞이지 않도록 직렬화
+        with self._alias_lock:
+            return self._rotate_alias_to_latest(alias_name, base_prefix, delete_old)
+
+    def _is_unfinished(self, index_meta: Dict[str, Any]) -> bool:
+        """
+            indices.get 응답의 인덱스 설정이 대량 적재 중(refresh_interval=-1)인지 확인한다.
+        """
+        index_settings = (index_meta or {}).get("settings", {}).get("index", {})
+        return str(index_settings.get("refresh_interval")) == _BULK_LOAD_SETTINGS["refresh_interval"]
+
+    def _rotate_alias_to_latest(
+        self,
+        alias_name: str,
+        base_prefix: str,
+        delete_old: bool) -> AliasResult:
         pattern = f"{base_prefix}-*"
         try:
             all_indices_map: Dict[str, Any] = self.client.indices.get(index=pattern)
@@ -155,7 +569,12 @@ class OpenSearchIndexer(IndexPort):
             print(f"Failed to list indices for pattern '{pattern}': {e}")
             return []
 
-        all_index_names: List[str] = sorted(all_indices_map.keys())
+        # 적재 중인 인덱스는 같은 그룹의 이전 인덱스가 계속 서비스한다(삭제 대상에서도 제외)
+        # - 이 프로세스에서 적재 중인 인덱스(_loading)
+        # - 대량 적재 설정이 남아 있는(finalize 전) 인덱스: 다른 워커가 적재 중이거나 적재 도중 프로세스가 종료됨
+        all_index_names: List[str] = sorted(
+            n for n, meta in all_indices_map.items()
+            if n not in self._loading and not self._is_unfinished(meta))
         if not all_index_names:
             print(f"No indices found for pattern '{pattern}'.")
             return []
@@ -202,6 +621,8 @@ class OpenSearchIndexer(IndexPort):
         if actions:
             self.client.indices.update_aliases(body={"actions": actions})
             print(f"Alias '{alias_name}' now points to: {', '.join(latest_indices)}")
+            if self.on_alias_rotated is not None:
+                self.on_alias_rotated()
 
         # 옵션(delete_old=True)일 경우 오래된 인덱스는 삭제
         if delete_old:
@@ -0,0 +1,52 @@
+"""
+다른 ParsePort 구현체를 감싸 원문 내용 해시로 파싱 결과를 재사용하는 구현체.
+"""
+
+from __future__ import annotations
+from typing import Optional
+import hashlib
+
+from api_server.app.domain.ports import ParsePort, ParseCachePort
+from api_server.app.domain.models import ParsedDocument, RawDocument
+
+
+class CachedParser(ParsePort):
+
+    def __init__(self, parser: ParsePort, cache: ParseCachePort, version: Optional[str] = None) -> None:
+        """
+        Args:
+            parser: 실제 파싱을 수행할 파서
+            cache: 파싱 결과 캐시
+            version: 캐시 키에 포함할 파서 버전 (기본: parser.version, 없으면 클래스 이름)
+        """
+        self._parser = parser
+        self._cache = cache
+        self._version = version or getattr(parser, "version", type(parser).__name__)
+
+    def parse(self, raw: RawDocument) -> ParsedDocument:
+        """
+        같은 파서 버전으로 같은 원문을 파싱한 결과가 캐시에 있으면 파서를 호출하지 않는다.
+        (캐시 적중 시 source/collection은 이번 원문 기준으로 바꿔서 반환)
+
+        Args:
+            raw: RawDocument
+        Returns:
+            ParsedDocument
+        """
+        key = self.cache_key(raw)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached.model_copy(update={"source": raw.source, "collection": raw.collection})
+
+        doc = self._parser.parse(raw)
+        self._cache.put(key, doc)
+        return doc
+
+    def cache_key(self, raw: RawDocument) -> str:
+        """
+        sha256(파서 버전 + 원문 텍스트) 키를 만든다.
+        """
+        digest = hashlib.sha256(self._version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((raw.body_text or "").encode("utf-8"))
+        return digest.hexdigest()
@@ -3,21 +3,30 @@ TSV 파일을 파싱하여 ParsedDocument로 변환하는 구현체.
 """
 
 from __future__ import annotations
-from typing import List, Dict
+from typing import List, Tuple
 import csv
 import io
 
 from api_server.app.domain.ports import ParsePort
-from api_server.app.domain.models import ParsedDocument, ParsedBlock, RawDocument
+from api_server.app.domain.models import ParsedDocument, RawDocument, RowTable
 from api_server.app.platform.exceptions import DomainError, InvalidInput
 
 REQUIRED_COLS = {"id", "question", "answer", "published", "user_id"}
 
 class QnaParser(ParsePort):
-    
+
+    # 추출 규칙이 바뀌면 올린다 (파싱 결과 캐시 키에 포함)
+    _VERSION = "2"
+
+    @property
+    def version(self) -> str:
+        """파싱 결과 캐시 키에 쓰는 파서 버전."""
+        return f"qna-{self._VERSION}"
+
     def parse(self, raw: RawDocument) -> ParsedDocument:
         """
-        TSV 텍스트를 읽어 각 행을 ParsedBlock(meta=row)으로 담는다.
+        TSV 텍스트를 읽어 행들을 RowTable(컬럼 이름 + 행 값 튜플)로 담는다.
+        (행마다 ParsedBlock/dict를 만들지 않아 행 수가 많아도 메모리 사용량이 작다)
         Args:
             raw: 파싱할 RawDocument
         Returns:
@@ -25,26 +34,30 @@ class QnaParser(ParsePort):
         """
         try:
             text = raw.body_text or ""
-            reader = csv.DictReader(io.StringIO(text), delimiter="\t")
+            reader = csv.reader(io.StringIO(text), delimiter="\t")
             
             # 헤더 검증
-            cols = set(reader.fieldnames or [])
-            missing = REQUIRED_COLS - cols
+            columns: List[str] = next(reader, [])
+            missing = REQUIRED_COLS - set(columns)
             if missing:
                 raise ValueError(f"TSV missing columns: {sorted(missing)}")
 
-            blocks: List[ParsedBlock] = []
+            width = len(columns)
+            rows: List[Tuple[str | None, ...]] = []
             for row in reader:
-                # 공백 정리
-                clean: Dict[str, str] = {k: (v.strip() if isinstance(v, str) else v) for k, v in row.items()}
-                blocks.append(ParsedBlock(type="row", text=None, meta=clean))
+                if not row:
+                    continue
+                # 공백 정리, 모자란 컬럼은 None(넘치는 값은 버림)
+                values = [v.strip() for v in row[:width]]
+                values.extend([None] * (width - len(values)))
+                rows.append(tuple(values))
 
             return ParsedDocument(
                 source=raw.source,
                 title=None,
-                blocks=blocks,
+                table=RowTable(columns=columns, rows=rows),
                 lang=None,
-                meta={"rows": len(blocks), "columns": list(cols)},
+                meta={"rows": len(rows), "columns": columns},
                 collection=raw.collection
             )
         except ValueError as e:
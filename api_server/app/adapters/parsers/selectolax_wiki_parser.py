@@ -0,0 +1,152 @@
+"""
+selectolax(Lexbor) 엔진으로 WikiParser와 동일한 ParsedDocument를 만드는 고속 구현체.
+
+셀렉터 매칭은 Lexbor CSS 엔진에 맡기고, 트리는 한 번만 순회하면서
+WikiParser와 같은 블록 수집기(WikiBlockCollector)에 이벤트를 넘긴다.
+텍스트 규칙(공백 문자열 정규화, script/style/template/rt/rp 제외)은
+BeautifulSoup(lxml) 동작을 그대로 따른다.
+단, Lexbor는 HTML5 규칙대로 <tbody>가 없는 테이블에 tbody를 보충하므로
+원문에 tbody가 없는 infobox는 lxml 결과와 다를 수 있다. (위키 원문은 항상 tbody 포함)
+"""
+
+from __future__ import annotations
+from typing import List, Set
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from api_server.app.adapters.parsers.wiki_parser import WikiParser
+from api_server.app.adapters.parsers.wiki_blocks import WikiBlockCollector
+from api_server.app.domain.models import ParsedDocument, RawDocument
+from api_server.app.platform.exceptions import DomainError
+
+# BeautifulSoup이 공백 문자열로 취급하는 ASCII 공백
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+# 하위 텍스트가 get_text 결과에서 제외되는 태그(BeautifulSoup string container)
+_MUTED_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+# 공백 정규화를 하지 않는 태그
+_PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+
+
+def _normalize(text: str) -> str:
+    """
+    ASCII 공백으로만 이루어진 문자열은 개행 포함 여부에 따라 '\\n' 또는 ' ' 로 바꾼다.
+    """
+    if text.strip(_ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+def _node_strings(node: LexborNode, out: List[str], preserve: bool = False) -> None:
+    """
+    불필요 요소 제거 전 노드의 문자열을 수집한다. (title 추출용)
+    """
+    child = node.child
+    while child is not None:
+        if child.is_text_node:
+            text = child.text_content
+            if text:
+                out.append(text if preserve else _normalize(text))
+        elif child.is_element_node and child.tag not in _MUTED_TAGS:
+            _node_strings(child, out, preserve or child.tag in _PRESERVE_WHITESPACE_TAGS)
+        child = child.next
+
+
+class SelectolaxWikiParser(WikiParser):
+    """
+    WikiParser와 같은 셀렉터/추출 규칙을 사용하는 selectolax 기반 파서.
+    """
+
+    def parse(self, raw: RawDocument) -> ParsedDocument:
+        """
+        HTML 텍스트를 Lexbor로 파싱한 뒤 한 번의 순회로 필수 셀렉터 블록을 추출한다.
+
+        Args:
+            raw: RawDocument (HTML 텍스트)
+        Returns:
+            ParsedDocument (제목/언어/infobox/summary/paragraph/body 블록)
+        """
+        try:
+            tree = LexborHTMLParser(raw.body_text or "")
+            root = tree.root
+
+            # title/lang (불필요 요소 제거 전 기준)
+            title_tag = tree.css_first("h1") or tree.css_first("title")
+            title = None
+            if title_tag is not None:
+                strings: List[str] = []
+                _node_strings(title_tag, strings)
+                title = "".join(s for s in (t.strip() for t in strings) if s)
+            lang = (root.attributes.get("lang") if root is not None else None) or None
+
+            collector = self._new_collector()
+            if root is not None:
+                self._walk_node(
+                    root,
+                    collector,
+                    strip_ids=self._match_ids(tree, self._STRIP_SELECTORS),
+                    infobox_ids=self._match_ids(tree, [self._MANDATORY_SELECTOR_DICT["infobox"]]),
+                    content_root_ids=self._match_ids(tree, [self._MANDATORY_SELECTOR_DICT["body"]]),
+                )
+            blocks = collector.blocks()
+
+            return ParsedDocument(
+                source=raw.source,
+                title=title,
+                blocks=blocks,
+                lang=lang,
+                meta={"block_count": len(blocks)},
+                collection=raw.collection
+            )
+        except AttributeError as e:
+            raise DomainError(f"not found selector: {raw.source.uri} error={e}")
+        except Exception as e:
+            raise DomainError(f"failed to parse: {raw.source.uri} error={e}")
+
+    @staticmethod
+    def _match_ids(tree: LexborHTMLParser, selectors: List[str]) -> Set[int]:
+        """
+        셀렉터에 매칭되는 노드의 식별자 집합을 만든다.
+        (순회 중 노드 비교용, 트리를 수정하지 않는다)
+        """
+        ids: Set[int] = set()
+        for sel in selectors:
+            for node in tree.css(sel):
+                ids.add(node.mem_id)
+        return ids
+
+    def _walk_node(
+        self,
+        node: LexborNode,
+        collector: WikiBlockCollector,
+        strip_ids: Set[int],
+        infobox_ids: Set[int],
+        content_root_ids: Set[int],
+        muted: bool = False,
+        preserve: bool = False,
+    ) -> None:
+        """
+        node 자신과 하위 트리를 문서 순서로 순회하며 수집기에 이벤트를 넘긴다.
+        """
+        attrs = node.attributes
+        collector.start(
+            node.tag,
+            (attrs.get("class") or "").split(),
+            attrs,
+            infobox=node.mem_id in infobox_ids,
+            content_root=node.mem_id in content_root_ids,
+        )
+        muted = muted or node.tag in _MUTED_TAGS
+        preserve = preserve or node.tag in _PRESERVE_WHITESPACE_TAGS
+
+        child = node.child
+        while child is not None:
+            if child.is_text_node:
+                if not muted:
+                    text = child.text_content
+                    if text:
+                        collector.text(text if preserve else _normalize(text))
+            elif child.is_element_node and child.mem_id not in strip_ids:
+                self._walk_node(
+                    child, collector, strip_ids, infobox_ids, content_root_ids, muted, preserve
+                )
+            child = child.next
+        collector.end()
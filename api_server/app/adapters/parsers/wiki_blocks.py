@@ -0,0 +1,272 @@
+"""
+위키 HTML 트리 순회 이벤트(start/text/end)를 받아 infobox/summary/paragraph/body 블록을
+한 번에 만드는 수집기.
+
+파서 구현체(BeautifulSoup, selectolax)는 각자의 트리를 한 번 순회하면서
+요소 시작/문자열/요소 끝을 이 수집기에 알리기만 하고,
+블록 추출 규칙은 모두 여기에서 처리한다.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from api_server.app.domain.models import ParsedBlock
+
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+# body 블록 종류(호환 모드에서는 헤딩 -> 문단 -> 리스트 항목 -> 테이블 순으로 모은다)
+_BODY_HEADING, _BODY_P, _BODY_LI, _BODY_TABLE = 0, 1, 2, 3
+
+
+def class_matches(classes: List[str], selector: str) -> bool:
+    """
+    BeautifulSoup의 class_ 매칭 규칙을 따른다.
+    (클래스 하나와 일치하거나, 공백으로 이은 전체 class 값과 일치)
+    """
+    return selector in classes or " ".join(classes) == selector
+
+
+class _Frame:
+    """열려 있는 요소 하나의 상태 (자식 형제 규칙용 상태 포함)"""
+
+    __slots__ = (
+        "start", "order", "tag",
+        "in_content", "in_body", "in_list", "in_container", "in_block",
+        "body_kind", "is_infobox", "is_summary_table", "heading_index",
+        "collect_summary", "open_sections",
+    )
+
+    def __init__(self) -> None:
+        self.start = 0
+        self.order = -1
+        self.tag: Optional[str] = None
+        self.in_content = False
+        self.in_body = False
+        self.in_list = False
+        self.in_container = False
+        self.in_block = False
+        self.body_kind: Optional[int] = None
+        self.is_infobox = False
+        self.is_summary_table = False
+        self.heading_index: Optional[int] = None
+        # 자식 순회 중 상태: infobox 테이블 이후 summary 수집 여부, 열린 paragraph 섹션
+        self.collect_summary = False
+        self.open_sections: List[int] = []
+
+
+class WikiBlockCollector:
+    """
+    순회 이벤트로 WikiParser의 블록을 만든다.
+    요소 텍스트는 순회 중 쌓은 문자열 목록의 [시작, 끝) 구간으로 계산한다.
+
+    legacy_body_text=True 이면 기존 body 규칙(헤딩/문단/리스트/테이블을 종류별로 모두 수집,
+    중첩된 요소의 텍스트가 중복됨)을 그대로 따르고,
+    False 이면 가장 바깥 블록 요소만 문서 순서대로 한 번씩 수집한다.
+    """
+
+    def __init__(
+        self,
+        summary_selector: str,
+        paragraph_selector: str,
+        filter_heading: List[str],
+        legacy_body_text: bool = False,
+    ) -> None:
+        self._summary_selector = summary_selector
+        self._paragraph_selector = paragraph_selector
+        self._filter_heading = filter_heading
+        self._legacy_body_text = legacy_body_text
+
+        self._texts: List[str] = []
+        self._stack: List[_Frame] = [_Frame()]
+        self._order = 0
+
+        # infobox: 셀렉터에 처음 매칭된 요소
+        self._infobox_claimed = False
+        self._infobox_text: Optional[str] = None
+
+        # summary: 첫 컨테이너 div 안의 첫 infobox 테이블 이후 형제 p
+        self._summary_container_claimed = False
+        self._summary_table_claimed = False
+        self._summary_texts: Optional[List[str]] = None
+
+        # paragraph: 헤딩 div 순서대로 (h2 텍스트, 형제 p 텍스트 목록)
+        self._headings: List[Optional[str]] = []
+        self._sections: List[Optional[List[str]]] = []
+        self._pending_headings: List[int] = []
+
+        # body: (종류, 진입 순서, 텍스트, content root 하위 여부, body 하위 여부)
+        self._content_root_found = False
+        self._body_found = False
+        self._body_items: List[Tuple[int, int, str, bool, bool]] = []
+
+    def _joined(self, start: int, sep: str) -> str:
+        """get_text(sep, strip=True) 와 같은 결과를 만든다."""
+        return sep.join(s for s in (t.strip() for t in self._texts[start:]) if s)
+
+    def text(self, text: str) -> None:
+        """
+        요소 밖/안의 문자열 하나를 받는다. (제외 대상 문자열은 순회하는 쪽에서 거른다)
+        """
+        self._texts.append(text)
+
+    def start(
+        self,
+        tag: str,
+        classes: List[str],
+        attrs: Mapping[str, object],
+        infobox: bool = False,
+        content_root: bool = False,
+    ) -> None:
+        """
+        요소 시작을 받는다.
+
+        Args:
+            tag: 태그 이름
+            classes: class 목록
+            attrs: 속성
+            infobox: infobox 셀렉터 매칭 여부
+            content_root: body 셀렉터(#mw-content-text) 매칭 여부
+        """
+        parent = self._stack[-1]
+
+        # 다음 heading div 를 만나면 열린 paragraph 섹션을 닫는다
+        if tag == "div" and "mw-heading2" in classes:
+            parent.open_sections = []
+        if parent.collect_summary and tag == "meta" and attrs.get("property") == "mw:PageProp/toc":
+            parent.collect_summary = False
+
+        frame = _Frame()
+        frame.tag = tag
+        frame.start = len(self._texts)
+        frame.order = self._order
+        self._order += 1
+
+        # 진입 시점(문서 순서)에 선점해야 하는 요소들
+        is_content_root = content_root and not self._content_root_found
+        if is_content_root:
+            self._content_root_found = True
+        is_body = tag == "body" and not self._body_found
+        if is_body:
+            self._body_found = True
+        frame.in_content = parent.in_content or is_content_root
+        frame.in_body = parent.in_body or is_body
+
+        kind = None
+        if tag in _HEADING_TAGS:
+            kind = _BODY_HEADING
+        elif tag == "p":
+            kind = _BODY_P
+        elif tag == "li" and parent.in_list:
+            kind = _BODY_LI
+        elif tag == "table":
+            kind = _BODY_TABLE
+        if self._legacy_body_text or not parent.in_block:
+            frame.body_kind = kind
+        frame.in_block = parent.in_block or kind is not None
+        frame.in_list = parent.in_list or tag in ("ul", "ol")
+
+        if infobox and not self._infobox_claimed:
+            self._infobox_claimed = True
+            frame.is_infobox = True
+
+        is_container = (
+            not self._summary_container_claimed
+            and tag == "div"
+            and class_matches(classes, self._summary_selector)
+        )
+        if is_container:
+            self._summary_container_claimed = True
+        frame.in_container = parent.in_container or is_container
+        if (
+            parent.in_container
+            and not self._summary_table_claimed
+            and tag == "table"
+            and class_matches(classes, "infobox vcard")
+        ):
+            self._summary_table_claimed = True
+            self._summary_texts = []
+            frame.is_summary_table = True
+
+        if tag == "div" and class_matches(classes, self._paragraph_selector):
+            frame.heading_index = len(self._headings)
+            self._headings.append(None)
+            self._sections.append(None)
+            self._pending_headings.append(frame.heading_index)
+
+        self._stack.append(frame)
+
+    def end(self) -> None:
+        """
+        요소 끝을 받아 해당 요소의 텍스트를 블록 규칙에 반영한다.
+        """
+        frame = self._stack.pop()
+        parent = self._stack[-1]
+        tag = frame.tag
+
+        if frame.is_infobox:
+            self._infobox_text = self._joined(frame.start, " ")
+
+        if tag == "h2" and self._pending_headings:
+            heading = self._joined(frame.start, "")
+            for index in self._pending_headings:
+                self._headings[index] = heading
+            self._pending_headings = []
+
+        if frame.heading_index is not None:
+            heading = self._headings[frame.heading_index]
+            if heading is None:
+                raise AttributeError("paragraph heading div has no h2")
+            if heading not in self._filter_heading:
+                self._sections[frame.heading_index] = []
+                parent.open_sections.append(frame.heading_index)
+        elif tag == "p":
+            text = "".join(self._texts[frame.start:])
+            if parent.collect_summary and text:
+                self._summary_texts.append(text)
+            for index in parent.open_sections:
+                self._sections[index].append(text)
+
+        if frame.body_kind is not None and (frame.in_content or not self._content_root_found):
+            if frame.body_kind == _BODY_P:
+                text = "".join(self._texts[frame.start:])
+            else:
+                text = self._joined(frame.start, " ")
+            if text:
+                self._body_items.append((frame.body_kind, frame.order, text, frame.in_content, frame.in_body))
+
+        if frame.is_summary_table:
+            parent.collect_summary = True
+
+    def blocks(self) -> List[ParsedBlock]:
+        """
+        수집한 텍스트로 infobox/summary/paragraph/body 블록을 만든다.
+        """
+        blocks: List[ParsedBlock] = []
+        if self._infobox_text is not None:
+            blocks.append(ParsedBlock(type="infobox", text=self._infobox_text))
+        if self._summary_texts is not None:
+            blocks.append(ParsedBlock(type="summary", text=" ".join(self._summary_texts)))
+        blocks.append(ParsedBlock(type="paragraph", text=self._paragraph_text()))
+        blocks.append(ParsedBlock(type="body", text=self._body_text()))
+        return blocks
+
+    def _paragraph_text(self) -> str:
+        # 같은 헤딩이 여러 번 나오면 위치는 처음 것, 내용은 마지막 것을 사용한다
+        paragraph_result: Dict[str, str] = {}
+        for heading, section in zip(self._headings, self._sections):
+            if section is not None:
+                paragraph_result[heading] = " ".join(section)
+        return " ".join(paragraph_result.values())
+
+    def _body_text(self) -> str:
+        # content root(#mw-content-text) -> body -> 문서 전체 순으로 범위를 정한다
+        items = self._body_items
+        if self._content_root_found:
+            items = [item for item in items if item[3]]
+        elif self._body_found:
+            items = [item for item in items if item[4]]
+        if self._legacy_body_text:
+            items = sorted(items, key=lambda item: (item[0], item[1]))
+        else:
+            items = sorted(items, key=lambda item: item[1])
+        return " ".join(item[2] for item in items)
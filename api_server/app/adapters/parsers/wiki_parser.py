@@ -3,14 +3,60 @@ HTML에서 제목/문단/리스트/헤딩 등 콘텐츠를 추출하여 ParsedDo
 """
 
 from __future__ import annotations
-from typing import List
-from bs4 import BeautifulSoup
+from typing import FrozenSet, List, Optional, Set, Tuple
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+import hashlib
 import re
 
+from api_server.app.adapters.parsers.wiki_blocks import WikiBlockCollector
 from api_server.app.domain.ports import ParsePort
-from api_server.app.domain.models import ParsedDocument, ParsedBlock, RawDocument
+from api_server.app.domain.models import ParsedDocument, RawDocument
 from api_server.app.platform.exceptions import DomainError
 
+# tag, #id, .class 조합으로만 된 단순 셀렉터
+_SIMPLE_SELECTOR_RE = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*)?(?P<id>#[\w-]+)?(?P<classes>(?:\.[\w-]+)*)$")
+
+
+class _SelectorMatcher:
+    """
+    CSS 셀렉터 목록에 요소가 매칭되는지 순회 중에 판정한다.
+    단순 셀렉터(tag, #id, .class 조합)는 요소의 태그/속성을 직접 비교하고,
+    결합자 등이 포함된 셀렉터는 soupsieve로 미리 찾아 둔 요소 집합으로 판정한다.
+    """
+
+    def __init__(self, soup: BeautifulSoup, selectors: List[str]) -> None:
+        self._tags: Set[str] = set()
+        self._classes: Set[str] = set()
+        self._rules: List[Tuple[Optional[str], Optional[str], FrozenSet[str]]] = []
+        complex_selectors = []
+        for sel in selectors:
+            m = _SIMPLE_SELECTOR_RE.match(sel.strip())
+            if not m or not sel.strip():
+                complex_selectors.append(sel)
+                continue
+            tag = m.group("tag").lower() if m.group("tag") else None
+            id_ = m.group("id")[1:] if m.group("id") else None
+            classes = frozenset(c for c in m.group("classes").split(".") if c)
+            if tag and not id_ and not classes:
+                self._tags.add(tag)
+            elif not tag and not id_ and len(classes) == 1:
+                self._classes |= classes
+            else:
+                self._rules.append((tag, id_, classes))
+        self._ids: Set[int] = (
+            {id(el) for el in soup.select(", ".join(complex_selectors))} if complex_selectors else set()
+        )
+
+    def matches(self, el: Tag, classes: List[str]) -> bool:
+        if el.name in self._tags:
+            return True
+        if self._classes and not self._classes.isdisjoint(classes):
+            return True
+        for tag, id_, required in self._rules:
+            if (tag is None or tag == el.name) and (id_ is None or el.get("id") == id_) and required.issubset(classes):
+                return True
+        return id(el) in self._ids
+
 
 class WikiParser(ParsePort):
 
@@ -29,11 +75,42 @@ class WikiParser(ParsePort):
         "summary": "mw-content-ltr mw-parser-output"
     }
 
+    # paragraph 추출에서 제외할 h2 헤딩
+    _FILTER_HEADINGS = ['각주', '외부 링크', '같이 보기', '관련 서적', '목차']
+
+    # 추출 규칙이 바뀌면 올린다 (파싱 결과 캐시 키에 포함)
+    _VERSION = "2"
+
+    def __init__(self, legacy_body_text: bool = False) -> None:
+        """
+        Args:
+            legacy_body_text: True 이면 기존 body 규칙(헤딩/문단/리스트/테이블을 종류별로 모두 모으며
+                중첩된 요소의 텍스트가 중복됨)을 사용한다.
+                False 이면 가장 바깥 블록 요소의 텍스트만 문서 순서대로 한 번씩 모은다.
+        """
+        self._legacy_body_text = legacy_body_text
+
+    @property
+    def version(self) -> str:
+        """
+        파싱 결과 캐시 키에 쓰는 파서 버전.
+        셀렉터/옵션이 바뀌어도 키가 달라지도록 설정값의 해시를 붙인다.
+        (selectolax 구현체도 같은 결과를 내므로 같은 버전을 쓴다)
+        """
+        settings = repr((
+            self._STRIP_SELECTORS,
+            sorted(self._MANDATORY_SELECTOR_DICT.items()),
+            self._FILTER_HEADINGS,
+            self._legacy_body_text,
+        ))
+        return f"wiki-{self._VERSION}-{hashlib.sha256(settings.encode('utf-8')).hexdigest()[:12]}"
+
     def parse(self, raw: RawDocument) -> ParsedDocument:
         """
         HTML 텍스트를 읽어 필수 셀렉터 키를 추출하여 ParsedDocument로 변환한다.
         - 필수 셀렉터 키: infobox, paragraph, body, summary
-        - 본문에 필수 셀렉터 키가 없으면 본문 전체를 body로 추출
+        - 셀렉터 매칭은 한 번씩만 하고, 트리를 한 번 순회하면서 모든 블록을 수집한다.
+        - #mw-content-text 가 없으면 body(없으면 문서 전체)를 본문 범위로 사용한다.
 
         Args:
             raw: RawDocument (HTML 텍스트)
@@ -44,26 +121,20 @@ class WikiParser(ParsePort):
             html = raw.body_text or ""
             soup = BeautifulSoup(html, "lxml")
 
-            blocks: List[ParsedBlock] = []
-
             # title/lang
             title_tag = soup.select_one("h1") or soup.select_one("title")
             title = title_tag.get_text(strip=True) if title_tag else None
             lang = (soup.html.get("lang") if soup.html else None) or None
 
-            # 불필요한 요소 제거
-            self._delete_unnecessary_elements(soup)
-            
-            # 필수 추출 셀렉터 딕셔너리에 따라 추출
-            blocks.append(self._parse_infobox_from(soup, self._MANDATORY_SELECTOR_DICT["infobox"]))
-            blocks.append(self._parse_summary_from(soup, self._MANDATORY_SELECTOR_DICT["summary"]))
-            blocks.append(self._parse_paragraph_from(soup, self._MANDATORY_SELECTOR_DICT["paragraph"]))
-            blocks.append(self._parse_body_from(soup, self._MANDATORY_SELECTOR_DICT["body"]))
-            
-            # 필수 셀렉터 키가 없으면 본문 전체를 body로 추출
-            self._parse_body_if_blocks_is_empty(soup, blocks)
-            blocks = [block for block in blocks if block is not None]
-            
+            # 불필요 요소는 제거하지 않고 순회에서 건너뛴다
+            strip = _SelectorMatcher(soup, self._STRIP_SELECTORS)
+            infobox = _SelectorMatcher(soup, [self._MANDATORY_SELECTOR_DICT["infobox"]])
+            content_root = _SelectorMatcher(soup, [self._MANDATORY_SELECTOR_DICT["body"]])
+
+            collector = self._new_collector()
+            self._walk(soup, collector, strip, infobox, content_root)
+            blocks = collector.blocks()
+
             return ParsedDocument(
                 source=raw.source,
                 title=title,
@@ -77,163 +148,42 @@ class WikiParser(ParsePort):
         except Exception as e:
             raise DomainError(f"failed to parse: {raw.source.uri} error={e}")
 
-    def _delete_unnecessary_elements(self, soup: BeautifulSoup) -> None:
+    def _new_collector(self) -> WikiBlockCollector:
         """
-            불필요한 요소를 제거한다.
-        Args:
-            soup: BeautifulSoup
+        필수 셀렉터 설정으로 블록 수집기를 만든다.
         """
-        for sel in self._STRIP_SELECTORS:
-            for el in soup.select(sel):
-                el.decompose()
-
-    def _parse_body_if_blocks_is_empty(
-        self, 
-        soup: BeautifulSoup,
-        blocks: List[ParsedBlock]
+        return WikiBlockCollector(
+            summary_selector=self._MANDATORY_SELECTOR_DICT["summary"],
+            paragraph_selector=self._MANDATORY_SELECTOR_DICT["paragraph"],
+            filter_heading=self._FILTER_HEADINGS,
+            legacy_body_text=self._legacy_body_text,
+        )
+
+    def _walk(
+        self,
+        node: Tag,
+        collector: WikiBlockCollector,
+        strip: _SelectorMatcher,
+        infobox: _SelectorMatcher,
+        content_root: _SelectorMatcher,
     ) -> None:
         """
-            아무것도 못 뽑았으면 전체 텍스트를 body로 추가한다.
-        Args:
-            soup: BeautifulSoup
-            blocks: List[ParsedBlock]
-        """
-        if not blocks:
-            page_text = soup.get_text(" ", strip=True)
-            if page_text:
-                blocks.append(ParsedBlock(type="body", text=page_text))
-
-    def _parse_body_from(
-        self, 
-        soup: BeautifulSoup, 
-        selector: str
-    ) -> ParsedBlock:
+        트리를 문서 순서로 순회하며 수집기에 요소 시작/문자열/요소 끝을 알린다.
+        get_text와 같이 NavigableString/CData 만 문자열로 넘긴다. (주석, script 등 제외)
         """
-        본문에서 해딩/문단/리스트/테이블 텍스트를 추출하여 body로 추가한다.
-
-        Args:
-            soup: BeautifulSoup
-            selector: str
-        Returns:
-            ParsedBlock
-        """
-        contents = []
-        content_root: Tag = soup.select_one("#mw-content-text") or soup.body or soup
-        for h in content_root.select("h1, h2, h3, h4, h5, h6"):
-            text = h.get_text(" ", strip=True)
-            if text:
-                contents.append(text)
-
-        # 문단
-        for p in content_root.select("p"):
-            text = p.get_text()
-            if text:
-                contents.append(text)
-
-        # 리스트 항목도 문단으로
-        for li in content_root.select("ul li, ol li"):
-            text = li.get_text(" ", strip=True)
-            if text:
-                contents.append(text)
-
-        # 테이블 요약 텍스트
-        for cap in content_root.select("table"):
-            text = cap.get_text(" ", strip=True)
-            if text:
-                contents.append(text)
-        body_text = " ".join(contents)
-        return ParsedBlock(type="body", text=body_text)
-
-    def _parse_infobox_from(
-        self, 
-        soup: BeautifulSoup, 
-        selector: str
-    ) -> ParsedBlock:
-        """
-        infobox 텍스트를 추출하여 infobox로 추가한다.
-        지정된 셀렉터에서 tbody 텍스트를 가져온다.
-
-        Args:
-            soup: BeautifulSoup
-            selector: str
-        Returns:
-            ParsedBlock
-        """
-        target = soup.select_one(selector)
-        if target:
-            return ParsedBlock(type="infobox", text=target.get_text(" ", strip=True))
-        return None
-
-    def _parse_summary_from(
-        self, 
-        soup: BeautifulSoup, 
-        selector: str
-    ) -> ParsedBlock:
-        """
-        본문 최상단의 요약 텍스트를 추출하여 summary로 추가한다.
-
-        Args:
-            soup: BeautifulSoup
-            selector: str
-        Returns:
-            List[ParsedBlock]
-        """
-        # 요약 영역 셀렉터 추출
-        summary_result = []
-        container = soup.find("div", class_=selector)
-        if not container:
-            return None
-        table = container.find("table", class_="infobox vcard")
-        if not table:
-            return None
-
-        # 요약 텍스트 추출
-        for sibling in table.find_next_siblings():
-            # meta 태그 만나면 멈춤
-            if sibling.name == "meta" and sibling.get("property") == "mw:PageProp/toc":
-                break
-            # p 태그만 추출
-            if sibling.name == "p":
-                text = sibling.get_text()
-                if text:
-                    summary_result.append(text)
-        
-        summary_text = " ".join(summary_result)
-        return ParsedBlock(type="summary", text=summary_text)
-
-    def _parse_paragraph_from(
-        self, 
-        soup: BeautifulSoup, 
-        selector: str, 
-        filter_heading: list[str] = ['각주', '외부 링크', '같이 보기', '관련 서적', '목차']
-    ) -> ParsedBlock:
-        """
-        본문에서 헤딩/문단 텍스트를 추출하여 paragraph로 추가한다.
-
-        Args:
-            soup: BeautifulSoup
-            selector: str
-        Returns:
-            ParsedBlock
-        """
-        # paragraph 선택 선택자 추출
-        paragraph_result = {}
-        # div.mw-heading.mw-heading2 각각 순회
-        for div in soup.find_all("div", class_=selector):
-            # div 안의 h2 텍스트를 key로 사용
-            heading = div.find("h2").get_text("", strip=True)
-            if heading in filter_heading:
-                continue
-            body = []
-            # div 이후의 형제 태그들을 탐색
-            for sibling in div.find_next_siblings():
-                # 다음 heading div 만나면 멈춤
-                if sibling.name == "div" and "mw-heading2" in sibling.get("class", []):
-                    break
-                # p 태그면 본문 수집
-                if sibling.name == "p":
-                    body.append(sibling.get_text())
-            paragraph_result[heading] = " ".join(body)
-        
-        paragraph_text = " ".join(paragraph_result.values())
-        return ParsedBlock(type="paragraph", text=paragraph_text)
\ No newline at end of file
+        for child in node.contents:
+            if isinstance(child, Tag):
+                classes = child.get("class") or []
+                if strip.matches(child, classes):
+                    continue
+                collector.start(
+                    child.name,
+                    classes,
+                    child.attrs,
+                    infobox=infobox.matches(child, classes),
+                    content_root=content_root.matches(child, classes),
+                )
+                self._walk(child, collector, strip, infobox, content_root)
+                collector.end()
+            elif type(child) in (NavigableString, CData):
+                collector.text(child)
@@ -0,0 +1,97 @@
+"""
+백그라운드 작업을 프로세스 메모리에 저장하는 대기열 구현체.
+
+- 작업은 최대 max_jobs개까지 보관하고, 넘으면 끝난 작업부터 오래된 순으로 삭제
+- 같은 프로세스 안에서만 공유되므로 여러 워커로 실행할 때는 Redis 구현체를 사용한다
+- 작업과 워커가 같은 프로세스에 있으므로 임대(heartbeat/ack/reclaim_stale)는 관리하지 않는다
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+import queue
+import threading
+
+from api_server.app.domain.models import Job, JobProgress, JobStatus
+from api_server.app.domain.ports import JobQueuePort
+
+
+class MemoryJobQueue(JobQueuePort):
+
+    def __init__(self, max_jobs: int = 1000) -> None:
+        """
+        Args:
+            max_jobs: 보관할 최대 작업 수
+        """
+        self._max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._progress: Dict[str, Dict[str, int]] = {}
+        self._cancel_requested: Set[str] = set()
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    def save(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = job.model_copy()
+            self._progress.setdefault(job.job_id, {})
+            self._evict()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return job.model_copy(update={"progress": JobProgress(**self._progress.get(job_id, {}))})
+
+    def transition(self, job_id: str, expected: JobStatus, changes: Dict[str, Any]) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != expected:
+                return None
+            job = job.model_copy(update=changes)
+            self._jobs[job_id] = job
+            return job.model_copy()
+
+    def enqueue(self, job_id: str) -> None:
+        self._queue.put(job_id)
+
+    def dequeue(self, timeout: float) -> Optional[str]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def heartbeat(self, job_id: str) -> None:
+        pass
+
+    def ack(self, job_id: str) -> None:
+        pass
+
+    def reclaim_stale(self) -> List[str]:
+        return []
+
+    def add_progress(self, job_id: str, counts: Dict[str, int]) -> None:
+        with self._lock:
+            progress = self._progress.setdefault(job_id, {})
+            for stage, n in counts.items():
+                progress[stage] = progress.get(stage, 0) + n
+
+    def request_cancel(self, job_id: str) -> None:
+        with self._lock:
+            self._cancel_requested.add(job_id)
+
+    def cancel_requested(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._cancel_requested
+
+    def _evict(self) -> None:
+        """
+        보관 한도를 넘으면 끝난 작업을 오래된 순으로 삭제한다(진행 중/대기 작업은 남긴다).
+        """
+        overflow = len(self._jobs) - self._max_jobs
+        if overflow <= 0:
+            return
+        for job_id in [j.job_id for j in self._jobs.values() if j.finished][:overflow]:
+            del self._jobs[job_id]
+            self._progress.pop(job_id, None)
+            self._cancel_requested.discard(job_id)
@@ -0,0 +1,141 @@
+"""
+백그라운드 작업을 Redis에 저장하는 대기열 구현체(여러 API 워커/서버가 작업을 나눠 처리).
+
+- 작업: {prefix}:job:{id} 에 JSON(ttl_seconds 만료). 상태 전이(transition)는 WATCH/MULTI로 원자적으로 바꾼다
+- 진행 건수: {prefix}:progress:{id} 해시(HINCRBY로 누적, 여러 스레드/프로세스에서 안전)
+- 취소 요청: {prefix}:cancel:{id} 키 존재 여부
+- 대기열: {prefix}:queue 리스트(LPUSH / BLMOVE). 한 작업은 한 워커만 꺼낸다
+- 처리 중: 꺼낸 작업은 {prefix}:processing 리스트로 옮기고, 임대 기한을 {prefix}:leases 정렬 집합에
+  기록한다. 실행 중에는 heartbeat로 기한을 연장하고 끝나면 ack로 지운다.
+  기한이 지난 작업(워커 프로세스가 죽음)은 reclaim_stale로 회수해 다시 대기열에 넣을 수 있다
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+import time
+
+from redis import Redis
+from redis.exceptions import WatchError
+
+from api_server.app.domain.models import Job, JobProgress, JobStatus
+from api_server.app.domain.ports import JobQueuePort
+
+
+class RedisJobQueue(JobQueuePort):
+
+    def __init__(
+        self,
+        client: Redis,
+        prefix: str = "jobs",
+        ttl_seconds: int = 86400,
+        lease_seconds: float = 60.0) -> None:
+        """
+        Args:
+            client: Redis 클라이언트(BLMOVE 대기 시간보다 긴 소켓 타임아웃 필요)
+            prefix: 키 접두사
+            ttl_seconds: 작업/진행 건수 보관 시간(초)
+            lease_seconds: 꺼낸 작업의 임대 기한(초). heartbeat 없이 이 시간이 지나면 회수 대상
+        """
+        self._client = client
+        self._prefix = prefix
+        self._ttl_seconds = ttl_seconds
+        self._lease_seconds = lease_seconds
+        self._queue_key = f"{prefix}:queue"
+        self._processing_key = f"{prefix}:processing"
+        self._leases_key = f"{prefix}:leases"
+
+    def _key(self, kind: str, job_id: str) -> str:
+        return f"{self._prefix}:{kind}:{job_id}"
+
+    def save(self, job: Job) -> None:
+        self._client.set(
+            self._key("job", job.job_id),
+            job.model_dump_json(exclude={"progress"}),
+            ex=self._ttl_seconds)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        data = self._client.get(self._key("job", job_id))
+        if data is None:
+            return None
+        job = Job.model_validate_json(data)
+        counts = self._client.hgetall(self._key("progress", job_id))
+        job.progress = JobProgress(**{_text(k): int(v) for k, v in counts.items()})
+        return job
+
+    def transition(self, job_id: str, expected: JobStatus, changes: Dict[str, Any]) -> Optional[Job]:
+        key = self._key("job", job_id)
+        with self._client.pipeline() as pipe:
+            while True:
+                try:
+                    # 읽은 뒤 EXEC 전에 다른 클라이언트가 작업을 바꾸면 EXEC가 실패하고 다시 읽는다
+                    pipe.watch(key)
+                    data = pipe.get(key)
+                    if data is None:
+                        return None
+                    job = Job.model_validate_json(data)
+                    if job.status != expected:
+                        return None
+                    job = job.model_copy(update=changes)
+                    pipe.multi()
+                    pipe.set(key, job.model_dump_json(exclude={"progress"}), ex=self._ttl_seconds)
+                    pipe.execute()
+                    return job
+                except WatchError:
+                    continue
+
+    def enqueue(self, job_id: str) -> None:
+        self._client.lpush(self._queue_key, job_id)
+
+    def dequeue(self, timeout: float) -> Optional[str]:
+        # 꺼내면서 처리 중 목록으로 옮긴다(워커가 죽어도 작업이 사라지지 않음)
+        # 타임아웃 0은 무한 대기이므로 최소 1초
+        item = self._client.blmove(
+            self._queue_key, self._processing_key, max(int(timeout), 1), src="RIGHT", dest="LEFT")
+        if item is None:
+            return None
+        job_id = _text(item)
+        self._client.zadd(self._leases_key, {job_id: time.time() + self._lease_seconds})
+        return job_id
+
+    def heartbeat(self, job_id: str) -> None:
+        # 이미 회수/완료된 작업의 기한은 다시 만들지 않는다
+        self._client.zadd(self._leases_key, {job_id: time.time() + self._lease_seconds}, xx=True)
+
+    def ack(self, job_id: str) -> None:
+        pipe = self._client.pipeline()
+        pipe.lrem(self._processing_key, 0, job_id)
+        pipe.zrem(self._leases_key, job_id)
+        pipe.execute()
+
+    def reclaim_stale(self) -> List[str]:
+        now = time.time()
+        # 처리 중 목록으로 옮긴 직후 기한을 기록하기 전에 죽은 작업도 기한을 매겨 다음 회수 대상으로 둔다
+        for item in self._client.lrange(self._processing_key, 0, -1):
+            self._client.zadd(self._leases_key, {_text(item): now + self._lease_seconds}, nx=True)
+
+        reclaimed: List[str] = []
+        for item in self._client.zrangebyscore(self._leases_key, "-inf", now):
+            job_id = _text(item)
+            # 여러 워커가 동시에 회수해도 ZREM에 성공한 한 워커만 가져간다
+            if self._client.zrem(self._leases_key, job_id):
+                self._client.lrem(self._processing_key, 0, job_id)
+                reclaimed.append(job_id)
+        return reclaimed
+
+    def add_progress(self, job_id: str, counts: Dict[str, int]) -> None:
+        key = self._key("progress", job_id)
+        pipe = self._client.pipeline()
+        for stage, n in counts.items():
+            pipe.hincrby(key, stage, n)
+        pipe.expire(key, self._ttl_seconds)
+        pipe.execute()
+
+    def request_cancel(self, job_id: str) -> None:
+        self._client.set(self._key("cancel", job_id), 1, ex=self._ttl_seconds)
+
+    def cancel_requested(self, job_id: str) -> bool:
+        return bool(self._client.exists(self._key("cancel", job_id)))
+
+
+def _text(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
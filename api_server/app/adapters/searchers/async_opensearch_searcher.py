@@ -0,0 +1,113 @@
+"""
+AsyncOpenSearch 클라이언트로 검색하는 AsyncSearchPort 구현체.
+쿼리 바디/검색 템플릿과 query_mode는 동기 검색기(OpenSearchSearcher)와 같다.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional
+from opensearchpy import AsyncOpenSearch
+from opensearchpy.exceptions import NotFoundError
+from api_server.app.domain.models import SearchOptions
+from api_server.app.domain.ports import AsyncSearchPort
+from api_server.app.adapters.searchers.opensearch_searcher import (
+    QUERY_MODES, build_msearch_body, build_msearch_template_body, default_search_template_id,
+    is_missing_template, render_search_body, template_params
+)
+from api_server.app.platform.exceptions import DomainError
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOpenSearchSearcher(AsyncSearchPort):
+
+    def __init__(
+        self,
+        client: AsyncOpenSearch,
+        alias_name: str,
+        query_mode: str = "compiled",
+        template_id: Optional[str] = None) -> None:
+        """
+        Args:
+            client: AsyncOpenSearch 클라이언트
+            alias_name: 검색용 alias 이름
+            query_mode: compiled(미리 직렬화한 바디) | template(저장된 검색 템플릿 호출)
+            template_id: 검색 템플릿 id(없으면 내장 템플릿 id)
+        """
+        if query_mode not in QUERY_MODES:
+            raise ValueError(f"unsupported search query mode: {query_mode}")
+        self.client = client
+        self.alias_name = alias_name
+        self.query_mode = query_mode
+        self.template_id = template_id or default_search_template_id()
+
+    async def search(
+        self,
+        query: str,
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None) -> Dict[str, Any]:
+        """
+        Opensearch에 비동기로 검색을 수행하여 결과를 반환한다.
+
+        Args:
+            query (str): 검색어
+            size (int): 가져올 문서 개수 (기본 3)
+            explain (bool): 검색 결과 설명 포함 여부 (기본 False)
+            options (SearchOptions | None): _source 필드 선택/하이라이트 (None이면 _source 전체)
+        Returns:
+            Dict[str, Any]: 검색 결과(hits, total, took, timed_out)
+        """
+        try:
+            if self.query_mode == "template":
+                try:
+                    body = {"id": self.template_id, "params": template_params(query, size, explain, options)}
+                    return await self.client.search_template(index=self.alias_name, body=body)
+                except NotFoundError as e:
+                    logger.warning("search: template %s not found, use compiled body: %s", self.template_id, e)
+            body = render_search_body(query, size=size, explain=explain, options=options)
+            return await self.client.search(index=self.alias_name, body=body)
+        except AttributeError as e:
+            raise DomainError(f"invalid client: {query} error={e}")
+        except Exception as e:
+            raise DomainError(f"failed to search: {query} error={e}")
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None) -> List[Dict[str, Any]]:
+        """
+        여러 쿼리를 msearch 한 번으로 비동기 검색한다.
+
+        Args:
+            queries (List[str]): 검색어 목록
+            size (int): 쿼리별 가져올 문서 개수
+            explain (bool): 검색 결과 설명 포함 여부
+            options (SearchOptions | None): _source 필드 선택/하이라이트
+        Returns:
+            List[Dict[str, Any]]: 쿼리 순서대로의 검색 결과(실패한 쿼리는 error/status 항목)
+        """
+        if not queries:
+            return []
+        try:
+            if self.query_mode == "template":
+                body = build_msearch_template_body(self.template_id, queries, size, explain, options)
+                responses = (await self.client.msearch_template(index=self.alias_name, body=body))["responses"]
+                missing = [i for i, r in enumerate(responses) if is_missing_template(r)]
+                if missing:
+                    logger.warning("search_batch: template %s not found, use compiled body", self.template_id)
+                    body = build_msearch_body([queries[i] for i in missing], size, explain, options)
+                    fetched = (await self.client.msearch(index=self.alias_name, body=body))["responses"]
+                    for i, response in zip(missing, fetched):
+                        responses[i] = response
+                return responses
+            body = build_msearch_body(queries, size=size, explain=explain, options=options)
+            response = await self.client.msearch(index=self.alias_name, body=body)
+            return response["responses"]
+        except AttributeError as e:
+            raise DomainError(f"invalid client: batch size={len(queries)} error={e}")
+        except Exception as e:
+            raise DomainError(f"failed to search: batch size={len(queries)} error={e}")
@@ -0,0 +1,167 @@
+"""
+다른 SearchPort(AsyncSearchPort) 구현체를 감싸 같은 검색 조건의 결과를 재사용하는 구현체.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
+import unicodedata
+
+from api_server.app.domain.models import SearchOptions
+from api_server.app.domain.ports import SearchPort, AsyncSearchPort, SearchCachePort, AsyncSearchCachePort
+
+
+class CachedSearcher(SearchPort):
+
+    def __init__(self, searcher: SearchPort, cache: SearchCachePort) -> None:
+        """
+        Args:
+            searcher: 실제 검색을 수행할 검색기
+            cache: 검색 결과 캐시
+        """
+        self._searcher = searcher
+        self._cache = cache
+
+    def search(
+        self,
+        query: str,
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None) -> Dict[str, Any]:
+        """
+        같은 세대에서 같은 조건(정규화된 쿼리, size, explain, options)으로 검색한 결과가 있으면 재사용한다.
+        세대는 검색 전에 읽으므로, 검색 중에 alias가 회전되면 결과는 이전 세대 키로 저장되어 다시 쓰이지 않는다.
+
+        Args:
+            query (str): 검색어
+            size (int): 가져올 문서 개수
+            explain (bool): 검색 결과 설명 포함 여부
+            options (SearchOptions | None): _source 필드 선택/하이라이트
+        Returns:
+            Dict[str, Any]: 검색 결과
+        """
+        key = self.cache_key(query, size, explain, self._cache.generation(), options)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._searcher.search(query, size, explain, options)
+        self._cache.put(key, result)
+        return result
+
+    def search_batch(
+        self,
+        queries: List[str],
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None) -> List[Dict[str, Any]]:
+        """
+        캐시에 있는 쿼리는 캐시로 채우고, 나머지만 모아 한 번의 msearch로 검색한다.
+        실패한 쿼리(error 항목)는 저장하지 않는다.
+        """
+        keys = _batch_keys(queries, size, explain, self._cache.generation(), options)
+        results = [self._cache.get(key) for key in keys]
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            fetched = self._searcher.search_batch([queries[i] for i in missing], size, explain, options)
+            for key, result in _fill_batch(keys, results, missing, fetched):
+                self._cache.put(key, result)
+        return results
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        유니코드 NFC 정규화 후 앞뒤 공백 제거, 연속 공백을 하나로 줄인다.
+        """
+        return " ".join(unicodedata.normalize("NFC", query).split())
+
+    @staticmethod
+    def cache_key(
+        query: str,
+        size: int,
+        explain: bool,
+        generation: int,
+        options: Optional[SearchOptions] = None) -> str:
+        """
+        {세대}:{sha1(정규화 쿼리, size, explain[, options])} 키를 만든다.
+        """
+        parts: List[Any] = [CachedSearcher.normalize_query(query), size, explain]
+        if options is not None:
+            parts.append(options.model_dump(mode="json"))
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return f"{generation}:{hashlib.sha1(payload.encode('utf-8')).hexdigest()}"
+
+
+class AsyncCachedSearcher(AsyncSearchPort):
+    """
+    CachedSearcher의 비동기 버전. 키 규칙/세대 처리는 같다.
+    캐시 조회/저장도 await하므로 redis 왕복 동안 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(self, searcher: AsyncSearchPort, cache: AsyncSearchCachePort) -> None:
+        """
+        Args:
+            searcher: 실제 검색을 수행할 비동기 검색기
+            cache: 검색 결과 캐시
+        """
+        self._searcher = searcher
+        self._cache = cache
+
+    async def search(
+        self,
+        query: str,
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None) -> Dict[str, Any]:
+        key = CachedSearcher.cache_key(query, size, explain, await self._cache.generation(), options)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await self._searcher.search(query, size, explain, options)
+        await self._cache.put(key, result)
+        return result
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None) -> List[Dict[str, Any]]:
+        keys = _batch_keys(queries, size, explain, await self._cache.generation(), options)
+        results = [await self._cache.get(key) for key in keys]
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            fetched = await self._searcher.search_batch([queries[i] for i in missing], size, explain, options)
+            for key, result in _fill_batch(keys, results, missing, fetched):
+                await self._cache.put(key, result)
+        return results
+
+
+def _batch_keys(
+    queries: List[str],
+    size: int,
+    explain: bool,
+    generation: int,
+    options: Optional[SearchOptions]) -> List[str]:
+    """
+    쿼리별 캐시 키 목록을 만든다.
+    """
+    return [CachedSearcher.cache_key(q, size, explain, generation, options) for q in queries]
+
+
+def _fill_batch(
+    keys: List[str],
+    results: List[Optional[Dict[str, Any]]],
+    missing: List[int],
+    fetched: List[Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    검색해 온 결과를 제자리에 채우고, 캐시에 저장할 성공한 결과의 (키, 결과) 목록을 반환한다.
+    """
+    to_store: List[Tuple[str, Dict[str, Any]]] = []
+    for i, result in zip(missing, fetched):
+        results[i] = result
+        if "error" not in result:
+            to_store.append((keys[i], result))
+    return to_store
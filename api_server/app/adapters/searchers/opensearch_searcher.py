@@ -1,23 +1,332 @@
 """
 사용자 검색 쿼리를 받아 검색하는 SearchPort 구현체.
+
+쿼리 바디 전달 방식(query_mode)
+- compiled : 검색 조건(size/explain/options)별로 직렬화해 둔 바디에 검색어만 끼워 보낸다(기본)
+- template : OpenSearch에 저장한 mustache 검색 템플릿을 id로 호출하고 검색어/size 등 파라미터만 보낸다
+             (템플릿을 새 id로 저장하고 SEARCH_TEMPLATE_ID만 바꾸면 코드 배포 없이 검색 전략 교체)
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
-import os
-from typing import Any, Dict
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 from opensearchpy import OpenSearch
+from opensearchpy.exceptions import NotFoundError
+from api_server.app.domain.models import SearchOptions
 from api_server.app.domain.ports import SearchPort
 from api_server.app.platform.exceptions import DomainError
 
+logger = logging.getLogger(__name__)
+
+QUERY_MODES = ("compiled", "template")
+
+# 바디를 미리 직렬화할 때 검색어/size/explain 자리에 넣는 표식
+_SLOT = "\u0000{}\u0000"
+
+
+def build_search_query(
+    query: str, 
+    size: int = 3, 
+    explain: bool = False, 
+    min_score: float = 5,
+    options: Optional[SearchOptions] = None) -> Dict[str, Any]:
+    """
+    검색 쿼리 바디를 구성한다(동기/비동기 검색기 공용).
+
+    Args:
+        query (str): 검색어
+        size (int): 가져올 문서 개수 (기본 3)
+        explain (bool): 검색 결과 설명 포함 여부 (기본 False)
+        min_score (float): 최소 점수 (기본 5)
+        options (SearchOptions | None): _source 필드 선택/하이라이트 (None이면 _source 전체, 하이라이트 없음)
+    Returns:
+        Dict[str, Any]: 검색 쿼리 바디
+    """
+    body = {
+        "from": 0,
+        "size": size,
+        "explain": explain,
+        "min_score": min_score,
+        "query": {
+            "function_score": {
+                "query": {
+                    "bool": {
+                        "filter": {
+                            "bool": {
+                                "must": [
+                                    {
+                                        "term": {
+                                            "published": True
+                                        }
+                                    }
+                                ]
+                            }
+                        },
+                        "should": [
+                            {
+                                "multi_match": {
+                                    "query": query,
+                                    "fields": ["title", "title.keyword"],
+                                    "type": "best_fields",
+                                    "operator": "or",
+                                    "boost": 4
+                                }
+                            },
+                            {
+                                "multi_match": {
+                                    "query": query,
+                                    "fields": ["question", "answer"],
+                                    "type": "best_fields",
+                                    "operator": "or",
+                                    "boost": 2.5
+                                }
+                            },
+                            {
+                                "match": {
+                                    "infobox": {
+                                        "query": query,
+                                        "boost": 2
+                                    }
+                                }
+                            },
+                            {
+                                "match": {
+                                    "paragraph": {
+                                        "query": query,
+                                        "boost": 2
+                                    }
+                                }
+                            },
+                            {
+                                "multi_match": {
+                                    "query": query,
+                                    "fields": ["summary", "infobox"],
+                                    "type": "best_fields",
+                                    "operator": "or",
+                                    "boost": 2
+                                }
+                            }
+                        ]
+                    }
+                },
+                "functions": [
+                    {
+                        "field_value_factor": {
+                            "field": "features.body",
+                            "factor": 1.5,
+                            "missing": 1
+                        }
+                    },
+                    {
+                        "field_value_factor": {
+                            "field": "features.summary",
+                            "factor": 3,
+                            "missing": 1
+                        }
+                    },
+                    {
+                        "field_value_factor": {
+                            "field": "features.infobox",
+                            "factor": 8,
+                            "missing": 3
+                        }
+                    }
+                ],
+                "score_mode": "avg",
+                "boost_mode": "sum"
+            }
+        }
+    }
+    if options is not None:
+        body.update(search_options_body(options))
+    return body
+
+
+def build_msearch_body(
+    queries: List[str],
+    size: int = 3,
+    explain: bool = False,
+    options: Optional[SearchOptions] = None) -> List[Union[Dict[str, Any], str]]:
+    """
+    msearch 요청 바디(헤더/쿼리 쌍 목록)를 구성한다. 인덱스는 요청 경로의 alias를 사용한다.
+
+    Args:
+        queries (List[str]): 검색어 목록
+        size (int): 쿼리별 가져올 문서 개수
+        explain (bool): 검색 결과 설명 포함 여부
+        options (SearchOptions | None): _source 필드 선택/하이라이트
+    Returns:
+        List[Union[Dict[str, Any], str]]: msearch 바디(헤더 dict, 직렬화된 쿼리 바디 str)
+    """
+    body: List[Union[Dict[str, Any], str]] = []
+    for query in queries:
+        body.append({})
+        body.append(render_search_body(query, size=size, explain=explain, options=options))
+    return body
+
+
+def search_options_body(options: SearchOptions) -> Dict[str, Any]:
+    """
+    _source 필터와 하이라이트 설정(쿼리 바디에 더할 항목)을 만든다.
+    하이라이트는 검색 필드가 아닌 body에도 검색어 조각이 나오도록 require_field_match=false로 요청한다.
+    """
+    extra: Dict[str, Any] = {}
+    source: Dict[str, Any] = {}
+    if options.source_includes is not None:
+        source["includes"] = options.source_includes
+    if options.source_excludes:
+        source["excludes"] = options.source_excludes
+    if source:
+        extra["_source"] = source
+    if options.highlight_fields:
+        extra["highlight"] = {
+            "require_field_match": False,
+            "fragment_size": options.fragment_size,
+            "number_of_fragments": options.number_of_fragments,
+            "fields": {field: {} for field in options.highlight_fields},
+        }
+    return extra
+
+
+def render_search_body(
+    query: str,
+    size: int = 3,
+    explain: bool = False,
+    options: Optional[SearchOptions] = None) -> str:
+    """
+    build_search_query와 같은 쿼리 바디를 JSON 문자열로 만든다.
+    검색 조건(size/explain/options)별로 한 번 직렬화해 둔 바디에 검색어만 끼우므로
+    요청마다 중첩 dict를 만들고 직렬화하지 않는다(클라이언트는 문자열 바디를 그대로 보낸다).
+    """
+    parts = _compiled_parts(size, explain, options.model_dump_json() if options is not None else None)
+    return json.dumps(query, ensure_ascii=False).join(parts)
+
+
+@lru_cache(maxsize=256)
+def _compiled_parts(size: int, explain: bool, options_json: Optional[str]) -> Tuple[str, ...]:
+    options = SearchOptions.model_validate_json(options_json) if options_json is not None else None
+    body = build_search_query(_SLOT.format("query"), size=size, explain=explain, options=options)
+    return tuple(_dumps(body).split(json.dumps(_SLOT.format("query"))))
+
+
+# ================= stored search template =================
+@lru_cache(maxsize=1)
+def search_template_source() -> str:
+    """
+    build_search_query를 mustache 검색 템플릿으로 만든다(파라미터: query, size, explain,
+    source_filter/highlight는 있을 때만 {{#toJson}}으로 추가).
+    """
+    body = build_search_query(_SLOT.format("query"), size=_SLOT.format("size"), explain=_SLOT.format("explain"))
+    source = _dumps(body)
+    source = source.replace(json.dumps(_SLOT.format("query")), '"{{query}}"')
+    for name in ("size", "explain"):
+        source = source.replace(json.dumps(_SLOT.format(name)), "{{%s}}" % name)
+    return source[:-1] + (
+        '{{#source_filter}},"_source":{{#toJson}}source_filter{{/toJson}}{{/source_filter}}'
+        '{{#highlight}},"highlight":{{#toJson}}highlight{{/toJson}}{{/highlight}}}'
+    )
+
+
+def default_search_template_id() -> str:
+    """
+    코드에 내장된 검색 템플릿 id(템플릿 내용의 해시, 쿼리가 바뀌면 새 id로 등록된다).
+    """
+    return "kreport-search-" + hashlib.sha1(search_template_source().encode("utf-8")).hexdigest()[:12]
+
+
+def register_search_template(client: OpenSearch, template_id: str, overwrite: bool = False) -> bool:
+    """
+    내장 검색 템플릿을 template_id로 저장한다. 이미 있으면(운영자가 바꿔 둔 전략 포함) 덮어쓰지 않는다.
+    Returns:
+        bool: 새로 저장했으면 True
+    """
+    if not overwrite:
+        try:
+            client.get_script(id=template_id)
+            return False
+        except NotFoundError:
+            pass
+    client.put_script(id=template_id, body={"script": {"lang": "mustache", "source": search_template_source()}})
+    return True
+
+
+def template_params(
+    query: str,
+    size: int = 3,
+    explain: bool = False,
+    options: Optional[SearchOptions] = None) -> Dict[str, Any]:
+    """
+    검색 템플릿 호출 파라미터를 만든다.
+    """
+    params: Dict[str, Any] = {"query": query, "size": size, "explain": explain}
+    if options is not None:
+        extra = search_options_body(options)
+        if "_source" in extra:
+            params["source_filter"] = extra["_source"]
+        if "highlight" in extra:
+            params["highlight"] = extra["highlight"]
+    return params
+
+
+def build_msearch_template_body(
+    template_id: str,
+    queries: List[str],
+    size: int = 3,
+    explain: bool = False,
+    options: Optional[SearchOptions] = None) -> List[Dict[str, Any]]:
+    """
+    msearch_template 요청 바디(헤더/템플릿 호출 쌍 목록)를 구성한다.
+    """
+    body: List[Dict[str, Any]] = []
+    for query in queries:
+        body.append({})
+        body.append({"id": template_id, "params": template_params(query, size, explain, options)})
+    return body
+
+
+def is_missing_template(response: Dict[str, Any]) -> bool:
+    """
+    msearch_template 항목이 저장된 템플릿이 없어 실패했는지 확인한다.
+    """
+    return response.get("status") == 404
+
+
+def _dumps(body: Dict[str, Any]) -> str:
+    return json.dumps(body, ensure_ascii=False, separators=(",", ":"))
+
+
 class OpenSearchSearcher(SearchPort):
     
-    def __init__(self, client: OpenSearch, alias_name: str) -> None:
+    def __init__(
+        self,
+        client: OpenSearch,
+        alias_name: str,
+        query_mode: str = "compiled",
+        template_id: Optional[str] = None) -> None:
+        """
+        Args:
+            client: OpenSearch 클라이언트
+            alias_name: 검색용 alias 이름
+            query_mode: compiled(미리 직렬화한 바디) | template(저장된 검색 템플릿 호출)
+            template_id: 검색 템플릿 id(없으면 내장 템플릿 id)
+        """
+        if query_mode not in QUERY_MODES:
+            raise ValueError(f"unsupported search query mode: {query_mode}")
         self.client = client
         self.alias_name = alias_name
+        self.query_mode = query_mode
+        self.template_id = template_id or default_search_template_id()
 
-    def search(self, query: str, size: int = 3, explain: bool = False) -> Dict[str, Any]:
+    def search(
+        self,
+        query: str,
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None) -> Dict[str, Any]:
         """
         Opensearch에 검색을 수행하여 결과를 반환한다.
 
@@ -25,23 +334,69 @@ class OpenSearchSearcher(SearchPort):
             query (str): 검색어
             size (int): 가져올 문서 개수 (기본 3)
             explain (bool): 검색 결과 설명 포함 여부 (기본 False)
+            options (SearchOptions | None): _source 필드 선택/하이라이트 (None이면 _source 전체)
         Returns:
             Dict[str, Any]: 검색 결과(hits, total, took, timed_out)
         """
         try:
-            body = self._build_query(query, size=size, explain=explain)
+            if self.query_mode == "template":
+                try:
+                    body = {"id": self.template_id, "params": template_params(query, size, explain, options)}
+                    return self.client.search_template(index=self.alias_name, body=body)
+                except NotFoundError as e:
+                    logger.warning("search: template %s not found, use compiled body: %s", self.template_id, e)
+            body = render_search_body(query, size=size, explain=explain, options=options)
             return self.client.search(index=self.alias_name, body=body)
         except AttributeError as e:
             raise DomainError(f"invalid client: {query} error={e}")
         except Exception as e:
             raise DomainError(f"failed to search: {query} error={e}")
 
+    def search_batch(
+        self,
+        queries: List[str],
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None) -> List[Dict[str, Any]]:
+        """
+        여러 쿼리를 msearch 한 번으로 검색한다.
+
+        Args:
+            queries (List[str]): 검색어 목록
+            size (int): 쿼리별 가져올 문서 개수
+            explain (bool): 검색 결과 설명 포함 여부
+            options (SearchOptions | None): _source 필드 선택/하이라이트
+        Returns:
+            List[Dict[str, Any]]: 쿼리 순서대로의 검색 결과(실패한 쿼리는 error/status 항목)
+        """
+        if not queries:
+            return []
+        try:
+            if self.query_mode == "template":
+                body = build_msearch_template_body(self.template_id, queries, size, explain, options)
+                responses = self.client.msearch_template(index=self.alias_name, body=body)["responses"]
+                missing = [i for i, r in enumerate(responses) if is_missing_template(r)]
+                if missing:
+                    logger.warning("search_batch: template %s not found, use compiled body", self.template_id)
+                    body = build_msearch_body([queries[i] for i in missing], size, explain, options)
+                    fetched = self.client.msearch(index=self.alias_name, body=body)["responses"]
+                    for i, response in zip(missing, fetched):
+                        responses[i] = response
+                return responses
+            body = build_msearch_body(queries, size=size, explain=explain, options=options)
+            return self.client.msearch(index=self.alias_name, body=body)["responses"]
+        except AttributeError as e:
+            raise DomainError(f"invalid client: batch size={len(queries)} error={e}")
+        except Exception as e:
+            raise DomainError(f"failed to search: batch size={len(queries)} error={e}")
+
     def _build_query(
         self, 
         query: str, 
         size: int = 3, 
         explain: bool = False, 
-        min_score: float = 5) -> Dict[str, Any]:
+        min_score: float = 5,
+        options: Optional[SearchOptions] = None) -> Dict[str, Any]:
         """
         검색 쿼리 바디를 구성한다.
 
@@ -50,102 +405,8 @@ class OpenSearchSearcher(SearchPort):
             size (int): 가져올 문서 개수 (기본 3)
             explain (bool): 검색 결과 설명 포함 여부 (기본 False)
             min_score (float): 최소 점수 (기본 5)
+            options (SearchOptions | None): _source 필드 선택/하이라이트
         Returns:
             Dict[str, Any]: 검색 쿼리 바디
         """
-        body = {
-            "from": 0,
-            "size": size,
-            "explain": explain,
-            "min_score": min_score,
-            "query": {
-                "function_score": {
-                    "query": {
-                        "bool": {
-                            "filter": {
-                                "bool": {
-                                    "must": [
-                                        {
-                                            "term": {
-                                                "published": True
-                                            }
-                                        }
-                                    ]
-                                }
-                            },
-                            "should": [
-                                {
-                                    "multi_match": {
-                                        "query": query,
-                                        "fields": ["title", "title.keyword"],
-                                        "type": "best_fields",
-                                        "operator": "or",
-                                        "boost": 4
-                                    }
-                                },
-                                {
-                                    "multi_match": {
-                                        "query": query,
-                                        "fields": ["question", "answer"],
-                                        "type": "best_fields",
-                                        "operator": "or",
-                                        "boost": 2.5
-                                    }
-                                },
-                                {
-                                    "match": {
-                                        "infobox": {
-                                            "query": query,
-                                            "boost": 2
-                                        }
-                                    }
-                                },
-                                {
-                                    "match": {
-                                        "paragraph": {
-                                            "query": query,
-                                            "boost": 2
-                                        }
-                                    }
-                                },
-                                {
-                                    "multi_match": {
-                                        "query": query,
-                                        "fields": ["summary", "infobox"],
-                                        "type": "best_fields",
-                                        "operator": "or",
-                                        "boost": 2
-                                    }
-                                }
-                            ]
-                        }
-                    },
-                    "functions": [
-                        {
-                            "field_value_factor": {
-                                "field": "features.body",
-                                "factor": 1.5,
-                                "missing": 1
-                            }
-                        },
-                        {
-                            "field_value_factor": {
-                                "field": "features.summary",
-                                "factor": 3,
-                                "missing": 1
-                            }
-                        },
-                        {
-                            "field_value_factor": {
-                                "field": "features.infobox",
-                                "factor": 8,
-                                "missing": 3
-                            }
-                        }
-                    ],
-                    "score_mode": "avg",
-                    "boost_mode": "sum"
-                }
-            }
-        }
-        return body
\ No newline at end of file
+        return build_search_query(query, size=size, explain=explain, min_score=min_score, options=options)
@@ -0,0 +1,170 @@
+"""
+대용량 TSV(QnA)를 열 단위로 읽어 색인 문서(dict)를 바로 만드는 ColumnarTransformPort 구현체.
+
+- pyarrow CSV 스트리밍 리더로 block_size 단위 RecordBatch(열 배열)를 읽는다
+- 공백 제거/published 플래그/source_id 매핑을 pyarrow.compute 열 연산으로 한 번에 처리
+- 행마다 ParsedBlock/NormalizedChunk 객체를 만들지 않고 색인 문서 dict만 만든다
+- 결과는 QnaParser + QnaTransformer(행 단위 경로)와 같다(content_hash 포함)
+- pyarrow가 읽지 못하는 파일(열 개수가 다른 행, 잘못된 UTF-8 등)은 행 단위 경로로 처리하며,
+  이미 내보낸 행은 건너뛴다
+"""
+
+from __future__ import annotations
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from datetime import datetime
+import logging
+
+from pydantic import TypeAdapter
+
+from api_server.app.adapters.parsers.qna_parser import REQUIRED_COLS
+from api_server.app.domain.delta import record_fingerprinter
+from api_server.app.domain.models import Collection, NormalizedChunk
+from api_server.app.domain.ports import ColumnarTransformPort, FetchPort, ParsePort, TransformPort
+from api_server.app.domain.utils import ext_to_file_type, infer_date_from_path
+
+logger = logging.getLogger(__name__)
+
+_DATETIME = TypeAdapter(datetime)
+
+# 열 연산으로 만드는(행마다 달라지는) 필드
+_ROW_FIELDS = ["source_id", "question", "answer", "author", "published"]
+
+
+class QnaColumnarTransformer(ColumnarTransformPort):
+
+    def __init__(
+        self,
+        fetcher: FetchPort,
+        parser: ParsePort,
+        transformer: TransformPort,
+        default_source_id: str = "tsv",
+        block_size: int = 4 * 1024 * 1024) -> None:
+        """
+        Args:
+            fetcher: FetchPort         : 행 단위 경로(대체 처리)용
+            parser: ParsePort          : 행 단위 경로(대체 처리)용
+            transformer: TransformPort : 행 단위 경로(대체 처리)용
+            default_source_id: str     : source_id 접두사(QnaTransformer와 같아야 함)
+            block_size: int            : 한 번에 읽어 열 배열로 만들 바이트 수
+        """
+        try:
+            import pyarrow
+            import pyarrow.compute
+            import pyarrow.csv
+        except ImportError as e:
+            raise RuntimeError("pyarrow package is required for the columnar QnA pipeline") from e
+        self._pa = pyarrow
+        self._pc = pyarrow.compute
+        self._csv = pyarrow.csv
+        self._fetcher = fetcher
+        self._parser = parser
+        self._transformer = transformer
+        self.default_source_id = default_source_id
+        self.block_size = block_size
+
+    def iter_records(self, resource_file: str, collection: Collection) -> Iterator[Dict[str, Any]]:
+        """
+        TSV 파일을 block_size 단위로 읽어 색인 문서 dict를 한 건씩 반환한다.
+        Args:
+            resource_file: str (file:// 또는 로컬 경로)
+            collection: Collection
+        Returns:
+            Iterator[Dict[str, Any]]
+        """
+        emitted = 0
+        template = self._template(resource_file, collection)
+        try:
+            reader = self._open(resource_file)
+        except Exception as e:
+            reader, error = None, e
+        while reader is not None:
+            try:
+                batch = reader.read_next_batch()
+                records = self._to_records(batch, template)
+            except StopIteration:
+                return
+            except Exception as e:
+                error = e
+                break
+            for record in records:
+                emitted += 1
+                yield record
+
+        logger.warning(
+            "transform.columnar: fallback to row path file=%s emitted=%d error=%s",
+            resource_file, emitted, error)
+        yield from islice(self._iter_row_records(resource_file, collection), emitted, None)
+
+    # ================= internal helpers =================
+    def _open(self, resource_file: str):
+        columns = sorted(REQUIRED_COLS)
+        return self._csv.open_csv(
+            _to_path(resource_file),
+            read_options=self._csv.ReadOptions(block_size=self.block_size),
+            parse_options=self._csv.ParseOptions(delimiter="\t", newlines_in_values=True),
+            convert_options=self._csv.ConvertOptions(
+                include_columns=columns,
+                column_types={c: self._pa.string() for c in columns},
+                strings_can_be_null=False,
+            ),
+        )
+
+    def _template(self, resource_file: str, collection: Collection) -> Dict[str, Any]:
+        """
+        파일 안의 모든 행에 공통인 필드(경로/유형/날짜 등)를 채운 색인 문서 틀.
+        """
+        created_date = _DATETIME.dump_python(infer_date_from_path(resource_file), mode="json")
+        template: Dict[str, Any] = dict.fromkeys(NormalizedChunk.model_fields)
+        template.update(
+            source_path=resource_file,
+            file_type=ext_to_file_type(Path(_to_path(resource_file))).value,
+            collection=collection.value if collection is not None else None,
+            created_date=created_date,
+            updated_date=created_date,
+        )
+        return template
+
+    def _to_records(self, batch, template: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        RecordBatch 1개를 열 연산으로 변환한 뒤 색인 문서 dict 목록으로 만든다.
+        (QnaTransformer._transform_document의 매핑 규칙과 같다)
+        """
+        pa, pc = self._pa, self._pc
+
+        def column(name: str):
+            return pc.utf8_trim_whitespace(batch.column(name))
+
+        def empty_to_null(values):
+            return pc.if_else(pc.equal(values, ""), pa.scalar(None, pa.string()), values)
+
+        rows = pa.RecordBatch.from_arrays(
+            [
+                pc.binary_join_element_wise(f"{self.default_source_id}_", column("id"), ""),
+                empty_to_null(column("question")),
+                column("answer"),
+                empty_to_null(column("user_id")),
+                pc.starts_with(pc.utf8_upper(column("published")), "Y"),
+            ],
+            names=_ROW_FIELDS,
+        )
+        fingerprint = record_fingerprinter(template, _ROW_FIELDS)
+        records = []
+        for row in rows.to_pylist():
+            record = {**template, **row}
+            record["content_hash"] = fingerprint(record)
+            records.append(record)
+        return records
+
+    def _iter_row_records(self, resource_file: str, collection: Collection) -> Iterator[Dict[str, Any]]:
+        """
+        행 단위 경로(fetch -> parse -> transform)로 같은 파일의 색인 문서를 만든다.
+        """
+        doc = self._parser.parse(self._fetcher.fetch(resource_file, collection))
+        for chunk in self._transformer.transform_iter([doc]):
+            yield chunk.model_dump(mode="json")
+
+
+def _to_path(resource_file: str) -> str:
+    return resource_file.replace("file://", "", 1) if resource_file.startswith("file://") else resource_file
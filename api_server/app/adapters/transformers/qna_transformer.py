@@ -4,9 +4,10 @@ tsv에서 파싱된 결과를 색인 단위인 NormalizedChunk로 변환하는 T
 
 from __future__ import annotations
 from datetime import datetime, timezone, timedelta
-from typing import List
-import json
+from typing import List, Iterable, Iterator
 
+from api_server.app.domain.delta import chunk_fingerprint
+from api_server.app.domain.jsonl import iter_jsonl_models
 from api_server.app.domain.utils import infer_date_from_path
 from api_server.app.domain.ports import TransformPort
 from api_server.app.domain.models import ParsedDocument, NormalizedChunk
@@ -25,24 +26,19 @@ class QnaTransformer(TransformPort):
         Returns:
             List[ParsedDocument]
         """
-        try:
-            with open(resource_file_path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+        return list(self.iter_parsed_document(resource_file_path))
 
-            docs: List[ParsedDocument] = []
-            if isinstance(payload, list):
-                for item in payload:
-                    docs.append(ParsedDocument.model_validate(item))
-            elif isinstance(payload, dict):
-                data = payload.get("data") if "data" in payload else None
-                if isinstance(data, list):
-                    for item in data:
-                        docs.append(ParsedDocument.model_validate(item))
-                else:
-                    docs.append(ParsedDocument.model_validate(payload))
-            else:
-                raise ValueError("Unsupported JSON format for ParsedDocument deserialization")
-            return docs
+    def iter_parsed_document(self, resource_file_path: str) -> Iterator[ParsedDocument]:
+        """
+        JSONL 파일(한 줄에 ParsedDocument 하나)을 한 줄씩 읽어 한 건씩 반환하는 메서드.
+        파일 전체를 올리지 않으므로 메모리 사용량은 문서 1건 크기로 제한된다.
+        Args:
+            resource_file_path: str (json 파일 경로)
+        Returns:
+            Iterator[ParsedDocument]
+        """
+        try:
+            yield from iter_jsonl_models(resource_file_path, ParsedDocument)
         except FileNotFoundError as e:
             raise ResourceNotFound(f"resource not found: {resource_file_path} error={e}")
         except Exception as e:
@@ -51,7 +47,7 @@ class QnaTransformer(TransformPort):
     def transform(self, docs: List[ParsedDocument]) -> List[NormalizedChunk]:
         """
         ParsedDocument를 NormalizedChunk로 변환하는 메서드.
-        parsed document의 row 블록을 참조하여 NormalizedChunk를 생성한다.
+        parsed document의 행(RowTable)을 참조하여 NormalizedChunk를 생성한다.
         - 매핑 규칙: 
             id -> source_id
             question -> question
@@ -63,49 +59,64 @@ class QnaTransformer(TransformPort):
         Returns:
             List[NormalizedChunk]
         """
+        return list(self.transform_iter(docs))
+
+    def transform_iter(self, docs: Iterable[ParsedDocument]) -> Iterator[NormalizedChunk]:
+        """
+        ParsedDocument를 한 건씩 받아 NormalizedChunk를 즉시 반환하는 메서드(파이프라인 모드).
+        row 단위 변환이라 문서 간 의존성이 없으므로 입력을 모두 모으지 않는다.
+        Args:
+            docs: Iterable[ParsedDocument]
+        Returns:
+            Iterator[NormalizedChunk]
+        """
         try:
-            result = []
             for doc in docs:
-                created_date = infer_date_from_path(doc.source.uri)
-                uri = doc.source.uri
-                for i, b in enumerate(doc.blocks):
-                    if b.type != "row":
-                        continue
-                    row = b.meta  # Dict[str, str]
-                    
-                    id = row.get('id')
-                    source_id   = f"{self.default_source_id}_{id}"
-                    source_path = uri
-                    file_type   = doc.source.file_type
-                    question    = row.get("question") or None
-                    answer      = row.get("answer") or ""
-                    author      = row.get("user_id") or None
-                    published   = (row.get("published") or "").upper().startswith("Y")
-
-                    chunk = NormalizedChunk(
-                        source_id=source_id,
-                        source_path=source_path,
-                        file_type=file_type,
-                        collection=doc.collection,
-                        title=None,
-                        body=None,
-                        paragraph=None,
-                        summary=None,
-                        infobox=None,
-                        question=question,
-                        answer=answer,
-                        title_embedding=None,
-                        body_embedding=None,
-                        created_date=created_date,
-                        updated_date=created_date,
-                        author=author,
-                        published=published,
-                        features=None,
-                    )
-                    result.append(chunk)
-            return result
-        except FileNotFoundError as e:
-            raise ResourceNotFound(f"resource not found: {resource_file_path} error={e}")
+                yield from self._transform_document(doc)
+        except DomainError:
+            raise
         except Exception as e:
             raise DomainError(f"failed to transform: qna docs. error={e}")
 
+    def _transform_document(self, doc: ParsedDocument) -> Iterator[NormalizedChunk]:
+        """
+        ParsedDocument 1건의 행(RowTable, 이전 형식은 row 블록)들을 NormalizedChunk로 변환한다.
+        Args:
+            doc: ParsedDocument
+        Returns:
+            Iterator[NormalizedChunk]
+        """
+        created_date = infer_date_from_path(doc.source.uri)
+        uri = doc.source.uri
+        for row in doc.iter_rows():  # Dict[str, str]
+            id = row.get('id')
+            source_id   = f"{self.default_source_id}_{id}"
+            source_path = uri
+            file_type   = doc.source.file_type
+            question    = row.get("question") or None
+            answer      = row.get("answer") or ""
+            author      = row.get("user_id") or None
+            published   = (row.get("published") or "").upper().startswith("Y")
+
+            chunk = NormalizedChunk(
+                source_id=source_id,
+                source_path=source_path,
+                file_type=file_type,
+                collection=doc.collection,
+                title=None,
+                body=None,
+                paragraph=None,
+                summary=None,
+                infobox=None,
+                question=question,
+                answer=answer,
+                title_embedding=None,
+                body_embedding=None,
+                created_date=created_date,
+                updated_date=created_date,
+                author=author,
+                published=published,
+                features=None,
+            )
+            chunk.content_hash = chunk_fingerprint(chunk)
+            yield chunk
@@ -5,10 +5,15 @@ HTML에서 제목/문단/리스트/헤딩을 뽑아 NormalizedChunk로 변환하
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List
-import json
+from pathlib import PurePosixPath
+from typing import List, Dict, Iterable, Iterator
+from urllib.parse import unquote, urlparse
+import hashlib
 import re
+import unicodedata
 
+from api_server.app.domain.delta import chunk_fingerprint
+from api_server.app.domain.jsonl import iter_jsonl_models
 from api_server.app.domain.utils import infer_date_from_path
 from api_server.app.domain.ports import TransformPort
 from api_server.app.domain.models import ParsedDocument, NormalizedChunk
@@ -19,6 +24,8 @@ class WikiTransformer(TransformPort):
     ParsedDocument(HTML) -> NormalizedChunk 한 건.
     - 문단 블록(text)들을 합쳐 body를 구성
     - 제목/언어/작성자 등은 정책에 따라 채움
+    - source_id는 날짜 디렉터리를 뺀 원본 파일 이름(없으면 제목)에서 만들어
+      파일 목록 순서나 날짜가 바뀌어도 같은 문서는 같은 id를 갖는다.
     """
 
     def __init__(
@@ -39,13 +46,18 @@ class WikiTransformer(TransformPort):
         Returns:
             List[ParsedDocument]
         """
+        return list(self.iter_parsed_document(resource_file_path))
+
+    def iter_parsed_document(self, resource_file_path: str) -> Iterator[ParsedDocument]:
+        """
+        JSONL 파일을 한 줄씩 읽어 ParsedDocument를 한 건씩 반환하는 메서드.
+        Args:
+            resource_file_path: str (json 파일 경로)
+        Returns:
+            Iterator[ParsedDocument]
+        """
         try:
-            docs: List[ParsedDocument] = []
-            with open(resource_file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        docs.append(ParsedDocument.model_validate(json.loads(line)))
-            return docs
+            yield from iter_jsonl_models(resource_file_path, ParsedDocument)
         except FileNotFoundError as e:
             raise ResourceNotFound(f"resource not found: {resource_file_path} error={e}")
         except Exception as e:
@@ -130,55 +142,105 @@ class WikiTransformer(TransformPort):
         Returns:
             List[NormalizedChunk]
         """
+        return list(self.transform_iter(docs))
+
+    def transform_iter(self, docs: Iterable[ParsedDocument]) -> Iterator[NormalizedChunk]:
+        """
+        ParsedDocument를 NormalizedChunk로 변환하여 한 건씩 반환하는 메서드(파이프라인 모드).
+        features는 전체 문서 기준 min/max 스케일링이 필요하므로 파싱 문서는 모두 모은 뒤,
+        NormalizedChunk는 한 건씩 생성해 반환한다.
+        Args:
+            docs: Iterable[ParsedDocument]
+        Returns:
+            Iterator[NormalizedChunk]
+        """
         try:
+            docs = list(docs)
             scaled_features = self._calculate_features(docs)
-            result = []
-            num = 0
+            seen: Dict[str, int] = {}
             for doc in docs:
-                # 본문 추출
-                for b in doc.blocks:
-                    if b.type == "body":
-                        body = self._normalize_percentage(b.text)
-                    elif b.type == "summary":
-                        summary = self._normalize_percentage(b.text)
-                    elif b.type == "infobox":
-                        infobox = self._normalize_percentage(b.text)
-                    elif b.type == "paragraph":
-                        paragraph = self._normalize_percentage(b.text)
-
-                created_date = infer_date_from_path(doc.source.uri)
-                title = doc.title
-                author = self.default_author
-                published = self.default_published
-                file_type = "html"
-                source_path = doc.source.uri  # 원본 URL
-                source_id = f"{self.default_source_id}_{num}"
-                num += 1
-
-                # NormalizedChunk 생성성
-                chunk = NormalizedChunk(
-                    source_id=source_id,
-                    source_path=source_path,
-                    file_type=file_type,
-                    collection=doc.collection,
-                    title=title,
-                    body=body,
-                    paragraph=paragraph,
-                    summary=summary,
-                    infobox=infobox,
-                    question=None,
-                    answer=None,
-                    title_embedding=None,
-                    body_embedding=None,
-                    created_date=created_date,
-                    updated_date=created_date,
-                    author=author,
-                    published=published,
-                    features=scaled_features[title],
-                )
-                result.append(chunk)
-            return result
-        except FileNotFoundError as e:
-            raise ResourceNotFound(f"resource not found: {resource_file_path} error={e}")
+                source_id = self._stable_source_id(doc)
+                # 같은 키를 갖는 문서가 또 있으면 등장 순서로 구분한다
+                dup = seen.get(source_id, 0)
+                seen[source_id] = dup + 1
+                if dup:
+                    source_id = f"{source_id}_{dup}"
+                yield self._transform_document(doc, source_id, scaled_features[doc.title])
+        except DomainError:
+            raise
         except Exception as e:
-            raise DomainError(f"failed to transform: wiki docs. error={e}")
\ No newline at end of file
+            raise DomainError(f"failed to transform: wiki docs. error={e}")
+
+    def _stable_source_id(self, doc: ParsedDocument) -> str:
+        """
+        문서 내용과 무관하게 같은 문서면 항상 같은 source_id를 만드는 메서드.
+        - 키: 원본 경로의 파일 이름(day_N 디렉터리 제외, NFC 정규화), 없으면 제목
+        - id: {default_source_id}_{sha1(키) 앞 16자리}
+        Args:
+            doc: ParsedDocument
+        Returns:
+            str: source_id
+        """
+        path = unquote(urlparse(doc.source.uri).path or doc.source.uri)
+        key = PurePosixPath(path.replace("\\", "/")).name or (doc.title or "")
+        key = unicodedata.normalize("NFC", key).strip().lower()
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return f"{self.default_source_id}_{digest}"
+
+    def _transform_document(
+        self,
+        doc: ParsedDocument,
+        source_id: str,
+        features: Dict[str, float]
+    ) -> NormalizedChunk:
+        """
+        ParsedDocument 1건을 NormalizedChunk로 변환하는 메서드.
+        Args:
+            doc: ParsedDocument
+            source_id: 문서 식별자
+            features: 스케일링된 문서 features
+        Returns:
+            NormalizedChunk
+        """
+        body = summary = infobox = paragraph = None
+        # 본문 추출
+        for b in doc.blocks:
+            if b.type == "body":
+                body = self._normalize_percentage(b.text)
+            elif b.type == "summary":
+                summary = self._normalize_percentage(b.text)
+            elif b.type == "infobox":
+                infobox = self._normalize_percentage(b.text)
+            elif b.type == "paragraph":
+                paragraph = self._normalize_percentage(b.text)
+
+        created_date = infer_date_from_path(doc.source.uri)
+        title = doc.title
+        author = self.default_author
+        published = self.default_published
+        file_type = "html"
+        source_path = doc.source.uri  # 원본 URL
+
+        # NormalizedChunk 생성
+        chunk = NormalizedChunk(
+            source_id=source_id,
+            source_path=source_path,
+            file_type=file_type,
+            collection=doc.collection,
+            title=title,
+            body=body,
+            paragraph=paragraph,
+            summary=summary,
+            infobox=infobox,
+            question=None,
+            answer=None,
+            title_embedding=None,
+            body_embedding=None,
+            created_date=created_date,
+            updated_date=created_date,
+            author=author,
+            published=published,
+            features=features,
+        )
+        chunk.content_hash = chunk_fingerprint(chunk)
+        return chunk
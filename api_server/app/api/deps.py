@@ -1,24 +1,45 @@
 from __future__ import annotations
 
-from typing import Generator
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, Generator, List, Optional
 from urllib.parse import urlparse
 
-from fastapi import Depends, Request
-from opensearchpy import OpenSearch
+from fastapi import HTTPException, Request
+from opensearchpy import AsyncOpenSearch, OpenSearch
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from api_server.app.domain.ports import (
-    FetchPort, ParsePort, TransformPort, IndexPort, SearchPort, ListenPort
+    FetchPort, ParsePort, TransformPort, IndexPort, SearchPort, AsyncSearchPort, ListenPort, SearchCachePort,
+    AsyncSearchCachePort,
+    JobQueuePort, ProgressPort, ColumnarTransformPort
 )
+from api_server.app.domain.models import FileType
+from api_server.app.domain.utils import choose_collection, run_per_file_type
 from api_server.app.adapters.listeners.file_listener import FileListener
-from api_server.app.domain.services.search_service import SearchService
+from api_server.app.domain.services.search_service import SearchService, AsyncSearchService
 from api_server.app.domain.services.index_service import IndexService
+from api_server.app.domain.services.job_service import JobService, JobHandler
 from api_server.app.adapters.fetchers.file_fetcher import FileFetcher
 from api_server.app.adapters.parsers.wiki_parser import WikiParser
+from api_server.app.adapters.parsers.selectolax_wiki_parser import SelectolaxWikiParser
 from api_server.app.adapters.parsers.qna_parser import QnaParser
+from api_server.app.adapters.parsers.cached_parser import CachedParser
+from api_server.app.adapters.caches.file_parse_cache import FileParseCache
+from api_server.app.adapters.caches.memory_search_cache import AsyncMemorySearchCache, MemorySearchCache
+from api_server.app.adapters.caches.redis_search_cache import AsyncRedisSearchCache, RedisSearchCache
+from api_server.app.adapters.queues.memory_job_queue import MemoryJobQueue
+from api_server.app.adapters.queues.redis_job_queue import RedisJobQueue
 from api_server.app.adapters.transformers.wiki_transformer import WikiTransformer
 from api_server.app.adapters.transformers.qna_transformer import QnaTransformer
+from api_server.app.adapters.transformers.qna_columnar_transformer import QnaColumnarTransformer
 from api_server.app.adapters.indexers.opensearch_indexer import OpenSearchIndexer
-from api_server.app.adapters.searchers.opensearch_searcher import OpenSearchSearcher
+from api_server.app.adapters.searchers.opensearch_searcher import (
+    OpenSearchSearcher, default_search_template_id, register_search_template
+)
+from api_server.app.adapters.searchers.async_opensearch_searcher import AsyncOpenSearchSearcher
+from api_server.app.adapters.searchers.cached_searcher import CachedSearcher, AsyncCachedSearcher
+from api_server.app.platform.admission import AdmissionController, LaneLimits
 from api_server.app.platform.config import settings
 
 
@@ -40,6 +61,180 @@ def get_opensearch(request: Request) -> OpenSearch:
     )
 
 
+def get_async_opensearch(request: Request) -> AsyncOpenSearch:
+    """
+    lifespan에서 만들어 둔 AsyncOpenSearch 클라이언트를 꺼낸다.
+    없으면(테스트 등) 즉석 생성.
+    """
+    if hasattr(request.app.state, "opensearch_async"):
+        return request.app.state.opensearch_async
+
+    u = urlparse(settings.OPENSEARCH_HOST)
+    return AsyncOpenSearch(
+        hosts=[
+            {"host": u.hostname, "port": u.port or 9200, "scheme": u.scheme or "http"}
+        ],
+        verify_certs=False,
+    )
+
+
+def _wiki_parser(backend: str, legacy_body_text: bool = False) -> ParsePort:
+    """
+    설정된 백엔드 이름에 맞는 위키 HTML 파서를 생성한다.
+    """
+    if backend == "selectolax":
+        return SelectolaxWikiParser(legacy_body_text=legacy_body_text)
+    if backend == "bs4":
+        return WikiParser(legacy_body_text=legacy_body_text)
+    raise ValueError(f"unsupported wiki parser backend: {backend}")
+
+
+def _with_parse_cache(parser: ParsePort) -> ParsePort:
+    """
+    PARSE_CACHE_DIR가 설정되어 있으면 원문 내용 해시 기반 파싱 캐시로 파서를 감싼다.
+    """
+    if not settings.PARSE_CACHE_DIR:
+        return parser
+    cache = FileParseCache(settings.PARSE_CACHE_DIR, settings.PARSE_CACHE_MAX_BYTES)
+    return CachedParser(parser, cache)
+
+
+@lru_cache(maxsize=1)
+def get_search_cache() -> Optional[SearchCachePort]:
+    """
+    SEARCH_CACHE_BACKEND 설정에 맞는 검색 결과 캐시를 프로세스당 하나만 만든다.
+    (색인 쪽 alias 회전 시 같은 캐시를 무효화해야 하므로 공유)
+    """
+    backend = settings.SEARCH_CACHE_BACKEND
+    if not backend:
+        return None
+    if backend == "memory":
+        return MemorySearchCache(settings.SEARCH_CACHE_MAX_ENTRIES, settings.SEARCH_CACHE_TTL_SECONDS)
+    if backend == "redis":
+        return RedisSearchCache(
+            Redis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT),
+            prefix=f"{settings.OPENSEARCH_ALIAS}:search",
+            ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS)
+    raise ValueError(f"unsupported search cache backend: {backend}")
+
+
+@lru_cache(maxsize=1)
+def get_async_search_cache() -> Optional[AsyncSearchCachePort]:
+    """
+    async 검색 경로에서 쓰는 검색 결과 캐시를 프로세스당 하나만 만든다.
+    get_search_cache()와 같은 저장소(memory는 같은 인스턴스, redis는 같은 키)를 보므로
+    색인 쪽 무효화가 그대로 반영된다.
+    """
+    backend = settings.SEARCH_CACHE_BACKEND
+    if not backend:
+        return None
+    if backend == "memory":
+        return AsyncMemorySearchCache(get_search_cache())
+    if backend == "redis":
+        return AsyncRedisSearchCache(
+            # 캐시가 느려도 검색 지연이 커지지 않도록 소켓 타임아웃을 짧게 둔다
+            AsyncRedis.from_url(
+                settings.REDIS_URL,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT),
+            prefix=f"{settings.OPENSEARCH_ALIAS}:search",
+            ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS)
+    raise ValueError(f"unsupported search cache backend: {backend}")
+
+
+@lru_cache(maxsize=1)
+def get_admission_controller() -> Optional[AdmissionController]:
+    """
+    요청 수락 제어기를 프로세스당 하나만 만든다(ADMISSION_ENABLED=false면 None).
+    검색 lane이 색인(ingest) lane보다 우선한다.
+    """
+    if not settings.ADMISSION_ENABLED:
+        return None
+    return AdmissionController(
+        settings.ADMISSION_MAX_IN_FLIGHT,
+        {
+            "search": LaneLimits(
+                settings.ADMISSION_SEARCH_CONCURRENCY,
+                settings.ADMISSION_SEARCH_QUEUE,
+                settings.ADMISSION_SEARCH_QUEUE_TIMEOUT,
+                priority=0),
+            "ingest": LaneLimits(
+                settings.ADMISSION_INGEST_CONCURRENCY,
+                settings.ADMISSION_INGEST_QUEUE,
+                settings.ADMISSION_INGEST_QUEUE_TIMEOUT,
+                priority=1),
+        })
+
+
+# 색인/파이프라인 라우트와 같은 종류의 작업(/v1/jobs)이 함께 쓰는 실행 자리 키
+# (모두 같은 alias로 새 인덱스를 적재/회전하므로 하나의 자리를 나눠 쓴다)
+INGEST_ROUTE = "ingest"
+JOB_ROUTES: Dict[str, str] = {
+    "extract": "extract",
+    "transform": "transform",
+    "index": INGEST_ROUTE,
+    "pipeline": INGEST_ROUTE,
+}
+
+
+def limit_route_concurrency(route: str) -> Callable[[], AsyncIterator[None]]:
+    """
+    라우트별 동시 실행 수를 ADMISSION_INGEST_ROUTE_CONCURRENCY로 제한하는 의존성을 만든다.
+    자리가 없으면 기다리지 않고 429로 거절한다(긴 작업은 /v1/jobs 사용, 작업은 자리가 날 때까지 대기).
+    """
+    async def dependency() -> AsyncIterator[None]:
+        controller = get_admission_controller()
+        if controller is None:
+            yield
+            return
+        if not controller.try_acquire_route(route, settings.ADMISSION_INGEST_ROUTE_CONCURRENCY):
+            raise HTTPException(
+                status_code=429,
+                detail=f"{route} is already running, retry later or use /v1/jobs",
+                headers={"Retry-After": "1"})
+        try:
+            yield
+        finally:
+            controller.release_route(route)
+
+    return dependency
+
+
+def _invalidate_search_cache() -> None:
+    """
+    alias가 새 인덱스로 회전되면 검색 결과 캐시를 무효화한다.
+    """
+    cache = get_search_cache()
+    if cache is not None:
+        cache.invalidate()
+
+
+def _with_search_cache(searcher: SearchPort) -> SearchPort:
+    """
+    검색 결과 캐시가 설정되어 있으면 검색기를 캐시로 감싼다.
+    """
+    cache = get_search_cache()
+    return searcher if cache is None else CachedSearcher(searcher, cache)
+
+
+def _with_async_search_cache(searcher: AsyncSearchPort) -> AsyncSearchPort:
+    """
+    _with_search_cache의 비동기 검색기 버전(캐시 조회/저장도 비동기).
+    """
+    cache = get_async_search_cache()
+    return searcher if cache is None else AsyncCachedSearcher(searcher, cache)
+
+
+def _search_template_id() -> str:
+    """
+    설정한 검색 템플릿 id(없으면 코드에 내장된 템플릿 id).
+    """
+    return settings.SEARCH_TEMPLATE_ID or default_search_template_id()
+
+
 class PipelineResolver:
     def __init__(self, os: OpenSearch) -> None:
         # OpenSearch 클라이언트 주입
@@ -47,44 +242,215 @@ class PipelineResolver:
         self._indexer: IndexPort = OpenSearchIndexer(
             os, 
             settings.OPENSEARCH_INDEX, 
-            settings.OPENSEARCH_ALIAS)
-        self._searcher: SearchPort = OpenSearchSearcher(os, settings.OPENSEARCH_ALIAS)
+            settings.OPENSEARCH_ALIAS,
+            bulk_thread_count=settings.BULK_THREAD_COUNT,
+            bulk_chunk_size=settings.BULK_CHUNK_SIZE,
+            bulk_max_chunk_bytes=settings.BULK_MAX_CHUNK_BYTES,
+            forcemerge_max_segments=settings.INDEX_FORCEMERGE_MAX_SEGMENTS,
+            on_alias_rotated=_invalidate_search_cache,
+            trust_artifacts=settings.ARTIFACT_TRUSTED)
+        # 구성 요소가 모두 상태를 갖지 않으므로 source_type별 IndexService를 한 번만 만들어 재사용한다
+        self._services: Dict[str, IndexService] = {}
 
     def for_type(self, source_type: str) -> IndexService:
         """
-        주어진 source_type(html, tsv 등)에 맞는
-        파이프라인 구성 요소(listener, fetcher, parser, transformer)를 생성해서
-        IndexService를 반환한다.
+        주어진 source_type(html, tsv 등)에 맞는 IndexService를 반환한다.
+        (처음 요청 시 생성하고 이후에는 캐시된 인스턴스를 반환)
+        """
+        service = self._services.get(source_type)
+        if service is None:
+            service = self._services.setdefault(source_type, self._build(source_type))
+        return service
+
+    def _build(self, source_type: str) -> IndexService:
+        """
+        source_type에 맞는 파이프라인 구성 요소(listener, fetcher, parser, transformer)로
+        IndexService를 생성한다.
         """
         listener: ListenPort = FileListener()
         fetcher: FetchPort = FileFetcher()
+        columnar: Optional[ColumnarTransformPort] = None
 
         if source_type == "html":
-            parser: ParsePort = WikiParser() 
+            parser: ParsePort = _wiki_parser(settings.WIKI_PARSER_BACKEND, settings.WIKI_LEGACY_BODY_TEXT)
             transformer: TransformPort = WikiTransformer(default_source_id=source_type.value)
         elif source_type == "tsv":
             parser: ParsePort = QnaParser()
             transformer: TransformPort = QnaTransformer(default_source_id=source_type.value)
+            if settings.QNA_COLUMNAR_PIPELINE:
+                columnar = QnaColumnarTransformer(
+                    fetcher, parser, transformer,
+                    default_source_id=source_type.value,
+                    block_size=settings.QNA_COLUMNAR_BLOCK_SIZE)
         else:
             raise ValueError(f"unsupported source_type: {source_type}")
 
         return IndexService(
             listener=listener,
             fetcher=fetcher, 
-            parser=parser, 
+            parser=_with_parse_cache(parser), 
             transformer=transformer, 
-            indexer=self._indexer
+            indexer=self._indexer,
+            pipeline_buffer_size=settings.PIPELINE_BUFFER_SIZE,
+            parse_workers=settings.EXTRACT_WORKERS,
+            parse_chunksize=settings.EXTRACT_CHUNK_SIZE,
+            artifact_format=settings.ARTIFACT_FORMAT,
+            trust_artifacts=settings.ARTIFACT_TRUSTED,
+            columnar=columnar
         )
 
-def get_pipeline_resolver(os: OpenSearch = Depends(get_opensearch)) -> PipelineResolver:
+def ensure_search_template(os: OpenSearch) -> bool:
+    """
+    template 모드이면 검색 템플릿을 (없을 때만) 등록한다(앱 시작 시 한 번).
+    실패해도 앱은 뜨고, 템플릿이 없는 동안 검색기는 미리 직렬화한 바디로 검색한다.
+    Returns:
+        bool: 새로 등록했으면 True
+    """
+    if settings.SEARCH_QUERY_MODE != "template":
+        return False
+    template_id = _search_template_id()
+    try:
+        return register_search_template(os, template_id)
+    except Exception as e:
+        print(f"Search template '{template_id}' registration failed: {e}")
+        return False
+
+
+def build_search_service(os: OpenSearch) -> SearchService:
     """
-    FastAPI DI에서 OpenSearch 클라이언트를 받아 PipelineResolver를 생성해 주입한다.
+    OpenSearch 클라이언트로 (캐시가 설정되어 있으면 캐시로 감싼) SearchService를 생성한다.
     """
-    return PipelineResolver(os)
+    searcher: SearchPort = _with_search_cache(OpenSearchSearcher(
+        os, settings.OPENSEARCH_ALIAS, query_mode=settings.SEARCH_QUERY_MODE, template_id=_search_template_id()))
+    return SearchService(searcher, coalesce=settings.SEARCH_COALESCE)
+
+
+def build_async_search_service(os: AsyncOpenSearch) -> AsyncSearchService:
+    """
+    AsyncOpenSearch 클라이언트로 AsyncSearchService를 생성한다.
+    """
+    searcher: AsyncSearchPort = _with_async_search_cache(AsyncOpenSearchSearcher(
+        os, settings.OPENSEARCH_ALIAS, query_mode=settings.SEARCH_QUERY_MODE, template_id=_search_template_id()))
+    return AsyncSearchService(searcher, coalesce=settings.SEARCH_COALESCE)
+
+
+def get_pipeline_resolver(request: Request) -> PipelineResolver:
+    """
+    lifespan에서 만들어 둔 PipelineResolver를 꺼내 주입한다.
+    없으면(테스트 등) 즉석 생성.
+    """
+    if hasattr(request.app.state, "pipeline_resolver"):
+        return request.app.state.pipeline_resolver
+    return PipelineResolver(get_opensearch(request))
+
+def get_search_service(request: Request) -> SearchService:
+    """
+    lifespan에서 만들어 둔 SearchService를 꺼내 주입한다.
+    없으면(테스트 등) 즉석 생성.
+    """
+    if hasattr(request.app.state, "search_service"):
+        return request.app.state.search_service
+    return build_search_service(get_opensearch(request))
+
+def get_async_search_service(request: Request) -> AsyncSearchService:
+    """
+    lifespan에서 만들어 둔 AsyncSearchService를 꺼내 주입한다.
+    없으면(테스트 등) 즉석 생성.
+    """
+    if hasattr(request.app.state, "async_search_service"):
+        return request.app.state.async_search_service
+    return build_async_search_service(get_async_opensearch(request))
+
+
+def _source_types(source: str) -> List[FileType]:
+    """
+    요청 source(all | html | tsv)를 처리할 파일 타입 목록으로 바꾼다.
+    """
+    return list(FileType) if source == "all" else [FileType(source)]
+
+
+def _run_sources(params: Dict[str, Any], run) -> Dict[str, Any]:
+    """
+    작업 파라미터의 source에 해당하는 타입별로 run을 실행한다(all이면 동시 실행).
+    """
+    return run_per_file_type(_source_types(params["source"]), run, concurrent=settings.SOURCE_ALL_CONCURRENT)
+
+
+def build_job_handlers(resolver: PipelineResolver) -> Dict[str, JobHandler]:
+    """
+    작업 종류별 실행 함수를 만든다.
+    결과는 동기 라우터 응답의 data와 같은 형태(타입별 결과 dict)이다.
+    """
+    def extract(params: Dict[str, Any], progress: ProgressPort) -> Dict[str, Any]:
+        return _run_sources(params, lambda ft: resolver.for_type(ft).extract(
+            source=ft.value, date=params["date"], collection=choose_collection(ft), progress=progress))
+
+    def transform(params: Dict[str, Any], progress: ProgressPort) -> Dict[str, Any]:
+        return _run_sources(params, lambda ft: resolver.for_type(ft).transform(
+            source=ft.value, date=params["date"], collection=choose_collection(ft), progress=progress))
+
+    def index(params: Dict[str, Any], progress: ProgressPort) -> Dict[str, Any]:
+        return _run_sources(params, lambda ft: resolver.for_type(ft).index(
+            source=ft.value, date=params["date"], collection=choose_collection(ft),
+            mode=params.get("mode", "full"), progress=progress))
+
+    def pipeline(params: Dict[str, Any], progress: ProgressPort) -> Dict[str, Any]:
+        return _run_sources(params, lambda ft: resolver.for_type(ft).run_pipeline(
+            source=ft.value, date=params["date"], collection=choose_collection(ft),
+            save_intermediate=params.get("save_intermediate", False),
+            mode=params.get("mode", "full"), progress=progress))
+
+    return {"extract": extract, "transform": transform, "index": index, "pipeline": pipeline}
+
+
+def build_job_queue() -> JobQueuePort:
+    """
+    JOB_QUEUE_BACKEND 설정에 맞는 작업 대기열을 만든다.
+    """
+    backend = settings.JOB_QUEUE_BACKEND
+    if backend == "memory":
+        return MemoryJobQueue(settings.JOB_MAX_ENTRIES)
+    if backend == "redis":
+        # BRPOP으로 대기하므로 검색 캐시용 짧은 소켓 타임아웃을 쓰지 않는다
+        return RedisJobQueue(
+            Redis.from_url(settings.REDIS_URL),
+            prefix=f"{settings.OPENSEARCH_ALIAS}:jobs",
+            ttl_seconds=settings.JOB_TTL_SECONDS,
+            lease_seconds=settings.JOB_LEASE_SECONDS)
+    raise ValueError(f"unsupported job queue backend: {backend}")
+
+
+def build_job_service(resolver: PipelineResolver) -> JobService:
+    """
+    작업 대기열과 작업 종류별 실행 함수로 JobService를 생성한다(워커 시작은 호출자가 한다).
+    """
+    controller = get_admission_controller()
+    acquire_slot = release_slot = None
+    if controller is not None:
+        # 동기 라우트와 같은 라우트 자리를 차지해야 실행한다(자리가 없으면 작업이 기다린다)
+        def acquire_slot(kind: str) -> bool:
+            return controller.try_acquire_route(JOB_ROUTES[kind], settings.ADMISSION_INGEST_ROUTE_CONCURRENCY)
+
+        def release_slot(kind: str) -> None:
+            controller.release_route(JOB_ROUTES[kind])
+
+    return JobService(
+        build_job_queue(),
+        build_job_handlers(resolver),
+        workers=settings.JOB_WORKERS,
+        heartbeat_interval=settings.JOB_LEASE_SECONDS / 3,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        acquire_slot=acquire_slot,
+        release_slot=release_slot)
+
 
-def get_search_service(os: OpenSearch = Depends(get_opensearch)) -> SearchService:
+def get_job_service(request: Request) -> JobService:
     """
-    FastAPI DI에서 OpenSearch 클라이언트를 받아 SearchService를 생성해 주입한다.
+    lifespan에서 만들어 둔 JobService를 꺼내 주입한다.
+    없으면(테스트 등) 처음 요청 시 만들어 워커를 시작하고 앱 단위로 보관한다.
     """
-    searcher: SearchPort = OpenSearchSearcher(os, settings.OPENSEARCH_ALIAS)
-    return SearchService(searcher)
\ No newline at end of file
+    state = request.app.state
+    if not hasattr(state, "job_service"):
+        state.job_service = build_job_service(get_pipeline_resolver(request))
+        state.job_service.start()
+    return state.job_service
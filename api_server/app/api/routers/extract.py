@@ -5,13 +5,15 @@
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 from typing import Literal, Dict, Any
-from api_server.app.api.deps import get_pipeline_resolver, PipelineResolver
-from api_server.app.domain.utils import choose_collection
+from api_server.app.api.deps import get_pipeline_resolver, limit_route_concurrency, PipelineResolver
+from api_server.app.domain.utils import choose_collection, run_per_file_type
+from api_server.app.platform.config import settings
 from api_server.app.domain.models import FileType
 import logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/extract", tags=["extract"])
+router = APIRouter(
+    prefix="/extract", tags=["extract"], dependencies=[Depends(limit_route_concurrency("extract"))])
 
 class ExtractRequest(BaseModel):
     """
@@ -44,7 +46,7 @@ def _run_extract_one(resolver: PipelineResolver, ft: FileType, date: str) -> Any
     summary="문서 추출 후 저장",
     description=(
         "요청한 소스 유형(html/tsv)에 대해 문서를 추출하고 저장합니다. "
-        "`source`가 `all`이면 두 유형을 순차 처리하여 타입별 결과를 반환합니다."
+        "`source`가 `all`이면 두 유형을 동시에 처리하여 타입별 결과를 반환합니다."
     ),
     operation_id="extractDocuments",
     status_code=200,
@@ -87,8 +89,11 @@ def _run_extract_one(resolver: PipelineResolver, ft: FileType, date: str) -> Any
 def extract(req: ExtractRequest, resolver: PipelineResolver = Depends(get_pipeline_resolver)):
     logger.info(f"ExtractRequest: {req}")
     if req.source == "all":
-        # html/tsv 각각 실행하고 타입별 결과를 dict로 반환
-        results: Dict[str, Any] = {ft.value: _run_extract_one(resolver, ft, req.date) for ft in FileType}
+        # html/tsv를 동시에 실행하고 타입별 결과를 dict로 반환
+        results: Dict[str, Any] = run_per_file_type(
+            list(FileType),
+            lambda ft: _run_extract_one(resolver, ft, req.date),
+            concurrent=settings.SOURCE_ALL_CONCURRENT)
         return ApiResponse(success=True, message="문서 추출 후 저장 성공", data=results)
     else:
         # 단일 타입
@@ -1,7 +1,16 @@
 from fastapi import APIRouter, Depends
+from api_server.app.api.deps import get_admission_controller
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 @router.get("")
 def health():
     return {"ok": True}
+
+@router.get("/admission")
+async def admission():
+    """
+    요청 수락 제어 상태(lane별 실행/대기/수락/거절 건수, 라우트별 실행 수)
+    """
+    controller = get_admission_controller()
+    return {"enabled": controller is not None, **(controller.stats() if controller is not None else {})}
@@ -1,14 +1,16 @@
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 from typing import Literal, Dict, Any
-from api_server.app.api.deps import get_pipeline_resolver, PipelineResolver
-from api_server.app.domain.utils import choose_collection
+from api_server.app.api.deps import get_pipeline_resolver, limit_route_concurrency, PipelineResolver, INGEST_ROUTE
+from api_server.app.domain.utils import choose_collection, run_per_file_type
+from api_server.app.platform.config import settings
 from api_server.app.domain.models import FileType
 import logging
 logger = logging.getLogger(__name__)
 
 
-router = APIRouter(prefix="/index", tags=["index"])
+router = APIRouter(
+    prefix="/index", tags=["index"], dependencies=[Depends(limit_route_concurrency(INGEST_ROUTE))])
 
 class IndexRequest(BaseModel):
     """
@@ -17,6 +19,10 @@ class IndexRequest(BaseModel):
     # all | html | tsv
     source: Literal["all", "html", "tsv"] = Field("all", description="default: all (html|tsv)")
     date: str = Field(..., description="날짜(예: '3')")
+    # full | delta
+    mode: Literal["full", "delta"] = Field(
+        "full", description="full: 전체 색인, delta: 이전 날짜 인덱스를 복제 후 변경분만 색인"
+    )
 
 class ApiResponse(BaseModel):
     """
@@ -30,18 +36,19 @@ class ApiResponse(BaseModel):
         description="타입별 결과 딕셔너리. 내부 구조는 작업 타입에 따라 상이"
     )
 
-def _run_index_one(resolver: PipelineResolver, ft: FileType, date: str) -> Any:
+def _run_index_one(resolver: PipelineResolver, ft: FileType, date: str, mode: str) -> Any:
     """파일 타입 1개에 대해 index 실행."""
     collection = choose_collection(ft)
     svc = resolver.for_type(ft)
-    return svc.index(source=ft.value, date=date, collection=collection)
+    return svc.index(source=ft.value, date=date, collection=collection, mode=mode)
 
 @router.post(
     "",
     summary="문서 인덱싱",
     description=(
         "요청한 소스 유형(html/tsv)에 대해 문서를 인덱싱합니다. "
-        "`source`가 `all`이면 두 유형을 순차 처리하여 타입별 결과를 반환합니다."
+        "`source`가 `all`이면 두 유형을 동시에 처리하여 타입별 결과를 반환합니다. "
+        "`mode=delta`이면 이전 날짜 인덱스를 복제한 뒤 이전 날짜 대비 추가/변경/삭제된 문서만 반영합니다."
     ),
     operation_id="indexDocuments",
     status_code=200,
@@ -69,6 +76,29 @@ def _run_index_one(resolver: PipelineResolver, ft: FileType, date: str) -> Any:
                                 }
                             }
                         },
+                        "delta": {
+                            "summary": "delta 색인(html) 예",
+                            "value": {
+                                "success": True,
+                                "message": "문서 인덱싱 성공",
+                                "data": {
+                                    "html": {
+                                        "indexed": 2,
+                                        "deleted": 1,
+                                        "errors": [],
+                                        "index_name": [
+                                            "collection-html-3"
+                                        ],
+                                        "alias_name": "kakaobank",
+                                        "mode": "delta",
+                                        "base_date": "2",
+                                        "added": 1,
+                                        "changed": 1,
+                                        "unchanged": 6
+                                    }
+                                }
+                            }
+                        },
                         "all_types": {
                             "summary": "전체 타입 처리 예",
                             "value": {
@@ -106,10 +136,13 @@ def _run_index_one(resolver: PipelineResolver, ft: FileType, date: str) -> Any:
 def index(req: IndexRequest, resolver: PipelineResolver = Depends(get_pipeline_resolver)):
     logger.info(f"IndexRequest: {req}")
     if req.source == "all":
-        # html/tsv 각각 실행하고 타입별 결과를 dict로 반환
-        results: Dict[str, Any] = {ft.value: _run_index_one(resolver, ft, req.date) for ft in FileType}
+        # html/tsv를 동시에 실행하고 타입별 결과를 dict로 반환
+        results: Dict[str, Any] = run_per_file_type(
+            list(FileType),
+            lambda ft: _run_index_one(resolver, ft, req.date, req.mode),
+            concurrent=settings.SOURCE_ALL_CONCURRENT)
         return ApiResponse(success=True, message="문서 인덱싱 성공", data=results)
     else:
         ft = FileType(req.source)
-        result = _run_index_one(resolver, ft, req.date)
+        result = _run_index_one(resolver, ft, req.date, req.mode)
         return ApiResponse(success=True, message="문서 인덱싱 성공", data={ft.value: result})
@@ -0,0 +1,131 @@
+"""
+추출/변환/색인/파이프라인을 백그라운드 작업으로 실행하고 진행 상황을 조회/취소하는 API 라우터.
+"""
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field
+from typing import Literal, Dict, Any
+from api_server.app.api.deps import get_job_service
+from api_server.app.domain.services.job_service import JobService
+import logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+class JobRequest(BaseModel):
+    """
+    작업 등록 요청 바디
+    """
+    # extract | transform | index | pipeline
+    kind: Literal["extract", "transform", "index", "pipeline"] = Field(..., description="작업 종류")
+    # all | html | tsv
+    source: Literal["all", "html", "tsv"] = Field("all", description="default: all (html|tsv)")
+    date: str = Field(..., description="날짜(예: '3')")
+    # full | delta (index, pipeline)
+    mode: Literal["full", "delta"] = Field(
+        "full", description="full: 전체 색인, delta: 이전 날짜 인덱스를 복제 후 변경분만 색인"
+    )
+    save_intermediate: bool = Field(
+        False, description="pipeline: 디버깅용 중간 산출물(*_parsed.json, *_normalized.json) 저장 여부"
+    )
+
+class ApiResponse(BaseModel):
+    """
+    작업 응답
+    """
+    success: bool = Field(..., description="성공 여부")
+    message: str = Field(..., description="결과 메시지")
+    data: Dict[str, Any] = Field(
+        ...,
+        description="작업(job_id, kind, params, status, progress, result, error, 시각)"
+    )
+
+_JOB_EXAMPLE = {
+    "job_id": "4f1c2d0e9a7b4b0c8f3e2a1d5c6b7a89",
+    "kind": "index",
+    "params": {"source": "all", "date": "3", "mode": "full", "save_intermediate": False},
+    "status": "running",
+    "progress": {"listed": 0, "parsed": 0, "transformed": 0, "indexed": 8, "failed": 0},
+    "result": None,
+    "error": None,
+    "created_at": "2025-09-22T10:00:00",
+    "started_at": "2025-09-22T10:00:01",
+    "finished_at": None
+}
+
+@router.post(
+    "",
+    summary="백그라운드 작업 등록",
+    description=(
+        "추출/변환/색인/파이프라인 작업을 대기열에 넣고 바로 반환합니다. "
+        "반환된 `job_id`로 상태와 단계별 진행 건수를 조회합니다."
+    ),
+    operation_id="submitJob",
+    status_code=202,
+    response_model=ApiResponse,
+    responses={
+        202: {
+            "description": "작업 등록 성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "success": True,
+                        "message": "작업 등록 성공",
+                        "data": {**_JOB_EXAMPLE, "status": "queued", "started_at": None,
+                                 "progress": {"listed": 0, "parsed": 0, "transformed": 0, "indexed": 0, "failed": 0}}
+                    }
+                }
+            },
+        },
+        400: {"description": "잘못된 요청 값"},
+        500: {"description": "서버 내부 오류"},
+    },
+)
+def submit_job(req: JobRequest, svc: JobService = Depends(get_job_service)):
+    logger.info(f"JobRequest: {req}")
+    job = svc.submit(req.kind, req.model_dump(exclude={"kind"}))
+    return ApiResponse(success=True, message="작업 등록 성공", data=job.model_dump(mode="json"))
+
+@router.get(
+    "/{job_id}",
+    summary="작업 상태 조회",
+    description="작업 상태(queued/running/succeeded/failed/cancelled)와 단계별 진행 건수, 끝난 작업의 결과를 반환합니다.",
+    operation_id="getJob",
+    status_code=200,
+    response_model=ApiResponse,
+    responses={
+        200: {
+            "description": "작업 조회 성공",
+            "content": {
+                "application/json": {
+                    "example": {"success": True, "message": "작업 조회 성공", "data": _JOB_EXAMPLE}
+                }
+            },
+        },
+        404: {"description": "작업 없음"},
+        500: {"description": "서버 내부 오류"},
+    },
+)
+def get_job(job_id: str, svc: JobService = Depends(get_job_service)):
+    job = svc.get(job_id)
+    return ApiResponse(success=True, message="작업 조회 성공", data=job.model_dump(mode="json"))
+
+@router.delete(
+    "/{job_id}",
+    summary="작업 취소",
+    description=(
+        "작업 취소를 요청합니다. 대기 중인 작업은 바로 취소되고, "
+        "실행 중인 작업은 다음 문서/단계 경계에서 멈춥니다(새 인덱스로 alias는 회전하지 않음)."
+    ),
+    operation_id="cancelJob",
+    status_code=200,
+    response_model=ApiResponse,
+    responses={
+        200: {"description": "작업 취소 요청 성공"},
+        404: {"description": "작업 없음"},
+        500: {"description": "서버 내부 오류"},
+    },
+)
+def cancel_job(job_id: str, svc: JobService = Depends(get_job_service)):
+    job = svc.cancel(job_id)
+    return ApiResponse(success=True, message="작업 취소 요청 성공", data=job.model_dump(mode="json"))
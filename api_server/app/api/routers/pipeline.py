@@ -0,0 +1,116 @@
+"""
+추출 -> 변환 -> 색인을 한 번에 스트리밍으로 수행하는 API 라우터.
+"""
+
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, Field
+from typing import Literal, Dict, Any
+from api_server.app.api.deps import get_pipeline_resolver, limit_route_concurrency, PipelineResolver, INGEST_ROUTE
+from api_server.app.domain.utils import choose_collection, run_per_file_type
+from api_server.app.platform.config import settings
+from api_server.app.domain.models import FileType
+import logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/pipeline", tags=["pipeline"], dependencies=[Depends(limit_route_concurrency(INGEST_ROUTE))])
+
+class PipelineRequest(BaseModel):
+    """
+    파이프라인 실행 요청 바디
+    """
+    # all | html | tsv
+    source: Literal["all", "html", "tsv"] = Field("all", description="default: all (html|tsv)")
+    date: str = Field(..., description="날짜(예: '3')")
+    save_intermediate: bool = Field(
+        False, description="디버깅용 중간 산출물(*_parsed.json, *_normalized.json) 저장 여부"
+    )
+    # full | delta
+    mode: Literal["full", "delta"] = Field(
+        "full", description="full: 전체 색인, delta: 이전 날짜 인덱스를 복제 후 변경분만 색인"
+    )
+
+class ApiResponse(BaseModel):
+    """
+    파이프라인 실행 응답
+    """
+    success: bool = Field(..., description="성공 여부")
+    message: str = Field(..., description="결과 메시지")
+    # 키: 'html' 또는 'tsv' (source=all인 경우 두 키 모두 존재)
+    data: Dict[str, Any] = Field(
+        ...,
+        description="타입별 결과 딕셔너리. 내부 구조는 작업 타입에 따라 상이"
+    )
+
+def _run_pipeline_one(
+    resolver: PipelineResolver, 
+    ft: FileType, 
+    date: str, 
+    save_intermediate: bool,
+    mode: str) -> Any:
+    """파일 타입 1개에 대해 pipeline 실행."""
+    collection = choose_collection(ft)
+    svc = resolver.for_type(ft)
+    return svc.run_pipeline(
+        source=ft.value, 
+        date=date, 
+        collection=collection, 
+        save_intermediate=save_intermediate,
+        mode=mode)
+
+@router.post(
+    "",
+    summary="문서 추출/변환/인덱싱 일괄 실행",
+    description=(
+        "요청한 소스 유형(html/tsv)에 대해 추출 -> 변환 -> 인덱싱을 중간 파일 없이 스트리밍으로 실행합니다. "
+        "`save_intermediate=true`이면 디버깅용 중간 파일도 함께 저장합니다. "
+        "`mode=delta`이면 이전 날짜 대비 변경분만 반영합니다(다음 날짜 비교용 normalized 파일은 항상 저장). "
+        "`source`가 `all`이면 두 유형을 동시에 처리하여 타입별 결과를 반환합니다."
+    ),
+    operation_id="runPipeline",
+    status_code=200,
+    response_model=ApiResponse,
+    responses={
+        200: {
+            "description": "파이프라인 실행 성공",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "single_type": {
+                            "summary": "단일 타입(html) 처리 예",
+                            "value": {
+                                "success": True,
+                                "message": "파이프라인 실행 성공",
+                                "data": {
+                                    "html": {
+                                        "indexed": 8,
+                                        "errors": [],
+                                        "index_name": [
+                                            "collection-html-3"
+                                        ],
+                                        "alias_name": "kakaobank"
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            },
+        },
+        400: {"description": "잘못된 요청 값"},
+        500: {"description": "서버 내부 오류"},
+    },
+)
+def pipeline(req: PipelineRequest, resolver: PipelineResolver = Depends(get_pipeline_resolver)):
+    logger.info(f"PipelineRequest: {req}")
+    if req.source == "all":
+        # html/tsv를 동시에 실행하고 타입별 결과를 dict로 반환
+        results: Dict[str, Any] = run_per_file_type(
+            list(FileType),
+            lambda ft: _run_pipeline_one(resolver, ft, req.date, req.save_intermediate, req.mode),
+            concurrent=settings.SOURCE_ALL_CONCURRENT)
+        return ApiResponse(success=True, message="파이프라인 실행 성공", data=results)
+    else:
+        ft = FileType(req.source)
+        result = _run_pipeline_one(resolver, ft, req.date, req.save_intermediate, req.mode)
+        return ApiResponse(success=True, message="파이프라인 실행 성공", data={ft.value: result})
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
-from api_server.app.api.deps import get_search_service, SearchService
-from typing import Dict, Any
+from api_server.app.api.deps import get_async_search_service, AsyncSearchService
+from typing import Dict, Any, List, Literal, Optional
+from api_server.app.domain.models import SearchOptions
+from api_server.app.platform.config import settings
 import logging
 logger = logging.getLogger(__name__)
 
@@ -11,6 +13,38 @@ class SearchRequest(BaseModel):
     query: str = Field(..., description="검색 쿼리")
     size: int = Field(3, description="검색 결과 개수")
     explain: bool = Field(False, description="검색 결과 설명 포함 여부")
+    options: Optional[SearchOptions] = Field(
+        None,
+        description="_source 필드 선택/하이라이트 옵션(없으면 compact는 기본 필드+하이라이트, raw는 _source 전체)"
+    )
+    format: Literal["compact", "raw"] = Field(
+        "compact",
+        description="compact: {total, took_ms, items} 요약 응답, raw: OpenSearch 응답 그대로"
+    )
+
+    def search_options(self) -> Optional[SearchOptions]:
+        return self.options or (SearchOptions() if self.format == "compact" else None)
+
+class SearchBatchRequest(BaseModel):
+    queries: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.SEARCH_BATCH_MAX_QUERIES,
+        description="검색 쿼리 목록(한 번의 msearch로 실행)"
+    )
+    size: int = Field(3, description="쿼리별 검색 결과 개수")
+    explain: bool = Field(False, description="검색 결과 설명 포함 여부")
+    options: Optional[SearchOptions] = Field(
+        None,
+        description="_source 필드 선택/하이라이트 옵션(없으면 compact는 기본 필드+하이라이트, raw는 _source 전체)"
+    )
+    format: Literal["compact", "raw"] = Field(
+        "compact",
+        description="compact: 쿼리별 result를 {total, took_ms, items} 요약 응답으로, raw: OpenSearch 응답 그대로"
+    )
+
+    def search_options(self) -> Optional[SearchOptions]:
+        return self.options or (SearchOptions() if self.format == "compact" else None)
 
 class ApiResponse(BaseModel):
     """
@@ -29,7 +63,10 @@ class ApiResponse(BaseModel):
     summary="문서 검색",
     description=(
         "쿼리로 문서를 검색합니다. `size`로 반환 개수를 제한하고, "
-        "`explain=true`로 설정하면 각 결과에 점수 산출 근거를 포함합니다."
+        "`explain=true`로 설정하면 각 결과에 점수 산출 근거를 포함합니다. "
+        "기본(`format=compact`)은 주요 필드와 본문 하이라이트 조각(`highlights`)만 반환하며, "
+        "`options`로 `_source` 포함/제외 필드와 하이라이트 필드/조각 크기를 지정할 수 있습니다. "
+        "`format=raw`는 OpenSearch 응답을 그대로 반환합니다."
     ),
     operation_id="searchDocuments",
     status_code=200,
@@ -53,7 +90,7 @@ class ApiResponse(BaseModel):
                                             "id": "doc_123",
                                             "score": 12.34,
                                             "title": "FastAPI로 만드는 검색 API",
-                                            
+                                            "highlights": {"body": ["<em>FastAPI</em>로 검색 API를 만드는 방법"]}
                                         },
                                         {
                                             "id": "doc_122",
@@ -77,7 +114,81 @@ class ApiResponse(BaseModel):
         500: {"description": "서버 내부 오류"},
     },
 )
-def search(req: SearchRequest, svc: SearchService = Depends(get_search_service)):
+async def search(req: SearchRequest, svc: AsyncSearchService = Depends(get_async_search_service)):
     logger.info(f"SearchRequest: {req}")
-    result = svc.search(query=req.query, size=req.size, explain=req.explain)
+    result = await svc.search(
+        query=req.query, size=req.size, explain=req.explain,
+        options=req.search_options(), compact=req.format == "compact")
     return ApiResponse(success=True, message="검색 성공", data=result)
+
+
+@router.post(
+    "/batch",
+    summary="문서 일괄 검색",
+    description=(
+        "여러 쿼리를 OpenSearch `_msearch` 한 번으로 검색합니다. "
+        "결과는 요청한 쿼리 순서대로 쿼리별 검색 결과와 처리 시간(`took_ms`)을 반환하며, "
+        "일부 쿼리가 실패해도 나머지 결과는 그대로 반환합니다(실패 항목은 `error` 포함)."
+    ),
+    operation_id="searchDocumentsBatch",
+    status_code=200,
+    response_model=ApiResponse,
+    responses={
+        200: {
+            "description": "검색 성공",
+            "content": {
+                "application/json": {
+                    "examples": {
+                        "basic": {
+                            "summary": "일괄 검색 예시",
+                            "value": {
+                                "success": True,
+                                "message": "검색 성공",
+                                "data": {
+                                    "took_ms": 18,
+                                    "items": [
+                                        {
+                                            "query": "카카오뱅크",
+                                            "took_ms": 7,
+                                            "result": {"total": 12, "took_ms": 7, "items": []}
+                                        },
+                                        {
+                                            "query": "삼성전자",
+                                            "status": 400,
+                                            "error": {"type": "search_phase_execution_exception"}
+                                        }
+                                    ]
+                                }
+                            }
+                        }
+                    }
+                }
+            },
+        },
+        400: {"description": "잘못된 요청 값"},
+        422: {"description": "쿼리 목록이 비었거나 최대 개수를 초과"},
+        500: {"description": "서버 내부 오류"},
+    },
+)
+async def search_batch(req: SearchBatchRequest, svc: AsyncSearchService = Depends(get_async_search_service)):
+    logger.info(f"SearchBatchRequest: queries={len(req.queries)} size={req.size} explain={req.explain}")
+    result = await svc.search_batch(
+        queries=req.queries, size=req.size, explain=req.explain,
+        options=req.search_options(), compact=req.format == "compact")
+    return ApiResponse(success=True, message="검색 성공", data=result)
+
+
+@router.get(
+    "/stats",
+    summary="검색 요청 합치기 통계",
+    description=(
+        "같은 조건으로 동시에 들어와 진행 중인 OpenSearch 요청 하나로 합쳐진 검색 수를 반환합니다. "
+        "`leaders`는 실제 OpenSearch(또는 캐시)로 보낸 검색 수, `coalesced`는 합쳐진 검색 수, "
+        "`in_flight`는 현재 진행 중인 검색 수입니다(프로세스 단위)."
+    ),
+    operation_id="searchStats",
+    status_code=200,
+    response_model=ApiResponse,
+)
+async def search_stats(svc: AsyncSearchService = Depends(get_async_search_service)):
+    return ApiResponse(success=True, message="조회 성공", data={"coalescing": svc.coalescing_stats()})
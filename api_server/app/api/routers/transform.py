@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 from typing import Literal, Dict, Any
-from api_server.app.api.deps import get_pipeline_resolver, PipelineResolver
-from api_server.app.domain.utils import choose_collection
+from api_server.app.api.deps import get_pipeline_resolver, limit_route_concurrency, PipelineResolver
+from api_server.app.domain.utils import choose_collection, run_per_file_type
+from api_server.app.platform.config import settings
 from api_server.app.domain.models import FileType
 import logging
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/transform", tags=["transform"])
+router = APIRouter(
+    prefix="/transform", tags=["transform"], dependencies=[Depends(limit_route_concurrency("transform"))])
 
 class TransformRequest(BaseModel):
     """
@@ -40,7 +42,7 @@ def _run_transform_one(resolver: PipelineResolver, ft: FileType, date: str) -> A
     summary="문서 변환 후 저장",
     description=(
         "요청한 소스 유형(html/tsv)에 대해 문서를 **변환(transform)** 하고 저장합니다. "
-        "`source=all`이면 html/tsv 모두 순차 처리하여 타입별 결과를 반환합니다."
+        "`source=all`이면 html/tsv 모두 동시에 처리하여 타입별 결과를 반환합니다."
     ),
     operation_id="transformDocuments",
     status_code=200,
@@ -83,8 +85,11 @@ def _run_transform_one(resolver: PipelineResolver, ft: FileType, date: str) -> A
 def transform(req: TransformRequest, resolver: PipelineResolver = Depends(get_pipeline_resolver)):
     logger.info(f"TransformRequest: {req}")
     if req.source == "all":
-        # html/tsv 각각 실행하고 타입별 결과를 dict로 반환
-        results: Dict[str, Any] = {ft.value: _run_transform_one(resolver, ft, req.date) for ft in FileType}
+        # html/tsv를 동시에 실행하고 타입별 결과를 dict로 반환
+        results: Dict[str, Any] = run_per_file_type(
+            list(FileType),
+            lambda ft: _run_transform_one(resolver, ft, req.date),
+            concurrent=settings.SOURCE_ALL_CONCURRENT)
         return ApiResponse(success=True, message="문서 변환 성공", data=results)
     else:
         ft = FileType(req.source)
@@ -0,0 +1,243 @@
+"""
+단계 사이 중간 산출물(*_parsed, *_normalized) 파일 형식.
+
+형식은 설정(ARTIFACT_FORMAT)으로 고르고, 읽을 때는 파일 확장자로 판별한다.
+- jsonl     (.json)     : 한 줄에 문서 1건(기본값, 기존 파일과 호환)
+- jsonl.gz  (.json.gz)  : gzip 압축 JSONL
+- jsonl.zst (.json.zst) : zstd 압축 JSONL(zstandard 패키지 필요)
+- parquet   (.parquet)  : 컬럼 형식(pyarrow 패키지 필요, NormalizedChunk처럼 평평한 모델만)
+  중첩 모델(ParsedDocument)은 parquet를 고르더라도 JSONL(.json)로 기록한다.
+
+JSONL 기록은 model_dump_json(Rust 직렬화)으로 dict/json.dumps 변환을 거치지 않는다.
+
+기록할 때 모델 이름과 스키마 버전(모델 JSON 스키마의 해시)을 헤더로 남긴다
+(JSONL: 첫 줄 {"_artifact": {...}}, parquet: 스키마 메타데이터).
+헤더가 현재 모델과 일치하는 파일은 이전 단계가 이미 검증한 "신뢰 산출물"로 보고
+읽는 쪽에서 pydantic 재검증을 생략할 수 있다(is_trusted). 헤더가 없거나 다르면 평소처럼 검증한다.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+import hashlib
+import json
+import os
+
+from pydantic import BaseModel
+
+from api_server.app.domain.jsonl import (
+    HEADER_KEY, iter_jsonl_lines, iter_jsonl_models, loads, open_binary, read_jsonl_header
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+# 형식 이름 -> 파일 확장자
+ARTIFACT_FORMATS: Dict[str, str] = {
+    "jsonl": ".json",
+    "jsonl.gz": ".json.gz",
+    "jsonl.zst": ".json.zst",
+    "parquet": ".parquet",
+}
+
+# parquet 행 그룹(한 번에 기록/읽기하는 행 수)
+PARQUET_ROW_GROUP_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def schema_version(model: Type[BaseModel]) -> str:
+    """
+    모델 JSON 스키마의 해시(필드/타입/제약이 바뀌면 달라진다).
+    """
+    schema = json.dumps(model.model_json_schema(), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()[:16]
+
+
+def artifact_header(model: Type[BaseModel]) -> Dict[str, str]:
+    return {"model": model.__name__, "schema_version": schema_version(model)}
+
+
+def read_header(path: str) -> Optional[Dict[str, str]]:
+    """
+    산출물 헤더를 읽는다(헤더가 없는 외부 입력/이전 형식 파일이면 None).
+    """
+    if path.endswith(".parquet"):
+        _, pq = _import_pyarrow()
+        metadata = pq.read_schema(path).metadata or {}
+        raw = metadata.get(HEADER_KEY.encode())
+        return loads(raw) if raw else None
+    return read_jsonl_header(path)
+
+
+def is_trusted(path: str, model: Type[BaseModel]) -> bool:
+    """
+    파일이 현재 model 스키마로 기록된 내부 산출물이면 True(재검증 생략 가능).
+    """
+    try:
+        return read_header(path) == artifact_header(model)
+    except (OSError, ValueError):
+        return False
+
+
+def artifact_extension(artifact_format: str, columnar: bool = True) -> str:
+    """
+    형식에 맞는 파일 확장자를 반환한다.
+    Args:
+        artifact_format: str (jsonl | jsonl.gz | jsonl.zst | parquet)
+        columnar: bool (False면 parquet 대신 JSONL 확장자 사용 - 중첩 모델)
+    Returns:
+        str: 파일 확장자
+    """
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise ValueError(f"unsupported artifact format: {artifact_format}")
+    if artifact_format == "parquet" and not columnar:
+        return ARTIFACT_FORMATS["jsonl"]
+    return ARTIFACT_FORMATS[artifact_format]
+
+
+def find_artifact(stem: str, extension: str) -> str:
+    """
+    stem + extension 파일이 있으면 그 경로를, 없으면 다른 형식으로 기록된 파일을 찾아 반환한다.
+    (설정을 바꾼 뒤에도 이전 형식으로 만든 산출물을 읽을 수 있도록)
+    Args:
+        stem: str (확장자를 뺀 경로)
+        extension: str (우선 확인할 확장자)
+    Returns:
+        str: 존재하는 파일 경로(아무 것도 없으면 stem + extension)
+    """
+    preferred = stem + extension
+    if os.path.exists(preferred):
+        return preferred
+    for ext in ARTIFACT_FORMATS.values():
+        if os.path.exists(stem + ext):
+            return stem + ext
+    return preferred
+
+
+@contextmanager
+def open_writer(path: str, model: Type[BaseModel]) -> Iterator[Any]:
+    """
+    확장자에 맞는 산출물 writer를 연다. writer.write(doc)로 한 건씩 기록한다.
+    Args:
+        path: str (파일 경로)
+        model: Type[BaseModel] (기록할 모델, parquet 스키마 생성용)
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    writer = _ParquetWriter(path, model) if path.endswith(".parquet") else _JsonlWriter(path, model)
+    try:
+        yield writer
+    finally:
+        writer.close()
+
+
+def iter_models(path: str, model: Type[M]) -> Iterator[M]:
+    """
+    산출물 파일을 한 건씩 model로 읽는다(확장자로 형식 판별).
+    """
+    if path.endswith(".parquet"):
+        for _, record in _iter_parquet_records(path):
+            yield model.model_validate(record)
+        return
+    yield from iter_jsonl_models(path, model)
+
+
+def iter_records(path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    산출물 파일을 (순번, dict)로 한 건씩 읽는다. 순번은 1부터(JSONL은 줄 번호).
+    """
+    if path.endswith(".parquet"):
+        yield from _iter_parquet_records(path)
+        return
+    for line_no, line in iter_jsonl_lines(path):
+        yield line_no, loads(line)
+
+
+# ================= internal helpers =================
+class _JsonlWriter:
+
+    def __init__(self, path: str, model: Type[BaseModel]) -> None:
+        self._f = open_binary(path, "wb")
+        self._f.write(json.dumps({HEADER_KEY: artifact_header(model)}).encode("utf-8"))
+        self._f.write(b"\n")
+
+    def write(self, doc: BaseModel) -> None:
+        self._f.write(doc.model_dump_json().encode("utf-8"))
+        self._f.write(b"\n")
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class _ParquetWriter:
+
+    def __init__(self, path: str, model: Type[BaseModel]) -> None:
+        pa, pq = _import_pyarrow()
+        self._pa = pa
+        self._schema = _arrow_schema(pa, model).with_metadata(
+            {HEADER_KEY: json.dumps(artifact_header(model))})
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, doc: BaseModel) -> None:
+        self._rows.append(doc.model_dump(mode="json"))
+        if len(self._rows) >= PARQUET_ROW_GROUP_SIZE:
+            self._flush()
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+    def _flush(self) -> None:
+        if self._rows:
+            batch = self._pa.RecordBatch.from_pylist(self._rows, schema=self._schema)
+            self._writer.write_batch(batch)
+            self._rows = []
+
+
+def _iter_parquet_records(path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    _, pq = _import_pyarrow()
+    seq = 0
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=PARQUET_ROW_GROUP_SIZE):
+        for record in batch.to_pylist(maps_as_pydicts="strict"):
+            seq += 1
+            yield seq, record
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("pyarrow package is required for parquet artifacts") from e
+    return pyarrow, pyarrow.parquet
+
+
+def _arrow_schema(pa, model: Type[BaseModel]):
+    """
+    모델 필드 타입으로 arrow 스키마를 만든다(datetime은 model_dump(mode="json")의 ISO 문자열).
+    """
+    scalars = {
+        str: pa.string(),
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        datetime: pa.string(),
+    }
+
+    def to_arrow(annotation):
+        # X | None -> X
+        if get_origin(annotation) is Union or type(annotation).__name__ == "UnionType":
+            args = [a for a in get_args(annotation) if a is not type(None)]
+            if len(args) == 1:
+                return to_arrow(args[0])
+        if annotation in scalars:
+            return scalars[annotation]
+        if get_origin(annotation) is list:
+            return pa.list_(to_arrow(get_args(annotation)[0]))
+        if get_origin(annotation) is dict and get_args(annotation)[0] is str:
+            return pa.map_(pa.string(), to_arrow(get_args(annotation)[1]))
+        raise ValueError(f"parquet artifacts support flat models only: {model.__name__} {annotation}")
+
+    return pa.schema([(name, to_arrow(field.annotation)) for name, field in model.model_fields.items()])
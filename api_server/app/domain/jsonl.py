@@ -0,0 +1,127 @@
+"""
+JSONL(한 줄에 JSON 객체 하나) 파일 스트리밍 읽기.
+
+- 파일 전체를 올리지 않고 한 줄씩 읽으므로 메모리 사용량은 가장 큰 한 줄(문서 1건) 크기로 제한된다
+- 모델로 읽을 때는 pydantic의 model_validate_json(Rust 파서)으로 dict를 거치지 않고 바로 검증
+- dict로 읽을 때는 orjson이 설치되어 있으면 orjson.loads를 사용(없으면 표준 json)
+- 예전 형식(한 줄 전체가 JSON 배열 또는 {"data": [...]})도 항목별로 풀어서 반환한다
+- 확장자가 .gz / .zst 이면 압축을 풀면서 읽고 쓴다(zst는 zstandard 패키지 필요)
+- 첫 줄의 산출물 헤더({"_artifact": {...}})는 데이터로 반환하지 않는다(read_jsonl_header로 읽음)
+"""
+
+from __future__ import annotations
+from typing import IO, Any, Iterator, Tuple, Type, TypeVar
+import gzip
+import io
+import json
+
+from pydantic import BaseModel, ValidationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    orjson = None
+
+M = TypeVar("M", bound=BaseModel)
+
+HAS_ORJSON = orjson is not None
+
+# 내부 산출물 헤더 줄의 키(모델 이름/스키마 버전)
+HEADER_KEY = "_artifact"
+_HEADER_PREFIX = b'{"' + HEADER_KEY.encode() + b'"'
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    JSON 문자열/바이트를 파싱한다(orjson이 있으면 orjson 사용).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def open_binary(path: str, mode: str = "rb") -> IO[bytes]:
+    """
+    확장자에 맞게(.gz: gzip, .zst: zstandard, 그 외: 일반 파일) 바이너리 스트림을 연다.
+    Args:
+        path: str (파일 경로)
+        mode: str ("rb" | "wb")
+    Returns:
+        IO[bytes]: 줄 단위로 읽고 쓸 수 있는 스트림
+    """
+    if path.endswith(".gz"):
+        # 중간 산출물은 한 번 쓰고 한 번 읽으므로 압축률보다 속도를 우선한다
+        return gzip.open(path, mode, compresslevel=1)
+    if path.endswith(".zst"):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError(f"zstandard package is required for {path}") from e
+        if "w" in mode:
+            return zstandard.open(path, mode, cctx=zstandard.ZstdCompressor(level=3, threads=-1))
+        return io.BufferedReader(zstandard.open(path, mode))
+    return open(path, mode)
+
+
+def iter_jsonl_lines(path: str) -> Iterator[Tuple[int, bytes]]:
+    """
+    비어 있지 않은 줄을 (줄 번호, 원본 바이트)로 반환한다. 줄 번호는 1부터.
+    첫 줄(비어 있지 않은 첫 줄)이 산출물 헤더일 때만 건너뛰고, 이후 줄은 "_artifact" 키로 시작해도 데이터로 반환한다.
+    (디코딩은 파서에 맡겨 문자열 변환 비용을 줄인다)
+    """
+    with open_binary(path, "rb") as f:
+        first = True
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            if first:
+                first = False
+                if line.startswith(_HEADER_PREFIX):
+                    continue
+            yield line_no, line
+
+
+def read_jsonl_header(path: str) -> dict | None:
+    """
+    첫 줄이 산출물 헤더이면 그 내용을, 아니면(외부 입력/이전 형식 파일) None을 반환한다.
+    """
+    with open_binary(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            if line.startswith(_HEADER_PREFIX):
+                return loads(line).get(HEADER_KEY)
+            return None
+    return None
+
+
+def iter_jsonl(path: str) -> Iterator[Any]:
+    """
+    JSONL 파일의 각 줄을 파싱해서 반환한다.
+    """
+    for _, line in iter_jsonl_lines(path):
+        yield loads(line)
+
+
+def iter_jsonl_models(path: str, model: Type[M]) -> Iterator[M]:
+    """
+    JSONL 파일의 각 줄을 model로 검증해서 한 건씩 반환한다.
+    Args:
+        path: str (JSONL 파일 경로)
+        model: Type[BaseModel] (각 줄의 모델)
+    Returns:
+        Iterator[BaseModel]
+    """
+    for _, line in iter_jsonl_lines(path):
+        try:
+            doc = model.model_validate_json(line)
+        except ValidationError:
+            # 예전 형식: 한 줄에 JSON 배열 또는 {"data": [...]}
+            payload = loads(line)
+            if isinstance(payload, dict) and isinstance(payload.get("data"), list):
+                payload = payload["data"]
+            if not isinstance(payload, list):
+                raise
+            yield from (model.model_validate(item) for item in payload)
+            continue
+        yield doc
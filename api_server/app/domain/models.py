@@ -6,16 +6,19 @@
 - SourceRef: 원본 리소스 식별자/메타데이터
 - RawDocument: 페치된 원문(HTML/텍스트 등)
 - ParsedDocument/ParsedBlock: 파서가 구조화한 결과
+- RowTable: 표 형식(TSV) 원문의 행들(컬럼 이름은 한 번만, 행은 값 튜플)
 - NormalizedChunk: 인덱싱 단위(컬렉션에 적재될 정규화된 청크)
 - IndexResult: 인덱싱 결과 요약
 - AliasResult: alias 결과 요약
+- SearchOptions: 검색 응답 필드 선택(_source)/하이라이트(snippet) 옵션
 - IndexErrorItem: 인덱싱 실패 항목 요약
+- Job/JobStatus/JobProgress: 백그라운드 작업(추출/변환/색인) 상태와 단계별 진행 건수
 """
 
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Literal
+from typing import Any, Dict, Iterator, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -58,21 +61,52 @@ class ParsedBlock(BaseModel):
     meta: JSONDict = Field(default_factory=dict, description="태그/속성 등 부가 정보")   
 
 
+class RowTable(BaseModel):
+    """
+    표 형식 원문의 행 묶음.
+    행마다 ParsedBlock + meta dict를 두면 컬럼 이름이 행 수만큼 중복되고 객체 오버헤드가 커지므로
+    컬럼 이름은 한 번만 두고 행은 값 튜플(컬럼 순서)로 보관한다. (JSON에서는 배열의 배열)
+    """
+    columns: list[str] = Field(default_factory=list, description="컬럼 이름(행 값의 순서)")
+    rows: list[tuple[str | None, ...]] = Field(default_factory=list, description="행 값 튜플 목록")
+
+    def iter_dicts(self) -> Iterator[Dict[str, str | None]]:
+        """
+        행을 {컬럼: 값} dict로 한 건씩 만들어 반환한다(소비 후 바로 버려지므로 전체를 들고 있지 않음).
+        """
+        columns = self.columns
+        for row in self.rows:
+            yield dict(zip(columns, row))
+
+
 class ParsedDocument(BaseModel):
     """구조화된 문서(여러 콘텐츠 블록으로 구성)."""
     source: SourceRef
     title: str | None = Field(None, description="문서 제목 추정")
     blocks: list[ParsedBlock] = Field(default_factory=list)
+    table: RowTable | None = Field(None, description="표 형식 원문(TSV)의 행들")
     lang: str | None = Field(None, description="ko (예: ko, en-US)")
     meta: JSONDict = Field(default_factory=dict, description="추출 시점의 부가 메타")
     collection: Collection | None = Field(None, description="컬렉션 이름")
 
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        표 형식 행을 dict로 반환한다(table이 없으면 이전 형식의 row 블록 meta).
+        """
+        if self.table is not None:
+            yield from self.table.iter_dicts()
+            return
+        for block in self.blocks:
+            if block.type == "row":
+                yield block.meta
+
 
 class NormalizedChunk(BaseModel):
     """
     인덱싱 대상 문서 1건과 1:1로 매핑되는 모델.
     OpenSearch 매핑 예시:
       - source_id: keyword
+      - content_hash: keyword (내용 해시, 변경 없는 문서 재색인 생략용)
       - source_path: text (+ keyword 서브필드 권장)
       - file_type: keyword
       - title: text (+ keyword 서브필드 권장)
@@ -86,6 +120,7 @@ class NormalizedChunk(BaseModel):
 
     # ---- 식별/메타 ----
     source_id: str = Field(..., description="원본(수집원) 식별자")
+    content_hash: str | None = Field(None, description="색인 내용 해시(변경 감지용)")
     source_path: str = Field(..., description="원본 경로(URL/파일 경로 등)")
     file_type: str = Field(..., description="원본 유형(e.g. html, pdf, tsv, md)")
     collection: str = Field(..., description="컬렉션 이름")
@@ -126,6 +161,7 @@ class IndexErrorItem(BaseModel):
 class IndexResult(BaseModel):
     """인덱싱 실행 결과."""
     indexed: int = Field(..., ge=0)
+    deleted: int = Field(0, ge=0, description="삭제 건수(delta 색인)")
     errors: list[IndexErrorItem] = Field(default_factory=list)
 
 
@@ -133,3 +169,60 @@ class AliasResult(BaseModel):
     """alias 실행 결과."""
     index_name: list[str] = Field(default_factory=list)
     alias_name: str = Field(..., description="alias 이름")
+
+
+# 검색 응답 기본 필드(본문/문단/인포박스/요약 전문은 싣지 않고 하이라이트 조각으로 대신한다)
+DEFAULT_SOURCE_INCLUDES = ["source_id", "collection", "file_type", "title", "question", "answer"]
+DEFAULT_HIGHLIGHT_FIELDS = ["body", "paragraph", "summary", "infobox"]
+
+
+class SearchOptions(BaseModel):
+    """검색 응답 필드 선택(_source)과 하이라이트(snippet) 옵션."""
+    source_includes: list[str] | None = Field(
+        default_factory=lambda: list(DEFAULT_SOURCE_INCLUDES),
+        description="응답 _source에 포함할 필드(None이면 전체)",
+    )
+    source_excludes: list[str] | None = Field(None, description="응답 _source에서 뺄 필드")
+    highlight_fields: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_HIGHLIGHT_FIELDS),
+        description="검색어가 나온 부분을 조각(snippet)으로 돌려받을 필드(빈 목록이면 하이라이트 없음)",
+    )
+    fragment_size: int = Field(150, ge=1, le=2000, description="하이라이트 조각 길이(문자 수)")
+    number_of_fragments: int = Field(3, ge=1, le=20, description="필드별 최대 하이라이트 조각 수")
+
+
+class JobStatus(str, Enum):
+    queued = "queued"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+    cancelled = "cancelled"
+
+
+class JobProgress(BaseModel):
+    """작업 단계별 진행 건수."""
+    listed: int = Field(0, ge=0, description="수집 파일 목록 건수")
+    parsed: int = Field(0, ge=0, description="파싱 완료 문서 수")
+    transformed: int = Field(0, ge=0, description="변환 완료 청크 수")
+    indexed: int = Field(0, ge=0, description="색인 완료 문서 수")
+    failed: int = Field(0, ge=0, description="색인 실패 문서 수")
+
+
+class Job(BaseModel):
+    """백그라운드 작업(extract/transform/index/pipeline)."""
+    job_id: str
+    kind: str = Field(..., description="작업 종류(extract|transform|index|pipeline)")
+    params: JSONDict = Field(default_factory=dict, description="작업 요청 파라미터")
+    status: JobStatus = JobStatus.queued
+    progress: JobProgress = Field(default_factory=JobProgress)
+    result: Any | None = Field(None, description="작업 결과(라우터 응답의 data와 같은 형태)")
+    error: str | None = None
+    worker: str | None = Field(None, description="작업을 실행 중인(실행한) 워커(host:pid)")
+    attempts: int = Field(0, ge=0, description="실행 시도 횟수(워커가 죽어 다시 대기열에 넣으면 증가)")
+    created_at: datetime = Field(default_factory=datetime.now)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.succeeded, JobStatus.failed, JobStatus.cancelled)
@@ -7,11 +7,12 @@
 
 from __future__ import annotations
 
-from typing import Protocol, List, Dict, Any
+from typing import Protocol, List, Dict, Any, Iterable, Iterator
 from .models import (
     RawDocument, ParsedDocument, NormalizedChunk,
     Collection,
-    IndexResult, AliasResult, IndexErrorItem
+    IndexResult, AliasResult, IndexErrorItem,
+    Job, JobStatus, SearchOptions
 )
 
 class ListenPort(Protocol):
@@ -49,6 +50,27 @@ class ParsePort(Protocol):
         ...
 
 
+class ParseCachePort(Protocol):
+    """파싱 결과를 원문 내용 해시 키로 저장/조회한다(로컬 디스크 등)."""
+
+    def get(self, key: str) -> ParsedDocument | None:
+        """
+        Args:
+            key: 원문 내용 해시 키
+        Returns:
+            ParsedDocument | None: 캐시된 파싱 결과(없으면 None)
+        """
+        ...
+
+    def put(self, key: str, doc: ParsedDocument) -> None:
+        """
+        Args:
+            key: 원문 내용 해시 키
+            doc: 저장할 파싱 결과
+        """
+        ...
+
+
 class TransformPort(Protocol):
     """
     파싱 결과를 인덱싱 단위 청크로 정규화/변환.
@@ -63,6 +85,14 @@ class TransformPort(Protocol):
         """
         ...
     
+    def transform_iter(self, docs: Iterable[ParsedDocument]) -> Iterator[NormalizedChunk]:
+        """
+        파싱 결과를 스트리밍으로 변환한다(파이프라인 모드).
+        Returns:
+            Iterator[NormalizedChunk]: 적재 가능한 청크 이터레이터
+        """
+        ...
+
     def read_parsed_document(self, resource_file_path: str) -> List[ParsedDocument]:
         """
         Returns:
@@ -70,6 +100,30 @@ class TransformPort(Protocol):
         """
         ...
 
+    def iter_parsed_document(self, resource_file_path: str) -> Iterator[ParsedDocument]:
+        """
+        파싱 결과 파일을 한 건씩 읽는다(파일 전체를 메모리에 올리지 않음).
+        Returns:
+            Iterator[ParsedDocument]: 파싱 결과 이터레이터
+        """
+        ...
+
+
+class ColumnarTransformPort(Protocol):
+    """
+    수집 파일을 파싱 결과/청크 객체 없이 열(column) 단위로 읽어 색인 문서(dict)를 바로 만든다.
+    행 수가 매우 많은 표 형식 원문(TSV)의 파이프라인 고속 경로.
+    """
+    def iter_records(self, resource_file: str, collection: Collection) -> Iterator[Dict[str, Any]]:
+        """
+        Args:
+            resource_file: 수집 파일 경로
+            collection: 컬렉션
+        Returns:
+            Iterator[Dict[str, Any]]: NormalizedChunk.model_dump(mode="json")과 같은 형태의 색인 문서
+        """
+        ...
+
 
 class IndexPort(Protocol):
     """
@@ -84,13 +138,282 @@ class IndexPort(Protocol):
         """
         ...
 
+    def index_chunks(self, index_name: str, chunks: Iterable[NormalizedChunk]) -> IndexResult:
+        """
+        파일을 거치지 않고 청크 이터러블을 바로 적재한다(파이프라인 모드).
+        Returns:
+            IndexResult: 성공/실패 건수 및 실패 상세
+        """
+        ...
+
+    def index_records(self, index_name: str, records: Iterable[Dict[str, Any]]) -> IndexResult:
+        """
+        이미 색인 문서 형태(dict)로 만들어진 레코드를 검증/재직렬화 없이 적재한다(열 단위 고속 경로).
+        Returns:
+            IndexResult: 성공/실패 건수 및 실패 상세
+        """
+        ...
+
+    def finalize_index(self, index_name: str) -> None:
+        """
+        적재를 마친 인덱스의 설정을 복원하고 refresh(옵션: force merge)한다.
+        alias 회전 전에 호출한다.
+        """
+        ...
+
+    def discard_index(self, index_name: str) -> None:
+        """
+        적재(생성/복제 ~ finalize)에 실패하거나 취소된 인덱스를 정리한다.
+        이번 적재에서 새로 만든(복제한) 인덱스는 삭제해 대량 적재 설정이 남은 인덱스가 회전되지 않게 한다.
+        """
+        ...
+
+    def clone_index(self, source: str, from_date: str, to_date: str) -> str | None:
+        """
+        이전 날짜 인덱스를 새 날짜 인덱스로 복제한다(delta 색인의 기준 인덱스).
+        Returns:
+            str | None: 복제된(또는 이미 있는) 인덱스 이름, 기준 인덱스가 없으면 None
+        """
+        ...
+
+    def apply_delta(
+        self,
+        index_name: str,
+        upserts: Iterable[NormalizedChunk],
+        deletes: Iterable[str]) -> IndexResult:
+        """
+        변경분만 적재한다(upsert 후 delete).
+        Returns:
+            IndexResult: 색인/삭제 건수 및 실패 상세
+        """
+        ...
+
+class ProgressPort(Protocol):
+    """
+    작업 단계별 진행 건수를 보고하고 취소 요청 여부를 확인한다(백그라운드 작업).
+    """
+
+    def add(self, stage: str, n: int = 1) -> None:
+        """
+        Args:
+            stage: 단계 이름(listed | parsed | transformed | indexed | failed)
+            n: 증가 건수
+        """
+        ...
+
+    def cancelled(self) -> bool:
+        """
+        Returns:
+            bool: 작업 취소가 요청되었으면 True
+        """
+        ...
+
+class JobQueuePort(Protocol):
+    """
+    백그라운드 작업을 저장하고 대기열로 워커에 나눠준다(프로세스 메모리, Redis 등).
+    Redis처럼 공유 저장소를 쓰면 여러 API 워커가 같은 대기열을 나눠 처리한다.
+    """
+
+    def save(self, job: Job) -> None:
+        """
+        작업 상태를 저장한다(진행 건수는 add_progress로 따로 누적).
+        """
+        ...
+
+    def transition(self, job_id: str, expected: JobStatus, changes: Dict[str, Any]) -> Job | None:
+        """
+        저장된 작업의 상태가 expected일 때만 changes를 반영해 저장한다(원자적 compare-and-set).
+        읽은 뒤 저장하는 사이에 다른 워커/요청이 상태를 바꿨으면 반영하지 않는다.
+        Args:
+            expected: 기대하는 현재 상태
+            changes: 필드 이름 -> 새 값
+        Returns:
+            Job | None: 반영된 작업(작업이 없거나 상태가 달라 반영하지 않았으면 None)
+        """
+        ...
+
+    def get(self, job_id: str) -> Job | None:
+        """
+        Returns:
+            Job | None: 누적 진행 건수가 반영된 작업(없으면 None)
+        """
+        ...
+
+    def enqueue(self, job_id: str) -> None:
+        ...
+
+    def dequeue(self, timeout: float) -> str | None:
+        """
+        Args:
+            timeout: 대기열이 비어 있을 때 기다릴 최대 시간(초)
+        Returns:
+            str | None: 꺼낸 작업 id(없으면 None)
+        """
+        ...
+
+    def heartbeat(self, job_id: str) -> None:
+        """
+        꺼낸(실행 중인) 작업의 임대 기한을 연장한다(워커가 살아 있음을 알림).
+        """
+        ...
+
+    def ack(self, job_id: str) -> None:
+        """
+        꺼낸 작업의 처리를 마쳤음을 알린다(처리 중 목록에서 제거).
+        """
+        ...
+
+    def reclaim_stale(self) -> List[str]:
+        """
+        임대 기한이 지난(실행하던 워커가 죽은) 작업을 처리 중 목록에서 회수한다.
+        Returns:
+            List[str]: 회수한 작업 id(호출자가 상태를 되돌린 뒤 다시 대기열에 넣는다)
+        """
+        ...
+
+    def add_progress(self, job_id: str, counts: Dict[str, int]) -> None:
+        """
+        Args:
+            counts: 단계 이름 -> 증가 건수
+        """
+        ...
+
+    def request_cancel(self, job_id: str) -> None:
+        ...
+
+    def cancel_requested(self, job_id: str) -> bool:
+        ...
+
+class SearchCachePort(Protocol):
+    """
+    검색 결과를 저장/조회한다(프로세스 메모리, Redis 등).
+    alias가 새 인덱스로 회전되면 세대(generation)를 올려 이전 결과를 무효화한다.
+    """
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        """
+        Args:
+            key: 검색 조건 키(세대 포함)
+        Returns:
+            Dict[str, Any] | None: 캐시된 검색 결과(없거나 만료되면 None)
+        """
+        ...
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Args:
+            key: 검색 조건 키(세대 포함)
+            value: 검색 결과
+        """
+        ...
+
+    def generation(self) -> int:
+        """
+        Returns:
+            int: 현재 캐시 세대
+        """
+        ...
+
+    def invalidate(self) -> None:
+        """
+        세대를 올려 저장된 검색 결과를 모두 무효화한다.
+        """
+        ...
+
+class AsyncSearchCachePort(Protocol):
+    """
+    SearchCachePort의 조회/저장을 비동기로 수행한다(async 검색 경로에서 이벤트 루프를 막지 않음).
+    무효화는 색인 쪽(동기)에서 같은 저장소의 SearchCachePort.invalidate()로 한다.
+    """
+
+    async def get(self, key: str) -> Dict[str, Any] | None:
+        """
+        Args:
+            key: 검색 조건 키(세대 포함)
+        Returns:
+            Dict[str, Any] | None: 캐시된 검색 결과(없거나 만료되면 None)
+        """
+        ...
+
+    async def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Args:
+            key: 검색 조건 키(세대 포함)
+            value: 검색 결과
+        """
+        ...
+
+    async def generation(self) -> int:
+        """
+        Returns:
+            int: 현재 캐시 세대
+        """
+        ...
+
+    async def close(self) -> None:
+        """
+        연결 등 사용한 자원을 정리한다.
+        """
+        ...
+
 class SearchPort(Protocol):
     """
     검색을 수행합니다.
     """
-    def search(self, query: str, size: int = 3, explain: bool = False) -> Dict[str, Any]:
+    def search(
+        self,
+        query: str,
+        size: int = 3,
+        explain: bool = False,
+        options: SearchOptions | None = None) -> Dict[str, Any]:
         """
+        Args:
+            options: _source 필드 선택/하이라이트(None이면 _source 전체, 하이라이트 없음)
         Returns:
             Any: 검색 결과
         """
         ...
+
+    def search_batch(
+        self,
+        queries: List[str],
+        size: int = 3,
+        explain: bool = False,
+        options: SearchOptions | None = None) -> List[Dict[str, Any]]:
+        """
+        여러 쿼리를 한 번의 요청(msearch)으로 검색한다.
+        Returns:
+            List[Dict[str, Any]]: 쿼리 순서대로의 검색 결과(실패한 쿼리는 error 키를 가진 항목)
+        """
+        ...
+
+class AsyncSearchPort(Protocol):
+    """
+    검색을 비동기로 수행합니다(이벤트 루프에서 스레드풀 없이 실행).
+    """
+    async def search(
+        self,
+        query: str,
+        size: int = 3,
+        explain: bool = False,
+        options: SearchOptions | None = None) -> Dict[str, Any]:
+        """
+        Args:
+            options: _source 필드 선택/하이라이트(None이면 _source 전체, 하이라이트 없음)
+        Returns:
+            Any: 검색 결과
+        """
+        ...
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        size: int = 3,
+        explain: bool = False,
+        options: SearchOptions | None = None) -> List[Dict[str, Any]]:
+        """
+        여러 쿼리를 한 번의 요청(msearch)으로 검색한다.
+        Returns:
+            List[Dict[str, Any]]: 쿼리 순서대로의 검색 결과(실패한 쿼리는 error 키를 가진 항목)
+        """
+        ...
@@ -0,0 +1,44 @@
+"""
+백그라운드 작업 진행 상황 보고 유틸.
+
+- NULL_PROGRESS: 동기 API 호출처럼 진행 상황을 보고할 곳이 없을 때 쓰는 빈 구현
+- counted: 이터러블을 흘려보내며 단계별 건수를 올리고, 취소가 요청되면 JobCancelled를 발생시킨다
+"""
+
+from __future__ import annotations
+from typing import Iterable, Iterator, TypeVar
+
+from api_server.app.domain.ports import ProgressPort
+from api_server.app.platform.exceptions import JobCancelled
+
+T = TypeVar("T")
+
+
+class _NullProgress:
+    def add(self, stage: str, n: int = 1) -> None:
+        pass
+
+    def cancelled(self) -> bool:
+        return False
+
+
+NULL_PROGRESS: ProgressPort = _NullProgress()
+
+
+def check_cancelled(progress: ProgressPort) -> None:
+    """
+    취소가 요청되었으면 JobCancelled를 발생시킨다.
+    """
+    if progress.cancelled():
+        raise JobCancelled(getattr(progress, "job_id", "-"))
+
+
+def counted(items: Iterable[T], progress: ProgressPort, stage: str) -> Iterator[T]:
+    """
+    항목을 하나씩 흘려보내며 stage 건수를 올린다.
+    각 항목을 넘기기 전에 취소 요청을 확인한다.
+    """
+    for item in items:
+        check_cancelled(progress)
+        progress.add(stage)
+        yield item
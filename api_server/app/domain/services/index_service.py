@@ -1,16 +1,25 @@
 from __future__ import annotations
 from pydantic import BaseModel
 from pathlib import Path
-import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import multiprocessing
 import os
 import logging
 import traceback
-from typing import List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Type
 
 from api_server.app.domain.ports import (
-    FetchPort, ParsePort, TransformPort, IndexPort, ListenPort
+    FetchPort, ParsePort, TransformPort, IndexPort, ListenPort, ProgressPort, ColumnarTransformPort
+)
+from api_server.app.domain.progress import NULL_PROGRESS, check_cancelled, counted
+from api_server.app.domain.utils import iter_in_background
+from api_server.app.domain.delta import ChunkDelta, load_fingerprints, load_record_fingerprints
+from api_server.app.domain.artifacts import (
+    artifact_extension, find_artifact, is_trusted, iter_models, iter_records, open_writer
 )
 from api_server.app.domain.models import (
+    Collection,
     NormalizedChunk,
     ParsedDocument,
     RawDocument,
@@ -20,6 +29,30 @@ from api_server.app.domain.models import (
 
 logger = logging.getLogger(__name__)
 
+# 중간 산출물 suffix -> 기록되는 모델
+_ARTIFACT_MODELS = {"parsed": ParsedDocument, "normalized": NormalizedChunk}
+
+
+def _fetch_and_parse(
+    fetcher: FetchPort,
+    parser: ParsePort,
+    collection: Collection,
+    resource_file: str) -> ParsedDocument:
+    """
+    프로세스 풀 워커에서 실행되는 작업 단위(fetch -> parse).
+    원문을 부모 프로세스에서 읽어 넘기지 않도록 워커가 직접 파일을 읽는다.
+    """
+    raw: RawDocument = fetcher.fetch(resource_file, collection)
+    return parser.parse(raw)
+
+
+def _report_index_result(progress: ProgressPort, result: IndexResult) -> None:
+    """
+    색인 결과의 성공/실패 건수를 진행 상황에 반영한다.
+    """
+    progress.add("indexed", result.indexed)
+    progress.add("failed", len(result.errors))
+
 
 class IndexService:
     """문서를 가져와 parse 수행하는 유스케이스 서비스."""
@@ -31,7 +64,13 @@ class IndexService:
         parser: ParsePort,
         transformer: TransformPort,
         indexer: IndexPort,
-        input_base_dir: str = "api_server/resources/data"
+        input_base_dir: str = "api_server/resources/data",
+        pipeline_buffer_size: int = 64,
+        parse_workers: int = 0,
+        parse_chunksize: int = 1,
+        artifact_format: str = "jsonl",
+        trust_artifacts: bool = False,
+        columnar: Optional[ColumnarTransformPort] = None
     ) -> None:
         """
         인덱스 서비스 초기화.
@@ -42,6 +81,12 @@ class IndexService:
             transformer: TransformPort: 파싱 파일 변환
             indexer: IndexPort        : 변환 파일 색인
             input_base_dir: str       : 수집 파일 기본 경로
+            pipeline_buffer_size: int : 파이프라인 모드에서 단계 사이에 보관할 최대 청크 수
+            parse_workers: int        : 파싱 프로세스 풀 크기(0/1이면 요청 스레드에서 순차 파싱)
+            parse_chunksize: int      : 프로세스 풀 워커에 한 번에 넘길 파일 수
+            artifact_format: str      : 중간 산출물 형식(jsonl | jsonl.gz | jsonl.zst | parquet)
+            trust_artifacts: bool     : 스키마 버전 헤더가 일치하는 산출물은 재검증 없이 읽음(delta 비교 기준)
+            columnar: ColumnarTransformPort : 파이프라인(full, 중간 산출물 없음) 열 단위 고속 경로(없으면 행 단위)
         """
         self._listener = listener
         self._fetcher = fetcher
@@ -49,6 +94,16 @@ class IndexService:
         self._transformer = transformer
         self._indexer = indexer
         self._input_base_dir = input_base_dir
+        self._pipeline_buffer_size = pipeline_buffer_size
+        self._parse_workers = parse_workers
+        self._parse_chunksize = max(parse_chunksize, 1)
+        # parquet는 평평한 NormalizedChunk에만 적용(ParsedDocument는 JSONL)
+        self._artifact_extensions = {
+            "parsed": artifact_extension(artifact_format, columnar=False),
+            "normalized": artifact_extension(artifact_format),
+        }
+        self._trust_artifacts = trust_artifacts
+        self._columnar = columnar
         
     # ================= public API =================
 
@@ -56,7 +111,8 @@ class IndexService:
         self, 
         source: str, 
         date: str, 
-        collection: Collection) -> str:
+        collection: Collection,
+        progress: ProgressPort = NULL_PROGRESS) -> str:
         """
         수집된 문서를 파싱하여 저장하는 메서드.
 
@@ -64,23 +120,14 @@ class IndexService:
             source: 처리 대상(예: html, tsv)
             date: 날짜
             collection: 컬렉션
+            progress: 진행 건수 보고/취소 확인(백그라운드 작업)
 
         Returns:
             str: 파싱 결과의 파일 이름
         """
         logger.info("service.run: source=%s date=%s", source, date)
         
-        result = []
-        print(f"self._input_base_dir: {self._input_base_dir}")
-        resource_files = self._listener.listen(
-            source, date, 
-            extension=source.lower(), 
-            base_dir=self._input_base_dir)
-        print(f"resource_files: {resource_files}")
-        for resource_file in resource_files:
-            raw: RawDocument = self._fetcher.fetch(resource_file, collection)
-            parsed: ParsedDocument = self._parser.parse(raw)
-            result.append(parsed)
+        result = list(self._iter_parsed_documents(source, date, collection, progress))
 
         out_dir = self._get_resource_dir_path(source, date)
         return self._save_parsed_document(
@@ -94,30 +141,32 @@ class IndexService:
         self, 
         source: str, 
         date: str, 
-        collection: Collection) -> str:
+        collection: Collection,
+        progress: ProgressPort = NULL_PROGRESS) -> str:
         """
         파싱된 문서를 색인 문서 형태로 변환하여 파일로 저장하는 메서드.
         Args:
             source: str
             date: str
             collection: Collection
+            progress: ProgressPort (진행 건수 보고/취소 확인)
         Returns:
             str: 변환된 문서의 파일 이름
         """
         logger.info("service.transform: source=%s date=%s", source, date)
         
-        # 파싱 문서 읽기기
+        # 파싱 문서 읽기(한 건씩 스트리밍)
         out_dir = self._get_resource_dir_path(source, date)
-        parsed_file_name = self._create_file_name(
+        parsed_file_name = self._find_artifact(
             collection, 
             date, 
             suffix="parsed", 
             out_dir=out_dir)
-        parsed_docs: List[ParsedDocument] = \
-            self._transformer.read_parsed_document(parsed_file_name)
+        parsed_docs: Iterator[ParsedDocument] = \
+            self._transformer.iter_parsed_document(parsed_file_name)
 
-        # 변환
-        result = self._transformer.transform(parsed_docs)
+        # 변환 결과도 한 건씩 파일로 기록(QnA는 문서 1건 단위, 위키는 피처 스케일링을 위해 파싱 문서를 모은 뒤 변환)
+        result = counted(self._transformer.transform_iter(parsed_docs), progress, "transformed")
         return self._save_parsed_document(
             collection, 
             date, 
@@ -125,30 +174,50 @@ class IndexService:
             suffix="normalized", 
             out_dir=out_dir)
 
-    def index(self, source: str, date: str, collection: Collection) -> Dict[str, Any]:
+    def index(
+        self,
+        source: str,
+        date: str,
+        collection: Collection,
+        mode: str = "full",
+        progress: ProgressPort = NULL_PROGRESS) -> Dict[str, Any]:
         """
         변환된 문서를 색인하는 메서드.
+        - full: 날짜별 새 인덱스를 만들고 공개 청크 전체를 색인한다.
+        - delta: 이전 날짜 인덱스를 복제한 뒤 이전 날짜 normalized 파일과 비교한 변경분만 반영한다.
+          (이전 날짜 normalized 파일이나 인덱스가 없으면 full로 대체)
         Args:
             source: str
             date: str
             collection: Collection
+            mode: str (full | delta)
+            progress: ProgressPort (진행 건수 보고/취소 확인)
         Returns:
             Dict[str, Any]: 색인 결과
         """
-        logger.info("service.index: source=%s date=%s", source, date)
+        logger.info("service.index: source=%s date=%s mode=%s", source, date, mode)
         
         # 변환된 문서 읽기
         out_dir = self._get_resource_dir_path(source, date)
-        normalized_file_name = self._create_file_name(
+        normalized_file_name = self._find_artifact(
             collection, 
             date, 
             suffix="normalized", 
             out_dir=out_dir)
+
+        if mode == "delta":
+            result = self._index_delta(
+                source, date, collection, self._iter_normalized_file(normalized_file_name), progress)
+            if result is not None:
+                return result
+
         # 인덱스 생성
+        check_cancelled(progress)
         index_name = self._indexer.create_index(source, date)
         
-        # 인덱싱
-        indexResult: IndexResult = self._indexer.index(index_name, normalized_file_name)
+        # 인덱싱 후 적재용 설정 복원/refresh(/force merge)
+        indexResult: IndexResult = self._load_and_finalize(
+            index_name, lambda: self._indexer.index(index_name, normalized_file_name), progress)
 
         # 두 인덱스 결과 병합(별칭 추가)
         aliasResult: AliasResult = self._indexer.rotate_alias_to_latest(
@@ -159,15 +228,307 @@ class IndexService:
         result = indexResult.model_dump() | aliasResult.model_dump()
         return result
 
+    def run_pipeline(
+        self,
+        source: str,
+        date: str,
+        collection: Collection,
+        save_intermediate: bool = False,
+        mode: str = "full",
+        progress: ProgressPort = NULL_PROGRESS) -> Dict[str, Any]:
+        """
+        추출 -> 변환 -> 색인을 중간 파일 없이 한 번에 스트리밍으로 수행하는 메서드.
+        - 문서 1건씩 fetch -> parse -> transform 을 거쳐 bulk 색인으로 바로 흘려보낸다.
+        - 파싱/변환은 백그라운드 스레드에서 수행되어 색인 I/O와 겹쳐 실행된다.
+        - 단계 사이 버퍼는 pipeline_buffer_size로 제한되어 메모리 사용량이 일정하다.
+        - save_intermediate=True이면 디버깅용으로 *_parsed.json / *_normalized.json 도 함께 기록한다.
+        - mode=delta이면 index의 delta와 같이 변경분만 반영하고,
+          다음 날짜의 비교 기준이 되도록 *_normalized.json 을 항상 기록한다.
+        - 열 단위 변환(columnar)이 설정되어 있고 mode=full, save_intermediate=False이면
+          파싱/청크 객체 없이 열 연산으로 만든 색인 문서를 바로 색인한다.
+
+        Args:
+            source: 처리 대상(예: html, tsv)
+            date: 날짜
+            collection: 컬렉션
+            save_intermediate: 중간 산출물 파일 저장 여부
+            mode: 색인 방식(full | delta)
+            progress: 진행 건수 보고/취소 확인(백그라운드 작업)
+        Returns:
+            Dict[str, Any]: 색인 결과(extract/transform/index 결과와 동일한 형태)
+        """
+        logger.info(
+            "service.pipeline: source=%s date=%s save_intermediate=%s mode=%s",
+            source, date, save_intermediate, mode)
+
+        if self._columnar is not None and mode == "full" and not save_intermediate:
+            return self._run_columnar_pipeline(source, date, collection, progress)
+
+        out_dir = self._get_resource_dir_path(source, date)
+        parsed_docs: Iterable[ParsedDocument] = self._iter_parsed_documents(source, date, collection, progress)
+        if save_intermediate:
+            parsed_docs = self._tee_to_file(
+                parsed_docs,
+                self._artifact_path(collection, date, suffix="parsed", out_dir=out_dir),
+                ParsedDocument)
+
+        chunks: Iterable[NormalizedChunk] = counted(
+            self._transformer.transform_iter(parsed_docs), progress, "transformed")
+        if save_intermediate or mode == "delta":
+            chunks = self._tee_to_file(
+                chunks,
+                self._artifact_path(collection, date, suffix="normalized", out_dir=out_dir))
+        chunks = iter_in_background(chunks, self._pipeline_buffer_size)
+
+        if mode == "delta":
+            result = self._index_delta(source, date, collection, chunks, progress)
+            if result is not None:
+                return result
+
+        # 인덱스 생성 후 스트리밍 색인
+        return self._index_into_new_index(
+            source, date, lambda index_name: self._indexer.index_chunks(index_name, chunks), progress)
+
     #================= internal helpers =================
+    def _run_columnar_pipeline(
+        self,
+        source: str,
+        date: str,
+        collection: Collection,
+        progress: ProgressPort = NULL_PROGRESS) -> Dict[str, Any]:
+        """
+        수집 파일을 열 단위로 변환한 색인 문서(dict)를 새 인덱스에 바로 적재한다.
+        (ParsedDocument/NormalizedChunk 객체를 만들지 않음, 변환은 백그라운드 스레드에서 색인과 겹쳐 실행)
+        """
+        resource_files = self._listener.listen(
+            source, date,
+            extension=source.lower(),
+            base_dir=self._input_base_dir)
+        logger.info("service.pipeline: columnar source=%s date=%s files=%d", source, date, len(resource_files))
+        progress.add("listed", len(resource_files))
+
+        def iter_records() -> Iterator[Dict[str, Any]]:
+            for resource_file in resource_files:
+                yield from counted(self._columnar.iter_records(resource_file, collection), progress, "transformed")
+                progress.add("parsed")
+
+        records = iter_in_background(iter_records(), self._pipeline_buffer_size)
+        return self._index_into_new_index(
+            source, date, lambda index_name: self._indexer.index_records(index_name, records), progress)
+
+    def _index_into_new_index(
+        self,
+        source: str,
+        date: str,
+        load: Callable[[str], IndexResult],
+        progress: ProgressPort = NULL_PROGRESS) -> Dict[str, Any]:
+        """
+        새 인덱스를 만들어 load(index_name)로 적재한 뒤 설정 복원/refresh 후 alias를 회전한다.
+        """
+        index_name = self._indexer.create_index(source, date)
+        indexResult: IndexResult = self._load_and_finalize(index_name, lambda: load(index_name), progress)
+
+        aliasResult: AliasResult = self._indexer.rotate_alias_to_latest(
+            self._indexer.alias_name, 
+            self._indexer.prefix_name, 
+            delete_old=False
+        )
+        return indexResult.model_dump() | aliasResult.model_dump()
+
+    def _load_and_finalize(
+        self,
+        index_name: str,
+        load: Callable[[], IndexResult],
+        progress: ProgressPort = NULL_PROGRESS) -> IndexResult:
+        """
+        생성/복제한 인덱스에 load()로 적재하고 finalize_index로 마무리한다.
+        적재/finalize 중 예외(색인 실패, 작업 취소 등)가 나면 인덱스를 정리(discard_index)한 뒤 다시 던진다.
+        """
+        try:
+            indexResult: IndexResult = load()
+            _report_index_result(progress, indexResult)
+            check_cancelled(progress)
+            self._indexer.finalize_index(index_name)
+        except Exception:
+            logger.warning("service.index: discard index=%s after failed load", index_name)
+            self._indexer.discard_index(index_name)
+            raise
+        return indexResult
+
+    def _index_delta(
+        self,
+        source: str,
+        date: str,
+        collection: Collection,
+        chunks: Iterable[NormalizedChunk],
+        progress: ProgressPort = NULL_PROGRESS) -> Optional[Dict[str, Any]]:
+        """
+        이전 날짜 대비 변경분만 색인한다.
+        - 이전 날짜 인덱스를 새 날짜 인덱스로 복제(clone)하고
+        - 이전 날짜 normalized 파일의 지문과 비교해 추가/변경 청크는 upsert, 사라진 청크는 delete
+        - 끝나면 alias를 새 인덱스로 회전한다.
+
+        Args:
+            source: 처리 대상(예: html, tsv)
+            date: 날짜
+            collection: 컬렉션
+            chunks: 현재 날짜 NormalizedChunk 이터러블
+            progress: 진행 건수 보고/취소 확인
+        Returns:
+            Optional[Dict[str, Any]]: 색인 결과(비교 기준이 없으면 None)
+        """
+        base_date = self._previous_date(date)
+        if base_date is None:
+            logger.info("service.delta: no previous date for date=%s, fallback to full", date)
+            return None
+        base_file_name = self._find_artifact(
+            collection,
+            base_date,
+            suffix="normalized",
+            out_dir=self._get_resource_dir_path(source, base_date))
+        if not os.path.exists(base_file_name):
+            logger.info("service.delta: base file not found %s, fallback to full", base_file_name)
+            return None
+
+        index_name = self._indexer.clone_index(source, base_date, date)
+        if index_name is None:
+            logger.info("service.delta: base index not found for date=%s, fallback to full", base_date)
+            return None
+
+        delta = ChunkDelta(self._load_base_fingerprints(base_file_name))
+        indexResult: IndexResult = self._load_and_finalize(
+            index_name, lambda: self._indexer.apply_delta(index_name, delta.upserts(chunks), delta.deletes()), progress)
+        logger.info("service.delta: index=%s base_date=%s %s", index_name, base_date, delta.summary())
+
+        aliasResult: AliasResult = self._indexer.rotate_alias_to_latest(
+            self._indexer.alias_name, 
+            self._indexer.prefix_name, 
+            delete_old=False
+        )
+        return (
+            indexResult.model_dump()
+            | aliasResult.model_dump()
+            | {"mode": "delta", "base_date": base_date, **delta.summary()}
+        )
+
+    def _previous_date(self, date: str) -> Optional[str]:
+        """
+        비교 기준이 되는 이전 날짜를 반환한다. (날짜는 '1', '2', '3' 형식)
+        """
+        try:
+            previous = int(date) - 1
+        except ValueError:
+            return None
+        return str(previous) if previous >= 1 else None
+
+    def _iter_normalized_file(self, file_name: str) -> Iterator[NormalizedChunk]:
+        """
+        *_normalized 산출물(JSONL/압축 JSONL/parquet)을 한 건씩 읽어 NormalizedChunk로 반환한다.
+        """
+        yield from iter_models(file_name, NormalizedChunk)
+
+    def _load_base_fingerprints(self, file_name: str) -> Dict[str, str]:
+        """
+        이전 날짜 normalized 파일의 source_id -> 지문을 읽는다.
+        신뢰 산출물이면 모델 검증 없이 레코드의 content_hash를 그대로 사용한다.
+        """
+        if self._trust_artifacts and is_trusted(file_name, NormalizedChunk):
+            return load_record_fingerprints(record for _, record in iter_records(file_name))
+        return load_fingerprints(self._iter_normalized_file(file_name))
+
+    def _iter_parsed_documents(
+        self,
+        source: str,
+        date: str,
+        collection: Collection,
+        progress: ProgressPort = NULL_PROGRESS) -> Iterator[ParsedDocument]:
+        """
+        수집 파일 목록을 조회하고 문서를 1건씩 fetch -> parse 하여 반환하는 메서드.
+        - parse_workers > 1 이고 파일이 여러 개면 프로세스 풀에서 병렬 파싱(GIL 우회)
+        - 병렬 모드에서도 결과 순서는 파일 목록 순서와 동일하다
+        Args:
+            source: str
+            date: str
+            collection: Collection
+            progress: ProgressPort (listed/parsed 건수 보고, 문서마다 취소 확인)
+        Returns:
+            Iterator[ParsedDocument]
+        """
+        resource_files = self._listener.listen(
+            source, date, 
+            extension=source.lower(), 
+            base_dir=self._input_base_dir)
+        logger.info("service.listen: source=%s date=%s files=%d", source, date, len(resource_files))
+        progress.add("listed", len(resource_files))
+
+        if self._parse_workers > 1 and len(resource_files) > 1:
+            yield from counted(self._parse_in_process_pool(resource_files, collection), progress, "parsed")
+            return
+
+        for resource_file in resource_files:
+            check_cancelled(progress)
+            raw: RawDocument = self._fetcher.fetch(resource_file, collection)
+            doc = self._parser.parse(raw)
+            progress.add("parsed")
+            yield doc
+
+    def _parse_in_process_pool(
+        self,
+        resource_files: List[str],
+        collection: Collection) -> Iterator[ParsedDocument]:
+        """
+        파일 목록을 프로세스 풀에서 병렬로 fetch -> parse 하는 메서드.
+        - 작업은 parse_chunksize 단위로 묶어 워커에 전달(IPC 비용 절감)
+        - Executor.map을 사용하므로 결과는 입력 순서대로 반환된다
+        - 파이프라인 모드(백그라운드 스레드)에서도 안전하도록 spawn 컨텍스트를 사용한다
+        Args:
+            resource_files: List[str]
+            collection: Collection
+        Returns:
+            Iterator[ParsedDocument]
+        """
+        workers = min(self._parse_workers, len(resource_files))
+        logger.info(
+            "service.parse: process pool workers=%d chunksize=%d files=%d",
+            workers, self._parse_chunksize, len(resource_files))
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"))
+        try:
+            task = partial(_fetch_and_parse, self._fetcher, self._parser, collection)
+            yield from executor.map(task, resource_files, chunksize=self._parse_chunksize)
+        finally:
+            # 소비자가 중간에 멈추거나 예외가 나면 남은 작업은 취소
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _get_resource_dir_path(self, source: str, date: str) -> str:
         return f"api_server/resources/data/{source}/day_{date}"
     
+    def _tee_to_file(
+        self,
+        docs: Iterable[BaseModel],
+        file_name: str,
+        model: Type[BaseModel] = NormalizedChunk) -> Iterator[BaseModel]:
+        """
+        문서를 흘려보내면서 동시에 산출물 파일로 기록하는 메서드(파이프라인 디버깅용).
+        Args:
+            docs: Iterable[BaseModel]
+            file_name: str (확장자로 형식 결정)
+            model: Type[BaseModel] (기록할 모델)
+        Returns:
+            Iterator[BaseModel]: 입력과 같은 문서 이터레이터
+        """
+        with open_writer(file_name, model) as writer:
+            for doc in docs:
+                writer.write(doc)
+                yield doc
+        logger.info("service.pipeline: %s 파일이 생성되었습니다.", file_name)
+
     def _save_parsed_document(
         self, 
         collection: Collection, 
         date: str, 
-        docs: List[BaseModel] = None, 
+        docs: Iterable[BaseModel] = None, 
         suffix: str = "normalized",
         out_dir: str = "./data"
     ) -> str:
@@ -176,20 +537,17 @@ class IndexService:
         Args:
             collection: Collection
             date: str
-            docs: List[BaseModel]
+            docs: Iterable[BaseModel] (한 건씩 기록하므로 이터레이터도 가능)
             suffix: str
             out_dir: str
         Returns:
             str: 저장된 파일 이름
         """
-        file_name = self._create_file_name(collection, date, suffix, out_dir)
+        file_name = self._artifact_path(collection, date, suffix, out_dir)
         out = Path(file_name)
-        out.parent.mkdir(parents=True, exist_ok=True)
-        with out.open("w", encoding="utf-8") as f:
+        with open_writer(file_name, _ARTIFACT_MODELS.get(suffix, NormalizedChunk)) as writer:
             for doc in docs:
-                f.write(json.dumps(
-                    doc.model_dump(mode="json"), ensure_ascii=False))
-                f.write("\n")
+                writer.write(doc)
         print(f"{file_name} 파일이 생성되었습니다.")
         return out.name
     
@@ -198,7 +556,8 @@ class IndexService:
         collection: Collection, 
         date: str, 
         suffix: str = "normalized",
-        out_dir: str = "./data"
+        out_dir: str = "./data",
+        extension: str = ".json"
     ) -> str:
         """
         파일 이름 생성하는 메서드.
@@ -207,8 +566,35 @@ class IndexService:
             date: str
             suffix: str
             out_dir: str
+            extension: str
         Returns:
             str: 파일 이름
         """
-        file_name = f"{collection.value}_{date}_{suffix}.json"
-        return str(Path(out_dir) / file_name)
\ No newline at end of file
+        file_name = f"{collection.value}_{date}_{suffix}{extension}"
+        return str(Path(out_dir) / file_name)
+
+    def _artifact_path(
+        self,
+        collection: Collection,
+        date: str,
+        suffix: str = "normalized",
+        out_dir: str = "./data"
+    ) -> str:
+        """
+        설정된 산출물 형식으로 기록할 파일 경로를 반환한다.
+        """
+        return self._create_file_name(
+            collection, date, suffix, out_dir, extension=self._artifact_extensions.get(suffix, ".json"))
+
+    def _find_artifact(
+        self,
+        collection: Collection,
+        date: str,
+        suffix: str = "normalized",
+        out_dir: str = "./data"
+    ) -> str:
+        """
+        읽을 산출물 파일 경로를 반환한다(설정된 형식을 먼저 찾고, 없으면 다른 형식의 파일).
+        """
+        stem = self._create_file_name(collection, date, suffix, out_dir, extension="")
+        return find_artifact(stem, self._artifact_extensions.get(suffix, ".json"))
\ No newline at end of file
@@ -0,0 +1,324 @@
+"""
+추출/변환/색인 작업을 HTTP 요청과 분리해 백그라운드에서 실행하는 유스케이스 서비스.
+
+- submit: 작업을 저장하고 대기열에 넣은 뒤 바로 반환(클라이언트는 job_id로 상태를 조회)
+- 워커 스레드가 대기열에서 작업을 꺼내 종류(kind)별 핸들러를 실행
+- 핸들러는 ProgressPort로 단계별 진행 건수를 보고하고, 취소가 요청되면 다음 문서/단계에서 멈춘다
+- 대기열이 Redis면 여러 API 워커가 같은 대기열을 나눠 처리한다
+- 실행 중에는 heartbeat로 작업 임대를 연장하고, 임대가 끝난 작업(워커 프로세스가 죽음)은
+  다른 워커가 회수해 다시 대기열에 넣는다(max_attempts회까지, 넘으면 failed)
+- acquire_slot이 주어지면 동기 라우트와 같은 실행 자리를 얻은 뒤에만 실행한다
+  (자리가 날 때까지 꺼낸 작업을 임대를 연장하며 기다린다)
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+from api_server.app.domain.models import Job, JobStatus
+from api_server.app.domain.ports import JobQueuePort, ProgressPort
+from api_server.app.platform.exceptions import InvalidInput, JobCancelled, ResourceNotFound
+
+logger = logging.getLogger(__name__)
+
+# 작업 파라미터와 진행 상황 보고 객체를 받아 결과(라우터 응답의 data와 같은 형태)를 반환
+JobHandler = Callable[[Dict[str, Any], ProgressPort], Any]
+# 작업 종류를 받아 실행 자리를 얻으면 True(기다리지 않음) / 얻은 자리를 돌려준다
+JobSlotAcquire = Callable[[str], bool]
+JobSlotRelease = Callable[[str], None]
+
+
+class _JobProgress(ProgressPort):
+    """
+    작업 1건의 진행 건수를 모아 두었다가 flush_interval마다 대기열 저장소에 반영한다.
+    (문서마다 저장소를 호출하지 않도록 보고/취소 확인을 묶는다)
+    """
+
+    def __init__(self, queue: JobQueuePort, job_id: str, flush_interval: float = 0.5) -> None:
+        self.job_id = job_id
+        self._queue = queue
+        self._flush_interval = flush_interval
+        self._counts: Dict[str, int] = {}
+        self._flushed_at = time.monotonic()
+        self._cancel_checked_at = 0.0
+        self._cancelled = False
+        # 파이프라인 모드에서는 파싱/변환(백그라운드 스레드)과 색인이 동시에 보고한다
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, n: int = 1) -> None:
+        if n <= 0:
+            return
+        with self._lock:
+            self._counts[stage] = self._counts.get(stage, 0) + n
+            due = time.monotonic() - self._flushed_at >= self._flush_interval
+        if due:
+            self.flush()
+
+    def cancelled(self) -> bool:
+        now = time.monotonic()
+        if not self._cancelled and now - self._cancel_checked_at >= self._flush_interval:
+            self._cancel_checked_at = now
+            self._cancelled = self._queue.cancel_requested(self.job_id)
+        return self._cancelled
+
+    def flush(self) -> None:
+        with self._lock:
+            counts, self._counts = self._counts, {}
+            self._flushed_at = time.monotonic()
+        if counts:
+            self._queue.add_progress(self.job_id, counts)
+
+
+class JobService:
+
+    def __init__(
+        self,
+        queue: JobQueuePort,
+        handlers: Dict[str, JobHandler],
+        workers: int = 1,
+        poll_interval: float = 1.0,
+        heartbeat_interval: float = 20.0,
+        max_attempts: int = 3,
+        acquire_slot: Optional[JobSlotAcquire] = None,
+        release_slot: Optional[JobSlotRelease] = None) -> None:
+        """
+        Args:
+            queue: JobQueuePort             : 작업 저장/대기열
+            handlers: Dict[str, JobHandler] : 작업 종류 -> 실행 함수
+            workers: int                    : 작업 실행 워커 스레드 수
+            poll_interval: float            : 대기열이 비었을 때 대기 시간(초, 종료 요청 확인 주기)
+            heartbeat_interval: float       : 실행 중 작업의 임대 연장/죽은 워커 작업 회수 주기(초, 임대 기한보다 짧게)
+            max_attempts: int               : 워커가 죽어 회수된 작업을 다시 실행할 최대 시도 횟수
+            acquire_slot: JobSlotAcquire    : 작업 종류별 실행 자리 획득(None이면 제한 없음)
+            release_slot: JobSlotRelease    : acquire_slot으로 얻은 자리 반환
+        """
+        self._queue = queue
+        self._handlers = handlers
+        self._workers = workers
+        self._poll_interval = poll_interval
+        self._heartbeat_interval = heartbeat_interval
+        self._max_attempts = max_attempts
+        self._acquire_slot = acquire_slot
+        self._release_slot = release_slot
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._reclaimed_at = 0.0
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    # ================= public API =================
+    def submit(self, kind: str, params: Dict[str, Any]) -> Job:
+        """
+        작업을 대기열에 넣고 바로 반환한다.
+        Args:
+            kind: str              : 작업 종류(extract | transform | index | pipeline)
+            params: Dict[str, Any] : 작업 파라미터(source, date, mode 등)
+        Returns:
+            Job: queued 상태의 작업
+        """
+        if kind not in self._handlers:
+            raise InvalidInput(f"unsupported job kind: {kind}")
+        job = Job(job_id=uuid.uuid4().hex, kind=kind, params=params)
+        self._queue.save(job)
+        self._queue.enqueue(job.job_id)
+        logger.info("service.job.submit: job_id=%s kind=%s params=%s", job.job_id, kind, params)
+        return job
+
+    def get(self, job_id: str) -> Job:
+        """
+        Returns:
+            Job: 진행 건수가 반영된 작업
+        """
+        job = self._queue.get(job_id)
+        if job is None:
+            raise ResourceNotFound("job", f"job not found: {job_id}")
+        return job
+
+    def cancel(self, job_id: str) -> Job:
+        """
+        작업 취소를 요청한다.
+        - 대기 중인 작업은 바로 cancelled로 바뀌고 실행되지 않는다
+        - 실행 중인 작업은 다음 문서/단계 경계에서 멈춘다(alias는 회전하지 않고, 적재 중이던 새 인덱스는 삭제)
+        - 이미 끝난 작업은 그대로 반환한다
+        """
+        job = self.get(job_id)
+        if job.finished:
+            return job
+        self._queue.request_cancel(job_id)
+        if job.status == JobStatus.queued:
+            # 읽은 뒤 워커가 실행을 시작했으면 바꾸지 않는다(실행 중 취소 요청으로 처리)
+            cancelled = self._queue.transition(
+                job_id, JobStatus.queued, {"status": JobStatus.cancelled, "finished_at": datetime.now()})
+            job = cancelled or self.get(job_id)
+        logger.info("service.job.cancel: job_id=%s status=%s", job_id, job.status.value)
+        return job
+
+    def start(self) -> None:
+        """
+        워커 스레드를 시작한다(앱 lifespan에서 호출).
+        """
+        self._stop.clear()
+        for i in range(self._workers):
+            thread = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        워커 스레드에 종료를 알리고, 실행 중인 작업이 끝날 때까지 최대 timeout초 기다린다.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def run_next(self, timeout: float = 0.0) -> Optional[Job]:
+        """
+        대기열에서 작업 1건을 꺼내 실행한다(워커 루프의 한 단계).
+        Returns:
+            Optional[Job]: 실행을 마친 작업(대기열이 비었거나 이미 취소된 작업이면 None)
+        """
+        job_id = self._queue.dequeue(timeout)
+        if job_id is None:
+            return None
+        job = self._queue.get(job_id)
+        if job is None or job.status != JobStatus.queued:
+            self._queue.ack(job_id)
+            return None
+        if self._acquire_slot is None:
+            return self._run(job)
+        if not self._wait_for_slot(job):
+            return None
+        try:
+            return self._run(job)
+        finally:
+            self._release_slot(job.kind)
+
+    def reclaim_stale_jobs(self) -> List[str]:
+        """
+        실행하던 워커가 죽어 임대가 끝난 작업을 다시 대기열에 넣는다.
+        - 취소가 요청된 작업은 cancelled, 시도 횟수가 max_attempts에 이른 작업은 failed로 끝낸다
+        Returns:
+            List[str]: 다시 대기열에 넣은 작업 id
+        """
+        requeued: List[str] = []
+        for job_id in self._queue.reclaim_stale():
+            job = self._queue.get(job_id)
+            if job is None or job.finished:
+                continue
+            logger.warning(
+                "service.job.reclaim: job_id=%s worker=%s attempts=%d", job_id, job.worker, job.attempts)
+            if self._queue.cancel_requested(job_id):
+                changes = {"status": JobStatus.cancelled, "finished_at": datetime.now()}
+            elif job.attempts >= self._max_attempts:
+                changes = {
+                    "status": JobStatus.failed,
+                    "error": f"worker lost: {job.worker} (attempts={job.attempts})",
+                    "finished_at": datetime.now(),
+                }
+            else:
+                changes = {"status": JobStatus.queued}
+            # 읽은 뒤 상태가 바뀌었으면(취소 등) 건드리지 않는다
+            if self._queue.transition(job_id, job.status, changes) is None:
+                continue
+            if changes["status"] == JobStatus.queued:
+                self._queue.enqueue(job_id)
+                requeued.append(job_id)
+        return requeued
+
+    # ================= internal helpers =================
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._reclaim_if_due()
+                self.run_next(self._poll_interval)
+            except Exception:
+                # 대기열 저장소 오류 등으로 워커가 죽지 않도록 로그만 남기고 계속
+                logger.exception("service.job.worker: failed to run next job")
+                self._stop.wait(self._poll_interval)
+
+    def _reclaim_if_due(self) -> None:
+        """
+        워커 스레드들이 함께 쓰므로 heartbeat_interval마다 한 번만 회수한다.
+        """
+        now = time.monotonic()
+        if now - self._reclaimed_at < self._heartbeat_interval:
+            return
+        self._reclaimed_at = now
+        self.reclaim_stale_jobs()
+
+    def _wait_for_slot(self, job: Job) -> bool:
+        """
+        실행 자리가 날 때까지 poll_interval마다 다시 시도하며 꺼낸 작업의 임대를 연장한다.
+        - 기다리는 동안 취소되면 cancelled로 끝내고, 워커가 종료되면 작업을 대기열에 되돌린다
+        Returns:
+            bool: 자리를 얻었으면 True
+        """
+        waited = False
+        while not self._acquire_slot(job.kind):
+            if not waited:
+                logger.info("service.job.wait_slot: job_id=%s kind=%s", job.job_id, job.kind)
+                waited = True
+            if self._queue.cancel_requested(job.job_id):
+                self._queue.transition(
+                    job.job_id, JobStatus.queued, {"status": JobStatus.cancelled, "finished_at": datetime.now()})
+                self._queue.ack(job.job_id)
+                return False
+            if self._stop.wait(self._poll_interval):
+                self._queue.enqueue(job.job_id)
+                self._queue.ack(job.job_id)
+                return False
+            self._queue.heartbeat(job.job_id)
+        return True
+
+    def _keep_alive(self, job_id: str, done: threading.Event) -> None:
+        """
+        작업이 끝날 때까지 heartbeat_interval마다 임대를 연장한다(별도 스레드).
+        (색인 bulk/finalize처럼 진행 건수 보고가 없는 구간에도 연장되도록 진행 보고와 분리)
+        """
+        while not done.wait(self._heartbeat_interval):
+            try:
+                self._queue.heartbeat(job_id)
+            except Exception:
+                logger.warning("service.job.heartbeat: failed job_id=%s", job_id, exc_info=True)
+
+    def _run(self, job: Job) -> Optional[Job]:
+        # 꺼낸 뒤 실행 전에 취소되었으면 실행하지 않는다(queued -> running 전이는 원자적으로)
+        started = self._queue.transition(
+            job.job_id, JobStatus.queued,
+            {"status": JobStatus.running, "started_at": datetime.now(), "worker": self._worker_id})
+        if started is None:
+            self._queue.ack(job.job_id)
+            return None
+        # running으로 바꾼 뒤에는 이 워커만 작업 상태를 저장한다
+        job = started
+        job.attempts += 1
+        self._queue.save(job)
+        progress = _JobProgress(self._queue, job.job_id)
+        logger.info("service.job.start: job_id=%s kind=%s attempt=%d", job.job_id, job.kind, job.attempts)
+        done = threading.Event()
+        threading.Thread(
+            target=self._keep_alive, args=(job.job_id, done), name=f"job-heartbeat-{job.job_id}", daemon=True
+        ).start()
+        try:
+            job.result = self._handlers[job.kind](job.params, progress)
+            job.status = JobStatus.succeeded
+        except JobCancelled:
+            job.status = JobStatus.cancelled
+        except Exception as e:
+            logger.exception("service.job.failed: job_id=%s", job.job_id)
+            job.status = JobStatus.failed
+            job.error = f"{type(e).__name__}: {e}"
+        finally:
+            done.set()
+            progress.flush()
+            job.finished_at = datetime.now()
+            self._queue.save(job)
+            self._queue.ack(job.job_id)
+        logger.info("service.job.finish: job_id=%s status=%s", job.job_id, job.status.value)
+        return job
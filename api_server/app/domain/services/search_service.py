@@ -3,37 +3,211 @@ from pydantic import BaseModel
 from pathlib import Path
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, List, Optional
 
 import logging
+import time
 import traceback
 
-from api_server.app.domain.ports import SearchPort
-from api_server.app.domain.models import NormalizedChunk
+from api_server.app.domain.ports import SearchPort, AsyncSearchPort
+from api_server.app.domain.models import NormalizedChunk, SearchOptions
+from api_server.app.domain.singleflight import AsyncSingleFlight, SingleFlight
 
 logger = logging.getLogger(__name__)
 
+
+def compact_result(response: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    OpenSearch 검색 응답을 간결한 형태로 바꾼다.
+    {"total", "took_ms", "items": [{"id", "score", <_source 필드>, "highlights"?, "explanation"?}]}
+    """
+    total = response.get("hits", {}).get("total")
+    items: List[Dict[str, Any]] = []
+    for hit in response.get("hits", {}).get("hits", []):
+        item = {"id": hit.get("_id"), "score": hit.get("_score"), **hit.get("_source", {})}
+        if hit.get("highlight"):
+            item["highlights"] = hit["highlight"]
+        if "_explanation" in hit:
+            item["explanation"] = hit["_explanation"]
+        items.append(item)
+    return {
+        "total": total.get("value") if isinstance(total, dict) else total,
+        "took_ms": response.get("took"),
+        "items": items,
+    }
+
+
+def _flight_key(query: str, size: int, explain: bool, options: Optional[SearchOptions]) -> Hashable:
+    """
+    같은 검색 결과를 내는 호출을 구분하는 키(요청 값 그대로, compact 여부는 결과 변환이므로 제외).
+    """
+    return (query, size, explain, options.model_dump_json() if options is not None else None)
+
+
+def _batch_result(
+    queries: List[str],
+    responses: List[Dict[str, Any]],
+    start: float,
+    compact: bool = False) -> Dict[str, Any]:
+    """
+    msearch 응답을 쿼리별 결과로 정리한다.
+    - 성공: {"query", "took_ms"(OpenSearch 처리 시간), "result"(검색 결과, compact면 compact_result 형태)}
+    - 실패: {"query", "status", "error"} (다른 쿼리 결과는 그대로 반환)
+    """
+    items: List[Dict[str, Any]] = []
+    for query, response in zip(queries, responses):
+        if "error" in response:
+            items.append({"query": query, "status": response.get("status"), "error": response["error"]})
+        else:
+            result = compact_result(response) if compact else response
+            items.append({"query": query, "took_ms": response.get("took"), "result": result})
+    return {"took_ms": int((time.perf_counter() - start) * 1000), "items": items}
+
+
 class SearchService:
 
     def __init__(
         self,
-        searcher: SearchPort) -> None:
+        searcher: SearchPort,
+        coalesce: bool = True) -> None:
+        """
+        Args:
+            searcher: SearchPort : 검색기(캐시 포함 가능)
+            coalesce: bool       : 같은 조건으로 동시에 들어온 검색을 진행 중인 검색 하나로 합칠지 여부
+        """
         self._searcher = searcher
+        self._flight: Optional[SingleFlight] = SingleFlight() if coalesce else None
         
     # ================= public API =================
     def search(
         self, 
         query: str, 
         size: int = 3, 
-        explain: bool = False) -> Dict[str, Any]:
+        explain: bool = False,
+        options: Optional[SearchOptions] = None,
+        compact: bool = False) -> Dict[str, Any]:
+        """
+        검색을 수행하는 메서드.
+        Args:
+            query: str      : 검색 쿼리
+            size: int       : 검색 결과 개수
+            explain: bool   : 검색 결과 설명 포함 여부
+            options: SearchOptions | None : _source 필드 선택/하이라이트 (None이면 _source 전체)
+            compact: bool   : True면 compact_result 형태로 반환
+        Returns:
+            Any: 검색 결과
+        """
+        logger.info("service.search: query=%s size=%s explain=%s", query, size, explain)
+        if self._flight is None:
+            result = self._searcher.search(query, size, explain, options)
+        else:
+            result = self._flight.do(
+                _flight_key(query, size, explain, options),
+                lambda: self._searcher.search(query, size, explain, options))
+        return compact_result(result) if compact else result
+
+    def search_batch(
+        self,
+        queries: List[str],
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None,
+        compact: bool = False) -> Dict[str, Any]:
+        """
+        여러 쿼리를 한 번에 검색하는 메서드(msearch).
+        Args:
+            queries: List[str] : 검색 쿼리 목록
+            size: int          : 쿼리별 검색 결과 개수
+            explain: bool      : 검색 결과 설명 포함 여부
+            options: SearchOptions | None : _source 필드 선택/하이라이트
+            compact: bool      : True면 쿼리별 result를 compact_result 형태로 반환
+        Returns:
+            Dict[str, Any]: 전체 소요 시간(took_ms)과 쿼리 순서대로의 결과 목록(items)
+        """
+        logger.info("service.search_batch: queries=%s size=%s explain=%s", len(queries), size, explain)
+        start = time.perf_counter()
+        responses = self._searcher.search_batch(queries, size, explain, options)
+        return _batch_result(queries, responses, start, compact)
+
+    def coalescing_stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: 실제 검색 수(leaders), 합쳐진 검색 수(coalesced), 진행 중인 검색 수(in_flight)
+        """
+        return self._flight.stats() if self._flight is not None else {"leaders": 0, "coalesced": 0, "in_flight": 0}
+
+
+class AsyncSearchService:
+    """
+    SearchService의 비동기 버전(async 라우트에서 사용).
+    """
+
+    def __init__(
+        self,
+        searcher: AsyncSearchPort,
+        coalesce: bool = True) -> None:
+        """
+        Args:
+            searcher: AsyncSearchPort : 비동기 검색기(캐시 포함 가능)
+            coalesce: bool            : 같은 조건으로 동시에 들어온 검색을 진행 중인 검색 하나로 합칠지 여부
+        """
+        self._searcher = searcher
+        self._flight: Optional[AsyncSingleFlight] = AsyncSingleFlight() if coalesce else None
+
+    # ================= public API =================
+    async def search(
+        self, 
+        query: str, 
+        size: int = 3, 
+        explain: bool = False,
+        options: Optional[SearchOptions] = None,
+        compact: bool = False) -> Dict[str, Any]:
         """
         검색을 수행하는 메서드.
         Args:
             query: str      : 검색 쿼리
             size: int       : 검색 결과 개수
             explain: bool   : 검색 결과 설명 포함 여부
+            options: SearchOptions | None : _source 필드 선택/하이라이트 (None이면 _source 전체)
+            compact: bool   : True면 compact_result 형태로 반환
         Returns:
             Any: 검색 결과
         """
         logger.info("service.search: query=%s size=%s explain=%s", query, size, explain)
-        return self._searcher.search(query, size, explain)
+        if self._flight is None:
+            result = await self._searcher.search(query, size, explain, options)
+        else:
+            result = await self._flight.do(
+                _flight_key(query, size, explain, options),
+                lambda: self._searcher.search(query, size, explain, options))
+        return compact_result(result) if compact else result
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        size: int = 3,
+        explain: bool = False,
+        options: Optional[SearchOptions] = None,
+        compact: bool = False) -> Dict[str, Any]:
+        """
+        여러 쿼리를 한 번에 검색하는 메서드(msearch).
+        Args:
+            queries: List[str] : 검색 쿼리 목록
+            size: int          : 쿼리별 검색 결과 개수
+            explain: bool      : 검색 결과 설명 포함 여부
+            options: SearchOptions | None : _source 필드 선택/하이라이트
+            compact: bool      : True면 쿼리별 result를 compact_result 형태로 반환
+        Returns:
+            Dict[str, Any]: 전체 소요 시간(took_ms)과 쿼리 순서대로의 결과 목록(items)
+        """
+        logger.info("service.search_batch: queries=%s size=%s explain=%s", len(queries), size, explain)
+        start = time.perf_counter()
+        responses = await self._searcher.search_batch(queries, size, explain, options)
+        return _batch_result(queries, responses, start, compact)
+
+    def coalescing_stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: 실제 검색 수(leaders), 합쳐진 검색 수(coalesced), 진행 중인 검색 수(in_flight)
+        """
+        return self._flight.stats() if self._flight is not None else {"leaders": 0, "coalesced": 0, "in_flight": 0}
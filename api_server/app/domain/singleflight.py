@@ -0,0 +1,115 @@
+"""
+같은 키로 동시에 들어온 호출을 진행 중인 호출 하나로 합치는(single-flight) 도우미.
+
+- 먼저 들어온 호출(leader)만 실제로 실행하고, 실행 중에 같은 키로 들어온 호출(coalesced)은
+  그 결과(또는 예외)를 그대로 받는다
+- 결과를 저장하지 않는다(실행이 끝나면 다음 호출은 다시 실행한다). 결과 재사용은 캐시가 담당
+- SingleFlight는 스레드(동기 라우트), AsyncSingleFlight는 이벤트 루프(async 라우트)용
+- stats()로 실제 실행 수(leaders)와 합쳐진 호출 수(coalesced), 진행 중인 키 수(in_flight)를 반환
+"""
+
+from __future__ import annotations
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+import asyncio
+import threading
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._leaders = 0
+        self._coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다려 반환하고, 없으면 fn()을 실행한다.
+        Args:
+            key: Hashable (같은 결과를 내는 호출을 구분하는 키)
+            fn: Callable[[], T] (실제 호출)
+        Returns:
+            T: fn()의 결과(합쳐진 호출은 leader와 같은 객체를 받는다)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._leaders += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"leaders": self._leaders, "coalesced": self._coalesced, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight의 이벤트 루프 버전.
+    실제 호출은 별도 Task로 실행하므로 먼저 들어온 요청이 취소(클라이언트 연결 끊김)되어도
+    기다리는 다른 요청은 결과를 받는다.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다려 반환하고, 없으면 fn()을 Task로 실행한다.
+        Args:
+            key: Hashable (같은 결과를 내는 호출을 구분하는 키)
+            fn: Callable[[], Awaitable[T]] (실제 호출)
+        Returns:
+            T: fn()의 결과(합쳐진 호출은 leader와 같은 객체를 받는다)
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self._leaders += 1
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 기다리던 요청이 모두 취소된 뒤 실패해도 "exception was never retrieved" 경고를 남기지 않는다
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {"leaders": self._leaders, "coalesced": self._coalesced, "in_flight": len(self._tasks)}
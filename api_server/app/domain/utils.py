@@ -4,13 +4,21 @@
 
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, TypeVar
 from pydantic import BaseModel
+import contextvars
 import json
+import queue
+import threading
 
 from api_server.app.domain.models import (
     ParsedBlock, ParsedDocument, SourceRef, FileType, Collection
 )
 
+T = TypeVar("T")
+
+
 def infer_date_from_path(source_path: str) -> datetime:
     """
     파일 경로에서 날짜를 추출하는 함수.
@@ -54,4 +62,87 @@ def choose_collection(ft: FileType) -> Collection:
         case FileType.tsv:
             return Collection.qna
         case _:
-            raise ValueError(f"Unsupported file type: {ft}")
\ No newline at end of file
+            raise ValueError(f"Unsupported file type: {ft}")
+
+
+class _ProducerError:
+    """백그라운드 생산자 스레드에서 발생한 예외를 소비자 쪽으로 전달하기 위한 래퍼."""
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def iter_in_background(items: Iterable[T], buffer_size: int = 64) -> Iterator[T]:
+    """
+    이터러블을 백그라운드 스레드에서 미리 소비하여 크기 제한 큐로 넘겨주는 함수.
+    - 생산(파싱/변환)과 소비(bulk 색인 I/O)가 겹쳐 실행되어 전체 시간이 가장 느린 단계에 수렴
+    - 큐 크기(buffer_size)로 메모리 사용량 상한을 둔다
+    - 생산자 예외는 소비자 쪽에서 그대로 다시 발생
+    - 소비자가 중간에 멈추면 생산자도 멈춘다
+    Args:
+        items: Iterable[T] (원본 이터러블)
+        buffer_size: int (큐 최대 크기)
+    Returns:
+        Iterator[T]: 원본과 같은 순서의 이터레이터
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(buffer_size, 1))
+    done = object()
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(done)
+        except BaseException as e:
+            put(_ProducerError(e))
+
+    # request_id 등 ContextVar를 생산자 스레드에서도 유지
+    ctx = contextvars.copy_context()
+    producer = threading.Thread(target=ctx.run, args=(produce,), daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                return
+            if isinstance(item, _ProducerError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+
+
+def run_per_file_type(
+    file_types: List[FileType],
+    run: Callable[[FileType], T],
+    concurrent: bool = True) -> Dict[str, T]:
+    """
+    파일 타입별 작업(source=all)을 실행하고 {타입: 결과} 딕셔너리로 모으는 함수.
+    - concurrent=True 이고 타입이 2개 이상이면 타입별 스레드에서 동시에 실행(전체 시간 = 가장 느린 타입)
+      (CPU 파싱은 각 서비스의 프로세스 풀에서, 나머지는 파일/OpenSearch I/O라 스레드로 충분)
+    - 결과 순서는 file_types 순서와 같다
+    - 한 타입이 실패하면 나머지 타입이 끝날 때까지 기다린 뒤 첫 번째 예외를 그대로 발생
+    Args:
+        file_types: List[FileType] (처리할 파일 타입 목록)
+        run: Callable[[FileType], T] (타입 1개 처리 함수)
+        concurrent: bool (동시 실행 여부)
+    Returns:
+        Dict[str, T]: 타입 값 -> 결과
+    """
+    if not concurrent or len(file_types) < 2:
+        return {ft.value: run(ft) for ft in file_types}
+
+    with ThreadPoolExecutor(max_workers=len(file_types), thread_name_prefix="source") as executor:
+        # request_id 등 ContextVar를 작업 스레드에서도 유지
+        futures = [executor.submit(contextvars.copy_context().run, run, ft) for ft in file_types]
+    return {ft.value: future.result() for ft, future in zip(file_types, futures)}
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 from urllib.parse import urlparse
-from opensearchpy import OpenSearch
+from opensearchpy import AsyncOpenSearch, OpenSearch
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 
@@ -12,7 +12,18 @@ from api_server.app.api.routers import (
     search, 
     extract, 
     transform, 
-    index
+    index,
+    pipeline,
+    jobs
+)
+from api_server.app.api.deps import (
+    PipelineResolver,
+    build_search_service,
+    build_async_search_service,
+    build_job_service,
+    ensure_search_template,
+    get_admission_controller,
+    get_async_search_cache
 )
 from api_server.app.platform.config import settings
 from api_server.app.platform.logging import setup_logging
@@ -24,6 +35,7 @@ from api_server.app.platform.errors import (
 )
 from api_server.app.platform import exceptions as domainex
 from api_server.app.middlewares.request_context import RequestContextMiddleware
+from api_server.app.middlewares.admission import AdmissionMiddleware
 
 
 @asynccontextmanager
@@ -35,18 +47,41 @@ async def lifespan(app: FastAPI):
         level="INFO")
 
     # OpenSearch 클라이언트를 한 번만 생성해서 공유
+    # (색인 등 동기 라우트용 OpenSearch, 검색 async 라우트용 AsyncOpenSearch)
     u = urlparse(settings.OPENSEARCH_HOST)
-    app.state.opensearch = OpenSearch(
-        hosts=[{"host": u.hostname, "port": u.port or 9200, "scheme": u.scheme or "http"}],
-        verify_certs=False,
-    )
+    hosts = [{"host": u.hostname, "port": u.port or 9200, "scheme": u.scheme or "http"}]
+    app.state.opensearch = OpenSearch(hosts=hosts, verify_certs=False)
+    app.state.opensearch_async = AsyncOpenSearch(hosts=hosts, verify_certs=False)
+
+    # 상태를 갖지 않는 서비스/어댑터도 요청마다 만들지 않고 앱 단위로 한 번만 생성해서 공유
+    app.state.pipeline_resolver = PipelineResolver(app.state.opensearch)
+    app.state.search_service = build_search_service(app.state.opensearch)
+    app.state.async_search_service = build_async_search_service(app.state.opensearch_async)
+    # template 모드의 검색 템플릿은 색인과 무관하게 앱 시작 시 한 번 등록
+    ensure_search_template(app.state.opensearch)
+
+    # 백그라운드 작업(/v1/jobs) 워커 시작
+    app.state.job_service = build_job_service(app.state.pipeline_resolver)
+    app.state.job_service.start()
     try:
         yield
     finally:
+        # 새 작업은 꺼내지 않고, 실행 중인 작업은 잠시 기다린 뒤 종료(daemon 스레드)
+        app.state.job_service.stop(timeout=5)
         try:
             app.state.opensearch.close()
         except Exception:
             pass
+        try:
+            await app.state.opensearch_async.close()
+        except Exception:
+            pass
+        try:
+            cache = get_async_search_cache()
+            if cache is not None:
+                await cache.close()
+        except Exception:
+            pass
 
 app = FastAPI(
     title="kakaobank report API", 
@@ -58,6 +93,8 @@ app.include_router(health.router)
 app.include_router(extract.router, prefix="/v1")
 app.include_router(transform.router, prefix="/v1")
 app.include_router(index.router, prefix="/v1")
+app.include_router(pipeline.router, prefix="/v1")
+app.include_router(jobs.router, prefix="/v1")
 app.include_router(search.router, prefix="/v1")
 
 # Global Exception Filter
@@ -66,6 +103,8 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(domainex.DomainError, domain_exception_handler)
 app.add_exception_handler(Exception, unhandled_exception_handler)
 
-# 요청 컨텍스트/액세스 로그 미들웨어
+# 요청 수락 제어(lane별 동시 실행 수/대기열, 검색 우선) 미들웨어
+app.add_middleware(AdmissionMiddleware, controller=get_admission_controller())
+# 요청 컨텍스트/액세스 로그 미들웨어(가장 바깥, 거절 응답에도 request id 기록)
 app.add_middleware(RequestContextMiddleware)
 
@@ -0,0 +1,71 @@
+from typing import Dict, Optional
+import logging
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from api_server.app.platform.admission import AdmissionController, AdmissionRejected
+from api_server.app.platform.errors import error_envelope
+from api_server.app.platform.logging import request_id_ctx
+
+logger = logging.getLogger(__name__)
+
+# 경로 접두사 -> lane
+ADMISSION_ROUTES: Dict[str, str] = {
+    "/v1/search": "search",
+    "/v1/index": "ingest",
+    "/v1/extract": "ingest",
+    "/v1/transform": "ingest",
+    "/v1/pipeline": "ingest",
+}
+
+
+class AdmissionMiddleware:
+    """
+    경로로 lane을 정해 AdmissionController에 자리를 얻은 뒤 요청을 처리하고, 응답을 다 보낸 뒤 자리를 돌려준다.
+    거절되면 본문을 읽지 않고 바로 429/503(Retry-After)으로 응답한다.
+    (응답 전송까지 자리를 잡고 있어야 하므로 BaseHTTPMiddleware 대신 ASGI 미들웨어로 구현)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: Optional[AdmissionController],
+        routes: Dict[str, str] = ADMISSION_ROUTES) -> None:
+        self.app = app
+        self.controller = controller
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        lane = self._lane(scope) if self.controller is not None else None
+        if lane is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.acquire(lane)
+        except AdmissionRejected as e:
+            logger.warning("admission rejected: lane=%s reason=%s path=%s", lane, e.reason, scope["path"])
+            response = JSONResponse(
+                status_code=e.status_code,
+                content=error_envelope(
+                    f"server busy ({e.reason}), retry later",
+                    code="TOO_MANY_REQUESTS" if e.status_code == 429 else "SERVICE_UNAVAILABLE",
+                    trace_id=request_id_ctx.get()),
+                headers={"Retry-After": str(e.retry_after)})
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(lane)
+
+    def _lane(self, scope: Scope) -> Optional[str]:
+        if scope["type"] != "http":
+            return None
+        path = scope["path"]
+        for prefix, lane in self.routes.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                return lane
+        return None
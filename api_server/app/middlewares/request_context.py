@@ -1,19 +1,45 @@
 import time, uuid, logging
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from api_server.app.platform.logging import request_id_ctx
 
 access_logger = logging.getLogger("uvicorn.access")
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        rid = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+
+class RequestContextMiddleware:
+    """
+    요청마다 request id(X-Request-ID 헤더 또는 새 uuid4)를 request_id_ctx에 설정하고,
+    응답 헤더에 X-Request-ID를 붙이며 처리 시간을 액세스 로그로 남긴다.
+    (BaseHTTPMiddleware는 요청마다 Task/스트림 래핑이 추가되어 느리고 스트리밍 응답을 깨뜨리므로 ASGI 미들웨어로 구현)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rid = _header(scope, b"x-request-id") or str(uuid.uuid4())
         token = request_id_ctx.set(rid)
         start = time.perf_counter()
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = rid
+            await send(message)
+
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
         finally:
             ms = (time.perf_counter() - start) * 1000
-            access_logger.info("%s %s %.2fms", request.method, request.url.path, ms)
+            access_logger.info("%s %s %.2fms", scope["method"], scope["path"], ms)
             request_id_ctx.reset(token)
-        response.headers["X-Request-ID"] = rid
-        return response
+
+
+def _header(scope: Scope, name: bytes):
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
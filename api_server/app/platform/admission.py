@@ -0,0 +1,173 @@
+"""
+요청 수락 제어(admission control).
+
+- 요청을 lane(search, ingest 등)으로 나누고 lane별 동시 실행 수와 전체 동시 실행 수를 제한한다
+- 자리가 없으면 lane별 크기 제한 대기열에서 기다리고, 대기열이 가득 차면 바로 429,
+  대기 시간(queue_timeout)을 넘기면 503으로 거절한다(AdmissionRejected)
+- priority 값이 작은 lane이 우선: 우선 lane에 대기 중인 요청이 있으면 다음 lane은 수락하지 않고,
+  자리가 나면 우선 lane 대기 요청부터 깨운다(색인이 몰려도 검색 지연이 일정하게 유지되도록)
+- 라우트별 동시 실행 제한(try_acquire_route)은 기다리지 않고 바로 성공/실패를 반환한다
+- lane은 이벤트 루프에서만 호출한다(잠금 없음). 라우트 자리는 작업 워커 스레드도 쓰므로 잠금으로 보호한다
+"""
+
+from __future__ import annotations
+from collections import deque
+from typing import Deque, Dict, NamedTuple
+import asyncio
+import threading
+
+
+class LaneLimits(NamedTuple):
+    concurrency: int
+    queue_size: int
+    queue_timeout: float
+    priority: int
+
+
+class AdmissionRejected(Exception):
+
+    def __init__(self, lane: str, status_code: int, reason: str, retry_after: int = 1) -> None:
+        super().__init__(f"admission rejected: lane={lane} reason={reason}")
+        self.lane = lane
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _Lane:
+    __slots__ = ("name", "limits", "active", "waiters", "admitted", "rejected", "timed_out")
+
+    def __init__(self, name: str, limits: LaneLimits) -> None:
+        self.name = name
+        self.limits = limits
+        self.active = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def waiting(self) -> int:
+        return sum(1 for w in self.waiters if not w.done())
+
+    def has_waiters(self) -> bool:
+        while self.waiters and self.waiters[0].done():
+            self.waiters.popleft()
+        return bool(self.waiters)
+
+
+class AdmissionController:
+
+    def __init__(self, max_in_flight: int, lanes: Dict[str, LaneLimits]) -> None:
+        """
+        Args:
+            max_in_flight: 전체 lane을 합친 최대 동시 실행 수
+            lanes: lane 이름 -> 제한(동시 실행 수, 대기열 크기, 대기 시간(초), 우선순위)
+        """
+        self.max_in_flight = max_in_flight
+        self._lanes = sorted((_Lane(name, limits) for name, limits in lanes.items()), key=lambda l: l.limits.priority)
+        self._by_name = {lane.name: lane for lane in self._lanes}
+        self._active = 0
+        self._routes: Dict[str, int] = {}
+        self._routes_lock = threading.Lock()
+
+    async def acquire(self, lane_name: str) -> None:
+        """
+        lane에 자리가 날 때까지(최대 queue_timeout) 기다린다. 수락되면 반드시 release를 호출한다.
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나(429) 대기 시간을 넘김(503)
+        """
+        lane = self._by_name[lane_name]
+        if not lane.has_waiters() and self._can_admit(lane):
+            self._admit(lane)
+            return
+        if lane.waiting() >= lane.limits.queue_size:
+            lane.rejected += 1
+            raise AdmissionRejected(lane_name, 429, "queue full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        lane.waiters.append(waiter)
+        admitted = False
+        try:
+            await asyncio.wait_for(waiter, lane.limits.queue_timeout)
+            admitted = True
+        except asyncio.TimeoutError:
+            # wait_for는 자리를 받은 뒤에도 TimeoutError를 낼 수 있으므로(3.12+) 받은 자리는 돌려준다
+            if waiter.done() and not waiter.cancelled():
+                self.release(lane_name)
+            lane.timed_out += 1
+            raise AdmissionRejected(lane_name, 503, "queue timeout") from None
+        except BaseException:
+            # 수락된 직후 요청이 취소되면 자리를 돌려준다
+            if waiter.done() and not waiter.cancelled():
+                self.release(lane_name)
+            raise
+        finally:
+            # 수락되지 못한(시간 초과/취소) 대기 요청은 대기열에서 바로 뺀다
+            if not admitted:
+                try:
+                    lane.waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    def release(self, lane_name: str) -> None:
+        lane = self._by_name[lane_name]
+        lane.active -= 1
+        self._active -= 1
+        self._dispatch()
+
+    def try_acquire_route(self, route: str, limit: int) -> bool:
+        """
+        라우트별 동시 실행 수가 limit 미만이면 자리를 차지하고 True, 아니면 False(기다리지 않음).
+        """
+        with self._routes_lock:
+            if self._routes.get(route, 0) >= limit:
+                return False
+            self._routes[route] = self._routes.get(route, 0) + 1
+            return True
+
+    def release_route(self, route: str) -> None:
+        with self._routes_lock:
+            self._routes[route] -= 1
+
+    def stats(self) -> Dict[str, object]:
+        with self._routes_lock:
+            routes = dict(self._routes)
+        return {
+            "active": self._active,
+            "max_in_flight": self.max_in_flight,
+            "lanes": {
+                lane.name: {
+                    "active": lane.active,
+                    "waiting": lane.waiting(),
+                    "admitted": lane.admitted,
+                    "rejected": lane.rejected,
+                    "timed_out": lane.timed_out,
+                }
+                for lane in self._lanes
+            },
+            "routes": routes,
+        }
+
+    # ================= internal helpers =================
+    def _can_admit(self, lane: _Lane) -> bool:
+        if lane.active >= lane.limits.concurrency or self._active >= self.max_in_flight:
+            return False
+        # 우선 lane에 대기 중인 요청이 있으면 양보한다
+        return not any(
+            other.has_waiters() for other in self._lanes if other.limits.priority < lane.limits.priority)
+
+    def _admit(self, lane: _Lane) -> None:
+        lane.active += 1
+        lane.admitted += 1
+        self._active += 1
+
+    def _dispatch(self) -> None:
+        """
+        우선순위 순으로 대기 요청을 깨운다. 우선 lane에 남은 대기 요청이 있으면 다음 lane은 깨우지 않는다.
+        """
+        for lane in self._lanes:
+            while lane.has_waiters() and lane.active < lane.limits.concurrency and self._active < self.max_in_flight:
+                self._admit(lane)
+                lane.waiters.popleft().set_result(None)
+            if lane.has_waiters():
+                return
@@ -11,4 +11,84 @@ class Settings(BaseSettings):
     OPENSEARCH_INDEX: str = os.getenv('OPENSEARCH_INDEX', 'collection')
     OPENSEARCH_ALIAS: str = os.getenv('OPENSEARCH_ALIAS', 'kakaobank')
 
+    # 파이프라인(extract -> transform -> index) 스트리밍 모드 단계 사이 버퍼 크기
+    PIPELINE_BUFFER_SIZE: int = int(os.getenv('PIPELINE_BUFFER_SIZE', '64'))
+
+    # extract 단계 병렬 파싱 프로세스 수(0/1: 순차 파싱), 워커당 한 번에 넘길 파일 수
+    EXTRACT_WORKERS: int = int(os.getenv('EXTRACT_WORKERS', '0'))
+    EXTRACT_CHUNK_SIZE: int = int(os.getenv('EXTRACT_CHUNK_SIZE', '2'))
+
+    # bulk 색인 동시 전송 스레드 수(1: streaming_bulk 순차 전송, 2 이상: parallel_bulk)
+    # bulk 요청 1회당 최대 문서 수/바이트 수
+    BULK_THREAD_COUNT: int = int(os.getenv('BULK_THREAD_COUNT', '1'))
+    BULK_CHUNK_SIZE: int = int(os.getenv('BULK_CHUNK_SIZE', '500'))
+    BULK_MAX_CHUNK_BYTES: int = int(os.getenv('BULK_MAX_CHUNK_BYTES', str(100 * 1024 * 1024)))
+    # 색인 완료 후 force merge 목표 세그먼트 수(0이면 force merge 생략, 기본 생략)
+    # (병합 동안 finalize가 블록되고, delta 복제 인덱스는 기준 인덱스와 공유하던 세그먼트를 다시 쓰게 된다)
+    INDEX_FORCEMERGE_MAX_SEGMENTS: int = int(os.getenv('INDEX_FORCEMERGE_MAX_SEGMENTS', '0'))
+
+    # 검색 결과 캐시(memory: 프로세스 내 LRU+TTL, redis: 여러 워커 공유, 빈 값: 사용 안 함)
+    SEARCH_CACHE_BACKEND: str = os.getenv('SEARCH_CACHE_BACKEND', 'memory')
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '10000'))
+    SEARCH_CACHE_TTL_SECONDS: int = int(os.getenv('SEARCH_CACHE_TTL_SECONDS', '60'))
+    REDIS_URL: str = os.getenv('REDIS_URL', 'redis://redis:6379/0')
+    REDIS_SOCKET_TIMEOUT: float = float(os.getenv('REDIS_SOCKET_TIMEOUT', '0.1'))
+
+    # source=all 요청에서 html/tsv를 동시에 처리할지 여부(false면 순차 처리)
+    SOURCE_ALL_CONCURRENT: bool = os.getenv('SOURCE_ALL_CONCURRENT', 'true').lower() == 'true'
+
+    # 백그라운드 작업(/v1/jobs) 대기열(memory: 프로세스 내, redis: 여러 워커가 나눠 처리)과 워커 스레드 수
+    JOB_QUEUE_BACKEND: str = os.getenv('JOB_QUEUE_BACKEND', 'memory')
+    JOB_WORKERS: int = int(os.getenv('JOB_WORKERS', '1'))
+    # memory 대기열이 보관할 최대 작업 수, redis 대기열의 작업 보관 시간(초)
+    JOB_MAX_ENTRIES: int = int(os.getenv('JOB_MAX_ENTRIES', '1000'))
+    JOB_TTL_SECONDS: int = int(os.getenv('JOB_TTL_SECONDS', '86400'))
+    # redis 대기열에서 꺼낸 작업의 임대 기한(초, 워커가 1/3 주기로 연장)과 워커가 죽어 회수된 작업의 최대 실행 시도 횟수
+    JOB_LEASE_SECONDS: float = float(os.getenv('JOB_LEASE_SECONDS', '60'))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+
+    # 검색 쿼리 전달 방식(compiled: 미리 직렬화한 바디에 검색어만 끼움, template: 저장된 검색 템플릿을 id로 호출)
+    # 검색 템플릿 id(빈 값이면 내장 템플릿 id, 새 id로 템플릿을 저장하고 바꾸면 배포 없이 검색 전략 교체)
+    SEARCH_QUERY_MODE: str = os.getenv('SEARCH_QUERY_MODE', 'compiled')
+    SEARCH_TEMPLATE_ID: str = os.getenv('SEARCH_TEMPLATE_ID', '')
+
+    # 같은 조건(query, size, explain, options)으로 동시에 들어온 검색을 진행 중인 검색 하나로 합칠지 여부
+    SEARCH_COALESCE: bool = os.getenv('SEARCH_COALESCE', 'true').lower() == 'true'
+
+    # 요청 수락 제어: 전체/lane(search, ingest)별 동시 실행 수, 대기열 크기, 대기 시간(초)
+    # (검색 lane이 우선, 대기열이 가득 차면 429, 대기 시간을 넘기면 503)
+    # 켜면 동시 색인/파이프라인 요청이 429로 거절될 수 있으므로 기본은 끔
+    ADMISSION_ENABLED: bool = os.getenv('ADMISSION_ENABLED', 'false').lower() == 'true'
+    ADMISSION_MAX_IN_FLIGHT: int = int(os.getenv('ADMISSION_MAX_IN_FLIGHT', '64'))
+    ADMISSION_SEARCH_CONCURRENCY: int = int(os.getenv('ADMISSION_SEARCH_CONCURRENCY', '32'))
+    ADMISSION_SEARCH_QUEUE: int = int(os.getenv('ADMISSION_SEARCH_QUEUE', '256'))
+    ADMISSION_SEARCH_QUEUE_TIMEOUT: float = float(os.getenv('ADMISSION_SEARCH_QUEUE_TIMEOUT', '2.0'))
+    ADMISSION_INGEST_CONCURRENCY: int = int(os.getenv('ADMISSION_INGEST_CONCURRENCY', '2'))
+    ADMISSION_INGEST_QUEUE: int = int(os.getenv('ADMISSION_INGEST_QUEUE', '0'))
+    ADMISSION_INGEST_QUEUE_TIMEOUT: float = float(os.getenv('ADMISSION_INGEST_QUEUE_TIMEOUT', '1.0'))
+    # 추출/변환/색인/파이프라인 라우트별 동시 실행 수(초과하면 바로 429)
+    ADMISSION_INGEST_ROUTE_CONCURRENCY: int = int(os.getenv('ADMISSION_INGEST_ROUTE_CONCURRENCY', '1'))
+
+    # /v1/search/batch 요청 1회당 최대 쿼리 수
+    SEARCH_BATCH_MAX_QUERIES: int = int(os.getenv('SEARCH_BATCH_MAX_QUERIES', '200'))
+
+    # 위키 HTML 파서 구현(selectolax: 단일 순회 고속 파서, bs4: BeautifulSoup 파서)
+    WIKI_PARSER_BACKEND: str = os.getenv('WIKI_PARSER_BACKEND', 'selectolax')
+    # true 이면 위키 body 블록에 중첩된 헤딩/문단/리스트/테이블 텍스트를 중복 수집하던 기존 방식 사용
+    WIKI_LEGACY_BODY_TEXT: bool = os.getenv('WIKI_LEGACY_BODY_TEXT', 'false').lower() == 'true'
+
+    # 중간 산출물(*_parsed, *_normalized) 형식: jsonl(.json) | jsonl.gz | jsonl.zst | parquet
+    # (parquet는 *_normalized에만 적용, jsonl.zst는 zstandard, parquet는 pyarrow 패키지 필요)
+    ARTIFACT_FORMAT: str = os.getenv('ARTIFACT_FORMAT', 'jsonl')
+    # 스키마 버전 헤더가 현재 모델과 일치하는 내부 산출물은 색인/delta 비교 시 pydantic 재검증 생략
+    ARTIFACT_TRUSTED: bool = os.getenv('ARTIFACT_TRUSTED', 'true').lower() == 'true'
+
+    # QnA(tsv) 파이프라인(full, 중간 산출물 없음)을 pyarrow 열 단위 경로로 처리할지 여부와 한 번에 읽을 바이트 수
+    QNA_COLUMNAR_PIPELINE: bool = os.getenv('QNA_COLUMNAR_PIPELINE', 'true').lower() == 'true'
+    QNA_COLUMNAR_BLOCK_SIZE: int = int(os.getenv('QNA_COLUMNAR_BLOCK_SIZE', str(4 * 1024 * 1024)))
+
+    # 파싱 결과 캐시 디렉터리(빈 값이면 캐시 사용 안 함)와 최대 크기(바이트)
+    PARSE_CACHE_DIR: str = os.getenv('PARSE_CACHE_DIR', 'api_server/resources/cache/parse')
+    PARSE_CACHE_MAX_BYTES: int = int(os.getenv('PARSE_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))
+
 settings = Settings()
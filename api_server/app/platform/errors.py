@@ -21,7 +21,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
                         content=error_envelope(
                             exc.detail, 
                             code=f"HTTP_{exc.status_code}", 
-                            trace_id=request_id_ctx.get()))
+                            trace_id=request_id_ctx.get()),
+                        headers=exc.headers)
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     # 422 Unprocessable Entity
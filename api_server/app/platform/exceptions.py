@@ -25,6 +25,11 @@ class IndexingFailed(DomainError):
         super().__init__(f"Indexing failed for {index_name}: {reason}")
         self.index_name = index_name
 
+class JobCancelled(DomainError):
+    def __init__(self, job_id: str):
+        super().__init__(f"Job cancelled: {job_id}")
+        self.job_id = job_id
+
 class ServiceError(DomainError):
     def __init__(self, message: str):
         super().__init__(message)
@@ -0,0 +1,127 @@
+"""
+RequestContextMiddleware 요청당 오버헤드 마이크로벤치마크.
+
+- 미들웨어 없음 / 기존 BaseHTTPMiddleware 구현 / ASGI 구현을 같은 라우터(/health, /v1/search)에 붙여 비교
+- OpenSearch 없이 실행되도록 검색 서비스는 고정 응답을 돌려주는 stub으로 바꾼다
+- 네트워크를 거치지 않고 httpx ASGITransport로 앱을 직접 호출하므로 차이는 미들웨어 비용에 가깝다
+
+실행 (저장소 루트에서):
+    python -m api_server.scripts.bench_request_context --requests 5000
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from api_server.app.api.deps import get_async_search_service
+from api_server.app.api.routers import health, search
+from api_server.app.middlewares.request_context import RequestContextMiddleware, access_logger
+from api_server.app.platform.logging import request_id_ctx
+
+SEARCH_BODY = {"query": "카카오뱅크", "size": 3}
+SEARCH_RESPONSE = {
+    "took": 1,
+    "hits": {
+        "total": {"value": 1, "relation": "eq"},
+        "hits": [{"_id": "1", "_score": 10.1, "_source": {"title": "카카오뱅크", "question": "질문", "answer": "답변"}}],
+    },
+}
+
+
+class LegacyRequestContextMiddleware(BaseHTTPMiddleware):
+    """비교용: 기존 BaseHTTPMiddleware 구현"""
+
+    async def dispatch(self, request, call_next):
+        rid = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        token = request_id_ctx.set(rid)
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            ms = (time.perf_counter() - start) * 1000
+            access_logger.info("%s %s %.2fms", request.method, request.url.path, ms)
+            request_id_ctx.reset(token)
+        response.headers["X-Request-ID"] = rid
+        return response
+
+
+class StubSearchService:
+    async def search(self, query, size=3, explain=False, options=None, compact=True):
+        return SEARCH_RESPONSE
+
+
+def build_app(middleware: Optional[type]) -> FastAPI:
+    app = FastAPI()
+    app.include_router(health.router)
+    app.include_router(search.router, prefix="/v1")
+    stub = StubSearchService()
+    app.dependency_overrides[get_async_search_service] = lambda: stub
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def measure(app: FastAPI, call: Callable, requests: int, warmup: int) -> List[float]:
+    """
+    요청을 순서대로 보내 요청당 소요 시간(µs) 목록을 반환한다.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(warmup):
+            await call(client)
+        samples = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            r = await call(client)
+            samples.append((time.perf_counter() - start) * 1e6)
+            r.raise_for_status()
+        return samples
+
+
+async def run(requests: int, warmup: int) -> Dict[str, Dict[str, float]]:
+    endpoints = {
+        "/health": lambda c: c.get("/health"),
+        "/v1/search": lambda c: c.post("/v1/search", json=SEARCH_BODY),
+    }
+    variants = {
+        "none": None,
+        "base_http": LegacyRequestContextMiddleware,
+        "asgi": RequestContextMiddleware,
+    }
+    results: Dict[str, Dict[str, float]] = {}
+    for path, call in endpoints.items():
+        results[path] = {}
+        for name, middleware in variants.items():
+            samples = await measure(build_app(middleware), call, requests, warmup)
+            results[path][name] = statistics.median(samples)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=200)
+    args = parser.parse_args()
+
+    # 액세스 로그 출력 비용은 두 구현이 같으므로 측정에서 뺀다
+    access_logger.setLevel(logging.WARNING)
+
+    results = asyncio.run(run(args.requests, args.warmup))
+    print(f"{'endpoint':<12}{'none':>10}{'base_http':>12}{'asgi':>10}{'overhead(base_http)':>22}{'overhead(asgi)':>17}")
+    for path, r in results.items():
+        print(
+            f"{path:<12}{r['none']:>8.1f}µs{r['base_http']:>10.1f}µs{r['asgi']:>8.1f}µs"
+            f"{r['base_http'] - r['none']:>20.1f}µs{r['asgi'] - r['none']:>15.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,18 @@ if str(ROOT) not in sys.path:
 import pytest
 from fastapi.testclient import TestClient
 from api_server.app.main import app
+from api_server.app.api.deps import get_admission_controller
+from api_server.app.platform.config import settings
 
 @pytest.fixture(scope="session")
 def client():
     return TestClient(app)
+
+
+@pytest.fixture
+def admission_enabled(monkeypatch):
+    """요청 수락 제어를 켠 상태의 (프로세스 공유) 수락 제어기"""
+    monkeypatch.setattr(settings, "ADMISSION_ENABLED", True)
+    get_admission_controller.cache_clear()
+    yield get_admission_controller()
+    get_admission_controller.cache_clear()
@@ -0,0 +1,135 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from unittest.mock import MagicMock
+import pytest
+
+from api_server.app.main import app
+from api_server.app.api.deps import INGEST_ROUTE, get_admission_controller, get_pipeline_resolver
+from api_server.app.middlewares.admission import AdmissionMiddleware
+from api_server.app.platform.admission import AdmissionController, LaneLimits
+from api_server.app.platform.config import Settings, settings
+
+
+def make_app(controller: AdmissionController) -> FastAPI:
+    """AdmissionMiddleware만 붙인 작은 앱 (/v1/search -> search lane, /v1/index -> ingest lane)"""
+    small = FastAPI()
+    small.add_middleware(AdmissionMiddleware, controller=controller)
+
+    @small.get("/v1/search")
+    def search():
+        return {"ok": True}
+
+    @small.get("/v1/index")
+    def index():
+        return {"ok": True}
+
+    @small.get("/other")
+    def other():
+        return {"ok": True}
+
+    return small
+
+
+@pytest.fixture
+def controller():
+    return AdmissionController(4, {
+        "search": LaneLimits(1, 1, 0.01, priority=0),
+        "ingest": LaneLimits(1, 0, 1.0, priority=1),
+    })
+
+
+def test_admitted_request_releases_slot(controller):
+    client = TestClient(make_app(controller))
+
+    assert client.get("/v1/search").status_code == 200
+    assert client.get("/v1/search").status_code == 200
+
+    stats = controller.stats()
+    assert stats["active"] == 0
+    assert stats["lanes"]["search"]["admitted"] == 2
+
+
+def test_full_lane_returns_429_with_retry_after(controller):
+    """
+    ingest lane 자리를 모두 쓰고 있으면(대기열 0) 본문을 처리하지 않고 429 + Retry-After로 응답한다.
+    """
+    client = TestClient(make_app(controller))
+    controller._by_name["ingest"].active = 1
+
+    r = client.get("/v1/index")
+
+    assert r.status_code == 429
+    assert r.headers["Retry-After"] == "1"
+    assert r.json()["error"]["code"] == "TOO_MANY_REQUESTS"
+    # 제한 대상이 아닌 경로나 다른 lane은 영향이 없다
+    assert client.get("/other").status_code == 200
+    assert client.get("/v1/search").status_code == 200
+
+
+def test_queue_timeout_returns_503(controller):
+    client = TestClient(make_app(controller))
+    controller._by_name["search"].active = 1
+
+    r = client.get("/v1/search")
+
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == "1"
+    assert r.json()["error"]["code"] == "SERVICE_UNAVAILABLE"
+
+
+@pytest.mark.parametrize("path", ["/v1/index", "/v1/pipeline"])
+def test_busy_ingest_route_returns_429(path, admission_enabled):
+    """
+    색인 자리(ingest)를 이미 쓰고 있으면(다른 색인/파이프라인 요청 또는 /v1/jobs 작업)
+    서비스를 호출하지 않고 429 + Retry-After로 응답한다.
+    """
+    svc = MagicMock()
+    resolver = MagicMock()
+    resolver.for_type.return_value = svc
+    app.dependency_overrides[get_pipeline_resolver] = lambda: resolver
+    shared = admission_enabled
+    assert shared.try_acquire_route(INGEST_ROUTE, 1)
+    try:
+        r = TestClient(app, raise_server_exceptions=False).post(path, json={"source": "tsv", "date": "3"})
+    finally:
+        shared.release_route(INGEST_ROUTE)
+        app.dependency_overrides.clear()
+
+    assert r.status_code == 429
+    assert r.headers["Retry-After"] == "1"
+    svc.index.assert_not_called()
+    svc.run_pipeline.assert_not_called()
+
+
+def test_health_admission_reports_lanes(admission_enabled):
+    r = TestClient(app).get("/health/admission")
+
+    assert r.status_code == 200
+    body = r.json()
+    assert body["enabled"] is True
+    assert set(body["lanes"]) == {"search", "ingest"}
+
+
+def test_admission_is_disabled_by_default_and_ingest_routes_are_not_limited(monkeypatch):
+    """
+    기본값(ADMISSION_ENABLED=false)이면 수락 제어기를 만들지 않고, 색인 라우트도 429로 거절하지 않는다.
+    """
+    monkeypatch.delenv("ADMISSION_ENABLED", raising=False)
+    assert Settings().ADMISSION_ENABLED is False
+
+    monkeypatch.setattr(settings, "ADMISSION_ENABLED", False)
+    get_admission_controller.cache_clear()
+    svc = MagicMock()
+    resolver = MagicMock()
+    resolver.for_type.return_value = svc
+    app.dependency_overrides[get_pipeline_resolver] = lambda: resolver
+    try:
+        client = TestClient(app)
+        assert client.get("/health/admission").json() == {"enabled": False}
+        r = client.post("/v1/index", json={"source": "tsv", "date": "3"})
+    finally:
+        app.dependency_overrides.clear()
+        get_admission_controller.cache_clear()
+
+    assert r.status_code != 429
+    svc.index.assert_called_once()
@@ -73,7 +73,7 @@ def test_index_single_tsv(client, svc_html, svc_tsv):
     assert body["data"]["tsv"]["index_name"] == ["myidx-tsv-3"]
     assert body["data"]["tsv"]["alias_name"] == "myalias"
 
-    svc_tsv.index.assert_called_once_with(source="tsv", date="3", collection=Collection.qna)
+    svc_tsv.index.assert_called_once_with(source="tsv", date="3", collection=Collection.qna, mode="full")
     svc_html.index.assert_not_called()
 
 
@@ -90,7 +90,7 @@ def test_index_single_html(client, svc_html, svc_tsv):
     assert body["data"]["html"]["index_name"] == ["myidx-html-3"]  # 더미 리턴값이므로 고정
     assert body["data"]["html"]["alias_name"] == "myalias"
 
-    svc_html.index.assert_called_once_with(source="html", date="3", collection=Collection.wiki)
+    svc_html.index.assert_called_once_with(source="html", date="3", collection=Collection.wiki, mode="full")
     svc_tsv.index.assert_not_called()
 
 
@@ -109,8 +109,8 @@ def test_index_all_calls_both_and_returns_last(client, svc_html, svc_tsv):
     assert body["data"]["html"]["index_name"] == ["myidx-html-3"]
     assert body["data"]["html"]["indexed"] == 5
 
-    svc_html.index.assert_called_once_with(source="html", date="3", collection=Collection.wiki)
-    svc_tsv.index.assert_called_once_with(source="tsv", date="3", collection=Collection.qna)
+    svc_html.index.assert_called_once_with(source="html", date="3", collection=Collection.wiki, mode="full")
+    svc_tsv.index.assert_called_once_with(source="tsv", date="3", collection=Collection.qna, mode="full")
 
 
 def test_index_invalid_source_returns_500(client, svc_html, svc_tsv):
@@ -135,7 +135,7 @@ def test_index_not_found_resource_returns_404(client, svc_html, svc_tsv):
     r = client.post("/v1/index", json={"source": "html", "date": "4"})
     assert r.status_code == 404
 
-    svc_html.index.assert_called_once_with(source="html", date="4", collection=Collection.wiki)
+    svc_html.index.assert_called_once_with(source="html", date="4", collection=Collection.wiki, mode="full")
     svc_tsv.index.assert_not_called()
 
 
@@ -147,5 +147,17 @@ def test_index_connection_error_returns_500(client, svc_html, svc_tsv):
     r = client.post("/v1/index", json={"source": "html", "date": "4"})
     assert r.status_code == 500
 
-    svc_html.index.assert_called_once_with(source="html", date="4", collection=Collection.wiki)
+    svc_html.index.assert_called_once_with(source="html", date="4", collection=Collection.wiki, mode="full")
     svc_tsv.index.assert_not_called()
+
+
+def test_index_delta_mode_is_forwarded(client, svc_html):
+    """
+    mode=delta 가 서비스까지 전달되는지
+    """
+    svc_html.index.return_value = {"indexed": 1, "deleted": 0, "mode": "delta"}
+
+    r = client.post("/v1/index", json={"source": "html", "date": "4", "mode": "delta"})
+
+    assert r.status_code == 200
+    svc_html.index.assert_called_once_with(source="html", date="4", collection=Collection.wiki, mode="delta")
@@ -0,0 +1,71 @@
+from fastapi.testclient import TestClient
+from unittest.mock import MagicMock
+import pytest
+
+from api_server.app.main import app
+from api_server.app.api.deps import get_job_service
+from api_server.app.domain.models import Job, JobStatus, JobProgress
+from api_server.app.platform.exceptions import ResourceNotFound
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.fixture
+def mock_job_service():
+    svc = MagicMock()
+    svc.submit.side_effect = lambda kind, params: Job(job_id="j1", kind=kind, params=params)
+    return svc
+
+
+@pytest.fixture(autouse=True)
+def override_dependency(mock_job_service):
+    app.dependency_overrides[get_job_service] = lambda: mock_job_service
+    yield
+    app.dependency_overrides.clear()
+
+
+def test_submit_job_returns_202_with_job_id(client, mock_job_service):
+    r = client.post("/v1/jobs", json={"kind": "index", "date": "3", "mode": "delta"})
+
+    assert r.status_code == 202
+    body = r.json()
+    assert body["data"]["job_id"] == "j1"
+    assert body["data"]["status"] == "queued"
+    mock_job_service.submit.assert_called_once_with(
+        "index", {"source": "all", "date": "3", "mode": "delta", "save_intermediate": False})
+
+
+def test_submit_job_invalid_kind_returns_422(client):
+    r = client.post("/v1/jobs", json={"kind": "reindex", "date": "3"})
+    assert r.status_code == 422
+
+
+def test_get_job_returns_progress(client, mock_job_service):
+    mock_job_service.get.return_value = Job(
+        job_id="j1", kind="pipeline", status=JobStatus.running,
+        progress=JobProgress(listed=10, parsed=4, transformed=4))
+
+    r = client.get("/v1/jobs/j1")
+
+    assert r.status_code == 200
+    data = r.json()["data"]
+    assert data["status"] == "running"
+    assert data["progress"] == {"listed": 10, "parsed": 4, "transformed": 4, "indexed": 0, "failed": 0}
+
+
+def test_get_unknown_job_returns_404(client, mock_job_service):
+    mock_job_service.get.side_effect = ResourceNotFound("job")
+    assert client.get("/v1/jobs/nope").status_code == 404
+
+
+def test_cancel_job(client, mock_job_service):
+    mock_job_service.cancel.return_value = Job(job_id="j1", kind="index", status=JobStatus.cancelled)
+
+    r = client.delete("/v1/jobs/j1")
+
+    assert r.status_code == 200
+    assert r.json()["data"]["status"] == "cancelled"
+    mock_job_service.cancel.assert_called_once_with("j1")
@@ -0,0 +1,114 @@
+from fastapi.testclient import TestClient
+from unittest.mock import MagicMock
+import pytest
+
+from api_server.app.main import app
+from api_server.app.api.deps import get_pipeline_resolver
+from api_server.app.domain.models import FileType, Collection
+from api_server.app.platform.exceptions import ResourceNotFound
+
+
+class DummyResolver:
+    """routers.pipeline 에서 resolver.for_type(FileType)로 서비스 반환을 흉내내는 간단한 mockup"""
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+    def for_type(self, ft: FileType):
+        return self._mapping[ft]
+
+
+@pytest.fixture
+def client():
+    return TestClient(app, raise_server_exceptions=False)
+
+
+@pytest.fixture
+def svc_html():
+    m = MagicMock()
+    m.run_pipeline.return_value = {
+        "indexed": 5,
+        "errors": [],
+        "index_name": ["myidx-html-3"],
+        "alias_name": "myalias",
+    }
+    return m
+
+
+@pytest.fixture
+def svc_tsv():
+    m = MagicMock()
+    m.run_pipeline.return_value = {
+        "indexed": 7,
+        "errors": [],
+        "index_name": ["myidx-html-3", "myidx-tsv-3"],
+        "alias_name": "myalias",
+    }
+    return m
+
+
+@pytest.fixture(autouse=True)
+def override_resolver(svc_html, svc_tsv):
+    resolver = DummyResolver(
+        {
+            FileType.html: svc_html,
+            FileType.tsv:  svc_tsv,
+        }
+    )
+    app.dependency_overrides[get_pipeline_resolver] = lambda: resolver
+    yield
+    app.dependency_overrides.clear()
+
+
+def test_pipeline_single_html(client, svc_html, svc_tsv):
+    """
+    source=html 이면 HTML용 서비스만 호출되고, 중간 파일 저장은 기본적으로 꺼져 있어야 한다.
+    """
+    r = client.post("/v1/pipeline", json={"source": "html", "date": "3"})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["success"] is True
+    assert body["data"]["html"]["indexed"] == 5
+
+    svc_html.run_pipeline.assert_called_once_with(
+        source="html", date="3", collection=Collection.wiki, save_intermediate=False, mode="full")
+    svc_tsv.run_pipeline.assert_not_called()
+
+
+def test_pipeline_all_with_intermediate(client, svc_html, svc_tsv):
+    """
+    source=all 이면 두 서비스를 모두 호출하고 save_intermediate 옵션을 그대로 전달한다.
+    """
+    r = client.post("/v1/pipeline", json={"date": "3", "save_intermediate": True})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["data"]["html"]["indexed"] == 5
+    assert body["data"]["tsv"]["indexed"] == 7
+
+    svc_html.run_pipeline.assert_called_once_with(
+        source="html", date="3", collection=Collection.wiki, save_intermediate=True, mode="full")
+    svc_tsv.run_pipeline.assert_called_once_with(
+        source="tsv", date="3", collection=Collection.qna, save_intermediate=True, mode="full")
+
+
+def test_pipeline_not_found_resource_returns_404(client, svc_tsv):
+    """
+    ResourceNotFound 예외가 발생하면 404 리턴
+    """
+    svc_tsv.run_pipeline.side_effect = ResourceNotFound(resource="tsv/day_9", detail="No files for date=9")
+    r = client.post("/v1/pipeline", json={"source": "tsv", "date": "9"})
+    assert r.status_code == 404
+
+
+def test_pipeline_delta_mode_is_forwarded(client, svc_html):
+    """
+    mode=delta 가 서비스까지 전달되는지
+    """
+    r = client.post("/v1/pipeline", json={"source": "html", "date": "4", "mode": "delta"})
+    assert r.status_code == 200
+    svc_html.run_pipeline.assert_called_once_with(
+        source="html", date="4", collection=Collection.wiki, save_intermediate=False, mode="delta")
+
+
+def test_pipeline_rejects_unknown_mode(client):
+    r = client.post("/v1/pipeline", json={"source": "html", "date": "4", "mode": "partial"})
+    assert r.status_code == 422
@@ -0,0 +1,50 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+import logging
+import uuid
+
+from api_server.app.main import app
+from api_server.app.middlewares.request_context import RequestContextMiddleware
+from api_server.app.platform.logging import request_id_ctx
+
+
+def test_request_id_header_is_echoed_and_logged(caplog):
+    caplog.set_level(logging.INFO, logger="uvicorn.access")
+
+    r = TestClient(app).get("/health", headers={"X-Request-ID": "rid-123"})
+
+    assert r.status_code == 200
+    assert r.headers["X-Request-ID"] == "rid-123"
+    assert any(rec.getMessage().startswith("GET /health ") for rec in caplog.records)
+
+
+def test_request_id_is_generated_when_missing():
+    r = TestClient(app).get("/health")
+
+    assert uuid.UUID(r.headers["X-Request-ID"])
+
+
+def test_request_id_is_visible_to_handlers_and_error_envelope():
+    """
+    핸들러/예외 처리기에서 request_id_ctx로 같은 request id를 읽는다(에러 응답의 trace_id).
+    """
+    r = TestClient(app, raise_server_exceptions=False).post("/v1/search", json={}, headers={"X-Request-ID": "rid-err"})
+
+    assert r.status_code == 422
+    assert r.headers["X-Request-ID"] == "rid-err"
+    assert r.json()["trace_id"] == "rid-err"
+
+
+def test_streaming_response_passes_through():
+    small = FastAPI()
+    small.add_middleware(RequestContextMiddleware)
+
+    @small.get("/stream")
+    def stream():
+        return StreamingResponse((f"{request_id_ctx.get()}:{i}\n" for i in range(3)), media_type="text/plain")
+
+    r = TestClient(small).get("/stream", headers={"X-Request-ID": "s1"})
+
+    assert r.headers["X-Request-ID"] == "s1"
+    assert r.text == "s1:0\ns1:1\ns1:2\n"
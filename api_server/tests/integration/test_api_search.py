@@ -1,9 +1,10 @@
 from fastapi.testclient import TestClient
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from api_server.app.main import app
-from api_server.app.api.deps import get_search_service
+from api_server.app.api.deps import get_async_search_service
+from api_server.app.domain.models import SearchOptions
 from api_server.app.platform.exceptions import DomainError
 from opensearchpy.exceptions import ConnectionError
 
@@ -16,6 +17,7 @@ def client():
 @pytest.fixture
 def mock_search_service():
     svc = MagicMock()
+    svc.search = AsyncMock()
     # 기본 리턴 형태를 OpenSearch 유사 형태로 세팅
     svc.search.return_value = {
         "hits": {
@@ -28,14 +30,14 @@ def mock_search_service():
 
 @pytest.fixture(autouse=True)
 def override_dependency(mock_search_service):
-    app.dependency_overrides[get_search_service] = lambda: mock_search_service
+    app.dependency_overrides[get_async_search_service] = lambda: mock_search_service
     yield
     app.dependency_overrides.clear()
 
 
 def test_search_defaults(client, mock_search_service):
     """
-    기본 파라미터(size=3, explain=False)가 적용되어 서비스가 호출되는지 검증
+    기본 파라미터(size=3, explain=False, compact 응답, 기본 필드/하이라이트 옵션)가 적용되어 서비스가 호출되는지 검증
     """
     mock_search_service.search.side_effect = None
     payload = {"query": "카카오뱅크"}
@@ -47,14 +49,15 @@ def test_search_defaults(client, mock_search_service):
     assert body["message"].startswith("검색 성공")
     assert "hits" in body["data"]
     # 서비스 호출 파라미터 확인
-    mock_search_service.search.assert_called_once_with(query="카카오뱅크", size=3, explain=False)
+    mock_search_service.search.assert_called_once_with(
+        query="카카오뱅크", size=3, explain=False, options=SearchOptions(), compact=True)
 
 
 def test_search_with_params(client, mock_search_service):
     """
     size, explain 파라미터를 오버라이드 했을 때 서비스가 같은 값으로 호출되는지
     """
-    payload = {"query": "삼성전자", "size": 5, "explain": True}
+    payload = {"query": "삼성전자", "size": 5, "explain": True, "format": "raw"}
     # 서비스 리턴값도 살짝 바꿔보자
     mock_search_service.search.return_value = {
         "hits": {
@@ -74,7 +77,32 @@ def test_search_with_params(client, mock_search_service):
     assert body["data"]["hits"]["total"]["value"] == 2
     assert len(body["data"]["hits"]["hits"]) == 2
 
-    mock_search_service.search.assert_called_once_with(query="삼성전자", size=5, explain=True)
+    mock_search_service.search.assert_called_once_with(
+        query="삼성전자", size=5, explain=True, options=None, compact=False)
+
+
+def test_search_passes_source_and_highlight_options(client, mock_search_service):
+    """
+    요청한 _source 포함/제외 필드와 하이라이트 옵션이 서비스로 그대로 전달되는지
+    """
+    payload = {
+        "query": "지구",
+        "options": {"source_includes": ["title"], "source_excludes": ["body"], "highlight_fields": ["paragraph"],
+                    "fragment_size": 80, "number_of_fragments": 1},
+    }
+
+    resp = client.post("/v1/search", json=payload)
+
+    assert resp.status_code == 200
+    options = mock_search_service.search.call_args.kwargs["options"]
+    assert options == SearchOptions(
+        source_includes=["title"], source_excludes=["body"], highlight_fields=["paragraph"],
+        fragment_size=80, number_of_fragments=1)
+
+
+def test_search_invalid_fragment_size_returns_422(client):
+    resp = client.post("/v1/search", json={"query": "지구", "options": {"fragment_size": 0}})
+    assert resp.status_code == 422
 
 
 def test_search_propagates_error_returns_500(client, mock_search_service):
@@ -104,4 +132,40 @@ def test_search_propagates_error_teturns_500(client, mock_search_service):
     mock_search_service.search.side_effect = ConnectionError("opensearch down")
 
     resp = client.post("/v1/search", json={"query": "신한은행"})
-    assert resp.status_code == 500
\ No newline at end of file
+    assert resp.status_code == 500
+
+def test_search_batch(client, mock_search_service):
+    """
+    배치 검색 요청이 서비스로 그대로 전달되고 결과 목록이 내려오는지
+    """
+    mock_search_service.search_batch = AsyncMock(return_value={
+        "took_ms": 7,
+        "items": [
+            {"query": "카카오뱅크", "took_ms": 3, "result": {"hits": {"hits": []}}},
+            {"query": "삼성전자", "status": 400, "error": {"type": "parse_exception"}},
+        ],
+    })
+
+    resp = client.post("/v1/search/batch", json={"queries": ["카카오뱅크", "삼성전자"], "size": 5})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["success"] is True
+    assert len(body["data"]["items"]) == 2
+    assert body["data"]["items"][1]["status"] == 400
+    mock_search_service.search_batch.assert_awaited_once_with(
+        queries=["카카오뱅크", "삼성전자"], size=5, explain=False, options=SearchOptions(), compact=True)
+
+
+def test_search_batch_empty_queries_returns_422(client):
+    resp = client.post("/v1/search/batch", json={"queries": []})
+    assert resp.status_code == 422
+
+
+def test_search_stats_returns_coalescing_counts(client, mock_search_service):
+    mock_search_service.coalescing_stats = MagicMock(return_value={"leaders": 3, "coalesced": 7, "in_flight": 0})
+
+    resp = client.get("/v1/search/stats")
+
+    assert resp.status_code == 200
+    assert resp.json()["data"]["coalescing"]["coalesced"] == 7
@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+
+from api_server.app.adapters.caches.file_parse_cache import FileParseCache
+from api_server.app.domain.models import ParsedDocument, ParsedBlock, SourceRef, FileType, Collection
+
+
+def make_doc(text: str = "본문") -> ParsedDocument:
+    return ParsedDocument(
+        source=SourceRef(uri="file:///tmp/a.html", file_type=FileType.html),
+        title="제목",
+        blocks=[ParsedBlock(type="body", text=text)],
+        collection=Collection.wiki,
+    )
+
+
+def test_put_and_get_roundtrip(tmp_path: Path):
+    """
+    저장한 파싱 결과를 같은 키로 그대로 읽어오는지, 없는 키는 None인지 확인.
+    """
+    cache = FileParseCache(str(tmp_path))
+    doc = make_doc()
+
+    cache.put("ab" + "0" * 62, doc)
+
+    assert cache.get("ab" + "0" * 62) == doc
+    assert cache.get("cd" + "0" * 62) is None
+    assert (tmp_path / "ab" / ("ab" + "0" * 62 + ".json")).exists()
+
+
+def test_broken_entry_is_dropped(tmp_path: Path):
+    """
+    손상된 캐시 파일은 미스로 처리하고 삭제한다.
+    """
+    cache = FileParseCache(str(tmp_path))
+    key = "ef" + "1" * 62
+    path = tmp_path / "ef" / f"{key}.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+
+    assert cache.get(key) is None
+    assert not path.exists()
+
+
+def test_evicts_least_recently_used_when_over_size(tmp_path: Path):
+    """
+    최대 크기를 넘으면 가장 오래전에 사용된 항목부터 삭제한다.
+    (조회된 항목은 최근 사용으로 갱신되어 남는다)
+    """
+    entry_size = len(make_doc("x" * 100).model_dump_json().encode("utf-8"))
+    cache = FileParseCache(str(tmp_path), max_bytes=int(entry_size * 3.5))
+    keys = [f"{i:02d}" + "a" * 62 for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, make_doc("x" * 100))
+        path = tmp_path / key[:2] / f"{key}.json"
+        os.utime(path, (1000 + i, 1000 + i))
+
+    # 가장 오래된 keys[0]을 조회해서 최근 사용으로 만든다
+    assert cache.get(keys[0]) is not None
+
+    cache.put("99" + "a" * 62, make_doc("x" * 100))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.get("99" + "a" * 62) is not None
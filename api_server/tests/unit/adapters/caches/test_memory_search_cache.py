@@ -0,0 +1,40 @@
+from api_server.app.adapters.caches import memory_search_cache
+from api_server.app.adapters.caches.memory_search_cache import MemorySearchCache
+
+
+def test_lru_eviction_keeps_recently_used():
+    """
+    최대 항목 수를 넘으면 가장 오래전에 사용된 항목부터 삭제한다.
+    """
+    cache = MemorySearchCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}   # a를 최근 사용으로
+
+    cache.put("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.get("c") == {"v": 3}
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(memory_search_cache.time, "monotonic", lambda: now[0])
+    cache = MemorySearchCache(max_entries=10, ttl_seconds=5)
+    cache.put("a", {"v": 1})
+
+    now[0] += 4
+    assert cache.get("a") == {"v": 1}
+    now[0] += 2
+    assert cache.get("a") is None
+
+
+def test_invalidate_bumps_generation_and_clears():
+    cache = MemorySearchCache()
+    cache.put("0:a", {"v": 1})
+
+    cache.invalidate()
+
+    assert cache.generation() == 1
+    assert cache.get("0:a") is None
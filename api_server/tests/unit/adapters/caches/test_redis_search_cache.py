@@ -0,0 +1,110 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from api_server.app.adapters.caches.redis_search_cache import AsyncRedisSearchCache, RedisSearchCache
+
+
+class FakeRedis:
+    """get/set/incr만 흉내내는 dict 기반 Redis"""
+    def __init__(self):
+        self.data = {}
+        self.ttl = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8")
+        self.ttl[key] = ex
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1).encode()
+        return int(self.data[key])
+
+
+def test_put_get_roundtrip_with_ttl_and_prefix():
+    r = FakeRedis()
+    cache = RedisSearchCache(r, prefix="kakaobank:search", ttl_seconds=30)
+
+    cache.put("0:abc", {"hits": {"total": {"value": 1}}, "title": "카카오뱅크"})
+
+    assert cache.get("0:abc") == {"hits": {"total": {"value": 1}}, "title": "카카오뱅크"}
+    assert r.ttl["kakaobank:search:0:abc"] == 30
+    assert cache.get("0:zzz") is None
+
+
+def test_generation_is_shared_through_redis():
+    """
+    다른 워커(인스턴스)에서 invalidate 하면 같은 Redis를 보는 캐시의 세대도 올라간다.
+    """
+    r = FakeRedis()
+    worker_a = RedisSearchCache(r, prefix="p")
+    worker_b = RedisSearchCache(r, prefix="p")
+    assert worker_b.generation() == 0
+
+    worker_a.invalidate()
+
+    assert worker_b.generation() == 1
+
+
+def test_redis_errors_degrade_to_miss():
+    r = MagicMock()
+    r.get.side_effect = RedisConnectionError("down")
+    r.set.side_effect = RedisConnectionError("down")
+    r.incr.side_effect = RedisConnectionError("down")
+    cache = RedisSearchCache(r)
+
+    assert cache.get("0:a") is None
+    assert cache.generation() == 0
+    cache.put("0:a", {"v": 1})
+    cache.invalidate()
+
+
+class FakeAsyncRedis:
+    """FakeRedis와 같은 저장소를 보는 redis.asyncio 흉내"""
+    def __init__(self, sync: FakeRedis):
+        self.sync = sync
+        self.closed = False
+
+    async def get(self, key):
+        return self.sync.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.sync.set(key, value, ex=ex)
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_async_cache_shares_keys_and_generation_with_sync_cache():
+    """
+    async 검색 경로의 캐시는 같은 키/세대를 보므로 색인 쪽(동기) invalidate가 그대로 반영된다.
+    """
+    r = FakeRedis()
+    sync_cache = RedisSearchCache(r, prefix="p", ttl_seconds=30)
+    async_cache = AsyncRedisSearchCache(FakeAsyncRedis(r), prefix="p", ttl_seconds=30)
+
+    async def run():
+        await async_cache.put("0:abc", {"title": "카카오뱅크"})
+        before = await async_cache.generation()
+        sync_cache.invalidate()
+        return before, await async_cache.generation(), await async_cache.get("0:abc")
+
+    assert asyncio.run(run()) == (0, 1, {"title": "카카오뱅크"})
+    assert sync_cache.get("0:abc") == {"title": "카카오뱅크"}
+    assert r.ttl["p:0:abc"] == 30
+
+
+def test_async_redis_errors_degrade_to_miss():
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=RedisConnectionError("down"))
+    client.set = AsyncMock(side_effect=RedisConnectionError("down"))
+    cache = AsyncRedisSearchCache(client)
+
+    async def run():
+        await cache.put("0:a", {"v": 1})
+        return await cache.get("0:a"), await cache.generation()
+
+    assert asyncio.run(run()) == (None, 0)
@@ -13,6 +13,7 @@ class DummyChunk:
     def __init__(self, source_id: str, payload: Dict[str, Any]):
         self.source_id = source_id
         self._payload = payload
+        self.content_hash = None
 
     def model_dump(self, mode: str = "json") -> Dict[str, Any]:
         return self._payload
@@ -45,7 +46,13 @@ def test_create_index_when_not_exists(indexer: OpenSearchIndexer, mock_client: M
 
     assert name == "myidx-html-3"
     mock_client.indices.exists.assert_called_once_with(index="myidx-html-3")
-    mock_client.indices.create.assert_called_once_with(index="myidx-html-3", body=indexer.index_schema)
+    # 대량 적재용 설정(refresh 중지, 복제본 0)으로 생성
+    mock_client.indices.create.assert_called_once()
+    body = mock_client.indices.create.call_args.kwargs["body"]
+    assert mock_client.indices.create.call_args.kwargs["index"] == "myidx-html-3"
+    assert body["mappings"] == indexer.index_schema["mappings"]
+    assert body["settings"]["refresh_interval"] == "-1"
+    assert body["settings"]["number_of_replicas"] == 0
 
 
 def test_create_index_when_exists(indexer: OpenSearchIndexer, mock_client: MagicMock):
@@ -61,20 +68,42 @@ def test_create_index_when_exists(indexer: OpenSearchIndexer, mock_client: Magic
     mock_client.indices.create.assert_not_called()
 
 
+def fake_bulk_results(failures: Dict[str, Dict[str, Any]] | None = None):
+    """
+    streaming_bulk/parallel_bulk 목: 액션을 모두 소비하고 액션 순서대로 결과를 돌려준다.
+    failures에 있는 _id는 실패로 응답한다.
+    """
+    failures = failures or {}
+    captured: Dict[str, Any] = {"actions": []}
+
+    def fake(client, actions, **kwargs):
+        captured["client"] = client
+        captured["kwargs"] = kwargs
+        for a in actions:
+            captured["actions"].append(a)
+            op = a["_op_type"]
+            if a["_id"] in failures:
+                yield False, {op: {"_id": a["_id"], **failures[a["_id"]]}}
+            else:
+                yield True, {op: {"_id": a["_id"], "status": 201}}
+
+    return fake, captured
+
+
 def test__index_bulk_success(indexer: OpenSearchIndexer, mock_client: MagicMock, monkeypatch):
     """
-    인덱스 색인: helpers.bulk 모킹으로 성공 케이스 검증
+    인덱스 색인: streaming_bulk 모킹으로 성공 케이스 검증(청크 크기/바이트 설정 전달)
     """
 
     chunks = [
-        DummyChunk("a1", {"foo": 1}),
-        DummyChunk("a2", {"bar": 2}),
-        DummyChunk("a3", {"baz": 3}),
+        (1, DummyChunk("a1", {"foo": 1})),
+        (2, DummyChunk("a2", {"bar": 2})),
+        (3, DummyChunk("a3", {"baz": 3})),
     ]
+    fake, captured = fake_bulk_results()
 
-    # helpers.bulk 모킹: ok=3, errors=[]
-    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.bulk") as mock_bulk:
-        mock_bulk.return_value = (3, [])
+    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.streaming_bulk",
+               side_effect=fake) as mock_bulk:
         result: IndexResult = indexer._index("myidx-html-3", chunks)
 
     assert isinstance(result, IndexResult)
@@ -82,33 +111,55 @@ def test__index_bulk_success(indexer: OpenSearchIndexer, mock_client: MagicMock,
     assert result.errors == []
 
     mock_bulk.assert_called_once()
-    args, kwargs = mock_bulk.call_args
-    # 첫번째 인수: client, 두번째: actions(generator)
-    assert args[0] is mock_client
+    assert captured["client"] is mock_client
+    assert captured["kwargs"]["chunk_size"] == indexer.bulk_chunk_size
+    assert captured["kwargs"]["max_chunk_bytes"] == indexer.bulk_max_chunk_bytes
+    assert [a["_id"] for a in captured["actions"]] == ["a1", "a2", "a3"]
 
 
-def test__index_bulk_with_errors(indexer: OpenSearchIndexer, mock_client: MagicMock):
+def test__index_bulk_with_errors_reports_seq(indexer: OpenSearchIndexer, mock_client: MagicMock):
     """
-    인덱스 색인: helpers.bulk 모킹으로 에러 케이스 검증
+    인덱스 색인: 실패 항목이 문서별로, 입력 seq(파일 줄 번호)와 함께 보고되는지
     """
 
-    chunks = [DummyChunk("e1", {"x": 1})]
-
-    bulk_errors = [
-        {"index": {"_id": "e1", "status": 400, "error": {"type": "unknown_error"}}}
-    ]
+    chunks = [(1, DummyChunk("ok1", {"x": 1})), (4, DummyChunk("e1", {"x": 2})), (7, DummyChunk("ok2", {"x": 3}))]
+    fake, _ = fake_bulk_results({"e1": {"status": 400, "error": {"type": "unknown_error"}}})
 
-    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.bulk") as mock_bulk:
-        mock_bulk.return_value = (0, bulk_errors)
+    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.streaming_bulk", side_effect=fake):
         result: IndexResult = indexer._index("myidx-html-3", chunks)
 
-    assert result.indexed == 0
+    assert result.indexed == 2
     assert len(result.errors) == 1
     err: IndexErrorItem = result.errors[0]
     assert err.doc_id == "e1"
+    assert err.seq == 4
     assert "unknown_error" in err.reason
 
 
+def test__index_uses_parallel_bulk_when_threads_configured(mock_client: MagicMock):
+    """
+    bulk_thread_count가 2 이상이면 parallel_bulk를 스레드 수/청크 설정과 함께 사용하는지
+    """
+    with patch.object(OpenSearchIndexer, "_load_index_schema"):
+        inst = OpenSearchIndexer(
+            client=mock_client, prefix_name="myidx", alias_name="myalias",
+            bulk_thread_count=4, bulk_chunk_size=100, bulk_max_chunk_bytes=1024)
+    fake, captured = fake_bulk_results({"b": {"status": 429}})
+
+    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.parallel_bulk",
+               side_effect=fake) as mock_parallel, \
+         patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.streaming_bulk") as mock_streaming:
+        result = inst._index("myidx-html-3", [(1, DummyChunk("a", {})), (2, DummyChunk("b", {}))])
+
+    mock_streaming.assert_not_called()
+    mock_parallel.assert_called_once()
+    assert captured["kwargs"]["thread_count"] == 4
+    assert captured["kwargs"]["chunk_size"] == 100
+    assert captured["kwargs"]["max_chunk_bytes"] == 1024
+    assert result.indexed == 1
+    assert [(e.doc_id, e.seq) for e in result.errors] == [("b", 2)]
+
+
 def test_index_reads_jsonl_and_filters_published(indexer: OpenSearchIndexer, tmp_path: Path, monkeypatch):
     """
     published 필터 검증: 첫 줄은 published=True, 둘째 줄은 published=False -> 한 개만 인덱싱
@@ -118,7 +169,7 @@ def test_index_reads_jsonl_and_filters_published(indexer: OpenSearchIndexer, tmp
         {"source_id": "ok1", "published": True, "payload": {"a": 1}},
         {"source_id": "ng1", "published": False, "payload": {"a": 2}},
     ]
-    p.write_text("\n".join(json.dumps(d) for d in docs), encoding="utf-8")
+    p.write_text("\n".join(json.dumps(d) for d in docs) + "\n\n", encoding="utf-8")
 
     class DummyNormalizedChunk(DummyChunk):
         @classmethod
@@ -131,9 +182,10 @@ def test_index_reads_jsonl_and_filters_published(indexer: OpenSearchIndexer, tmp
         captured = {}
 
         # _index 함수를 fake__index로 대체하여 넘어온 chunks 개수만 기록
-        def fake__index(index_name: str, chunks: Iterable[DummyNormalizedChunk]):
+        def fake__index(index_name: str, chunks: Iterable[Tuple[int, DummyNormalizedChunk]]):
             items = list(chunks)
             captured["count"] = len(items)
+            captured["seqs"] = [seq for seq, _ in items]
             return IndexResult(indexed=len(items), errors=[])
 
         with patch.object(indexer, "_index", side_effect=fake__index):
@@ -143,6 +195,8 @@ def test_index_reads_jsonl_and_filters_published(indexer: OpenSearchIndexer, tmp
     # published=True 인 것만 1개
     assert res.indexed == 1
     assert captured["count"] == 1
+    # seq는 파일 줄 번호(1부터)
+    assert captured["seqs"] == [1]
 
 
 def test_rotate_alias_to_latest_updates_alias_and_deletes_old(indexer: OpenSearchIndexer, mock_client: MagicMock):
@@ -239,3 +293,321 @@ def test_rotate_alias_to_latest_when_alias_absent(indexer: OpenSearchIndexer, mo
     assert all("add" in a for a in actions)
     add_targets = [a["add"]["index"] for a in actions]
     assert set(add_targets) == {"myidx-html-2", "myidx-tsv-3"}
+
+
+def test_index_chunks_streams_published_only(indexer: OpenSearchIndexer):
+    """
+    파이프라인 모드: 이터러블로 받은 청크 중 published=True 인 것만 _index로 전달되는지
+    """
+    class PublishedChunk(DummyChunk):
+        def __init__(self, source_id: str, published: bool):
+            super().__init__(source_id, {"id": source_id})
+            self.published = published
+
+    chunks = (PublishedChunk(f"c{i}", published=(i % 2 == 0)) for i in range(4))
+    captured = {}
+
+    def fake__index(index_name: str, items):
+        captured["ids"] = [(seq, c.source_id) for seq, c in items]
+        return IndexResult(indexed=len(captured["ids"]), errors=[])
+
+    with patch.object(indexer, "_index", side_effect=fake__index):
+        res = indexer.index_chunks("myidx-tsv-3", chunks)
+
+    assert res.indexed == 2
+    # seq는 비공개 청크를 포함한 스트림 내 순번
+    assert captured["ids"] == [(1, "c0"), (3, "c2")]
+
+
+def test_clone_index_copies_previous_day_and_restores_write_block(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    """
+    delta 색인: 이전 날짜 인덱스를 복제하고, 기준 인덱스의 쓰기 금지를 원래대로 되돌리는지
+    """
+    mock_client.indices.exists.side_effect = lambda index: index == "myidx-html-2"
+
+    name = indexer.clone_index("html", "2", "3")
+
+    assert name == "myidx-html-3"
+    mock_client.indices.clone.assert_called_once()
+    assert mock_client.indices.clone.call_args.kwargs["index"] == "myidx-html-2"
+    assert mock_client.indices.clone.call_args.kwargs["target"] == "myidx-html-3"
+    assert mock_client.indices.put_settings.call_args_list == [
+        call(index="myidx-html-2", body={"index.blocks.write": True}),
+        call(index="myidx-html-2", body={"index.blocks.write": False}),
+    ]
+
+
+def test_clone_index_without_base_returns_none(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    mock_client.indices.exists.return_value = False
+
+    assert indexer.clone_index("html", "2", "3") is None
+    mock_client.indices.clone.assert_not_called()
+
+
+def test_apply_delta_upserts_then_deletes(indexer: OpenSearchIndexer):
+    """
+    delta 색인: upsert 액션을 먼저, delete 액션을 나중에 보내고 삭제 대상이 없는 404는 실패로 보지 않는지
+    """
+    fake, captured = fake_bulk_results({
+        "old2": {"status": 404},
+        "c2": {"status": 400, "error": "mapper_parsing_exception"},
+    })
+
+    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.streaming_bulk",
+               side_effect=fake):
+        res = indexer.apply_delta(
+            "myidx-html-3",
+            [DummyChunk("c1", {"id": "c1"}), DummyChunk("c2", {"id": "c2"})],
+            iter(["old1", "old2"]))
+
+    assert [(a["_op_type"], a["_id"]) for a in captured["actions"]] == [
+        ("index", "c1"), ("index", "c2"), ("delete", "old1"), ("delete", "old2"),
+    ]
+    assert res.indexed == 1
+    assert res.deleted == 1
+    assert [(e.doc_id, e.seq) for e in res.errors] == [("c2", 2)]
+
+
+def test__index_uses_hash_guarded_upsert_for_existing_index(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    """
+    이미 있던 인덱스에는 content_hash 비교 update(scripted upsert)로, 새로 만든 인덱스에는 index 액션으로 적재하는지
+    """
+    class HashedChunk(DummyChunk):
+        def __init__(self, source_id: str):
+            super().__init__(source_id, {"id": source_id, "content_hash": f"h-{source_id}"})
+            self.content_hash = f"h-{source_id}"
+
+    fake, captured = fake_bulk_results()
+
+    mock_client.indices.exists.return_value = False
+    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.streaming_bulk", side_effect=fake):
+        indexer._index("myidx-html-2", [(1, HashedChunk("c1"))])
+        indexer.create_index("html", "3")
+        indexer._index("myidx-html-3", [(1, HashedChunk("c1"))])
+
+    existing, created = captured["actions"][:1], captured["actions"][1:]
+    assert existing[0]["_op_type"] == "update"
+    assert existing[0]["_id"] == "c1"
+    # 문서는 script params로 한 번만 보내고, 없는 문서는 scripted_upsert로 만든다
+    assert existing[0]["scripted_upsert"] is True
+    assert existing[0]["upsert"] == {}
+    assert existing[0]["script"]["params"]["doc"]["content_hash"] == "h-c1"
+    assert "ctx.op = 'none'" in existing[0]["script"]["source"]
+    assert created[0]["_op_type"] == "index"
+
+
+def test_same_day_rerun_on_one_indexer_uses_hash_guarded_upsert(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    """
+    같은 indexer로 create -> index -> finalize를 두 번 돌리면 두 번째 실행은 content_hash 비교 update로 적재하는지
+    """
+    class HashedChunk(DummyChunk):
+        def __init__(self, source_id: str):
+            super().__init__(source_id, {"id": source_id, "content_hash": f"h-{source_id}"})
+            self.content_hash = f"h-{source_id}"
+            self.published = True
+
+    fake, captured = fake_bulk_results()
+
+    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.streaming_bulk", side_effect=fake):
+        mock_client.indices.exists.return_value = False
+        name = indexer.create_index("html", "3")
+        indexer.index_chunks(name, [HashedChunk("c1")])
+        indexer.finalize_index(name)
+
+        mock_client.indices.exists.return_value = True
+        assert indexer.create_index("html", "3") == name
+        indexer.index_chunks(name, [HashedChunk("c1")])
+        indexer.finalize_index(name)
+
+    first, second = captured["actions"]
+    assert first["_op_type"] == "index"
+    assert second["_op_type"] == "update"
+    assert second["scripted_upsert"] is True
+
+
+def test_finalize_index_restores_settings_refreshes_and_merges(mock_client: MagicMock):
+    """
+    적재 후 스키마 설정 복원 -> refresh -> force merge 순으로 호출되는지(0이면 force merge 생략)
+    """
+    with patch.object(OpenSearchIndexer, "_load_index_schema"):
+        inst = OpenSearchIndexer(client=mock_client, prefix_name="myidx", alias_name="myalias",
+                                 forcemerge_max_segments=1)
+    inst.index_schema = {"settings": {"refresh_interval": "1s"}, "mappings": {}}
+
+    inst.finalize_index("myidx-html-3")
+
+    names = [c[0] for c in mock_client.indices.method_calls]
+    assert names == ["put_settings", "refresh", "forcemerge"]
+    mock_client.indices.put_settings.assert_called_once_with(
+        index="myidx-html-3",
+        body={"index": {"refresh_interval": "1s", "number_of_replicas": None}},
+    )
+    assert mock_client.indices.forcemerge.call_args.kwargs["max_num_segments"] == 1
+
+    mock_client.reset_mock()
+    inst.forcemerge_max_segments = 0
+    inst.finalize_index("myidx-html-3")
+    mock_client.indices.forcemerge.assert_not_called()
+
+
+def test_rotate_alias_calls_on_alias_rotated(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    """
+    alias가 갱신된 뒤에만 콜백(검색 캐시 무효화)이 호출되는지
+    """
+    callback = MagicMock()
+    indexer.on_alias_rotated = callback
+    mock_client.indices.exists_alias.return_value = False
+
+    mock_client.indices.get.return_value = {}
+    indexer.rotate_alias_to_latest(alias_name="myalias", base_prefix="myidx", delete_old=False)
+    callback.assert_not_called()
+
+    mock_client.indices.get.return_value = {"myidx-html-3": {}}
+    indexer.rotate_alias_to_latest(alias_name="myalias", base_prefix="myidx", delete_old=False)
+    callback.assert_called_once_with()
+
+
+def test_index_schema_is_loaded_once_per_process(mock_client):
+    """
+    인덱서를 여러 번 만들어도 스키마 파일은 한 번만 읽고 같은 dict를 공유한다.
+    """
+    from api_server.app.adapters.indexers.opensearch_indexer import load_index_schema
+
+    load_index_schema.cache_clear()
+    a = OpenSearchIndexer(client=mock_client, prefix_name="myidx", alias_name="myalias")
+    b = OpenSearchIndexer(client=mock_client, prefix_name="myidx", alias_name="myalias")
+
+    assert a.index_schema is b.index_schema
+    assert "mappings" in a.index_schema
+    assert load_index_schema.cache_info().misses == 1
+
+
+def test_rotate_alias_skips_indices_still_loading(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    """
+    다른 소스가 적재 중인(생성 후 finalize 전) 인덱스는 alias에 붙이지도, 삭제하지도 않는다.
+    finalize 이후 회전에서는 최신 인덱스로 포함된다.
+    """
+    mock_client.indices.exists.return_value = False
+    mock_client.indices.exists_alias.return_value = False
+    mock_client.indices.get.return_value = {"myidx-html-3": {}, "myidx-tsv-2": {}, "myidx-tsv-3": {}}
+    indexer.create_index("tsv", "3")
+
+    result = indexer.rotate_alias_to_latest(alias_name="myalias", base_prefix="myidx", delete_old=True)
+
+    assert sorted(result.index_name) == ["myidx-html-3", "myidx-tsv-2"]
+    deleted = [c.kwargs["index"] for c in mock_client.indices.delete.call_args_list]
+    assert "myidx-tsv-3" not in deleted
+
+    indexer.finalize_index("myidx-tsv-3")
+    result = indexer.rotate_alias_to_latest(alias_name="myalias", base_prefix="myidx", delete_old=False)
+    assert sorted(result.index_name) == ["myidx-html-3", "myidx-tsv-3"]
+
+
+def test_index_passes_trusted_artifact_records_without_validation(mock_client: MagicMock, tmp_path: Path):
+    """
+    trust_artifacts=True 이면 스키마 헤더가 일치하는 파일의 레코드를 검증/재직렬화 없이 _source로 보내고,
+    헤더가 없는 파일은 NormalizedChunk로 검증한다.
+    """
+    from datetime import datetime
+    from api_server.app.domain.artifacts import open_writer
+    from api_server.app.domain.models import NormalizedChunk
+
+    now = datetime(2024, 1, 1)
+    chunks = [
+        NormalizedChunk(source_id=f"c{i}", source_path="p", file_type="tsv", collection="qna",
+                        question="Q", created_date=now, updated_date=now, published=i != 1)
+        for i in range(3)
+    ]
+    trusted_path = tmp_path / "qna_3_normalized.json"
+    with open_writer(str(trusted_path), NormalizedChunk) as writer:
+        for c in chunks:
+            writer.write(c)
+    external_path = tmp_path / "external.json"
+    external_path.write_text("".join(c.model_dump_json() + "\n" for c in chunks), encoding="utf-8")
+
+    with patch.object(OpenSearchIndexer, "_load_index_schema"):
+        inst = OpenSearchIndexer(client=mock_client, prefix_name="myidx", alias_name="myalias",
+                                 trust_artifacts=True)
+    fake, captured = fake_bulk_results()
+
+    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.streaming_bulk", side_effect=fake), \
+         patch.object(NormalizedChunk, "model_validate", wraps=NormalizedChunk.model_validate) as validate:
+        trusted = inst.index("myidx-tsv-3", str(trusted_path))
+        validate.assert_not_called()
+        external = inst.index("myidx-tsv-3", str(external_path))
+        assert validate.call_count == 2
+
+    assert trusted.indexed == external.indexed == 2
+    sources = [a["_source"] for a in captured["actions"]]
+    assert sources[:2] == sources[2:] == [chunks[0].model_dump(mode="json"), chunks[2].model_dump(mode="json")]
+
+
+def test_index_records_sends_published_dicts_as_source(indexer: OpenSearchIndexer):
+    """
+    열 단위 경로: dict 레코드 중 published인 것만 그대로 _source로 보내고, seq는 스트림 내 순번인지
+    """
+    records = [
+        {"source_id": "r1", "content_hash": None, "published": True, "question": "Q1"},
+        {"source_id": "r2", "content_hash": None, "published": False, "question": "Q2"},
+        {"source_id": "r3", "content_hash": None, "published": True, "question": "Q3"},
+    ]
+    fake, captured = fake_bulk_results({"r3": {"status": 400}})
+
+    with patch("api_server.app.adapters.indexers.opensearch_indexer.helpers.streaming_bulk", side_effect=fake):
+        res = indexer.index_records("myidx-tsv-3", iter(records))
+
+    assert [a["_source"] for a in captured["actions"]] == [records[0], records[2]]
+    assert res.indexed == 1
+    assert [(e.doc_id, e.seq) for e in res.errors] == [("r3", 3)]
+
+
+def test_discard_index_deletes_only_indices_created_by_this_load(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    """
+    적재에 실패한 새 인덱스(대량 적재 설정이 남은 인덱스)는 삭제하고,
+    이미 있던 인덱스나 finalize를 마친 인덱스는 삭제하지 않는다.
+    """
+    mock_client.indices.exists.return_value = False
+    indexer.create_index("tsv", "3")
+    indexer.discard_index("myidx-tsv-3")
+    mock_client.indices.delete.assert_called_once_with(index="myidx-tsv-3", ignore=[404])
+    assert "myidx-tsv-3" not in indexer._loading
+
+    mock_client.reset_mock()
+    mock_client.indices.exists.return_value = True
+    indexer.create_index("html", "3")
+    indexer.discard_index("myidx-html-3")
+
+    mock_client.indices.exists.return_value = False
+    indexer.create_index("tsv", "4")
+    indexer.finalize_index("myidx-tsv-4")
+    indexer.discard_index("myidx-tsv-4")
+    mock_client.indices.delete.assert_not_called()
+
+
+def test_rotate_alias_skips_unfinished_indices_from_other_processes(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    """
+    이 프로세스가 만들지 않았어도(재시작, 다른 워커) 대량 적재 설정(refresh_interval=-1)이 남아 있는
+    인덱스는 alias에 붙이지도, 삭제하지도 않는다.
+    """
+    mock_client.indices.exists_alias.return_value = False
+    mock_client.indices.get.return_value = {
+        "myidx-tsv-2": {"settings": {"index": {"refresh_interval": "1s"}}},
+        "myidx-tsv-3": {"settings": {"index": {"refresh_interval": "-1", "number_of_replicas": "0"}}},
+    }
+
+    result = indexer.rotate_alias_to_latest(alias_name="myalias", base_prefix="myidx", delete_old=True)
+
+    assert result.index_name == ["myidx-tsv-2"]
+    mock_client.indices.delete.assert_not_called()
+
+
+def test_clone_index_uses_bulk_load_settings(indexer: OpenSearchIndexer, mock_client: MagicMock):
+    """
+    복제한 인덱스도 finalize 전까지는 적재 중 상태(refresh 중지)로 저장되어 회전에서 제외된다.
+    """
+    mock_client.indices.exists.side_effect = lambda index: index == "myidx-html-2"
+
+    indexer.clone_index("html", "2", "3")
+
+    settings = mock_client.indices.clone.call_args.kwargs["body"]["settings"]
+    assert settings == {"index.blocks.write": False, "refresh_interval": "-1", "number_of_replicas": 0}
@@ -0,0 +1,83 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+import pytest
+
+from api_server.app.adapters.parsers.cached_parser import CachedParser
+from api_server.app.adapters.parsers.wiki_parser import WikiParser
+from api_server.app.adapters.caches.file_parse_cache import FileParseCache
+from api_server.app.domain.models import (
+    RawDocument, ParsedDocument, ParsedBlock, SourceRef, FileType, Collection,
+)
+from api_server.app.platform.exceptions import DomainError
+
+
+def make_raw(body: str, uri: str) -> RawDocument:
+    return RawDocument(
+        source=SourceRef(uri=uri, file_type=FileType.html),
+        body_text=body,
+        encoding="utf-8",
+        collection=Collection.wiki,
+    )
+
+
+def make_inner(version: str = "v1") -> MagicMock:
+    inner = MagicMock()
+    inner.version = version
+    inner.parse.side_effect = lambda raw: ParsedDocument(
+        source=raw.source,
+        title="제목",
+        blocks=[ParsedBlock(type="body", text=raw.body_text)],
+        collection=raw.collection,
+    )
+    return inner
+
+
+def test_hit_skips_inner_parser_and_keeps_current_source(tmp_path: Path):
+    """
+    같은 원문이면 두 번째부터는 내부 파서를 호출하지 않고,
+    source는 이번 원문 기준으로 바꿔서 반환한다.
+    """
+    inner = make_inner()
+    parser = CachedParser(inner, FileParseCache(str(tmp_path)))
+
+    first = parser.parse(make_raw("<p>같은 내용</p>", "day_1/a.html"))
+    second = parser.parse(make_raw("<p>같은 내용</p>", "day_2/a.html"))
+
+    assert inner.parse.call_count == 1
+    assert second.source.uri == "day_2/a.html"
+    assert second.blocks == first.blocks
+
+
+def test_changed_content_or_version_is_a_miss(tmp_path: Path):
+    """
+    원문이 바뀌거나 파서 버전이 바뀌면 다시 파싱한다.
+    """
+    cache = FileParseCache(str(tmp_path))
+    inner = make_inner("v1")
+    CachedParser(inner, cache).parse(make_raw("<p>a</p>", "a.html"))
+    CachedParser(inner, cache).parse(make_raw("<p>b</p>", "a.html"))
+    assert inner.parse.call_count == 2
+
+    inner_v2 = make_inner("v2")
+    CachedParser(inner_v2, cache).parse(make_raw("<p>a</p>", "a.html"))
+    assert inner_v2.parse.call_count == 1
+
+
+def test_parse_error_is_not_cached(tmp_path: Path):
+    inner = make_inner()
+    inner.parse.side_effect = DomainError("failed to parse")
+    parser = CachedParser(inner, FileParseCache(str(tmp_path)))
+
+    for _ in range(2):
+        with pytest.raises(DomainError):
+            parser.parse(make_raw("<p>x</p>", "a.html"))
+    assert inner.parse.call_count == 2
+    assert not list(tmp_path.glob("*/*.json"))
+
+
+def test_wiki_parser_version_follows_options():
+    """
+    body 규칙 옵션이 다르면 캐시 키에 쓰는 버전도 달라야 한다.
+    """
+    assert WikiParser().version == WikiParser().version
+    assert WikiParser().version != WikiParser(legacy_body_text=True).version
@@ -5,7 +5,6 @@ from api_server.app.adapters.parsers.qna_parser import QnaParser
 from api_server.app.domain.models import (
     RawDocument,
     ParsedDocument,
-    ParsedBlock,
     SourceRef,
     FileType,
     Collection,
@@ -27,9 +26,9 @@ def make_raw(tsv_text: str, uri: str = "file:///tmp/qna.tsv") -> RawDocument:
     )
 
 
-def test_parse_valid_tsv_returns_blocks():
+def test_parse_valid_tsv_returns_row_table():
     """
-    tsv 정상 파싱: 행이 ParsedBlock(type="row", text=None, meta=dict) 로 생성되고, 전체 메타(rows, columns)가 맞는지.
+    tsv 정상 파싱: 행이 RowTable(컬럼 이름 + 행 값 튜플)로 생성되고, 전체 메타(rows, columns)가 맞는지.
     """
 
     parser = QnaParser()
@@ -47,20 +46,18 @@ def test_parse_valid_tsv_returns_blocks():
     assert doc.source.uri == raw.source.uri
     assert doc.collection == TEST_COLLECTION
 
-    # 블록(행) 파싱 검증
-    assert len(doc.blocks) == 2
-    for b in doc.blocks:
-        assert b.type == "row"
-        assert b.text is None
-        assert isinstance(b.meta, dict)
+    # 행 파싱 검증(행마다 블록을 만들지 않음)
+    assert doc.blocks == []
+    assert doc.table.columns == ["id", "question", "answer", "published", "user_id"]
+    assert doc.table.rows[0] == ("1", "지구 반경?", "약 6371km", "Y", "user1")
 
     # 첫 번째 행 내용 확인
-    first: ParsedBlock = doc.blocks[0]
-    assert first.meta["id"] == "1"
-    assert first.meta["question"] == "지구 반경?"
-    assert first.meta["answer"] == "약 6371km"
-    assert first.meta["published"] == "Y"
-    assert first.meta["user_id"] == "user1"
+    first = next(doc.iter_rows())
+    assert first["id"] == "1"
+    assert first["question"] == "지구 반경?"
+    assert first["answer"] == "약 6371km"
+    assert first["published"] == "Y"
+    assert first["user_id"] == "user1"
 
     # 메타 정보(행/열)
     assert doc.meta["rows"] == 2
@@ -81,8 +78,9 @@ def test_parse_strips_whitespace_in_values():
     raw = make_raw(tsv)
     doc = parser.parse(raw)
 
-    assert len(doc.blocks) == 1
-    row = doc.blocks[0].meta
+    rows = list(doc.iter_rows())
+    assert len(rows) == 1
+    row = rows[0]
     # 앞뒤 공백이 제거되었는지 확인
     assert row["question"] == "지구 반경?"
     assert row["answer"] == "약 6371km"
@@ -90,6 +88,36 @@ def test_parse_strips_whitespace_in_values():
     assert row["user_id"] == "user1"
 
 
+def test_parse_pads_short_rows_and_skips_blank_lines():
+    """
+    값이 모자란 행은 None으로 채우고(넘치는 값은 버림), 빈 줄은 행으로 만들지 않는지.
+    """
+    parser = QnaParser()
+    tsv = (
+        "id\tquestion\tanswer\tpublished\tuser_id\n"
+        "1\tQ\n"
+        "\n"
+        "2\tQ2\tA2\tY\tu2\textra\n"
+    )
+
+    doc = parser.parse(make_raw(tsv))
+
+    assert doc.table.rows == [("1", "Q", None, None, None), ("2", "Q2", "A2", "Y", "u2")]
+
+
+def test_parsed_document_round_trips_row_table_as_json_arrays():
+    """
+    RowTable은 JSON에서 컬럼 이름 한 번 + 배열의 배열로 저장되고 그대로 복원되는지.
+    """
+    tsv = "id\tquestion\tanswer\tpublished\tuser_id\n1\tQ\tA\tY\tu\n"
+    doc = QnaParser().parse(make_raw(tsv))
+
+    data = doc.model_dump_json()
+
+    assert '"rows":[["1","Q","A","Y","u"]]' in data
+    assert ParsedDocument.model_validate_json(data) == doc
+
+
 def test_parse_raises_when_missing_required_columns():
     """
     필수 컬럼 누락 시 예외 발생하는지
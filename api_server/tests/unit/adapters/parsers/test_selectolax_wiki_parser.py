@@ -0,0 +1,121 @@
+import pytest
+from pathlib import Path
+
+from api_server.app.adapters.parsers.wiki_parser import WikiParser
+from api_server.app.adapters.parsers.selectolax_wiki_parser import SelectolaxWikiParser
+from api_server.app.domain.models import RawDocument, SourceRef, FileType, Collection
+from api_server.app.platform.exceptions import DomainError
+
+"""
+selectolax 파서 parity 테스트: 실제 위키 HTML 코퍼스와 경계 케이스에서
+BeautifulSoup 구현(WikiParser)과 ParsedDocument가 완전히 같은지 확인.
+"""
+
+HTML_DIR = Path(__file__).resolve().parents[4] / "resources" / "data" / "html"
+CORPUS_FILES = sorted(HTML_DIR.glob("day_*/*.html"))
+
+
+def make_raw(html: str, uri: str = "file:///tmp/wiki.html") -> RawDocument:
+    return RawDocument(
+        source=SourceRef(uri=uri, file_type=FileType.html),
+        body_text=html,
+        encoding="utf-8",
+        collection=Collection.wiki,
+    )
+
+
+def assert_parity(
+    raw: RawDocument,
+    legacy: WikiParser = None,
+    fast: SelectolaxWikiParser = None,
+    legacy_body_text: bool = False,
+):
+    expected = (legacy or WikiParser(legacy_body_text=legacy_body_text)).parse(raw)
+    actual = (fast or SelectolaxWikiParser(legacy_body_text=legacy_body_text)).parse(raw)
+    assert actual.model_dump() == expected.model_dump()
+
+
+def test_corpus_is_present():
+    assert CORPUS_FILES, f"no html corpus under {HTML_DIR}"
+
+
+@pytest.mark.parametrize("legacy_body_text", [False, True], ids=["outermost", "legacy"])
+@pytest.mark.parametrize("path", CORPUS_FILES, ids=lambda p: f"{p.parent.name}/{p.stem}")
+def test_parity_on_wiki_corpus(path, legacy_body_text):
+    """
+    리소스의 위키 HTML 전체에 대해 블록 텍스트가 바이트 단위로 같은지 확인. (body 규칙 두 가지 모두)
+    """
+    assert_parity(make_raw(path.read_text(encoding="utf-8"), uri=str(path)), legacy_body_text=legacy_body_text)
+
+
+EDGE_CASES = {
+    "empty": "",
+    "title_only": "<html><body><h1>빈문서</h1></body></html>",
+    # 주석/rt/공백 정규화/pre/중첩 리스트/ul·ol 밖 li
+    "text_rules": (
+        "<p>a<!--c-->b<rt>x</rt> <b>y</b>\n\n<i>z</i>&nbsp;</p><pre>  p\n </pre>"
+        "<ul><li>1<ul><li>2</li></ul></li></ul><ol><li>3</li></ol><li>orphan</li>"
+    ),
+    # summary meta 중단, 필터 헤딩, 중복 헤딩, 중첩 테이블, content root 밖 문단
+    "wiki_layout": (
+        '<html lang="en"><h1>T<span class="mw-editsection">[edit]</span></h1>'
+        '<div id="mw-content-text"><div class="mw-content-ltr mw-parser-output">'
+        '<table class="infobox vcard"><tbody><tr><td>a</td></tr></tbody></table>'
+        '<p>s1</p><p></p><meta property="mw:PageProp/toc"><p>after</p>'
+        '<div class="mw-heading mw-heading2"><h2>개요</h2></div><p>p1</p>'
+        "<table><tbody><tr><td>t<table><tbody><tr><td>inner</td></tr></tbody></table></td></tr></tbody></table>"
+        '<p>p2</p><div class="mw-heading mw-heading2"><h2>각주</h2></div><p>skip</p>'
+        '<div class="mw-heading mw-heading2"><h2>개요</h2></div><p>dup</p>'
+        "</div></div><p>outside</p></html>"
+    ),
+    # 첫 컨테이너에 infobox 테이블이 없으면 summary 없음
+    "first_container_only": (
+        '<div class="mw-content-ltr mw-parser-output"><p>no table</p></div>'
+        '<div class="mw-content-ltr mw-parser-output"><table class="infobox vcard"></table><p>x</p></div>'
+    ),
+    # class 순서가 다른 헤딩 div, 제거 대상이 섞인 h2
+    "heading_rules": (
+        '<div class="mw-heading2 mw-heading"><h2>A</h2></div><p>q</p>'
+        '<div class="mw-heading mw-heading2"><span>no</span><h2> B <sup class="reference">[1]</sup></h2></div>'
+        "<div><p>nested</p></div><p>r</p>"
+    ),
+    "no_content_root": (
+        "<html><head><title> 제목 </title><script>var a=1</script></head><body><nav><p>n</p></nav>"
+        "<h3>x</h3><table><tr><td> a </td><td>b</td></tr></table></body></html>"
+    ),
+}
+
+
+@pytest.mark.parametrize("legacy_body_text", [False, True], ids=["outermost", "legacy"])
+@pytest.mark.parametrize("html", EDGE_CASES.values(), ids=EDGE_CASES.keys())
+def test_parity_on_edge_cases(html, legacy_body_text):
+    assert_parity(make_raw(html), legacy_body_text=legacy_body_text)
+
+
+def test_parity_with_patched_selectors(monkeypatch):
+    """
+    인스턴스 셀렉터를 바꿔도 두 구현이 같은 규칙을 따르는지 확인.
+    """
+    html = (
+        '<div id="mw-content-text"><div class="mw-parser-output">'
+        '<table class="infobox vcard"><tbody><tr><td>회사</td></tr></tbody></table><p>요약</p>'
+        '<div class="mw-heading2"><h2>역사</h2></div><p>본문</p></div></div>'
+    )
+    legacy, fast = WikiParser(), SelectolaxWikiParser()
+    for parser in (legacy, fast):
+        patched = dict(parser._MANDATORY_SELECTOR_DICT)
+        patched["summary"] = "mw-parser-output"
+        patched["paragraph"] = "mw-heading2"
+        monkeypatch.setattr(parser, "_MANDATORY_SELECTOR_DICT", patched, raising=True)
+
+    assert_parity(make_raw(html), legacy, fast)
+    doc = fast.parse(make_raw(html))
+    assert [b.type for b in doc.blocks] == ["summary", "paragraph", "body"]
+
+
+def test_heading_div_without_h2_raises_domain_error():
+    raw = make_raw('<div class="mw-heading mw-heading2"><p>no h2</p></div>')
+    with pytest.raises(DomainError):
+        WikiParser().parse(raw)
+    with pytest.raises(DomainError):
+        SelectolaxWikiParser().parse(raw)
@@ -183,3 +183,33 @@ def test_parse_infobox_selector_exact(monkeypatch):
     ib = next(b for b in doc.blocks if b.type == "infobox")
     assert "항목" in (ib.text or "")
     assert "값" in (ib.text or "")
+
+
+NESTED_BODY_HTML = """
+<html><body>
+  <div id="mw-content-text">
+    <h2>개요</h2>
+    <p>문단</p>
+    <ul><li>상위<ul><li>하위</li></ul></li></ul>
+    <table><tbody><tr><td><p>셀 문단</p></td></tr></tbody></table>
+  </div>
+</body></html>
+"""
+
+
+def test_parse_body_outermost_blocks_only():
+    """
+    기본 모드: 가장 바깥 블록(헤딩/문단/리스트 항목/테이블)만 문서 순서대로 한 번씩 body에 포함.
+    """
+    doc = WikiParser().parse(make_raw(NESTED_BODY_HTML))
+    body = next(b for b in doc.blocks if b.type == "body")
+    assert body.text == "개요 문단 상위 하위 셀 문단"
+
+
+def test_parse_body_legacy_duplicated_text():
+    """
+    호환 모드: 종류별(헤딩 -> 문단 -> 리스트 -> 테이블)로 모두 모아 중첩 텍스트가 중복된다.
+    """
+    doc = WikiParser(legacy_body_text=True).parse(make_raw(NESTED_BODY_HTML))
+    body = next(b for b in doc.blocks if b.type == "body")
+    assert body.text == "개요 문단 셀 문단 상위 하위 하위 셀 문단"
@@ -0,0 +1,51 @@
+from api_server.app.adapters.queues.memory_job_queue import MemoryJobQueue
+from api_server.app.domain.models import Job, JobStatus
+
+
+def test_progress_is_accumulated_and_merged_on_get():
+    q = MemoryJobQueue()
+    q.save(Job(job_id="a", kind="index"))
+
+    q.add_progress("a", {"parsed": 2, "indexed": 1})
+    q.add_progress("a", {"parsed": 3})
+
+    job = q.get("a")
+    assert job.progress.parsed == 5
+    assert job.progress.indexed == 1
+    assert q.get("missing") is None
+
+
+def test_transition_applies_changes_only_from_expected_status():
+    q = MemoryJobQueue()
+    q.save(Job(job_id="a", kind="index"))
+
+    started = q.transition("a", JobStatus.queued, {"status": JobStatus.running, "worker": "w1"})
+    assert started.status == JobStatus.running and started.worker == "w1"
+
+    assert q.transition("a", JobStatus.queued, {"status": JobStatus.cancelled}) is None
+    assert q.get("a").status == JobStatus.running
+    assert q.transition("missing", JobStatus.queued, {"status": JobStatus.cancelled}) is None
+
+
+def test_queue_is_fifo_and_empty_returns_none():
+    q = MemoryJobQueue()
+    q.enqueue("a")
+    q.enqueue("b")
+
+    assert q.dequeue(0) == "a"
+    assert q.dequeue(0) == "b"
+    assert q.dequeue(0) is None
+
+
+def test_evicts_oldest_finished_jobs_only():
+    """
+    보관 한도를 넘으면 끝난 작업만 오래된 순으로 지우고, 대기/실행 중 작업은 남긴다.
+    """
+    q = MemoryJobQueue(max_jobs=2)
+    q.save(Job(job_id="queued", kind="index"))
+    q.save(Job(job_id="done", kind="index", status=JobStatus.succeeded))
+    q.save(Job(job_id="new", kind="index"))
+
+    assert q.get("queued") is not None
+    assert q.get("done") is None
+    assert q.get("new") is not None
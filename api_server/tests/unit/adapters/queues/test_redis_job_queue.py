@@ -0,0 +1,235 @@
+from redis.exceptions import WatchError
+
+from api_server.app.adapters.queues import redis_job_queue
+from api_server.app.adapters.queues.redis_job_queue import RedisJobQueue
+from api_server.app.domain.models import Job, JobStatus
+
+
+class FakeRedis:
+    """get/set/exists/hash/list/sorted set 명령만 흉내내는 dict 기반 Redis"""
+    def __init__(self):
+        self.data = {}
+        self.hashes = {}
+        self.lists = {}
+        self.zsets = {}
+        self.ttl = {}
+        self.versions = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8") if isinstance(value, str) else str(value).encode()
+        self.ttl[key] = ex
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def hgetall(self, key):
+        return {k.encode(): str(v).encode() for k, v in self.hashes.get(key, {}).items()}
+
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value.encode())
+
+    def blmove(self, first_list, second_list, timeout, src="LEFT", dest="RIGHT"):
+        items = self.lists.get(first_list)
+        if not items:
+            return None
+        item = items.pop() if src == "RIGHT" else items.pop(0)
+        target = self.lists.setdefault(second_list, [])
+        target.insert(0, item) if dest == "LEFT" else target.append(item)
+        return item
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def lrem(self, key, count, value):
+        items = self.lists.get(key, [])
+        self.lists[key] = [i for i in items if i != value.encode()]
+
+    def zadd(self, key, mapping, nx=False, xx=False):
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if (nx and member in zset) or (xx and member not in zset):
+                continue
+            zset[member] = score
+
+    def zrem(self, key, member):
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    def zrangebyscore(self, key, low, high):
+        return [m.encode() for m, score in sorted(self.zsets.get(key, {}).items(), key=lambda kv: kv[1])
+                if score <= high]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+        self.watched = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.watched = {}
+
+    def watch(self, key):
+        self.watched[key] = self.redis.versions.get(key, 0)
+
+    def get(self, key):
+        # WATCH 중에는 바로 실행된다
+        return self.redis.get(key)
+
+    def multi(self):
+        pass
+
+    def set(self, key, value, ex=None):
+        self.ops.append(("set", key, value, ex))
+
+    def hincrby(self, key, field, n):
+        self.ops.append(("hincrby", key, field, n))
+
+    def expire(self, key, seconds):
+        self.ops.append(("expire", key, seconds))
+
+    def lrem(self, key, count, value):
+        self.ops.append(("lrem", key, count, value))
+
+    def zrem(self, key, member):
+        self.ops.append(("zrem", key, member))
+
+    def execute(self):
+        watched, self.watched = self.watched, {}
+        if any(self.redis.versions.get(k, 0) != v for k, v in watched.items()):
+            self.ops = []
+            raise WatchError("watched key changed")
+        for op in self.ops:
+            if op[0] == "hincrby":
+                h = self.redis.hashes.setdefault(op[1], {})
+                h[op[2]] = h.get(op[2], 0) + op[3]
+            elif op[0] == "expire":
+                self.redis.ttl[op[1]] = op[2]
+            else:
+                getattr(self.redis, op[0])(*op[1:])
+        self.ops = []
+
+
+def test_job_roundtrip_with_progress_hash():
+    r = FakeRedis()
+    q = RedisJobQueue(r, prefix="kakaobank:jobs", ttl_seconds=60)
+
+    q.save(Job(job_id="a", kind="index", params={"date": "3"}, status=JobStatus.running))
+    q.add_progress("a", {"parsed": 2})
+    q.add_progress("a", {"parsed": 1, "indexed": 3})
+
+    job = q.get("a")
+    assert job.status == JobStatus.running
+    assert job.params == {"date": "3"}
+    assert job.progress.parsed == 3 and job.progress.indexed == 3
+    assert r.ttl["kakaobank:jobs:job:a"] == 60
+    assert r.ttl["kakaobank:jobs:progress:a"] == 60
+
+
+def test_queue_and_cancel_flag_are_shared_between_instances():
+    """
+    같은 Redis를 보는 다른 워커 인스턴스가 작업을 꺼내고 취소 요청을 확인할 수 있다.
+    """
+    r = FakeRedis()
+    api, worker = RedisJobQueue(r), RedisJobQueue(r)
+
+    api.enqueue("a")
+    api.enqueue("b")
+    assert worker.dequeue(1) == "a"
+    assert worker.dequeue(1) == "b"
+    assert worker.dequeue(1) is None
+
+    assert not worker.cancel_requested("a")
+    api.request_cancel("a")
+    assert worker.cancel_requested("a")
+
+
+def test_dequeued_job_is_kept_in_processing_until_ack():
+    r = FakeRedis()
+    q = RedisJobQueue(r, prefix="p", lease_seconds=30)
+    q.enqueue("a")
+
+    assert q.dequeue(1) == "a"
+    assert r.lists["p:processing"] == [b"a"]
+    assert "a" in r.zsets["p:leases"]
+
+    q.ack("a")
+    assert r.lists["p:processing"] == []
+    assert r.zsets["p:leases"] == {}
+
+
+def test_reclaim_stale_returns_jobs_whose_lease_expired(monkeypatch):
+    """
+    heartbeat가 끊긴(워커가 죽은) 작업만 회수하고, 같은 작업을 두 워커가 함께 회수하지 않는다.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(redis_job_queue.time, "time", lambda: now[0])
+    r = FakeRedis()
+    dead, alive = RedisJobQueue(r, prefix="p", lease_seconds=30), RedisJobQueue(r, prefix="p", lease_seconds=30)
+    for job_id in ("a", "b"):
+        dead.enqueue(job_id)
+    assert dead.dequeue(1) == "a"
+    assert alive.dequeue(1) == "b"
+
+    now[0] += 20
+    alive.heartbeat("b")
+    assert alive.reclaim_stale() == []
+
+    now[0] += 20
+    assert alive.reclaim_stale() == ["a"]
+    assert dead.reclaim_stale() == []
+    assert r.lists["p:processing"] == [b"b"]
+
+    # 회수된 작업의 늦은 heartbeat는 임대를 다시 만들지 않는다
+    dead.heartbeat("a")
+    assert "a" not in r.zsets["p:leases"]
+
+
+def test_transition_applies_changes_only_from_expected_status():
+    r = FakeRedis()
+    api, worker = RedisJobQueue(r, prefix="p", ttl_seconds=60), RedisJobQueue(r, prefix="p", ttl_seconds=60)
+    api.save(Job(job_id="a", kind="index"))
+
+    started = worker.transition("a", JobStatus.queued, {"status": JobStatus.running, "worker": "w1"})
+    assert started.status == JobStatus.running and started.worker == "w1"
+
+    # 이미 실행이 시작된 작업은 queued -> cancelled로 바뀌지 않는다
+    assert api.transition("a", JobStatus.queued, {"status": JobStatus.cancelled}) is None
+    assert api.get("a").status == JobStatus.running
+    assert api.transition("missing", JobStatus.queued, {"status": JobStatus.cancelled}) is None
+    assert r.ttl["p:job:a"] == 60
+
+
+def test_transition_rereads_when_job_changes_before_exec(monkeypatch):
+    """
+    WATCH 후 EXEC 전에 다른 클라이언트가 작업을 바꾸면 다시 읽어 바뀐 상태로 판단한다.
+    """
+    r = FakeRedis()
+    api, worker = RedisJobQueue(r, prefix="p"), RedisJobQueue(r, prefix="p")
+    api.save(Job(job_id="a", kind="index"))
+
+    reads = []
+    get = FakePipeline.get
+
+    def racing_get(self, key):
+        data = get(self, key)
+        if not reads:
+            worker.save(Job(job_id="a", kind="index", status=JobStatus.running, worker="w1"))
+        reads.append(data)
+        return data
+
+    monkeypatch.setattr(FakePipeline, "get", racing_get)
+
+    assert api.transition("a", JobStatus.queued, {"status": JobStatus.cancelled}) is None
+    assert len(reads) == 2
+    job = api.get("a")
+    assert job.status == JobStatus.running and job.worker == "w1"
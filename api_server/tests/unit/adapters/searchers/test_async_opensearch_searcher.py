@@ -0,0 +1,92 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+
+from api_server.app.adapters.searchers.async_opensearch_searcher import AsyncOpenSearchSearcher
+from api_server.app.adapters.searchers.opensearch_searcher import OpenSearchSearcher
+from api_server.app.adapters.searchers.cached_searcher import AsyncCachedSearcher
+from api_server.app.adapters.caches.memory_search_cache import AsyncMemorySearchCache, MemorySearchCache
+from api_server.app.platform.exceptions import DomainError
+
+
+def test_async_search_uses_same_query_body_as_sync():
+    """
+    비동기 검색기가 동기 검색기와 같은 쿼리 바디로 alias를 검색하는지
+    """
+    client = MagicMock()
+    client.search = AsyncMock(return_value={"hits": {"hits": []}})
+    searcher = AsyncOpenSearchSearcher(client, "my-alias")
+
+    result = asyncio.run(searcher.search("카카오뱅크", size=5, explain=True))
+
+    assert result == {"hits": {"hits": []}}
+    expected = OpenSearchSearcher(MagicMock(), "my-alias")._build_query("카카오뱅크", size=5, explain=True)
+    client.search.assert_awaited_once()
+    assert client.search.call_args.kwargs["index"] == "my-alias"
+    assert json.loads(client.search.call_args.kwargs["body"]) == expected
+
+
+def test_async_search_wraps_errors_as_domain_error():
+    client = MagicMock()
+    client.search = AsyncMock(side_effect=RuntimeError("down"))
+
+    with pytest.raises(DomainError):
+        asyncio.run(AsyncOpenSearchSearcher(client, "my-alias").search("q"))
+
+
+def test_async_cached_searcher_hits_cache():
+    inner = MagicMock()
+    inner.search = AsyncMock(return_value={"hits": {"hits": []}})
+    searcher = AsyncCachedSearcher(inner, AsyncMemorySearchCache(MemorySearchCache()))
+
+    async def run():
+        await searcher.search("삼성전자", 3, False)
+        await searcher.search(" 삼성전자", 3, False)
+
+    asyncio.run(run())
+    assert inner.search.await_count == 1
+
+
+def test_async_cached_searcher_batch_fetches_only_misses_and_sees_invalidation():
+    """
+    비동기 캐시 검색기도 캐시에 없는 쿼리만 msearch로 보내고, 색인 쪽 invalidate 이후에는 다시 검색한다.
+    """
+    inner = MagicMock()
+    inner.search_batch = AsyncMock(side_effect=lambda queries, size, explain, options=None: [
+        {"error": {"type": "x"}, "status": 500} if q == "실패" else {"q": q} for q in queries])
+    cache = MemorySearchCache()
+    searcher = AsyncCachedSearcher(inner, AsyncMemorySearchCache(cache))
+
+    asyncio.run(searcher.search_batch(["삼성전자", "실패"], 3, False))
+    asyncio.run(searcher.search_batch(["삼성전자", "실패"], 3, False))
+    assert inner.search_batch.call_args.args[0] == ["실패"]
+
+    cache.invalidate()
+    asyncio.run(searcher.search_batch(["삼성전자"], 3, False))
+    assert inner.search_batch.call_args.args[0] == ["삼성전자"]
+
+
+def test_async_search_batch_sends_single_msearch():
+    client = MagicMock()
+    client.msearch = AsyncMock(return_value={"responses": [{"took": 1}]})
+    searcher = AsyncOpenSearchSearcher(client, "my-alias")
+
+    result = asyncio.run(searcher.search_batch(["카카오뱅크"], size=3))
+
+    assert result == [{"took": 1}]
+    expected = OpenSearchSearcher(MagicMock(), "my-alias")._build_query("카카오뱅크", size=3)
+    client.msearch.assert_awaited_once()
+    header, body = client.msearch.call_args.kwargs["body"]
+    assert header == {} and json.loads(body) == expected
+
+
+def test_async_search_template_mode_calls_stored_template():
+    client = MagicMock()
+    client.search_template = AsyncMock(return_value={"hits": {"hits": []}})
+    searcher = AsyncOpenSearchSearcher(client, "my-alias", query_mode="template", template_id="tpl-1")
+
+    asyncio.run(searcher.search("카카오뱅크", size=5))
+
+    client.search_template.assert_awaited_once_with(
+        index="my-alias", body={"id": "tpl-1", "params": {"query": "카카오뱅크", "size": 5, "explain": False}})
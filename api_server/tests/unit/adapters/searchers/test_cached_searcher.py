@@ -0,0 +1,113 @@
+from unittest.mock import MagicMock
+
+from api_server.app.adapters.caches.memory_search_cache import MemorySearchCache
+from api_server.app.adapters.searchers.cached_searcher import CachedSearcher
+from api_server.app.domain.models import SearchOptions
+
+
+def make_inner():
+    inner = MagicMock()
+    inner.search.side_effect = lambda query, size, explain, options=None: {"q": query, "size": size, "explain": explain}
+    return inner
+
+
+def test_same_normalized_query_hits_cache():
+    """
+    공백/유니코드 정규화 후 같은 쿼리면 내부 검색기를 다시 호출하지 않는다.
+    size/explain이 다르면 다른 키로 본다.
+    """
+    inner = make_inner()
+    searcher = CachedSearcher(inner, MemorySearchCache())
+
+    first = searcher.search("카카오뱅크  금리", 3, False)
+    second = searcher.search("  카카오뱅크 금리 ", 3, False)
+    searcher.search("카카오뱅크 금리", 5, False)
+    searcher.search("카카오뱅크 금리", 3, True)
+
+    assert second == first
+    assert inner.search.call_count == 3
+
+
+def test_invalidate_on_alias_rotation_misses_old_results():
+    """
+    alias 회전(invalidate) 이후에는 이전 세대 결과를 쓰지 않는다.
+    """
+    inner = make_inner()
+    cache = MemorySearchCache()
+    searcher = CachedSearcher(inner, cache)
+
+    searcher.search("삼성전자", 3, False)
+    cache.invalidate()
+    searcher.search("삼성전자", 3, False)
+
+    assert inner.search.call_count == 2
+
+
+def test_result_started_before_rotation_is_not_served_after():
+    """
+    검색 도중 alias가 회전되면 그 결과는 이전 세대 키로 저장되어 이후 조회에 쓰이지 않는다.
+    """
+    cache = MemorySearchCache()
+    inner = MagicMock()
+
+    def slow_search(query, size, explain, options=None):
+        cache.invalidate()  # 검색 중 회전
+        return {"stale": True}
+
+    inner.search.side_effect = slow_search
+    searcher = CachedSearcher(inner, cache)
+    searcher.search("네이버", 3, False)
+
+    inner.search.side_effect = lambda query, size, explain, options=None: {"stale": False}
+    assert searcher.search("네이버", 3, False) == {"stale": False}
+
+
+def test_errors_are_not_cached():
+    inner = MagicMock()
+    inner.search.side_effect = [RuntimeError("down"), {"ok": True}]
+    searcher = CachedSearcher(inner, MemorySearchCache())
+
+    try:
+        searcher.search("q", 3, False)
+    except RuntimeError:
+        pass
+    assert searcher.search("q", 3, False) == {"ok": True}
+    assert inner.search.call_count == 2
+
+
+def test_search_batch_fetches_only_misses_and_skips_errors():
+    """
+    배치 검색은 캐시에 없는 쿼리만 msearch로 보내고, 실패한 쿼리 결과는 저장하지 않는다.
+    """
+    inner = make_inner()
+    inner.search_batch.side_effect = lambda queries, size, explain, options=None: [
+        {"error": {"type": "x"}, "status": 500} if q == "실패" else {"q": q} for q in queries
+    ]
+    searcher = CachedSearcher(inner, MemorySearchCache())
+    searcher.search("카카오뱅크", 3, False)
+
+    result = searcher.search_batch(["카카오뱅크", "삼성전자", "실패"], 3, False)
+
+    assert result[0] == {"q": "카카오뱅크", "size": 3, "explain": False}
+    assert result[1] == {"q": "삼성전자"}
+    assert "error" in result[2]
+    inner.search_batch.assert_called_once_with(["삼성전자", "실패"], 3, False, None)
+
+    searcher.search_batch(["삼성전자", "실패"], 3, False)
+    assert inner.search_batch.call_args.args[0] == ["실패"]
+
+
+def test_search_options_are_part_of_cache_key():
+    """
+    _source/하이라이트 옵션이 다르면 다른 결과로 보고, 같은 옵션은 캐시를 재사용한다.
+    """
+    inner = make_inner()
+    searcher = CachedSearcher(inner, MemorySearchCache())
+
+    searcher.search("카카오뱅크", 3, False, SearchOptions())
+    searcher.search("카카오뱅크", 3, False, SearchOptions())
+    searcher.search("카카오뱅크", 3, False, SearchOptions(source_includes=["title"]))
+    searcher.search("카카오뱅크", 3, False)
+
+    assert inner.search.call_count == 3
+    assert inner.search.call_args_list[0].args[3] == SearchOptions()
@@ -1,7 +1,13 @@
 from unittest.mock import MagicMock
+import json
+import re
 import pytest
+from opensearchpy.exceptions import NotFoundError
 
-from api_server.app.adapters.searchers.opensearch_searcher import OpenSearchSearcher
+from api_server.app.adapters.searchers.opensearch_searcher import (
+    OpenSearchSearcher, build_search_query, register_search_template, search_template_source, template_params
+)
+from api_server.app.domain.models import SearchOptions
 
 
 @pytest.fixture
@@ -82,6 +88,34 @@ def test_build_query_overrides(mock_client):
     assert pytest.approx(body["min_score"], rel=1e-6) == 0.1
 
 
+def test_build_query_without_options_returns_full_source(mock_client):
+    body = OpenSearchSearcher(client=mock_client, alias_name="alias")._build_query(query="네이버")
+
+    assert "_source" not in body
+    assert "highlight" not in body
+
+
+def test_build_query_applies_source_filter_and_highlight(mock_client):
+    """
+    기본 옵션은 주요 필드만 _source로 받고, 본문/문단/요약/인포박스는 하이라이트 조각으로 받는다.
+    """
+    s = OpenSearchSearcher(client=mock_client, alias_name="alias")
+
+    body = s._build_query(query="네이버", options=SearchOptions())
+
+    assert "body" not in body["_source"]["includes"]
+    assert "excludes" not in body["_source"]
+    assert body["highlight"]["require_field_match"] is False
+    assert body["highlight"]["fragment_size"] == 150
+    assert set(body["highlight"]["fields"]) == {"body", "paragraph", "summary", "infobox"}
+
+    body = s._build_query(
+        query="네이버", options=SearchOptions(source_includes=None, source_excludes=["body"], highlight_fields=[]))
+
+    assert body["_source"] == {"excludes": ["body"]}
+    assert "highlight" not in body
+
+
 def test_search_calls_client_with_alias_and_body(mock_client):
     """
     검색 호출 파라미터 검증
@@ -104,7 +138,111 @@ def test_search_calls_client_with_alias_and_body(mock_client):
     assert kwargs["index"] == "my-search-alias"
 
     # body 내용 검증(핵심 몇 가지만)
-    body = kwargs["body"]
+    body = json.loads(kwargs["body"])
     assert body["size"] == 5
     assert body["explain"] is True
     assert body["query"]["function_score"]["query"]["bool"]["filter"]["bool"]["must"][0]["term"] == {"published": True}
+
+
+def test_search_batch_sends_single_msearch(mock_client):
+    """
+    여러 쿼리를 헤더({})와 단건 검색과 같은 쿼리 바디를 번갈아 담아 한 번의 msearch로 보내는지
+    """
+    mock_client.msearch.return_value = {"responses": [{"took": 1}, {"took": 2}]}
+    s = OpenSearchSearcher(client=mock_client, alias_name="my-alias")
+
+    result = s.search_batch(["카카오뱅크", "삼성전자"], size=5)
+
+    assert result == [{"took": 1}, {"took": 2}]
+    expected = [
+        {}, s._build_query("카카오뱅크", size=5),
+        {}, s._build_query("삼성전자", size=5),
+    ]
+    mock_client.msearch.assert_called_once()
+    args, kwargs = mock_client.msearch.call_args
+    assert kwargs["index"] == "my-alias"
+    assert [line if isinstance(line, dict) else json.loads(line) for line in kwargs["body"]] == expected
+
+
+def test_search_batch_empty_skips_request(mock_client):
+    s = OpenSearchSearcher(client=mock_client, alias_name="my-alias")
+    assert s.search_batch([]) == []
+    mock_client.msearch.assert_not_called()
+
+
+def render_mustache(source: str, params: dict) -> str:
+    """
+    테스트용 최소 mustache 렌더러(섹션, toJson, JSON 이스케이프 변수만 지원).
+    """
+    def section(m):
+        name, inner = m.group(1), m.group(2)
+        return inner if params.get(name) else ""
+
+    source = re.sub(r"\{\{#(source_filter|highlight)\}\}(.*?)\{\{/\1\}\}", section, source)
+    source = re.sub(r"\{\{#toJson\}\}(\w+)\{\{/toJson\}\}", lambda m: json.dumps(params[m.group(1)]), source)
+
+    def variable(m):
+        value = json.dumps(params[m.group(1)], ensure_ascii=False)
+        return value[1:-1] if isinstance(params[m.group(1)], str) else value
+
+    return re.sub(r"\{\{(\w+)\}\}", variable, source)
+
+
+@pytest.mark.parametrize("options", [None, SearchOptions(), SearchOptions(source_includes=None, highlight_fields=[])])
+def test_search_template_renders_same_body_as_build_query(options):
+    """
+    저장 검색 템플릿을 파라미터로 렌더링하면 build_search_query와 같은 쿼리 바디가 된다.
+    """
+    query = '카카오 "뱅크" \\ 금리'
+    params = template_params(query, size=7, explain=True, options=options)
+
+    rendered = json.loads(render_mustache(search_template_source(), params))
+
+    assert rendered == build_search_query(query, size=7, explain=True, options=options)
+
+
+def test_template_mode_sends_template_id_and_params_only(mock_client):
+    mock_client.search_template.return_value = {"hits": {"hits": []}}
+    s = OpenSearchSearcher(client=mock_client, alias_name="my-alias", query_mode="template", template_id="tpl-2")
+
+    s.search("삼성전자", size=5, options=SearchOptions(source_includes=["title"], highlight_fields=[]))
+
+    mock_client.search_template.assert_called_once_with(index="my-alias", body={
+        "id": "tpl-2",
+        "params": {"query": "삼성전자", "size": 5, "explain": False, "source_filter": {"includes": ["title"]}},
+    })
+    mock_client.search.assert_not_called()
+
+
+def test_template_mode_falls_back_to_compiled_body_when_template_missing(mock_client):
+    """
+    저장된 템플릿이 없으면(404) 미리 직렬화한 바디로 검색한다(배치는 실패한 항목만 다시 검색).
+    """
+    mock_client.search_template.side_effect = NotFoundError(404, "resource_not_found_exception", {})
+    mock_client.search.return_value = {"hits": {"hits": []}}
+    mock_client.msearch_template.return_value = {"responses": [{"took": 1}, {"status": 404, "error": {}}]}
+    mock_client.msearch.return_value = {"responses": [{"took": 2}]}
+    s = OpenSearchSearcher(client=mock_client, alias_name="my-alias", query_mode="template")
+
+    assert s.search("네이버") == {"hits": {"hits": []}}
+    assert s.search_batch(["카카오뱅크", "삼성전자"]) == [{"took": 1}, {"took": 2}]
+    body = mock_client.msearch.call_args.kwargs["body"]
+    assert json.loads(body[1]) == build_search_query("삼성전자")
+
+
+def test_register_search_template_keeps_existing_template(mock_client):
+    """
+    같은 id의 템플릿이 이미 있으면(운영자가 바꿔 둔 전략 포함) 덮어쓰지 않는다.
+    """
+    assert register_search_template(mock_client, "tpl-1") is False
+    mock_client.put_script.assert_not_called()
+
+    mock_client.get_script.side_effect = NotFoundError(404, "resource_not_found_exception", {})
+    assert register_search_template(mock_client, "tpl-1") is True
+    script = mock_client.put_script.call_args.kwargs["body"]["script"]
+    assert script == {"lang": "mustache", "source": search_template_source()}
+
+
+def test_unknown_query_mode_is_rejected(mock_client):
+    with pytest.raises(ValueError):
+        OpenSearchSearcher(client=mock_client, alias_name="alias", query_mode="dict")
@@ -0,0 +1,77 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from api_server.app.adapters.fetchers.file_fetcher import FileFetcher
+from api_server.app.adapters.parsers.qna_parser import QnaParser
+from api_server.app.adapters.transformers.qna_columnar_transformer import QnaColumnarTransformer
+from api_server.app.adapters.transformers.qna_transformer import QnaTransformer
+from api_server.app.domain.models import Collection, NormalizedChunk
+from api_server.app.platform.exceptions import InvalidInput
+
+FIXED_DATE = datetime(2025, 9, 22, 10, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def fixed_date(monkeypatch):
+    """행 단위/열 단위 경로의 created_date를 같은 값으로 고정"""
+    for module in ("qna_transformer", "qna_columnar_transformer"):
+        monkeypatch.setattr(
+            f"api_server.app.adapters.transformers.{module}.infer_date_from_path", lambda uri: FIXED_DATE)
+
+
+def make_columnar(block_size: int = 1 << 20) -> QnaColumnarTransformer:
+    return QnaColumnarTransformer(FileFetcher(), QnaParser(), QnaTransformer(), block_size=block_size)
+
+
+def row_path_records(path: Path):
+    doc = QnaParser().parse(FileFetcher().fetch(str(path), Collection.qna))
+    return [c.model_dump(mode="json") for c in QnaTransformer().transform_iter([doc])]
+
+
+def write_tsv(path: Path, rows) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join("\t".join(r) for r in rows) + "\n", encoding="utf-8")
+    return path
+
+
+def test_columnar_records_match_row_path(tmp_path: Path):
+    """
+    공백 제거/빈 값/published 플래그/source_id/content_hash까지 행 단위 경로와 같은 색인 문서를 만든다.
+    (여러 block으로 나눠 읽어도 순서 유지)
+    """
+    rows = [["id", "question", "answer", "published", "user_id", "extra"]]
+    rows += [[f" {i} ", f" 질문 {i} ", "" if i % 3 else f"답변 {i}", "y" if i % 2 else "N", "" if i % 4 else f"u{i}", "x"]
+             for i in range(200)]
+    path = write_tsv(tmp_path / "day_1" / "qna.tsv", rows)
+
+    records = list(make_columnar(block_size=1024).iter_records(str(path), Collection.qna))
+
+    assert records == row_path_records(path)
+    assert [NormalizedChunk.model_validate(r).model_dump(mode="json") for r in records[:3]] == records[:3]
+
+
+def test_columnar_falls_back_to_row_path_without_duplicates(tmp_path: Path, caplog):
+    """
+    pyarrow가 읽지 못하는 행(열 개수 부족)이 있으면 행 단위 경로로 이어서 처리하고, 이미 내보낸 행은 건너뛴다.
+    """
+    rows = [["id", "question", "answer", "published", "user_id"]]
+    rows += [[str(i), f"Q{i}", f"A{i}", "Y", "u"] for i in range(100)]
+    rows += [["100", "Q100"]]
+    path = write_tsv(tmp_path / "day_1" / "qna.tsv", rows)
+
+    records = list(make_columnar(block_size=512).iter_records(str(path), Collection.qna))
+
+    assert records == row_path_records(path)
+    assert [r["source_id"] for r in records][-2:] == ["tsv_99", "tsv_100"]
+    assert "fallback to row path" in caplog.text
+
+
+def test_columnar_missing_columns_raise_like_row_path(tmp_path: Path):
+    path = write_tsv(tmp_path / "day_1" / "qna.tsv", [["id", "question"], ["1", "Q"]])
+
+    with pytest.raises(InvalidInput):
+        list(make_columnar().iter_records(str(path), Collection.qna))
@@ -12,6 +12,7 @@ from api_server.app.domain.models import (
     FileType,
     Collection,
     NormalizedChunk,
+    RowTable,
 )
 from api_server.app.platform.exceptions import DomainError
 
@@ -94,6 +95,26 @@ def test_read_parsed_document_from_single_dict(tmp_path: Path):
     assert docs[0].blocks[0].meta["question"] == "Q3"
 
 
+def test_read_parsed_document_from_jsonl_with_multiple_documents(tmp_path: Path):
+    """
+    extract 단계가 기록하는 JSONL(한 줄에 문서 하나) 파일의 문서를 모두 읽는지.
+    """
+    tr = QnaTransformer()
+    lines = [
+        make_parsed_document(
+            uri=f"file:///data/qna_{i}.tsv",
+            rows=[{"id": str(i), "question": "Q", "answer": "A", "published": "Y", "user_id": "u"}],
+        ).model_dump_json()
+        for i in range(2)
+    ]
+    p = tmp_path / "qna_1_parsed.json"
+    p.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    docs = list(tr.iter_parsed_document(str(p)))
+
+    assert [d.blocks[0].meta["id"] for d in docs] == ["0", "1"]
+
+
 def test_read_parsed_document_unsupported_format_raises(tmp_path: Path):
     """
     지원하지 않는 포맷은 예외 발생.
@@ -186,6 +207,31 @@ def test_transform_skips_non_row_blocks(monkeypatch):
     assert chunks[0].source_id == "tsv_1"
 
 
+def test_transform_reads_row_table_like_row_blocks(monkeypatch):
+    """
+    파서가 만든 RowTable 행도 row 블록과 같은 NormalizedChunk로 변환되는지.
+    """
+    tr = QnaTransformer()
+    monkeypatch.setattr(
+        "api_server.app.adapters.transformers.qna_transformer.infer_date_from_path",
+        lambda uri: datetime(2025, 9, 22, tzinfo=timezone.utc),
+        raising=True,
+    )
+    rows = [
+        {"id": "1", "question": "Q", "answer": "A", "published": "Y", "user_id": "u"},
+        {"id": "2", "question": "Q2", "answer": None, "published": "N", "user_id": None},
+    ]
+    columns = list(rows[0])
+    table_doc = ParsedDocument(
+        source=SourceRef(uri="file:///d/qna.tsv", file_type=FileType.tsv),
+        table=RowTable(columns=columns, rows=[tuple(r[c] for c in columns) for r in rows]),
+        collection=TEST_COLLECTION,
+    )
+    block_doc = make_parsed_document(uri="file:///d/qna.tsv", rows=rows)
+
+    assert tr.transform([table_doc]) == tr.transform([block_doc])
+
+
 def test_transform_defaults_when_missing_fields(monkeypatch):
     """
     결측값 시 기본값 적용: answer="", author=None, published=False(빈 문자열은 startswith('Y')가 False)
@@ -214,3 +260,33 @@ def test_transform_defaults_when_missing_fields(monkeypatch):
     assert c.answer == ""          # 기본값
     assert c.author is None
     assert c.published is False    # "":upper().startswith("Y") -> False
+
+
+def test_transform_iter_is_lazy(monkeypatch):
+    """
+    transform_iter는 입력 문서를 모두 모으지 않고 문서 단위로 청크를 반환해야 한다.
+    """
+    tr = QnaTransformer(default_source_id="tsv")
+    fixed_dt = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    monkeypatch.setattr(
+        "api_server.app.adapters.transformers.qna_transformer.infer_date_from_path",
+        lambda uri: fixed_dt,
+        raising=True,
+    )
+
+    consumed = []
+
+    def docs():
+        for i in range(3):
+            consumed.append(i)
+            yield make_parsed_document(
+                uri=f"file:///data/day_3/qna{i}.tsv",
+                rows=[{"id": str(i), "question": "Q", "answer": "A", "published": "Y", "user_id": "u"}],
+            )
+
+    it = tr.transform_iter(docs())
+    first = next(it)
+    assert first.source_id == "tsv_0"
+    # 첫 청크를 꺼낸 시점에는 첫 문서만 소비됨
+    assert consumed == [0]
+    assert [c.source_id for c in it] == ["tsv_1", "tsv_2"]
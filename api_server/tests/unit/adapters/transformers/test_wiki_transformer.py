@@ -6,6 +6,7 @@ import json
 import pytest
 
 from api_server.app.adapters.transformers.wiki_transformer import WikiTransformer
+from api_server.app.domain.delta import chunk_fingerprint
 from api_server.app.domain.models import (
     ParsedDocument,
     ParsedBlock,
@@ -124,7 +125,9 @@ def test_transform_builds_chunk_and_normalizes_percentages(monkeypatch):
     assert isinstance(c, NormalizedChunk)
 
     # 기본 메타
-    assert c.source_id == "html_0"          # 증가 번호
+    assert c.source_id == tr._stable_source_id(doc)   # 파일 이름 기반 id
+    assert c.source_id.startswith("html_")
+    assert c.content_hash == chunk_fingerprint(c)
     assert c.source_path == doc.source.uri
     assert c.collection == TEST_COLLECTION
     # file_type은 구현상 "html" 문자열을 사용 -> 타입이 Enum이 아닐 수도 있으므로 값만 간접 확인
@@ -149,7 +152,7 @@ def test_transform_builds_chunk_and_normalizes_percentages(monkeypatch):
 
 def test_transform_multiple_docs_feature_scaling_and_ids(monkeypatch):
     """
-    여러 문서 입력 시 source_id가 html_0, html_1처럼 증가하는지.
+    여러 문서 입력 시 문서마다 다른 source_id를 갖는지.
     """
     tr = WikiTransformer(default_source_id="html")
 
@@ -160,11 +163,11 @@ def test_transform_multiple_docs_feature_scaling_and_ids(monkeypatch):
         raising=True,
     )
 
-    doc_short = make_parsed_doc(title="짧은", body="짧다 1.0%", summary="S", infobox="I", paragraph="P")
-    doc_long = make_parsed_doc(title="긴문서", body=("매우 " * 100) + "2.5%", summary=("요약 " * 30), infobox=("정보 " * 15), paragraph=("문단 " * 10))
+    doc_short = make_parsed_doc(uri="file:///data/day_3/짧은.html", title="짧은", body="짧다 1.0%", summary="S", infobox="I", paragraph="P")
+    doc_long = make_parsed_doc(uri="file:///data/day_3/긴문서.html", title="긴문서", body=("매우 " * 100) + "2.5%", summary=("요약 " * 30), infobox=("정보 " * 15), paragraph=("문단 " * 10))
 
     chunks = list(tr.transform([doc_short, doc_long]))
-    assert {c.source_id for c in chunks} == {"html_0", "html_1"}
+    assert len({c.source_id for c in chunks}) == 2
 
     c_short = next(c for c in chunks if c.title == "짧은")
     c_long = next(c for c in chunks if c.title == "긴문서")
@@ -179,3 +182,71 @@ def test_transform_multiple_docs_feature_scaling_and_ids(monkeypatch):
     for c in (c_short, c_long):
         for k in ("body", "summary", "infobox", "paragraph"):
             assert 0.0 <= c.features[k] <= 1.0
+
+
+def test_transform_missing_blocks_are_none(monkeypatch):
+    """
+    summary/infobox가 없는 문서는 이전 문서의 값을 물려받지 않고 None이어야 한다.
+    """
+    tr = WikiTransformer(default_source_id="html")
+    monkeypatch.setattr(
+        "api_server.app.adapters.transformers.wiki_transformer.infer_date_from_path",
+        lambda uri: datetime(2023, 9, 9, tzinfo=timezone.utc),
+        raising=True,
+    )
+
+    full = make_parsed_doc(uri="file:///data/day_3/전체.html", title="전체")
+    partial = make_parsed_doc(uri="file:///data/day_3/일부.html", title="일부")
+    partial.blocks = [b for b in partial.blocks if b.type in ("body", "paragraph")]
+
+    chunks = list(tr.transform_iter(iter([full, partial])))
+    assert [c.source_id for c in chunks] == [tr._stable_source_id(full), tr._stable_source_id(partial)]
+    assert chunks[1].summary is None
+    assert chunks[1].infobox is None
+    assert chunks[1].body is not None
+
+
+def test_source_id_is_stable_across_order_and_days(monkeypatch):
+    """
+    파일 목록 순서나 날짜 디렉터리가 바뀌어도 같은 문서는 같은 source_id를 갖는지.
+    같은 키를 갖는 문서가 여럿이면 뒤의 문서에 순번을 붙여 구분하는지.
+    """
+    tr = WikiTransformer(default_source_id="html")
+    monkeypatch.setattr(
+        "api_server.app.adapters.transformers.wiki_transformer.infer_date_from_path",
+        lambda uri: datetime(2023, 9, 9, tzinfo=timezone.utc),
+        raising=True,
+    )
+
+    day1 = [
+        make_parsed_doc(uri="file:///data/day_1/카카오.html", title="카카오"),
+        make_parsed_doc(uri="file:///data/day_1/네이버.html", title="네이버"),
+    ]
+    day2 = [
+        make_parsed_doc(uri="file:///data/day_2/네이버.html", title="네이버"),
+        make_parsed_doc(uri="file:///data/day_2/카카오.html", title="카카오"),
+    ]
+    ids1 = {c.title: c.source_id for c in tr.transform(day1)}
+    ids2 = {c.title: c.source_id for c in tr.transform(day2)}
+    assert ids1 == ids2
+
+    dups = tr.transform([make_parsed_doc(title="A"), make_parsed_doc(title="B")])
+    assert dups[1].source_id == f"{dups[0].source_id}_1"
+
+
+def test_content_hash_changes_only_with_content(monkeypatch):
+    """
+    content_hash는 날짜/경로가 달라도 내용이 같으면 같고, 내용이 바뀌면 달라지는지.
+    """
+    tr = WikiTransformer(default_source_id="html")
+    monkeypatch.setattr(
+        "api_server.app.adapters.transformers.wiki_transformer.infer_date_from_path",
+        lambda uri: datetime.now(timezone.utc),
+        raising=True,
+    )
+    a = tr.transform([make_parsed_doc(uri="file:///data/day_1/a.html")])[0]
+    b = tr.transform([make_parsed_doc(uri="file:///data/day_2/a.html")])[0]
+    c = tr.transform([make_parsed_doc(uri="file:///data/day_2/a.html", body="바뀐 본문")])[0]
+
+    assert a.content_hash == b.content_hash
+    assert a.content_hash != c.content_hash
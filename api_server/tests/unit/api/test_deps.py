@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from api_server.app.api.deps import (
+    INGEST_ROUTE,
+    PipelineResolver,
+    build_job_service,
+    ensure_search_template,
+    get_pipeline_resolver,
+    get_search_service,
+    get_async_search_service,
+    get_async_search_cache,
+    get_search_cache,
+)
+from api_server.app.domain.models import FileType
+from api_server.app.platform.config import settings
+
+
+def make_request(**state) -> SimpleNamespace:
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(**state)))
+
+
+def test_resolver_reuses_service_per_source_type():
+    """
+    같은 source_type이면 IndexService를 다시 만들지 않고 캐시된 인스턴스를 반환한다.
+    """
+    resolver = PipelineResolver(MagicMock())
+
+    html = resolver.for_type(FileType.html)
+
+    assert resolver.for_type(FileType.html) is html
+    assert resolver.for_type(FileType.tsv) is not html
+    # 인덱서는 source_type과 관계없이 하나를 공유
+    assert resolver.for_type(FileType.tsv)._indexer is html._indexer
+
+
+def test_dependencies_return_app_scoped_instances():
+    """
+    lifespan에서 app.state에 넣어 둔 인스턴스를 요청마다 그대로 주입한다.
+    """
+    resolver, search, async_search = object(), object(), object()
+    request = make_request(
+        pipeline_resolver=resolver, search_service=search, async_search_service=async_search)
+
+    assert get_pipeline_resolver(request) is resolver
+    assert get_search_service(request) is search
+    assert get_async_search_service(request) is async_search
+
+
+def test_search_template_is_registered_at_startup_only_in_template_mode(monkeypatch):
+    """
+    template 모드일 때만 검색 템플릿을 등록하고, 등록 실패는 앱 시작을 막지 않는다.
+    """
+    from opensearchpy.exceptions import NotFoundError
+
+    client = MagicMock()
+    client.get_script.side_effect = NotFoundError(404, "resource_not_found_exception", {})
+
+    monkeypatch.setattr(settings, "SEARCH_QUERY_MODE", "compiled")
+    assert ensure_search_template(client) is False
+    client.put_script.assert_not_called()
+
+    monkeypatch.setattr(settings, "SEARCH_QUERY_MODE", "template")
+    monkeypatch.setattr(settings, "SEARCH_TEMPLATE_ID", "tpl-1")
+    assert ensure_search_template(client) is True
+    assert client.put_script.call_args.kwargs["id"] == "tpl-1"
+
+    client.put_script.side_effect = ConnectionError("opensearch down")
+    assert ensure_search_template(client) is False
+
+
+def test_async_search_cache_shares_memory_cache_with_invalidation():
+    """
+    async 검색 경로의 memory 캐시는 색인 쪽이 무효화하는 캐시 인스턴스를 감싼다.
+    """
+    assert get_async_search_cache()._cache is get_search_cache()
+
+
+def test_index_and_pipeline_jobs_share_ingest_slot_with_routes(admission_enabled):
+    """
+    색인/파이프라인 작업은 동기 색인/파이프라인 라우트와 같은 ingest 자리를 차지한다.
+    """
+    svc = build_job_service(MagicMock())
+    controller = admission_enabled
+
+    assert svc._acquire_slot("pipeline")
+    try:
+        assert not controller.try_acquire_route(INGEST_ROUTE, 1)
+        assert not svc._acquire_slot("index")
+    finally:
+        svc._release_slot("pipeline")
+    assert controller.stats()["routes"][INGEST_ROUTE] == 0
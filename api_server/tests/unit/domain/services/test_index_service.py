@@ -31,6 +31,12 @@ def make_parsed_doc(uri: str, rows: list[dict], collection=Collection.wiki):
     )
 
 
+def data_lines(path: Path) -> list[str]:
+    """산출물 파일의 데이터 줄(빈 줄과 첫 줄의 산출물 헤더 제외)"""
+    lines = [l for l in path.read_text(encoding="utf-8").splitlines() if l.strip()]
+    return lines[1:] if lines and lines[0].startswith('{"_artifact"') else lines
+
+
 def make_chunk(source_id="tsv_1", uri="file:///data/day_3/qna.tsv", collection="qna"):
     now = datetime(2024, 1, 1, tzinfo=timezone.utc)
     return NormalizedChunk(
@@ -128,7 +134,7 @@ def test_extract_writes_parsed_json_and_calls_ports(tmp_path: Path, service: Ind
     assert expected_file.exists()
 
     # 내용: JSON 2줄
-    lines = [l for l in expected_file.read_text(encoding="utf-8").splitlines() if l.strip()]
+    lines = data_lines(expected_file)
     assert len(lines) == 2
 
     # 포트 호출 검증
@@ -140,36 +146,36 @@ def test_extract_writes_parsed_json_and_calls_ports(tmp_path: Path, service: Ind
 def test_transform_reads_parsed_and_writes_normalized(tmp_path: Path, service: IndexService, ports):
     """
     파싱된 문서를 색인 문서 형태로 변환하여 파일로 저장하는 메서드.
-    Transformer.read_parsed_document가 올바른 경로로 호출되는지.
-    Transformer.transform 결과가 *_normalized.json으로 저장되는지.
+    Transformer.iter_parsed_document가 올바른 경로로 호출되는지.
+    Transformer.transform_iter 결과가 *_normalized.json으로 저장되는지.
     """
 
     listener, fetcher, parser, transformer, indexer = ports
 
     service._get_resource_dir_path = lambda source, date: str(tmp_path / f"{source}/day_{date}")
 
-    # transformer.read_parsed_document 는 파일 경로를 받고 ParsedDocument 리스트 반환
+    # transformer.iter_parsed_document 는 파일 경로를 받고 ParsedDocument 이터레이터 반환
     pd = make_parsed_doc("file:///data/day_3/qna.tsv", rows=[{"id": "1", "question": "Q", "answer": "A", "published": "Y", "user_id": "u"}], collection=Collection.qna)
-    transformer.read_parsed_document.return_value = [pd]
+    transformer.iter_parsed_document.return_value = iter([pd])
 
-    # transformer.transform 는 NormalizedChunk 이터러블 반환
+    # transformer.transform_iter 는 NormalizedChunk 이터러블 반환
     chunk = make_chunk(source_id="tsv_1", uri="file:///data/day_3/qna.tsv", collection="qna")
-    transformer.transform.return_value = [chunk]
+    transformer.transform_iter.side_effect = lambda docs: iter([chunk for _ in docs])
 
     out_name = service.transform(source="tsv", date="3", collection=Collection.qna)
     expected_dir = service._get_resource_dir_path("tsv", "3")
     parsed_path = service._create_file_name(Collection.qna, "3", suffix="parsed", out_dir=expected_dir)
     normalized_path = Path(expected_dir) / "qna_3_normalized.json"
 
-    # read_parsed_document가 올바른 경로로 호출되었는지
-    transformer.read_parsed_document.assert_called_once_with(parsed_path)
+    # iter_parsed_document가 올바른 경로로 호출되었는지
+    transformer.iter_parsed_document.assert_called_once_with(parsed_path)
 
     # 출력 파일 생성 확인 (파일명만 반환)
     assert out_name == normalized_path.name
     assert normalized_path.exists()
 
     # 내용: JSON 1줄
-    lines = [l for l in normalized_path.read_text(encoding="utf-8").splitlines() if l.strip()]
+    lines = data_lines(normalized_path)
     assert len(lines) == 1
     parsed_json = json.loads(lines[0])
     assert parsed_json["source_id"] == "tsv_1"
@@ -209,8 +215,11 @@ def test_index_creates_indexes_and_rotates_alias(tmp_path: Path, service: IndexS
     # index 호출(파일 경로 확인)
     
     indexer.index.assert_called_once_with("myidx-tsv-3", str(normalized_path))
-    # alias 회전 호출
+    # alias 회전 호출(적재 마무리 후)
     indexer.rotate_alias_to_latest.assert_called_once_with("myalias", "myidx", delete_old=False)
+    names = [c[0] for c in indexer.method_calls]
+    assert names.index("finalize_index") < names.index("rotate_alias_to_latest")
+    indexer.finalize_index.assert_called_once_with("myidx-tsv-3")
 
     # 결과 병합 확인
     assert result["indexed"] == 1
@@ -230,3 +239,352 @@ def test_internal_filename_helpers(tmp_path: Path, service: IndexService):
     # 파일명 조합 확인
     fname = service._create_file_name(Collection.wiki, "7", suffix="parsed", out_dir=str(tmp_path))
     assert fname == str(Path(tmp_path) / "wiki_7_parsed.json")
+
+
+def _stream_transform(docs):
+    """transform_iter 목: row 1개당 chunk 1개를 지연 생성"""
+    for doc in docs:
+        for b in doc.blocks:
+            yield make_chunk(source_id=f"tsv_{b.meta['id']}", uri=doc.source.uri, collection="qna")
+
+
+def _prepare_pipeline(service: IndexService, ports, tmp_path: Path):
+    listener, fetcher, parser, transformer, indexer = ports
+    resource_files = ["file:///data/day_3/qna.tsv", "file:///data/day_3/qna2.tsv"]
+    listener.listen.return_value = resource_files
+    fetcher.fetch.side_effect = lambda uri, collection: RawDocument(
+        source=SourceRef(uri=uri, file_type=FileType.tsv),
+        body_text="",
+        collection=collection,
+    )
+    parser.parse.side_effect = lambda raw: make_parsed_doc(
+        raw.source.uri,
+        rows=[{"id": Path(raw.source.uri).stem, "question": "Q", "answer": "A", "published": "Y", "user_id": "u"}],
+        collection=Collection.qna,
+    )
+    transformer.transform_iter.side_effect = _stream_transform
+
+    captured = {}
+
+    def fake_index_chunks(index_name, chunks):
+        captured["index_name"] = index_name
+        captured["ids"] = [c.source_id for c in chunks]
+        return IndexResult(indexed=len(captured["ids"]), errors=[])
+
+    indexer.create_index.return_value = "myidx-tsv-3"
+    indexer.index_chunks.side_effect = fake_index_chunks
+    indexer.rotate_alias_to_latest.return_value = AliasResult(index_name=["myidx-tsv-3"], alias_name="myalias")
+    indexer.alias_name = "myalias"
+    indexer.prefix_name = "myidx"
+    service._get_resource_dir_path = lambda source, date: str(tmp_path / f"{source}/day_{date}")
+    return captured
+
+
+def test_run_pipeline_streams_documents_to_indexer(tmp_path: Path, service: IndexService, ports):
+    """
+    파이프라인 모드: fetch -> parse -> transform_iter -> index_chunks 가 중간 파일 없이 이어지는지.
+    """
+    listener, fetcher, parser, transformer, indexer = ports
+    captured = _prepare_pipeline(service, ports, tmp_path)
+
+    result = service.run_pipeline(source="tsv", date="3", collection=Collection.qna)
+
+    # 문서 순서대로 색인되었는지
+    assert captured["index_name"] == "myidx-tsv-3"
+    assert captured["ids"] == ["tsv_qna", "tsv_qna2"]
+    assert parser.parse.call_count == 2
+    indexer.rotate_alias_to_latest.assert_called_once_with("myalias", "myidx", delete_old=False)
+    # 파일 기반 단계는 사용하지 않음
+    transformer.read_parsed_document.assert_not_called()
+    indexer.index.assert_not_called()
+    assert not (tmp_path / "tsv").exists()
+
+    assert result["indexed"] == 2
+    assert result["index_name"] == ["myidx-tsv-3"]
+
+
+def test_run_pipeline_save_intermediate_writes_files(tmp_path: Path, service: IndexService, ports):
+    """
+    save_intermediate=True 이면 parsed/normalized 중간 파일도 함께 기록되는지.
+    """
+    _prepare_pipeline(service, ports, tmp_path)
+
+    service.run_pipeline(source="tsv", date="3", collection=Collection.qna, save_intermediate=True)
+
+    out_dir = tmp_path / "tsv" / "day_3"
+    parsed = data_lines(out_dir / "qna_3_parsed.json")
+    normalized = data_lines(out_dir / "qna_3_normalized.json")
+    assert len(parsed) == 2
+    assert [json.loads(l)["source_id"] for l in normalized] == ["tsv_qna", "tsv_qna2"]
+
+
+def test_run_pipeline_propagates_parse_error(tmp_path: Path, service: IndexService, ports):
+    """
+    백그라운드 단계에서 발생한 예외가 호출자에게 그대로 전파되는지.
+    """
+    listener, fetcher, parser, transformer, indexer = ports
+    _prepare_pipeline(service, ports, tmp_path)
+    parser.parse.side_effect = ValueError("broken html")
+
+    with pytest.raises(ValueError):
+        service.run_pipeline(source="tsv", date="3", collection=Collection.qna)
+    indexer.rotate_alias_to_latest.assert_not_called()
+
+
+class RecordingProgress:
+    """단계별 건수를 기록하고, cancel_after 건을 넘기면 취소를 알리는 ProgressPort"""
+    def __init__(self, cancel_after: int | None = None):
+        self.counts = {}
+        self.cancel_after = cancel_after
+
+    def add(self, stage, n=1):
+        self.counts[stage] = self.counts.get(stage, 0) + n
+
+    def cancelled(self):
+        return self.cancel_after is not None and self.counts.get("parsed", 0) >= self.cancel_after
+
+
+def test_run_pipeline_reports_progress(tmp_path: Path, service: IndexService, ports):
+    """
+    파이프라인 모드에서 단계별 진행 건수(listed/parsed/transformed/indexed/failed)를 보고하는지.
+    """
+    _prepare_pipeline(service, ports, tmp_path)
+    progress = RecordingProgress()
+
+    service.run_pipeline(source="tsv", date="3", collection=Collection.qna, progress=progress)
+
+    assert progress.counts == {"listed": 2, "parsed": 2, "transformed": 2, "indexed": 2, "failed": 0}
+
+
+def test_run_pipeline_stops_when_cancelled(tmp_path: Path, service: IndexService, ports):
+    """
+    취소가 요청되면 다음 문서에서 멈추고 alias는 회전하지 않는다.
+    """
+    from api_server.app.platform.exceptions import JobCancelled
+
+    listener, fetcher, parser, transformer, indexer = ports
+    _prepare_pipeline(service, ports, tmp_path)
+
+    with pytest.raises(JobCancelled):
+        service.run_pipeline(
+            source="tsv", date="3", collection=Collection.qna, progress=RecordingProgress(cancel_after=1))
+    assert parser.parse.call_count == 1
+    indexer.rotate_alias_to_latest.assert_not_called()
+    # 대량 적재 설정이 남은 새 인덱스는 남기지 않는다
+    indexer.finalize_index.assert_not_called()
+    indexer.discard_index.assert_called_once_with("myidx-tsv-3")
+
+
+def test_extract_with_process_pool_keeps_file_order(tmp_path: Path):
+    """
+    parse_workers > 1 이면 프로세스 풀에서 파싱하되, 결과 순서는 파일 목록 순서와 같아야 한다.
+    (워커 프로세스로 전달되어야 하므로 목 객체 대신 실제 FileFetcher/WikiParser 사용)
+    """
+    from api_server.app.adapters.fetchers.file_fetcher import FileFetcher
+    from api_server.app.adapters.parsers.wiki_parser import WikiParser
+
+    titles = [f"문서{i}" for i in range(5)]
+    files = []
+    for t in titles:
+        p = tmp_path / "html" / "day_1" / f"{t}.html"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(f"<html><body><h1>{t}</h1><p>{t} 본문</p></body></html>", encoding="utf-8")
+        files.append(str(p))
+
+    listener = MagicMock()
+    listener.listen.return_value = files
+    service = IndexService(
+        listener=listener,
+        fetcher=FileFetcher(),
+        parser=WikiParser(),
+        transformer=MagicMock(),
+        indexer=MagicMock(),
+        parse_workers=2,
+        parse_chunksize=2,
+    )
+    service._get_resource_dir_path = lambda source, date: str(tmp_path / f"{source}/day_{date}")
+
+    out_name = service.extract(source="html", date="1", collection=Collection.wiki)
+
+    lines = data_lines(tmp_path / "html" / "day_1" / out_name)
+    assert [json.loads(l)["title"] for l in lines] == titles
+
+
+def _write_normalized(out_dir: Path, date: str, chunks) -> Path:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"qna_{date}_normalized.json"
+    path.write_text(
+        "".join(json.dumps(c.model_dump(mode="json"), ensure_ascii=False) + "\n" for c in chunks),
+        encoding="utf-8")
+    return path
+
+
+def test_index_delta_clones_previous_index_and_applies_changes(tmp_path: Path, service: IndexService, ports):
+    """
+    mode=delta: 이전 날짜 인덱스를 clone하고, 이전 normalized 파일 대비 변경분만 apply_delta로 보내는지.
+    """
+    listener, fetcher, parser, transformer, indexer = ports
+    service._get_resource_dir_path = lambda source, date: str(tmp_path / f"{source}/day_{date}")
+    _write_normalized(tmp_path / "tsv" / "day_2", "2", [make_chunk("tsv_1"), make_chunk("tsv_2")])
+    changed = make_chunk("tsv_2").model_copy(update={"answer": "바뀐 답변"})
+    _write_normalized(tmp_path / "tsv" / "day_3", "3", [make_chunk("tsv_1"), changed, make_chunk("tsv_3")])
+
+    captured = {}
+
+    def fake_apply_delta(index_name, upserts, deletes):
+        captured["upserts"] = [c.source_id for c in upserts]
+        captured["deletes"] = list(deletes)
+        return IndexResult(indexed=len(captured["upserts"]), deleted=len(captured["deletes"]), errors=[])
+
+    indexer.clone_index.return_value = "myidx-tsv-3"
+    indexer.apply_delta.side_effect = fake_apply_delta
+    indexer.rotate_alias_to_latest.return_value = AliasResult(index_name=["myidx-tsv-3"], alias_name="myalias")
+    indexer.alias_name = "myalias"
+    indexer.prefix_name = "myidx"
+
+    result = service.index(source="tsv", date="3", collection=Collection.qna, mode="delta")
+
+    indexer.clone_index.assert_called_once_with("tsv", "2", "3")
+    indexer.create_index.assert_not_called()
+    indexer.index.assert_not_called()
+    assert captured == {"upserts": ["tsv_2", "tsv_3"], "deletes": []}
+    assert result["mode"] == "delta"
+    assert result["base_date"] == "2"
+    assert (result["added"], result["changed"], result["unchanged"]) == (1, 1, 1)
+
+
+def test_index_delta_falls_back_to_full_without_base(tmp_path: Path, service: IndexService, ports):
+    """
+    mode=delta 여도 이전 날짜 normalized 파일이나 인덱스가 없으면 전체 색인으로 대체하는지.
+    """
+    listener, fetcher, parser, transformer, indexer = ports
+    service._get_resource_dir_path = lambda source, date: str(tmp_path / f"{source}/day_{date}")
+    _write_normalized(tmp_path / "tsv" / "day_3", "3", [make_chunk("tsv_1")])
+    indexer.create_index.return_value = "myidx-tsv-3"
+    indexer.index.return_value = IndexResult(indexed=1, errors=[])
+    indexer.rotate_alias_to_latest.return_value = AliasResult(index_name=["myidx-tsv-3"], alias_name="myalias")
+
+    # 이전 날짜 파일 없음
+    result = service.index(source="tsv", date="3", collection=Collection.qna, mode="delta")
+    indexer.clone_index.assert_not_called()
+    assert result["indexed"] == 1
+    assert "mode" not in result
+
+    # 이전 날짜 파일은 있지만 인덱스가 없음
+    _write_normalized(tmp_path / "tsv" / "day_2", "2", [make_chunk("tsv_1")])
+    indexer.clone_index.return_value = None
+    service.index(source="tsv", date="3", collection=Collection.qna, mode="delta")
+    indexer.clone_index.assert_called_once_with("tsv", "2", "3")
+    indexer.apply_delta.assert_not_called()
+    assert indexer.index.call_count == 2
+
+
+def test_artifact_format_writes_compressed_and_reads_previous_format(tmp_path: Path, ports):
+    """
+    artifact_format=jsonl.gz 이면 normalized 산출물을 .json.gz로 기록해 색인에 넘기고,
+    이전 날짜 비교 기준은 기존 형식(.json) 파일도 찾아 읽는지.
+    """
+    listener, fetcher, parser, transformer, indexer = ports
+    service = IndexService(
+        listener=listener, fetcher=fetcher, parser=parser, transformer=transformer, indexer=indexer,
+        artifact_format="jsonl.gz")
+    service._get_resource_dir_path = lambda source, date: str(tmp_path / f"{source}/day_{date}")
+    transformer.iter_parsed_document.return_value = iter([])
+    transformer.transform_iter.return_value = iter([make_chunk("tsv_1"), make_chunk("tsv_2")])
+
+    out_name = service.transform(source="tsv", date="3", collection=Collection.qna)
+
+    assert out_name == "qna_3_normalized.json.gz"
+    transformer.iter_parsed_document.assert_called_once_with(
+        str(tmp_path / "tsv" / "day_3" / "qna_3_parsed.json.gz"))
+    out_path = str(tmp_path / "tsv" / "day_3" / out_name)
+    assert [c.source_id for c in service._iter_normalized_file(out_path)] == ["tsv_1", "tsv_2"]
+
+    _write_normalized(tmp_path / "tsv" / "day_2", "2", [make_chunk("tsv_1")])
+    indexer.clone_index.return_value = "myidx-tsv-3"
+    indexer.apply_delta.side_effect = lambda index_name, upserts, deletes: IndexResult(
+        indexed=len(list(upserts)), deleted=len(list(deletes)), errors=[])
+    indexer.rotate_alias_to_latest.return_value = AliasResult(index_name=["myidx-tsv-3"], alias_name="myalias")
+
+    result = service.index(source="tsv", date="3", collection=Collection.qna, mode="delta")
+
+    assert result["mode"] == "delta"
+    assert (result["added"], result["unchanged"]) == (1, 1)
+
+
+def test_run_pipeline_uses_columnar_path_for_full_mode(tmp_path: Path, ports):
+    """
+    열 단위 변환이 설정되면 full 파이프라인은 파싱/청크 객체 없이 레코드를 index_records로 적재하고,
+    중간 산출물 저장/delta 요청은 행 단위 경로를 사용하는지.
+    """
+    listener, fetcher, parser, transformer, indexer = ports
+    columnar = MagicMock()
+    columnar.iter_records.side_effect = lambda resource_file, collection: iter(
+        [{"source_id": f"{Path(resource_file).stem}_{i}", "published": True} for i in range(2)])
+    service = IndexService(
+        listener=listener, fetcher=fetcher, parser=parser, transformer=transformer, indexer=indexer,
+        columnar=columnar)
+    captured = _prepare_pipeline(service, ports, tmp_path)
+
+    def fake_index_records(index_name, records):
+        captured["records"] = [r["source_id"] for r in records]
+        return IndexResult(indexed=len(captured["records"]), errors=[])
+
+    indexer.index_records.side_effect = fake_index_records
+
+    result = service.run_pipeline(source="tsv", date="3", collection=Collection.qna)
+
+    assert captured["records"] == ["qna_0", "qna_1", "qna2_0", "qna2_1"]
+    assert result["indexed"] == 4
+    fetcher.fetch.assert_not_called()
+    indexer.index_chunks.assert_not_called()
+    indexer.finalize_index.assert_called_once_with("myidx-tsv-3")
+
+    service.run_pipeline(source="tsv", date="3", collection=Collection.qna, save_intermediate=True)
+
+    assert columnar.iter_records.call_count == 2
+    assert captured["ids"] == ["tsv_qna", "tsv_qna2"]
+
+
+def test_failed_load_discards_new_index_without_rotation(tmp_path: Path, service: IndexService, ports):
+    """
+    적재 중 예외(bulk 실패 등)가 나면 finalize/alias 회전 없이 새 인덱스를 정리(discard_index)하고 예외를 전파한다.
+    """
+    from api_server.app.platform.exceptions import IndexingFailed
+
+    listener, fetcher, parser, transformer, indexer = ports
+    _prepare_pipeline(service, ports, tmp_path)
+    indexer.index_chunks.side_effect = IndexingFailed("myidx-tsv-3", "connection error")
+
+    with pytest.raises(IndexingFailed):
+        service.run_pipeline(source="tsv", date="3", collection=Collection.qna)
+
+    indexer.discard_index.assert_called_once_with("myidx-tsv-3")
+    indexer.finalize_index.assert_not_called()
+    indexer.rotate_alias_to_latest.assert_not_called()
+
+
+def test_index_cancelled_after_load_discards_new_index(tmp_path: Path, service: IndexService, ports):
+    """
+    적재를 마친 뒤(finalize 전) 취소가 확인되면 새 인덱스를 정리하고 alias는 회전하지 않는다.
+    """
+    from api_server.app.platform.exceptions import JobCancelled
+
+    listener, fetcher, parser, transformer, indexer = ports
+    service._get_resource_dir_path = lambda source, date: str(tmp_path / f"{source}/day_{date}")
+    _write_normalized(tmp_path / "tsv" / "day_3", "3", [make_chunk("tsv_1")])
+    indexer.create_index.return_value = "myidx-tsv-3"
+    progress = RecordingProgress()
+
+    def cancel_during_load(index_name, path):
+        progress.cancel_after = 0
+        return IndexResult(indexed=1, errors=[])
+
+    indexer.index.side_effect = cancel_during_load
+
+    with pytest.raises(JobCancelled):
+        service.index(source="tsv", date="3", collection=Collection.qna, progress=progress)
+
+    indexer.discard_index.assert_called_once_with("myidx-tsv-3")
+    indexer.finalize_index.assert_not_called()
+    indexer.rotate_alias_to_latest.assert_not_called()
@@ -0,0 +1,266 @@
+import time
+import pytest
+
+from api_server.app.adapters.queues.memory_job_queue import MemoryJobQueue
+from api_server.app.domain.models import JobStatus
+from api_server.app.domain.progress import check_cancelled
+from api_server.app.domain.services.job_service import JobService
+from api_server.app.platform.exceptions import InvalidInput, ResourceNotFound
+
+
+def index_handler(params, progress):
+    progress.add("listed", 2)
+    progress.add("indexed", 2)
+    return {"html": {"indexed": 2, "date": params["date"]}}
+
+
+@pytest.fixture
+def queue():
+    return MemoryJobQueue()
+
+
+def test_submit_then_run_records_result_and_progress(queue):
+    svc = JobService(queue, {"index": index_handler})
+
+    job = svc.submit("index", {"source": "html", "date": "3"})
+    assert job.status == JobStatus.queued
+
+    svc.run_next()
+
+    done = svc.get(job.job_id)
+    assert done.status == JobStatus.succeeded
+    assert done.result == {"html": {"indexed": 2, "date": "3"}}
+    assert done.progress.listed == 2 and done.progress.indexed == 2
+    assert done.started_at is not None and done.finished_at is not None
+
+
+def test_handler_error_marks_job_failed(queue):
+    def broken(params, progress):
+        raise ValueError("opensearch down")
+
+    svc = JobService(queue, {"index": broken})
+    job = svc.submit("index", {"date": "3"})
+    svc.run_next()
+
+    failed = svc.get(job.job_id)
+    assert failed.status == JobStatus.failed
+    assert "opensearch down" in failed.error
+
+
+def test_cancel_queued_job_is_never_run(queue):
+    calls = []
+    svc = JobService(queue, {"index": lambda params, progress: calls.append(1)})
+
+    job = svc.submit("index", {"date": "3"})
+    assert svc.cancel(job.job_id).status == JobStatus.cancelled
+
+    assert svc.run_next() is None
+    assert calls == []
+    assert svc.get(job.job_id).status == JobStatus.cancelled
+
+
+class RacingQueue(MemoryJobQueue):
+    """조회 직후 한 번 다른 쪽(워커/취소 요청)이 끼어드는 대기열"""
+    def __init__(self):
+        super().__init__()
+        self.after_get = None
+
+    def get(self, job_id):
+        job = super().get(job_id)
+        hook, self.after_get = self.after_get, None
+        if hook:
+            hook()
+        return job
+
+
+def test_cancel_does_not_overwrite_job_started_after_read():
+    """
+    취소가 queued 작업을 읽은 직후 워커가 실행을 시작하면 running을 cancelled로 덮어쓰지 않는다(취소 요청만 남김).
+    """
+    queue = RacingQueue()
+    svc = JobService(queue, {"index": index_handler})
+    job = svc.submit("index", {"date": "3"})
+    queue.after_get = lambda: queue.transition(job.job_id, JobStatus.queued, {"status": JobStatus.running})
+
+    assert svc.cancel(job.job_id).status == JobStatus.running
+    assert queue.get(job.job_id).status == JobStatus.running
+    assert queue.cancel_requested(job.job_id)
+
+
+def test_job_cancelled_after_dequeue_is_not_run():
+    """
+    워커가 queued 작업을 읽은 직후 취소되면 running으로 덮어쓰지 않고 실행하지 않는다.
+    """
+    calls = []
+    queue = RacingQueue()
+    svc = JobService(queue, {"index": lambda params, progress: calls.append(1)})
+    job = svc.submit("index", {"date": "3"})
+    queue.after_get = lambda: svc.cancel(job.job_id)
+
+    assert svc.run_next() is None
+    assert calls == []
+    assert svc.get(job.job_id).status == JobStatus.cancelled
+
+
+def test_cancel_running_job_stops_at_next_check(queue):
+    """
+    실행 중 취소가 요청되면 핸들러가 다음 취소 확인 지점에서 멈추고 cancelled로 끝난다.
+    """
+    svc = JobService(queue, {})
+
+    def long_running(params, progress):
+        svc.cancel(params["job_id"])
+        check_cancelled(progress)
+        return "not reached"
+
+    svc._handlers["index"] = long_running
+    job = svc.submit("index", {})
+    queue.save(job.model_copy(update={"params": {"job_id": job.job_id}}))
+
+    svc.run_next()
+
+    cancelled = svc.get(job.job_id)
+    assert cancelled.status == JobStatus.cancelled
+    assert cancelled.result is None
+
+
+def test_unknown_kind_and_job_id(queue):
+    svc = JobService(queue, {"index": index_handler})
+    with pytest.raises(InvalidInput):
+        svc.submit("reindex", {})
+    with pytest.raises(ResourceNotFound):
+        svc.get("missing")
+
+
+def test_worker_threads_process_submitted_jobs(queue):
+    svc = JobService(queue, {"index": index_handler}, workers=2, poll_interval=0.05)
+    svc.start()
+    try:
+        job = svc.submit("index", {"date": "1"})
+        deadline = time.monotonic() + 5
+        while svc.get(job.job_id).status != JobStatus.succeeded and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        svc.stop(timeout=1)
+
+    assert svc.get(job.job_id).status == JobStatus.succeeded
+
+
+class StaleQueue(MemoryJobQueue):
+    """reclaim_stale로 지정한 작업 id를 돌려주는 대기열(다른 워커가 죽은 상황)"""
+    def __init__(self):
+        super().__init__()
+        self.stale = []
+        self.acked = []
+
+    def reclaim_stale(self):
+        stale, self.stale = self.stale, []
+        return stale
+
+    def ack(self, job_id):
+        self.acked.append(job_id)
+
+
+def test_reclaimed_job_is_requeued_until_max_attempts():
+    """
+    임대가 끝난 running 작업은 다시 대기열에 넣어 실행하고, 시도 횟수가 max_attempts에 이르면 failed로 끝낸다.
+    """
+    queue = StaleQueue()
+    svc = JobService(queue, {"index": index_handler}, max_attempts=2)
+    job = svc.submit("index", {"date": "3"})
+    queue.dequeue(0)
+    queue.save(job.model_copy(update={"status": JobStatus.running, "worker": "dead:1", "attempts": 1}))
+
+    queue.stale = [job.job_id]
+    assert svc.reclaim_stale_jobs() == [job.job_id]
+    done = svc.run_next()
+    assert done.status == JobStatus.succeeded
+    assert done.attempts == 2 and done.worker != "dead:1"
+    assert queue.acked == [job.job_id]
+
+    queue.save(done.model_copy(update={"status": JobStatus.running}))
+    queue.stale = [job.job_id]
+    assert svc.reclaim_stale_jobs() == []
+    failed = svc.get(job.job_id)
+    assert failed.status == JobStatus.failed
+    assert "worker lost" in failed.error
+
+
+def test_running_job_heartbeats_until_finished():
+    beats = []
+    queue = MemoryJobQueue()
+    queue.heartbeat = beats.append
+    svc = JobService(queue, {"index": lambda params, progress: time.sleep(0.1)}, heartbeat_interval=0.02)
+    job = svc.submit("index", {})
+
+    svc.run_next()
+    count = len(beats)
+    time.sleep(0.05)
+
+    assert count >= 2 and set(beats) == {job.job_id}
+    assert len(beats) == count
+
+
+class Slots:
+    """한 자리만 있는 라우트 자리(색인 라우트가 먼저 차지한 상황을 흉내)"""
+    def __init__(self, busy_tries=0):
+        self.busy_tries = busy_tries
+        self.held = []
+        self.released = []
+
+    def acquire(self, kind):
+        if self.busy_tries > 0:
+            self.busy_tries -= 1
+            return False
+        self.held.append(kind)
+        return True
+
+    def release(self, kind):
+        self.released.append(kind)
+
+
+def test_job_waits_for_ingest_slot_and_releases_it():
+    """
+    자리가 없으면 꺼낸 작업의 임대를 연장하며 기다렸다가, 자리를 얻으면 실행하고 돌려준다.
+    """
+    beats = []
+    queue = MemoryJobQueue()
+    queue.heartbeat = beats.append
+    slots = Slots(busy_tries=2)
+    svc = JobService(
+        queue, {"index": index_handler}, poll_interval=0.01, acquire_slot=slots.acquire, release_slot=slots.release)
+    job = svc.submit("index", {"date": "3"})
+
+    done = svc.run_next()
+
+    assert done.status == JobStatus.succeeded
+    assert beats == [job.job_id, job.job_id]
+    assert slots.held == ["index"] and slots.released == ["index"]
+
+
+def test_job_cancelled_while_waiting_for_slot_is_not_run():
+    calls = []
+    queue = StaleQueue()
+    svc = JobService(
+        queue, {"index": lambda params, progress: calls.append(1)},
+        poll_interval=0.01, acquire_slot=lambda kind: False, release_slot=lambda kind: None)
+    job = svc.submit("index", {})
+    queue.request_cancel(job.job_id)
+
+    assert svc.run_next() is None
+    assert calls == []
+    assert svc.get(job.job_id).status == JobStatus.cancelled
+    assert queue.acked == [job.job_id]
+
+
+def test_stopping_worker_returns_waiting_job_to_queue():
+    queue = MemoryJobQueue()
+    svc = JobService(
+        queue, {"index": index_handler},
+        poll_interval=0.01, acquire_slot=lambda kind: False, release_slot=lambda kind: None)
+    job = svc.submit("index", {})
+    svc.stop()
+
+    assert svc.run_next() is None
+    assert svc.get(job.job_id).status == JobStatus.queued
+    assert queue.dequeue(0) == job.job_id
@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from api_server.app.domain.services.search_service import SearchService
+from api_server.app.domain.models import SearchOptions
 
 
 @pytest.fixture
@@ -27,7 +28,7 @@ def test_search_calls_searcher_with_defaults(service, mock_searcher):
 
     # then
     assert res == {"hits": {"total": {"value": 0}, "hits": []}}
-    mock_searcher.search.assert_called_once_with("카카오뱅크", 3, False)
+    mock_searcher.search.assert_called_once_with("카카오뱅크", 3, False, None)
 
 
 def test_search_overrides_params(service, mock_searcher):
@@ -44,7 +45,7 @@ def test_search_overrides_params(service, mock_searcher):
     # then
     assert res["hits"]["total"]["value"] == 2
     assert len(res["hits"]["hits"]) == 2
-    mock_searcher.search.assert_called_once_with("삼성전자", 10, True)
+    mock_searcher.search.assert_called_once_with("삼성전자", 10, True, None)
 
 
 def test_search_propagates_exception(service, mock_searcher):
@@ -60,3 +61,89 @@ def test_search_propagates_exception(service, mock_searcher):
         _ = service.search("네이버", size=5)
 
     assert "opensearch down" in str(ei.value)
+
+
+def test_search_batch_keeps_failed_queries_as_error_items(service, mock_searcher):
+    """
+    일부 쿼리가 실패해도 배치 전체는 실패하지 않고, 실패한 쿼리만 error 항목으로 반환하는지
+    """
+    mock_searcher.search_batch.return_value = [
+        {"took": 4, "hits": {"hits": []}},
+        {"status": 400, "error": {"type": "search_phase_execution_exception"}},
+    ]
+
+    res = service.search_batch(["카카오뱅크", "삼성전자"], size=2)
+
+    mock_searcher.search_batch.assert_called_once_with(["카카오뱅크", "삼성전자"], 2, False, None)
+    assert res["took_ms"] >= 0
+    assert res["items"][0] == {"query": "카카오뱅크", "took_ms": 4, "result": {"took": 4, "hits": {"hits": []}}}
+    assert res["items"][1]["status"] == 400
+    assert "result" not in res["items"][1]
+
+
+def test_search_compact_flattens_hits_with_highlights(service, mock_searcher):
+    """
+    compact=True면 {total, took_ms, items}로 줄이고, _source 필드/하이라이트 조각을 항목에 싣는다.
+    """
+    options = SearchOptions()
+    mock_searcher.search.return_value = {
+        "took": 5,
+        "hits": {
+            "total": {"value": 2, "relation": "eq"},
+            "hits": [
+                {"_id": "wiki_1", "_score": 12.5, "_source": {"title": "지구"},
+                 "highlight": {"body": ["<em>지구</em>의 평균 반경"]}},
+                {"_id": "qna_1", "_score": 9.0, "_source": {"question": "Q", "answer": "A"}},
+            ],
+        },
+    }
+
+    res = service.search("지구", options=options, compact=True)
+
+    mock_searcher.search.assert_called_once_with("지구", 3, False, options)
+    assert res == {
+        "total": 2,
+        "took_ms": 5,
+        "items": [
+            {"id": "wiki_1", "score": 12.5, "title": "지구", "highlights": {"body": ["<em>지구</em>의 평균 반경"]}},
+            {"id": "qna_1", "score": 9.0, "question": "Q", "answer": "A"},
+        ],
+    }
+
+
+def test_concurrent_identical_searches_are_coalesced():
+    """
+    같은 조건의 동시 검색은 검색기를 한 번만 호출하고 결과를 나눠 받는다(다른 조건은 따로 검색).
+    """
+    import asyncio
+    from unittest.mock import AsyncMock
+    from api_server.app.domain.services.search_service import AsyncSearchService
+
+    async def slow_search(query, size, explain, options):
+        await asyncio.sleep(0.01)
+        return {"hits": {"total": {"value": 1}, "hits": [{"_id": query, "_score": 1.0, "_source": {}}]}}
+
+    searcher = MagicMock()
+    searcher.search = AsyncMock(side_effect=slow_search)
+    service = AsyncSearchService(searcher)
+
+    async def run():
+        return await asyncio.gather(
+            *[service.search("카카오뱅크", compact=True) for _ in range(5)],
+            service.search("카카오뱅크", size=5),
+        )
+
+    results = asyncio.run(run())
+
+    assert searcher.search.await_count == 2
+    assert all(r["items"][0]["id"] == "카카오뱅크" for r in results[:5])
+    assert service.coalescing_stats() == {"leaders": 2, "coalesced": 4, "in_flight": 0}
+
+
+def test_coalescing_can_be_disabled(mock_searcher):
+    mock_searcher.search.return_value = {"hits": {"hits": []}}
+    service = SearchService(mock_searcher, coalesce=False)
+
+    service.search("카카오뱅크")
+
+    assert service.coalescing_stats()["leaders"] == 0
@@ -0,0 +1,137 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from api_server.app.domain import artifacts
+from api_server.app.domain.models import NormalizedChunk, ParsedDocument, ParsedBlock, SourceRef, FileType, Collection
+
+
+def make_chunk(i: int, published: bool = True) -> NormalizedChunk:
+    return NormalizedChunk(
+        source_id=f"qna_{i}",
+        source_path=f"/data/day_1/qna_{i}.tsv",
+        file_type="tsv",
+        collection="qna",
+        question=f"질문 {i}",
+        answer=None,
+        features={"length": float(i)} if i % 2 else None,
+        body_embedding=[0.1, 0.2] if i % 2 else None,
+        created_date=datetime(2025, 9, 1, 12, 0, 0),
+        updated_date=datetime(2025, 9, 2, 12, 0, 0),
+        published=published,
+    )
+
+
+def write_chunks(path: str, chunks) -> None:
+    with artifacts.open_writer(path, NormalizedChunk) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+
+@pytest.mark.parametrize("extension", [".json", ".json.gz"])
+def test_jsonl_artifacts_round_trip(tmp_path: Path, extension: str):
+    """
+    JSONL/gzip JSONL로 기록한 청크를 확장자로 판별해 그대로 읽는다.
+    """
+    path = str(tmp_path / f"qna_1_normalized{extension}")
+    chunks = [make_chunk(i) for i in range(3)]
+
+    write_chunks(path, chunks)
+
+    assert list(artifacts.iter_models(path, NormalizedChunk)) == chunks
+    # 순번은 파일 줄 번호(1번 줄은 산출물 헤더)
+    assert [seq for seq, _ in artifacts.iter_records(path)] == [2, 3, 4]
+
+
+def test_jsonl_artifact_keeps_non_ascii_text(tmp_path: Path):
+    path = tmp_path / "qna_1_normalized.json"
+
+    write_chunks(str(path), [make_chunk(1)])
+
+    assert "질문 1" in path.read_text(encoding="utf-8")
+
+
+def test_zstd_artifact_round_trip(tmp_path: Path):
+    pytest.importorskip("zstandard")
+    path = str(tmp_path / "qna_1_normalized.json.zst")
+    chunks = [make_chunk(i) for i in range(3)]
+
+    write_chunks(path, chunks)
+
+    assert list(artifacts.iter_models(path, NormalizedChunk)) == chunks
+
+
+def test_parquet_artifact_round_trip(tmp_path: Path, monkeypatch):
+    """
+    parquet는 행 그룹 단위로 기록/읽기하며, 맵/리스트/None 필드와 순번을 보존한다.
+    """
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(artifacts, "PARQUET_ROW_GROUP_SIZE", 2)
+    path = str(tmp_path / "qna_1_normalized.parquet")
+    chunks = [make_chunk(i, published=i != 3) for i in range(5)]
+
+    write_chunks(path, chunks)
+
+    assert list(artifacts.iter_models(path, NormalizedChunk)) == chunks
+    records = list(artifacts.iter_records(path))
+    assert [seq for seq, _ in records] == [1, 2, 3, 4, 5]
+    assert records[1][1]["features"] == {"length": 1.0}
+    assert records[3][1]["published"] is False
+
+
+def test_parquet_rejects_nested_models(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    with pytest.raises(ValueError):
+        with artifacts.open_writer(str(tmp_path / "qna_1_parsed.parquet"), ParsedDocument):
+            pass
+
+
+def test_artifact_extension_keeps_nested_models_as_jsonl():
+    assert artifacts.artifact_extension("parquet") == ".parquet"
+    assert artifacts.artifact_extension("parquet", columnar=False) == ".json"
+    assert artifacts.artifact_extension("jsonl.zst", columnar=False) == ".json.zst"
+    with pytest.raises(ValueError):
+        artifacts.artifact_extension("csv")
+
+
+def test_find_artifact_falls_back_to_other_formats(tmp_path: Path):
+    """
+    설정된 형식의 파일이 없으면 이전 형식으로 기록된 파일을 찾는다.
+    """
+    stem = str(tmp_path / "qna_1_normalized")
+    assert artifacts.find_artifact(stem, ".parquet") == stem + ".parquet"
+
+    write_chunks(stem + ".json.gz", [make_chunk(1)])
+
+    assert artifacts.find_artifact(stem, ".parquet") == stem + ".json.gz"
+    assert artifacts.find_artifact(stem, ".json.gz") == stem + ".json.gz"
+
+
+@pytest.mark.parametrize("extension", [".json", ".parquet"])
+def test_written_artifacts_are_trusted_for_their_model(tmp_path: Path, extension: str):
+    """
+    기록한 산출물은 같은 모델에 대해서만 신뢰 산출물로 판별된다.
+    """
+    if extension == ".parquet":
+        pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"qna_1_normalized{extension}")
+    write_chunks(path, [make_chunk(1)])
+
+    assert artifacts.is_trusted(path, NormalizedChunk)
+    assert not artifacts.is_trusted(path, ParsedDocument)
+
+
+def test_external_or_outdated_files_are_not_trusted(tmp_path: Path, monkeypatch):
+    """
+    헤더가 없는 파일(외부 입력/이전 형식)이나 스키마 버전이 다른 파일은 신뢰하지 않는다.
+    """
+    external = tmp_path / "external.json"
+    external.write_text(make_chunk(1).model_dump_json() + "\n", encoding="utf-8")
+    assert artifacts.read_header(str(external)) is None
+    assert not artifacts.is_trusted(str(external), NormalizedChunk)
+
+    path = str(tmp_path / "qna_1_normalized.json")
+    write_chunks(path, [make_chunk(1)])
+    monkeypatch.setattr(artifacts, "schema_version", lambda model: "changed")
+    assert not artifacts.is_trusted(path, NormalizedChunk)
@@ -0,0 +1,120 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from api_server.app.domain.delta import (
+    ChunkDelta, chunk_fingerprint, load_fingerprints, load_record_fingerprints, record_fingerprint, record_fingerprinter
+)
+from api_server.app.adapters.fetchers.file_fetcher import FileFetcher
+from api_server.app.adapters.parsers.qna_parser import QnaParser
+from api_server.app.adapters.transformers.qna_transformer import QnaTransformer
+from api_server.app.domain.models import Collection, NormalizedChunk
+
+
+def make_chunk(source_id: str, answer: str = "A", published: bool = True, day: int = 1) -> NormalizedChunk:
+    now = datetime(2024, 1, day, tzinfo=timezone.utc)
+    return NormalizedChunk(
+        source_id=source_id,
+        source_path=f"file:///data/day_{day}/qna.tsv",
+        file_type="tsv",
+        collection="qna",
+        question="Q",
+        answer=answer,
+        created_date=now,
+        updated_date=now,
+        published=published,
+    )
+
+
+def test_fingerprint_ignores_created_and_updated_date():
+    """
+    변환 시각/날짜 디렉터리가 들어가는 created_date, updated_date, source_path는 지문에 영향을 주지 않는다.
+    """
+    a = make_chunk("tsv_1", day=1)
+    b = make_chunk("tsv_1", day=2)
+    assert chunk_fingerprint(a) == chunk_fingerprint(b)
+    assert chunk_fingerprint(a) != chunk_fingerprint(a.model_copy(update={"answer": "B"}))
+
+
+def test_delta_classifies_added_changed_unchanged_and_deleted():
+    """
+    이전 대비 추가/변경 청크만 upsert, 사라지거나 비공개로 바뀐 청크는 delete 대상이 된다.
+    """
+    previous = [
+        make_chunk("tsv_1"),
+        make_chunk("tsv_2"),
+        make_chunk("tsv_3"),
+        make_chunk("tsv_4"),
+        make_chunk("tsv_9", published=False),
+    ]
+    fingerprints = load_fingerprints(previous)
+    assert set(fingerprints) == {"tsv_1", "tsv_2", "tsv_3", "tsv_4"}
+
+    current = [
+        make_chunk("tsv_1", day=2),                     # 그대로
+        make_chunk("tsv_2", answer="바뀐 답변", day=2),   # 변경
+        make_chunk("tsv_3", published=False, day=2),    # 비공개 전환
+        make_chunk("tsv_5", day=2),                     # 추가
+    ]
+    delta = ChunkDelta(fingerprints)
+
+    upserts = [c.source_id for c in delta.upserts(current)]
+    deletes = list(delta.deletes())
+
+    assert upserts == ["tsv_2", "tsv_5"]
+    assert sorted(deletes) == ["tsv_3", "tsv_4"]
+    assert delta.summary() == {"added": 1, "changed": 1, "unchanged": 1}
+
+
+def test_record_fingerprints_match_model_fingerprints():
+    """
+    신뢰 산출물 레코드(dict)에서 읽은 지문이 모델로 읽은 지문과 같다(content_hash가 없어도).
+    """
+    hashed = make_chunk("tsv_1").model_copy(update={"content_hash": "h-1"})
+    chunks = [hashed, make_chunk("tsv_2"), make_chunk("tsv_3", published=False)]
+    records = [c.model_dump(mode="json") for c in chunks]
+
+    assert load_record_fingerprints(records) == load_fingerprints(chunks)
+    assert load_record_fingerprints(records)["tsv_1"] == "h-1"
+
+
+def test_record_fingerprinter_matches_record_fingerprint():
+    """
+    고정 필드를 미리 인코딩한 지문 함수도 record_fingerprint와 같은 값을 낸다(특수문자/None/bool 포함).
+    """
+    template = make_chunk("qna_0").model_dump(mode="json")
+    template["source_path"] = "/data/100%/qna.tsv"
+    fingerprint = record_fingerprinter(template, ["source_id", "question", "answer", "published"])
+
+    for values in [("qna_1", "질문 \"1\"\n", None, True), ("qna_2", None, "50% \\ \t", False)]:
+        record = {**template, **dict(zip(["source_id", "question", "answer", "published"], values))}
+        assert fingerprint(record) == record_fingerprint(record)
+
+
+def test_record_fingerprinter_rejects_non_string_varying_fields():
+    template = make_chunk("qna_0").model_dump(mode="json")
+
+    with pytest.raises(ValueError):
+        record_fingerprinter({**template, "question": 1}, ["question"])
+    with pytest.raises(ValueError):
+        record_fingerprinter(template, ["missing"])
+    with pytest.raises(ValueError):
+        record_fingerprinter(template, ["created_date"])
+
+
+@pytest.mark.parametrize("day", [1, 2, 3])
+def test_record_fingerprinter_matches_record_fingerprint_on_qna_fixtures(day):
+    """
+    실제 qna 데이터(resources/data/tsv)로 만든 색인 문서에서도 record_fingerprint와 같은 값을 낸다.
+    """
+    path = Path(__file__).resolve().parents[3] / "resources" / "data" / "tsv" / f"day_{day}" / "qna.tsv"
+    doc = QnaParser().parse(FileFetcher().fetch(str(path), Collection.qna))
+    records = [c.model_dump(mode="json") for c in QnaTransformer().transform_iter([doc])]
+    keys = ["source_id", "question", "answer", "author", "published"]
+    template = {**records[0], **dict.fromkeys(keys)}
+    fingerprint = record_fingerprinter(template, keys)
+
+    assert records
+    for record in records:
+        assert fingerprint(record) == record_fingerprint(record)
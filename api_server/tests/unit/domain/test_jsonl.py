@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+from api_server.app.domain import jsonl
+from api_server.app.domain.models import ParsedDocument, ParsedBlock, SourceRef, FileType, Collection
+
+
+def make_doc(i: int) -> ParsedDocument:
+    return ParsedDocument(
+        source=SourceRef(uri=f"file:///data/day_1/qna_{i}.tsv", file_type=FileType.tsv),
+        blocks=[ParsedBlock(type="row", meta={"id": str(i)})],
+        collection=Collection.qna,
+    )
+
+
+def test_iter_jsonl_models_reads_multiple_documents_lazily(tmp_path: Path):
+    """
+    여러 줄(문서 여러 건)을 한 건씩 반환하고, 빈 줄은 건너뛴다.
+    """
+    p = tmp_path / "qna_1_parsed.json"
+    p.write_text("\n".join(make_doc(i).model_dump_json() for i in range(3)) + "\n\n", encoding="utf-8")
+
+    it = jsonl.iter_jsonl_models(str(p), ParsedDocument)
+    first = next(it)
+
+    assert first.blocks[0].meta["id"] == "0"
+    assert [d.blocks[0].meta["id"] for d in it] == ["1", "2"]
+
+
+def test_iter_jsonl_lines_keeps_line_numbers(tmp_path: Path):
+    p = tmp_path / "a.json"
+    p.write_text('{"a": 1}\n\n{"a": 2}\n', encoding="utf-8")
+
+    assert [n for n, _ in jsonl.iter_jsonl_lines(str(p))] == [1, 3]
+    assert list(jsonl.iter_jsonl(str(p))) == [{"a": 1}, {"a": 2}]
+
+
+def test_only_first_line_header_is_skipped(tmp_path: Path):
+    """
+    산출물 헤더는 첫 줄일 때만 건너뛰고, 이후 "_artifact" 키로 시작하는 데이터 줄은 그대로 반환한다.
+    """
+    p = tmp_path / "a.json"
+    p.write_text('\n{"_artifact": {"model": "X"}}\n{"_artifact": 1, "a": 1}\n{"a": 2}\n', encoding="utf-8")
+
+    assert [n for n, _ in jsonl.iter_jsonl_lines(str(p))] == [3, 4]
+    assert list(jsonl.iter_jsonl(str(p))) == [{"_artifact": 1, "a": 1}, {"a": 2}]
+    assert jsonl.read_jsonl_header(str(p)) == {"model": "X"}
+
+    p.write_text('{"a": 0}\n{"_artifact": {"model": "X"}}\n', encoding="utf-8")
+
+    assert list(jsonl.iter_jsonl(str(p))) == [{"a": 0}, {"_artifact": {"model": "X"}}]
+    assert jsonl.read_jsonl_header(str(p)) is None
+
+
+def test_loads_falls_back_to_json_without_orjson(monkeypatch):
+    monkeypatch.setattr(jsonl, "orjson", None)
+    assert jsonl.loads(b'{"q": "\xea\xb0\x80"}') == {"q": "가"}
+
+
+def test_legacy_array_line_is_expanded(tmp_path: Path):
+    p = tmp_path / "legacy.json"
+    p.write_text(json.dumps([make_doc(1).model_dump(mode="json"), make_doc(2).model_dump(mode="json")]), encoding="utf-8")
+
+    docs = list(jsonl.iter_jsonl_models(str(p), ParsedDocument))
+
+    assert [d.blocks[0].meta["id"] for d in docs] == ["1", "2"]
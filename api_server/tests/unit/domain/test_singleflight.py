@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api_server.app.domain.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_with_same_key_share_one_execution():
+    """
+    같은 키로 동시에 들어온 호출은 먼저 들어온 호출의 결과를 함께 받고, fn은 한 번만 실행된다.
+    """
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"hits": 1}
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(flight.do, "q", fn)
+        started.wait(5)
+        followers = [pool.submit(flight.do, "q", fn) for _ in range(3)]
+        while flight.stats()["coalesced"] < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == {"leaders": 1, "coalesced": 3, "in_flight": 0}
+
+
+def test_errors_are_shared_and_not_remembered():
+    """
+    실행 중 예외는 합쳐진 호출에도 전달되고, 끝난 뒤의 호출은 다시 실행한다.
+    """
+    flight = SingleFlight()
+    with pytest.raises(RuntimeError):
+        flight.do("q", lambda: (_ for _ in ()).throw(RuntimeError("down")))
+
+    assert flight.do("q", lambda: "ok") == "ok"
+    assert flight.stats()["leaders"] == 2
+
+
+def test_async_calls_with_same_key_share_one_task():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fn(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return {"value": value}
+
+    async def run():
+        return await asyncio.gather(
+            flight.do("a", lambda: fn("a")),
+            flight.do("a", lambda: fn("a")),
+            flight.do("b", lambda: fn("b")),
+        )
+
+    results = asyncio.run(run())
+
+    assert calls == ["a", "b"]
+    assert results[0] is results[1]
+    assert flight.stats() == {"leaders": 2, "coalesced": 1, "in_flight": 0}
+
+
+def test_async_leader_cancellation_does_not_cancel_followers():
+    """
+    먼저 들어온 요청이 취소되어도 실제 호출은 계속되어 기다리던 요청은 결과를 받는다.
+    """
+    flight = AsyncSingleFlight()
+
+    async def fn():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do("q", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("q", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == "ok"
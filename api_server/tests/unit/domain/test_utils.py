@@ -74,3 +74,57 @@ def test_choose_collection_invalid_type():
 
     with pytest.raises(ValueError):
         utils.choose_collection("pdf")
+
+
+def test_iter_in_background_keeps_order():
+    """
+    백그라운드 이터레이터가 원본 순서를 유지하는지
+    """
+    assert list(utils.iter_in_background(iter(range(100)), buffer_size=3)) == list(range(100))
+
+
+def test_iter_in_background_propagates_error():
+    """
+    생산자 예외가 소비자 쪽에서 다시 발생하는지
+    """
+    def gen():
+        yield 1
+        raise RuntimeError("boom")
+
+    it = utils.iter_in_background(gen(), buffer_size=1)
+    assert next(it) == 1
+    with pytest.raises(RuntimeError):
+        next(it)
+
+
+def test_run_per_file_type_runs_types_concurrently_in_order():
+    """
+    타입별 작업이 동시에 실행되고(서로를 기다리는 barrier 통과), 결과는 타입 순서대로 모인다.
+    """
+    import threading
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run(ft):
+        barrier.wait()
+        return f"{ft.value}-done"
+
+    result = utils.run_per_file_type([FileType.html, FileType.tsv], run)
+
+    assert list(result.items()) == [("html", "html-done"), ("tsv", "tsv-done")]
+
+
+def test_run_per_file_type_propagates_error_and_sequential_mode():
+    calls = []
+
+    def run(ft):
+        calls.append(ft)
+        if ft == FileType.tsv:
+            raise ValueError("broken tsv")
+        return ft.value
+
+    with pytest.raises(ValueError):
+        utils.run_per_file_type([FileType.html, FileType.tsv], run)
+
+    calls.clear()
+    assert utils.run_per_file_type([FileType.html], run, concurrent=False) == {"html": "html"}
+    assert calls == [FileType.html]
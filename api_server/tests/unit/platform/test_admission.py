@@ -0,0 +1,176 @@
+import asyncio
+from collections import deque
+
+import pytest
+
+from api_server.app.platform import admission
+from api_server.app.platform.admission import AdmissionController, AdmissionRejected, LaneLimits
+
+
+def make_controller(max_in_flight=4, search=(1, 2, 1.0), ingest=(1, 0, 1.0)) -> AdmissionController:
+    return AdmissionController(max_in_flight, {
+        "search": LaneLimits(*search, priority=0),
+        "ingest": LaneLimits(*ingest, priority=1),
+    })
+
+
+def test_acquire_admits_immediately_and_release_frees_slot():
+    controller = make_controller()
+
+    async def run():
+        await controller.acquire("search")
+        active = controller.stats()["lanes"]["search"]["active"]
+        controller.release("search")
+        return active
+
+    assert asyncio.run(run()) == 1
+    stats = controller.stats()
+    assert stats["active"] == 0
+    assert stats["lanes"]["search"]["admitted"] == 1
+
+
+def test_full_queue_is_rejected_with_429():
+    """
+    대기열 크기가 0인 lane은 자리가 없으면 기다리지 않고 바로 429로 거절한다.
+    """
+    controller = make_controller()
+
+    async def run():
+        await controller.acquire("ingest")
+        with pytest.raises(AdmissionRejected) as e:
+            await controller.acquire("ingest")
+        controller.release("ingest")
+        return e.value
+
+    rejected = asyncio.run(run())
+
+    assert (rejected.status_code, rejected.reason, rejected.lane) == (429, "queue full", "ingest")
+    assert controller.stats()["lanes"]["ingest"]["rejected"] == 1
+
+
+def test_queue_timeout_is_rejected_with_503():
+    controller = make_controller(search=(1, 2, 0.01))
+
+    async def run():
+        await controller.acquire("search")
+        with pytest.raises(AdmissionRejected) as e:
+            await controller.acquire("search")
+        controller.release("search")
+        return e.value
+
+    rejected = asyncio.run(run())
+
+    assert (rejected.status_code, rejected.reason) == (503, "queue timeout")
+    stats = controller.stats()
+    assert stats["lanes"]["search"]["timed_out"] == 1
+    assert stats["active"] == 0
+
+
+def test_waiter_is_admitted_when_slot_is_released():
+    controller = make_controller()
+
+    async def run():
+        await controller.acquire("search")
+        waiter = asyncio.ensure_future(controller.acquire("search"))
+        await asyncio.sleep(0)
+        waiting = controller.stats()["lanes"]["search"]["waiting"]
+        controller.release("search")
+        await waiter
+        return waiting
+
+    assert asyncio.run(run()) == 1
+    assert controller.stats()["lanes"]["search"] == {
+        "active": 1, "waiting": 0, "admitted": 2, "rejected": 0, "timed_out": 0}
+
+
+def test_search_waiters_are_dispatched_before_ingest():
+    """
+    전체 자리가 모자라면 검색 lane 대기 요청을 먼저 깨우고, 그동안 색인 요청은 수락하지 않는다.
+    """
+    controller = make_controller(max_in_flight=1, search=(1, 2, 1.0), ingest=(1, 2, 1.0))
+    order = []
+
+    async def request(lane):
+        await controller.acquire(lane)
+        order.append(lane)
+
+    async def run():
+        await controller.acquire("ingest")
+        ingest = asyncio.ensure_future(request("ingest"))
+        await asyncio.sleep(0)
+        search = asyncio.ensure_future(request("search"))
+        await asyncio.sleep(0)
+        controller.release("ingest")
+        await search
+        controller.release("search")
+        await ingest
+        controller.release("ingest")
+
+    asyncio.run(run())
+
+    assert order == ["search", "ingest"]
+    assert controller.stats()["active"] == 0
+
+
+def test_route_slots_do_not_wait():
+    controller = make_controller()
+
+    assert controller.try_acquire_route("index", 1) is True
+    assert controller.try_acquire_route("index", 1) is False
+    assert controller.try_acquire_route("extract", 1) is True
+    controller.release_route("index")
+    assert controller.try_acquire_route("index", 1) is True
+    assert controller.stats()["routes"] == {"index": 1, "extract": 1}
+
+
+def test_cancelled_waiters_do_not_fill_the_queue():
+    """
+    취소(연결 끊김)/시간 초과로 빠진 대기 요청은 대기열 크기에 세지 않는다(아무도 기다리지 않는데 429가 나지 않도록).
+    """
+    controller = make_controller(search=(1, 2, 1.0))
+
+    async def run():
+        await controller.acquire("search")
+        first = asyncio.ensure_future(controller.acquire("search"))
+        gone = asyncio.ensure_future(controller.acquire("search"))
+        await asyncio.sleep(0)
+        gone.cancel()
+        await asyncio.sleep(0)
+        third = asyncio.ensure_future(controller.acquire("search"))
+        await asyncio.sleep(0)
+        waiting = controller.stats()["lanes"]["search"]["waiting"]
+        controller.release("search")
+        await first
+        controller.release("search")
+        await third
+        controller.release("search")
+        return waiting
+
+    assert asyncio.run(run()) == 2
+    assert controller._by_name["search"].waiters == deque()
+    assert controller.stats()["lanes"]["search"]["rejected"] == 0
+    assert controller.stats()["active"] == 0
+
+
+def test_slot_granted_before_timeout_is_released(monkeypatch):
+    """
+    자리를 받은 직후 wait_for가 TimeoutError를 내도(3.12+) 받은 자리를 돌려준다.
+    """
+    controller = make_controller()
+
+    async def late_wait_for(future, timeout):
+        controller.release("search")  # 대기 중 자리가 나서 waiter가 수락됨
+        assert future.done()
+        raise asyncio.TimeoutError
+
+    async def run():
+        await controller.acquire("search")
+        monkeypatch.setattr(admission.asyncio, "wait_for", late_wait_for)
+        with pytest.raises(AdmissionRejected) as e:
+            await controller.acquire("search")
+        return e.value
+
+    assert asyncio.run(run()).status_code == 503
+    stats = controller.stats()
+    assert stats["active"] == 0
+    assert stats["lanes"]["search"]["active"] == 0
@@ -25,6 +25,8 @@ retry = Retry(
 adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=10)
 
 COLUMN_COUNT_MIN = 2
+# compact 검색 응답의 하이라이트 태그
+HIGHLIGHT_TAG = re.compile(r"</?em>")
 
 class PipelineClient:
     def __init__(self, base_url: str = "http://localhost:8000"):
@@ -52,21 +54,50 @@ class PipelineClient:
             print(f"Request failed for {url}: {e}")
             return None
 
+    def _run_job(self, kind: str, payload: dict, poll_interval: float = 1.0, timeout: float = 3600):
+        """
+        /v1/jobs 로 작업을 등록하고 끝날 때까지 상태를 조회한다.
+        (긴 색인도 HTTP 요청 타임아웃에 걸리지 않음)
+        """
+        submitted = self._post("/v1/jobs", {"kind": kind, **payload})
+        if not submitted:
+            return None
+        job_id = submitted["data"]["job_id"]
+        url = f"{self.base_url}/v1/jobs/{job_id}"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                response = self.session.get(url, timeout=10)
+                response.raise_for_status()
+                job = response.json()["data"]
+            except requests.RequestException as e:
+                print(f"Request failed for {url}: {e}")
+                return None
+            if job["status"] == "succeeded":
+                return {"success": True, "data": job["result"]}
+            if job["status"] in ("failed", "cancelled"):
+                print(f"job {job_id} {job['status']}: {job.get('error')}")
+                return None
+            print(f"  {kind} {job['status']} progress={job['progress']}")
+            time.sleep(poll_interval)
+        print(f"job {job_id} timeout")
+        return None
+
     def run_pipeline(self, date: str):
         payload = {"date": date}
 
         print(f"day={date} Extract 단계 실행...")
-        extract_result = self._post("/v1/extract", payload)
+        extract_result = self._run_job("extract", payload)
         if not extract_result:
             return {"error": "extract 실패"}
 
         print(f"day={date} Transform 단계 실행...")
-        transform_result = self._post("/v1/transform", payload)
+        transform_result = self._run_job("transform", payload)
         if not transform_result:
             return {"error": "transform 실패"}
 
         print(f"day={date} Index 단계 실행...")
-        index_result = self._post("/v1/index", payload)
+        index_result = self._run_job("index", payload)
         if not index_result:
             return {"error": "index 실패"}
 
@@ -145,6 +176,30 @@ class SearchReport:
             }
         return search_dict
 
+    def search_answers_batch(self, answer_dict: dict, batch_size: int = 100):
+        """
+        질문을 batch_size개씩 /v1/search/batch 로 보내 한 번의 왕복으로 검색한다.
+        search_time은 질문별 OpenSearch 처리 시간(took_ms)을 초 단위로 환산한 값.
+        """
+        search_dict = {}
+        items = list(answer_dict.items())
+        for i in range(0, len(items), batch_size):
+            batch = items[i:i + batch_size]
+            response = self.session.post(
+                f"{self.api_url}/v1/search/batch",
+                json={"queries": [obj["question"] for _, obj in batch], "size": self.count},
+                timeout=30,
+            )
+            response.raise_for_status()
+            results = response.json()["data"]["items"]
+            for (no, _), item in zip(batch, results):
+                search_dict[no] = {
+                    # 실패한 질문은 검색 결과 없음으로 기록
+                    "search_result": item.get("result", {"items": []}),
+                    "search_time": (item.get("took_ms") or 0) / 1000,
+                }
+        return search_dict
+
     def close(self):
         try:
             self.session.close()
@@ -257,6 +312,21 @@ class SearchReport:
         os.rename(source_file_path, target_file_path)
     
     def _parse_search_result(self, search_result: Dict[str, Any]) -> List[str]:
+        """
+        검색 결과별 텍스트(제목/질문/답변 + 본문 하이라이트 조각)를 만든다.
+        compact 응답({"items": [...]})과 raw 응답({"hits": {"hits": [...]}}) 모두 처리한다.
+        """
+        if "items" in search_result:
+            result = []
+            for item in search_result["items"]:
+                contents = [
+                    item[key].replace("\n", " ")
+                    for key in ['title', 'question', 'answer'] if item.get(key) is not None
+                ]
+                for fragments in item.get("highlights", {}).values():
+                    contents.extend(HIGHLIGHT_TAG.sub("", f).replace("\n", " ") for f in fragments)
+                result.append(" ".join(contents))
+            return result
         result = []
         hits = search_result["hits"]["hits"]
         for hit in hits:
@@ -301,8 +371,12 @@ def run_report(args):
     
     # 질문 파일 초기화
     answer_dict = search_report.init_answer_file()
-    # 질문 검색
-    search_dict = search_report.search_answers(answer_dict)
+    # 질문 검색(batch_size > 0 이면 /v1/search/batch 로 묶어서 검색)
+    batch_size = int(args.batch_size)
+    if batch_size > 0:
+        search_dict = search_report.search_answers_batch(answer_dict, batch_size=batch_size)
+    else:
+        search_dict = search_report.search_answers(answer_dict)
     #search_dict = asyncio.run(
     #    search_report.search_answers_async(answer_dict, max_concurrency=20)
     #)
@@ -337,6 +411,12 @@ if __name__ == "__main__":
         default=3,
         help='count for answer', 
         dest='count')
+    parser.add_argument(
+        '--batch_size', 
+        '-b',
+        default=100,
+        help='questions per /v1/search/batch request (0: one /v1/search request per question)', 
+        dest='batch_size')
     parser.add_argument(
         '--api_url', 
         '-u',